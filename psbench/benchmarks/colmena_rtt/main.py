@@ -39,6 +39,7 @@ from psbench.benchmarks.colmena_rtt.config import RunResult
 from psbench.benchmarks.protocol import ContextManagerAddIn
 from psbench.config.executor import GlobusComputeConfig
 from psbench.config.executor import ParslConfig
+from psbench.connectors.wan import connector_name
 from psbench.logging import TEST_LOG_LEVEL
 
 logger = logging.getLogger('colmena-rtt')
@@ -90,7 +91,7 @@ class Thinker(BaseThinker):
                 result.task_info['input_size'],
                 result.task_info['output_size'],
                 (
-                    self.store.connector.__class__.__name__
+                    connector_name(self.store.connector)
                     if self.store is not None
                     else ''
                 ),
@@ -204,7 +205,7 @@ class Benchmark(ContextManagerAddIn):
         connector = (
             'None'
             if self.store is None
-            else self.store.connector.__class__.__name__
+            else connector_name(self.store.connector)
         )
         return {
             'executor': executor,
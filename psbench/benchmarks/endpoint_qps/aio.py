@@ -0,0 +1,304 @@
+"""Asyncio engine for endpoint route tests.
+
+The process engine in
+[`routes`][psbench.benchmarks.endpoint_qps.routes] runs one synchronous
+client per worker process. This engine instead runs many concurrent logical
+clients as coroutines within each worker process which share a pool of
+HTTP connections to the endpoint.
+"""
+
+from __future__ import annotations
+
+import asyncio
+import random
+import time
+import uuid
+from collections.abc import Awaitable
+from collections.abc import Callable
+from typing import Any
+from typing import TypeVar
+
+import aiohttp
+
+from psbench.benchmarks.endpoint_qps.config import ARRIVAL_TYPE
+from psbench.benchmarks.endpoint_qps.config import ROUTE_TYPE
+from psbench.benchmarks.endpoint_qps.routes import interarrival_time
+from psbench.benchmarks.endpoint_qps.routes import Stats
+from psbench.histogram import LatencyHistogram
+from psbench.utils import randbytes
+
+T = TypeVar('T')
+
+
+class EndpointClient:
+    """Asyncio client for the endpoint REST API.
+
+    Args:
+        session (ClientSession): session to make requests with. The
+            connection pool of the session is shared by all requests.
+        address (str): endpoint address (e.g., `http://localhost:8765`).
+    """
+
+    def __init__(self, session: aiohttp.ClientSession, address: str) -> None:
+        self.session = session
+        self.address = address
+
+    async def endpoint(self) -> None:
+        async with self.session.get(f'{self.address}/endpoint') as response:
+            response.raise_for_status()
+            await response.read()
+
+    async def evict(self, key: str) -> None:
+        async with self.session.post(
+            f'{self.address}/evict',
+            params={'key': key},
+        ) as response:
+            response.raise_for_status()
+
+    async def exists(self, key: str) -> bool:
+        async with self.session.get(
+            f'{self.address}/exists',
+            params={'key': key},
+        ) as response:
+            response.raise_for_status()
+            return (await response.json())['exists']
+
+    async def get(self, key: str) -> bytes | None:
+        async with self.session.get(
+            f'{self.address}/get',
+            params={'key': key},
+        ) as response:
+            if response.status == 404:
+                return None
+            response.raise_for_status()
+            return await response.read()
+
+    async def set(self, key: str, data: bytes) -> None:
+        async with self.session.post(
+            f'{self.address}/set',
+            params={'key': key},
+            data=data,
+        ) as response:
+            response.raise_for_status()
+
+
+async def run_queries_async(
+    query: Callable[[], Awaitable[T]],
+    queries: int,
+    *,
+    cleanup: Callable[[T], Awaitable[Any]] | None = None,
+    sleep: float = 0,
+    rate: float | None = None,
+    arrival: ARRIVAL_TYPE = 'poisson',
+    histograms: Stats | None = None,
+) -> Stats:
+    """Execute and time a sequence of queries as a single logical client.
+
+    This is the asyncio equivalent of
+    [`run_queries()`][psbench.benchmarks.endpoint_qps.routes.run_queries].
+
+    Args:
+        query (Callable): coroutine function which executes a single query.
+        queries (int): number of queries to make.
+        cleanup (Callable): optional coroutine function called with the return
+            value of each query that is excluded from the query timing.
+        sleep (float): sleep (seconds) between queries in closed-loop mode.
+        rate (float): target queries per second of this client in open-loop
+            mode.
+        arrival (str): distribution of inter-arrival times in open-loop mode.
+        histograms (Stats): optional histograms to record latencies into.
+            Concurrent clients share one set of histograms so the memory
+            used does not grow with the number of clients. New histograms
+            are created if `None`.
+
+    Returns:
+        Stats object with results of the client. The histograms are
+        `histograms` if provided.
+    """
+    latency = (
+        histograms.latency if histograms is not None else LatencyHistogram()
+    )
+
+    if rate is None:
+        total_elapsed_ns = 0
+        for _ in range(queries):
+            start = time.perf_counter_ns()
+            result = await query()
+            end = time.perf_counter_ns()
+            latency.record((end - start) / 1e6)
+            total_elapsed_ns += end - start
+            if cleanup is not None:
+                await cleanup(result)
+            await asyncio.sleep(sleep)
+        return Stats(queries, total_elapsed_ns / 1e6, latency)
+
+    if rate <= 0:
+        raise ValueError('Open-loop query rate must be positive.')
+
+    rng = random.Random()
+    corrected = (
+        histograms.corrected_latency
+        if histograms is not None and histograms.corrected_latency is not None
+        else LatencyHistogram()
+    )
+    delay = (
+        histograms.start_delay
+        if histograms is not None and histograms.start_delay is not None
+        else LatencyHistogram()
+    )
+
+    # Stagger the first query of each client so clients started at the same
+    # time do not issue their queries in lockstep.
+    test_start = time.perf_counter_ns()
+    scheduled = test_start + int(rng.uniform(0, 1 / rate) * 1e9)
+    for _ in range(queries):
+        now = time.perf_counter_ns()
+        if scheduled > now:
+            await asyncio.sleep((scheduled - now) / 1e9)
+
+        start = time.perf_counter_ns()
+        result = await query()
+        end = time.perf_counter_ns()
+        latency.record((end - start) / 1e6)
+        corrected.record((end - scheduled) / 1e6)
+        delay.record(max(0, start - scheduled) / 1e6)
+        if cleanup is not None:
+            await cleanup(result)
+
+        scheduled += int(interarrival_time(rng, rate, arrival) * 1e9)
+
+    total_elapsed_ms = (time.perf_counter_ns() - test_start) / 1e6
+    return Stats(queries, total_elapsed_ms, latency, corrected, delay)
+
+
+async def run_clients(
+    address: str,
+    route: ROUTE_TYPE,
+    *,
+    clients: int = 1,
+    queries: int = 100,
+    payload_size: int = 0,
+    sleep: float = 0,
+    rate: float | None = None,
+    arrival: ARRIVAL_TYPE = 'poisson',
+    connections: int = 100,
+    start_time: float | None = None,
+) -> Stats:
+    """Run concurrent logical clients against an endpoint route.
+
+    Args:
+        address (str): endpoint address (e.g., `http://localhost:8765`).
+        route (str): endpoint route to query.
+        clients (int): number of concurrent logical clients.
+        queries (int): number of queries to make per client.
+        payload_size (int): payload size in bytes for GET/SET routes.
+        sleep (float): sleep (seconds) between queries of a client.
+        rate (float): target queries per second of each client. If provided,
+            queries are issued in an open loop and `sleep` is ignored.
+        arrival (str): inter-arrival time distribution for open-loop tests.
+        connections (int): maximum number of simultaneous HTTP connections
+            shared by all clients.
+        start_time (float): UNIX timestamp to sleep until for starting test.
+            Useful for synchronizing workers.
+
+    Returns:
+        Stats object with the results of all clients.
+    """
+    pool = aiohttp.TCPConnector(limit=connections)
+    timeout = aiohttp.ClientTimeout(total=None)
+    async with aiohttp.ClientSession(
+        connector=pool,
+        timeout=timeout,
+    ) as session:
+        client = EndpointClient(session, address)
+
+        fake_key = str(uuid.uuid4())
+        data = randbytes(payload_size)
+
+        async def _evict() -> None:
+            await client.evict(fake_key)
+
+        async def _exists() -> None:
+            await client.exists(fake_key)
+
+        async def _get() -> None:
+            res = await client.get(fake_key)
+            assert res is not None
+
+        async def _set() -> str:
+            key = str(uuid.uuid4())
+            await client.set(key, data)
+            return key
+
+        query: Callable[[], Awaitable[Any]]
+        cleanup: Callable[[Any], Awaitable[Any]] | None = None
+        if route == 'ENDPOINT':
+            query = client.endpoint
+        elif route == 'EVICT':
+            query = _evict
+        elif route == 'EXISTS':
+            query = _exists
+        elif route == 'GET':
+            await client.set(fake_key, data)
+            query = _get
+        elif route == 'SET':
+            query = _set
+            # Evict each key after it is set to keep endpoint memory in check
+            cleanup = client.evict
+        else:
+            raise AssertionError('Unsupported route')
+
+        if start_time is not None:
+            await asyncio.sleep(max(0, start_time - time.time()))
+
+        histograms = Stats(
+            queries=0,
+            total_elapsed_ms=0,
+            latency=LatencyHistogram(),
+            corrected_latency=LatencyHistogram() if rate is not None else None,
+            start_delay=LatencyHistogram() if rate is not None else None,
+        )
+
+        start = time.perf_counter_ns()
+        times = await asyncio.gather(
+            *(
+                run_queries_async(
+                    query,
+                    queries,
+                    cleanup=cleanup,
+                    sleep=sleep,
+                    rate=rate,
+                    arrival=arrival,
+                    histograms=histograms,
+                )
+                for _ in range(clients)
+            ),
+        )
+        end = time.perf_counter_ns()
+
+        if route == 'GET':
+            await client.evict(fake_key)
+
+    # The clients recorded into the same histograms so only the query
+    # counts need to be combined.
+    return histograms._replace(
+        queries=sum(s.queries for s in times),
+        total_elapsed_ms=(end - start) / 1e6,
+    )
+
+
+def run_clients_process(
+    address: str,
+    route: ROUTE_TYPE,
+    start_time: float | None = None,
+    **kwargs: Any,
+) -> Stats:
+    """Run logical clients in a new event loop.
+
+    This is the entry point for each worker process. See
+    [`run_clients()`][psbench.benchmarks.endpoint_qps.aio.run_clients] for
+    the supported keyword arguments.
+    """
+    return asyncio.run(
+        run_clients(address, route, start_time=start_time, **kwargs),
+    )
@@ -6,6 +6,7 @@ import sys
 from typing import Any
 from typing import List  # noqa: UP035
 from typing import Literal
+from typing import Optional
 
 if sys.version_info >= (3, 11):  # pragma: >=3.11 cover
     from typing import Self
@@ -15,6 +16,8 @@ else:  # pragma: <3.11 cover
 from pydantic import BaseModel
 
 ROUTE_TYPE = Literal['GET', 'SET', 'EXISTS', 'EVICT', 'ENDPOINT']
+ARRIVAL_TYPE = Literal['fixed', 'poisson']
+ENGINE_TYPE = Literal['process', 'asyncio']
 
 
 class RunConfig(BaseModel):
@@ -24,6 +27,11 @@ class RunConfig(BaseModel):
     total_queries: int
     sleep_seconds: float
     workers: int
+    rate: Optional[float] = None  # noqa: UP045
+    arrival: ARRIVAL_TYPE = 'poisson'
+    engine: ENGINE_TYPE = 'process'
+    clients: int = 1
+    connections: int = 100
 
 
 class RunResult(BaseModel):
@@ -32,6 +40,8 @@ class RunResult(BaseModel):
     total_queries: int
     sleep_seconds: float
     workers: int
+    engine: ENGINE_TYPE = 'process'
+    clients: int = 1
     min_worker_elapsed_time_ms: float
     max_worker_elapsed_time_ms: float
     avg_worker_elapsed_time_ms: float
@@ -40,7 +50,17 @@ class RunResult(BaseModel):
     max_latency_ms: float
     avg_latency_ms: float
     stdev_latency_ms: float
+    p50_latency_ms: float
+    p90_latency_ms: float
+    p99_latency_ms: float
+    p999_latency_ms: float
     qps: float
+    target_qps: Optional[float] = None  # noqa: UP045
+    arrival: Optional[ARRIVAL_TYPE] = None  # noqa: UP045
+    avg_corrected_latency_ms: Optional[float] = None  # noqa: UP045
+    max_corrected_latency_ms: Optional[float] = None  # noqa: UP045
+    avg_start_delay_ms: Optional[float] = None  # noqa: UP045
+    max_start_delay_ms: Optional[float] = None  # noqa: UP045
 
 
 class BenchmarkMatrix(BaseModel):
@@ -50,6 +70,11 @@ class BenchmarkMatrix(BaseModel):
     total_queries: int
     sleep_seconds: List[float]  # noqa: UP006
     workers: List[int]  # noqa: UP006
+    rates: List[Optional[float]] = [None]  # noqa: UP006,UP045
+    arrival: ARRIVAL_TYPE = 'poisson'
+    engine: ENGINE_TYPE = 'process'
+    clients: List[int] = [1]  # noqa: UP006
+    connections: int = 100
 
     @staticmethod
     def add_parser_group(parser: argparse.ArgumentParser) -> None:
@@ -90,7 +115,59 @@ class BenchmarkMatrix(BaseModel):
             '--queries',
             type=int,
             default=100,
-            help='Number of queries per worker to make',
+            help=(
+                'Number of queries per worker (process engine) or per '
+                'client (asyncio engine) to make'
+            ),
+        )
+        group.add_argument(
+            '--rates',
+            type=float,
+            nargs='+',
+            default=None,
+            metavar='QPS',
+            help=(
+                'Target queries per second summed across all workers. '
+                'If provided, queries are issued in an open loop at each '
+                'rate regardless of when prior queries complete, and '
+                '--sleep is ignored'
+            ),
+        )
+        group.add_argument(
+            '--arrival',
+            choices=['fixed', 'poisson'],
+            default='poisson',
+            help='Inter-arrival time distribution when using --rates',
+        )
+        group.add_argument(
+            '--engine',
+            choices=['process', 'asyncio'],
+            default='process',
+            help=(
+                'Client engine. The process engine runs one synchronous '
+                'client per worker process. The asyncio engine runs '
+                '--clients concurrent logical clients spread across the '
+                'worker processes'
+            ),
+        )
+        group.add_argument(
+            '--clients',
+            type=int,
+            nargs='+',
+            default=[1],
+            help=(
+                'Total concurrent logical clients across all workers '
+                '(asyncio engine only)'
+            ),
+        )
+        group.add_argument(
+            '--connections',
+            type=int,
+            default=100,
+            help=(
+                'Maximum HTTP connections per worker process shared by its '
+                'clients (asyncio engine only)'
+            ),
         )
 
     @classmethod
@@ -102,6 +179,11 @@ class BenchmarkMatrix(BaseModel):
             total_queries=kwargs['queries'],
             sleep_seconds=kwargs['sleep'],
             workers=kwargs['workers'],
+            rates=kwargs['rates'] if kwargs['rates'] is not None else [None],
+            arrival=kwargs['arrival'],
+            engine=kwargs['engine'],
+            clients=kwargs['clients'],
+            connections=kwargs['connections'],
         )
 
     def configs(self) -> tuple[RunConfig, ...]:
@@ -113,16 +195,27 @@ class BenchmarkMatrix(BaseModel):
                 total_queries=self.total_queries,
                 sleep_seconds=sleep_seconds,
                 workers=workers,
+                rate=rate,
+                arrival=self.arrival,
+                engine=self.engine,
+                clients=clients,
+                connections=self.connections,
             )
             for (
                 route,
                 payload_size_bytes,
                 sleep_seconds,
                 workers,
+                rate,
+                clients,
             ) in itertools.product(
                 self.routes,
                 self.payload_size_bytes,
                 self.sleep_seconds,
                 self.workers,
+                self.rates,
+                # Clients only apply to the asyncio engine so we avoid
+                # repeating process engine configs for each client count.
+                self.clients if self.engine == 'asyncio' else [1],
             )
         )
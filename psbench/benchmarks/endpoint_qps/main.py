@@ -5,7 +5,6 @@ from __future__ import annotations
 import datetime
 import functools
 import logging
-import math
 import multiprocessing
 import sys
 import time
@@ -20,7 +19,10 @@ else:  # pragma: <3.11 cover
 
 from proxystore.connectors.endpoint import EndpointConnector
 
+from psbench.benchmarks.endpoint_qps import aio
 from psbench.benchmarks.endpoint_qps import routes
+from psbench.benchmarks.endpoint_qps.config import ARRIVAL_TYPE
+from psbench.benchmarks.endpoint_qps.config import ENGINE_TYPE
 from psbench.benchmarks.endpoint_qps.config import ROUTE_TYPE
 from psbench.benchmarks.endpoint_qps.config import RunConfig
 from psbench.benchmarks.endpoint_qps.config import RunResult
@@ -32,34 +34,22 @@ PROCESS_STARTUP_BUFFER_SECONDS = 5
 logger = logging.getLogger('endpoint-qps')
 
 
-def run(
-    endpoint: str,
-    route: ROUTE_TYPE,
-    *,
-    payload_size: int = 0,
-    queries: int = 100,
-    sleep: float = 0,
-    workers: int = 1,
-) -> RunResult:
-    """Run test workers and gather results.
+def _split_evenly(total: int, parts: int) -> list[int]:
+    base, remainder = divmod(total, parts)
+    return [base + (1 if i < remainder else 0) for i in range(parts)]
 
-    Args:
-        endpoint (str): endpoint uuid.
-        route (str): endpoint route to query.
-        payload_size (int): bytes to send/receive for GET/SET routes.
-        queries (int): number of queries to perform per worker.
-        sleep (float): sleep (seconds) between queries.
-        workers (int): number of worker processes to use.
-
-    Returns:
-        RunResult with summary of test run.
-    """
-    connector = EndpointConnector([endpoint])
 
-    logger.log(
-        TEST_LOG_LEVEL,
-        f'starting QPS for /{route} with endpoint {endpoint}...',
-    )
+def _process_worker_func(
+    connector: EndpointConnector,
+    route: ROUTE_TYPE,
+    *,
+    payload_size: int,
+    queries: int,
+    sleep: float,
+    rate: float | None,
+    arrival: ARRIVAL_TYPE,
+) -> Callable[..., routes.Stats]:
+    loop_kwargs: dict[str, Any] = {'rate': rate, 'arrival': arrival}
 
     func: Callable[[float], routes.Stats]
     if route == 'ENDPOINT':
@@ -68,11 +58,24 @@ def run(
             connector,
             sleep,
             queries,
+            **loop_kwargs,
         )
     elif route == 'EVICT':
-        func = functools.partial(routes.evict_test, connector, sleep, queries)
+        func = functools.partial(
+            routes.evict_test,
+            connector,
+            sleep,
+            queries,
+            **loop_kwargs,
+        )
     elif route == 'EXISTS':
-        func = functools.partial(routes.exists_test, connector, sleep, queries)
+        func = functools.partial(
+            routes.exists_test,
+            connector,
+            sleep,
+            queries,
+            **loop_kwargs,
+        )
     elif route == 'GET':
         func = functools.partial(
             routes.get_test,
@@ -80,6 +83,7 @@ def run(
             sleep,
             queries,
             payload_size,
+            **loop_kwargs,
         )
     elif route == 'SET':
         func = functools.partial(
@@ -88,10 +92,97 @@ def run(
             sleep,
             queries,
             payload_size,
+            **loop_kwargs,
         )
     else:
         raise AssertionError('Unsupported route')
 
+    return func
+
+
+def run(
+    endpoint: str,
+    route: ROUTE_TYPE,
+    *,
+    payload_size: int = 0,
+    queries: int = 100,
+    sleep: float = 0,
+    workers: int = 1,
+    rate: float | None = None,
+    arrival: ARRIVAL_TYPE = 'poisson',
+    engine: ENGINE_TYPE = 'process',
+    clients: int = 1,
+    connections: int = 100,
+) -> RunResult:
+    """Run test workers and gather results.
+
+    Args:
+        endpoint (str): endpoint uuid.
+        route (str): endpoint route to query.
+        payload_size (int): bytes to send/receive for GET/SET routes.
+        queries (int): number of queries to perform per worker (process
+            engine) or per client (asyncio engine).
+        sleep (float): sleep (seconds) between queries.
+        workers (int): number of worker processes to use.
+        rate (float): optional target queries per second across all
+            workers. If provided, each worker (process engine) or client
+            (asyncio engine) issues queries in an open loop at an equal
+            share of the rate.
+        arrival (str): inter-arrival time distribution for open-loop tests.
+        engine (str): `'process'` runs one synchronous client per worker
+            process and `'asyncio'` runs `clients` concurrent logical clients
+            spread across the worker processes.
+        clients (int): total number of logical clients (asyncio engine only).
+        connections (int): maximum HTTP connections per worker process
+            (asyncio engine only).
+
+    Returns:
+        RunResult with summary of test run.
+    """
+    connector = EndpointConnector([endpoint])
+
+    logger.log(
+        TEST_LOG_LEVEL,
+        f'starting QPS for /{route} with endpoint {endpoint}...',
+    )
+
+    funcs: list[Callable[..., routes.Stats]]
+    if engine == 'asyncio':
+        if clients < workers:
+            raise ValueError(
+                f'The asyncio engine requires at least one client per worker '
+                f'but got {clients} clients and {workers} workers.',
+            )
+        funcs = [
+            functools.partial(
+                aio.run_clients_process,
+                connector.address,
+                route,
+                clients=worker_clients,
+                queries=queries,
+                payload_size=payload_size,
+                sleep=sleep,
+                rate=None if rate is None else rate / clients,
+                arrival=arrival,
+                connections=connections,
+            )
+            for worker_clients in _split_evenly(clients, workers)
+        ]
+    elif engine == 'process':
+        funcs = [
+            _process_worker_func(
+                connector,
+                route,
+                payload_size=payload_size,
+                queries=queries,
+                sleep=sleep,
+                rate=None if rate is None else rate / workers,
+                arrival=arrival,
+            ),
+        ] * workers
+    else:
+        raise AssertionError(f'Unsupported engine {engine}')
+
     # Tell test functions to start a few seconds from now to ensure all
     # process start at the same time
     start_time = time.time() + PROCESS_STARTUP_BUFFER_SECONDS
@@ -103,11 +194,11 @@ def run(
     with multiprocessing.Pool(workers) as pool:
         logger.log(
             TEST_LOG_LEVEL,
-            f'initialized {workers} worker processes',
+            f'initialized {workers} worker processes ({engine} engine)',
         )
         results: list[multiprocessing.pool.AsyncResult[routes.Stats]] = [
             pool.apply_async(func, [], {'start_time': start_time})
-            for _ in range(workers)
+            for func in funcs
         ]
 
         stats = [result.get() for result in results]
@@ -118,15 +209,20 @@ def run(
     stdev_elapsed_ms = (
         stdev([s.total_elapsed_ms for s in stats]) if len(stats) > 1 else 0
     )
-    min_latency_ms = min(s.min_latency_ms for s in stats)
-    max_latency_ms = max(s.max_latency_ms for s in stats)
-    avg_latency_ms = sum(s.avg_latency_ms for s in stats) / len(stats)
-    # Avg standard deviation among k groups with equal samples in each group:
-    #   sqrt( (s_1^2 + s_2^2 + ...) / k)
-    stdev_latency_ms = math.sqrt(
-        sum(s.stdev_latency_ms**2 for s in stats) / len(stats),
-    )
-    queries = sum(s.queries for s in stats)
+    merged = routes.merge_stats(stats, max_elapsed_ms)
+    queries = merged.queries
+    latency = merged.latency
+
+    avg_corrected_ms: float | None = None
+    max_corrected_ms: float | None = None
+    avg_delay_ms: float | None = None
+    max_delay_ms: float | None = None
+    if merged.corrected_latency is not None:
+        avg_corrected_ms = merged.corrected_latency.mean
+        max_corrected_ms = merged.corrected_latency.max
+    if merged.start_delay is not None:
+        avg_delay_ms = merged.start_delay.mean
+        max_delay_ms = merged.start_delay.max
 
     run_stats = RunResult(
         route=route,
@@ -134,15 +230,27 @@ def run(
         total_queries=queries,
         sleep_seconds=sleep,
         workers=workers,
+        engine=engine,
+        clients=clients if engine == 'asyncio' else workers,
         min_worker_elapsed_time_ms=min_elapsed_ms,
         max_worker_elapsed_time_ms=max_elapsed_ms,
         avg_worker_elapsed_time_ms=avg_elapsed_ms,
         stdev_worker_elapsed_time_ms=stdev_elapsed_ms,
-        min_latency_ms=min_latency_ms,
-        max_latency_ms=max_latency_ms,
-        avg_latency_ms=avg_latency_ms,
-        stdev_latency_ms=stdev_latency_ms,
+        min_latency_ms=latency.min,
+        max_latency_ms=latency.max,
+        avg_latency_ms=latency.mean,
+        stdev_latency_ms=latency.stdev,
+        p50_latency_ms=latency.percentile(50),
+        p90_latency_ms=latency.percentile(90),
+        p99_latency_ms=latency.percentile(99),
+        p999_latency_ms=latency.percentile(99.9),
         qps=queries / (max_elapsed_ms / 1000),
+        target_qps=rate,
+        arrival=None if rate is None else arrival,
+        avg_corrected_latency_ms=avg_corrected_ms,
+        max_corrected_latency_ms=max_corrected_ms,
+        avg_start_delay_ms=avg_delay_ms,
+        max_start_delay_ms=max_delay_ms,
     )
 
     logger.log(
@@ -150,12 +258,25 @@ def run(
         f'complete {queries} queries across {workers} workers:\n'
         f'slowest worker elapsed time: {max_elapsed_ms / 1000:.3f} seconds\n'
         f'fastest worker elapsed time: {min_elapsed_ms / 1000:.3f} seconds\n'
-        f'minimum request latency: {min_latency_ms:.3f} ms\n'
-        f'maximum request latency: {max_latency_ms:.3f} ms\n'
+        f'minimum request latency: {latency.min:.3f} ms\n'
+        f'maximum request latency: {latency.max:.3f} ms\n'
         'average request latency: '
-        f'{avg_latency_ms:.3f} ± {stdev_latency_ms:.3f} ms\n'
+        f'{latency.mean:.3f} ± {latency.stdev:.3f} ms\n'
+        'p50/p90/p99/p99.9 request latency: '
+        f'{run_stats.p50_latency_ms:.3f}/{run_stats.p90_latency_ms:.3f}/'
+        f'{run_stats.p99_latency_ms:.3f}/{run_stats.p999_latency_ms:.3f} ms\n'
         f'total QPS: {run_stats.qps:.3f}',
     )
+    if rate is not None:
+        logger.log(
+            TEST_LOG_LEVEL,
+            f'open-loop target QPS: {rate:.3f} ({arrival} arrivals)\n'
+            'average corrected request latency: '
+            f'{avg_corrected_ms:.3f} ms\n'
+            'maximum corrected request latency: '
+            f'{max_corrected_ms:.3f} ms\n'
+            f'maximum request start delay: {max_delay_ms:.3f} ms',
+        )
 
     connector.close()
 
@@ -181,4 +302,9 @@ class Benchmark(ContextManagerAddIn):
             queries=config.total_queries,
             sleep=config.sleep_seconds,
             workers=config.workers,
+            rate=config.rate,
+            arrival=config.arrival,
+            engine=config.engine,
+            clients=config.clients,
+            connections=config.connections,
         )
@@ -1,27 +1,173 @@
 from __future__ import annotations
 
+import random
 import time
 import uuid
-from statistics import stdev
+from collections.abc import Callable
+from collections.abc import Sequence
+from typing import Any
+from typing import cast
 from typing import NamedTuple
+from typing import TypeVar
 
 import requests
 from proxystore.connectors.endpoint import EndpointConnector
 from proxystore.connectors.endpoint import EndpointKey
 
+from psbench.benchmarks.endpoint_qps.config import ARRIVAL_TYPE
+from psbench.histogram import LatencyHistogram
+from psbench.histogram import merge_histograms
 from psbench.utils import randbytes
 from psbench.utils import wait_until
 
+T = TypeVar('T')
+
 
 class Stats(NamedTuple):
-    """Results of test."""
+    """Results of test.
+
+    The corrected latency and start delay histograms are only set for
+    open-loop tests. The corrected latency of a query is measured from when
+    the query was scheduled to start rather than when it actually started so
+    queueing delay caused by slow prior queries is not omitted.
+    """
 
     queries: int
     total_elapsed_ms: float
-    min_latency_ms: float
-    max_latency_ms: float
-    avg_latency_ms: float
-    stdev_latency_ms: float
+    latency: LatencyHistogram
+    corrected_latency: LatencyHistogram | None = None
+    start_delay: LatencyHistogram | None = None
+
+    @property
+    def min_latency_ms(self) -> float:
+        return self.latency.min
+
+    @property
+    def max_latency_ms(self) -> float:
+        return self.latency.max
+
+    @property
+    def avg_latency_ms(self) -> float:
+        return self.latency.mean
+
+    @property
+    def stdev_latency_ms(self) -> float:
+        return self.latency.stdev
+
+
+def interarrival_time(
+    rng: random.Random,
+    rate: float,
+    arrival: ARRIVAL_TYPE,
+) -> float:
+    """Get the seconds until the next query in an open-loop test."""
+    return rng.expovariate(rate) if arrival == 'poisson' else 1 / rate
+
+
+def merge_stats(stats: Sequence[Stats], total_elapsed_ms: float) -> Stats:
+    """Merge the results of tests which ran concurrently.
+
+    Args:
+        stats (Sequence[Stats]): results to merge.
+        total_elapsed_ms (float): elapsed time of all of the tests.
+
+    Returns:
+        Stats object with the combined results.
+    """
+    corrected = [s.corrected_latency for s in stats]
+    delays = [s.start_delay for s in stats]
+    return Stats(
+        queries=sum(s.queries for s in stats),
+        total_elapsed_ms=total_elapsed_ms,
+        latency=merge_histograms(s.latency for s in stats),
+        corrected_latency=None
+        if None in corrected
+        else merge_histograms(cast(list[LatencyHistogram], corrected)),
+        start_delay=None
+        if None in delays
+        else merge_histograms(cast(list[LatencyHistogram], delays)),
+    )
+
+
+def run_queries(
+    query: Callable[[], T],
+    queries: int,
+    *,
+    cleanup: Callable[[T], Any] | None = None,
+    sleep: float = 0,
+    rate: float | None = None,
+    arrival: ARRIVAL_TYPE = 'poisson',
+    start_time: float | None = None,
+) -> Stats:
+    """Execute and time a sequence of queries.
+
+    By default, queries are executed in a closed loop where the next query
+    is issued `sleep` seconds after the previous query completes. If `rate`
+    is provided, queries are instead scheduled in an open loop at `rate`
+    queries per second, independent of when prior queries complete.
+
+    Args:
+        query (Callable): function which executes a single query.
+        queries (int): number of queries to make.
+        cleanup (Callable): optional function called with the return value
+            of each query that is excluded from the query timing.
+        sleep (float): sleep (seconds) between queries in closed-loop mode.
+        rate (float): target queries per second in open-loop mode.
+        arrival (str): distribution of inter-arrival times in open-loop mode.
+            Either `'fixed'` or `'poisson'` (exponentially distributed).
+        start_time (float): UNIX timestamp to sleep until for starting test.
+            Useful for synchronizing workers.
+
+    Returns:
+        Stats object with results of test.
+    """
+    if start_time is not None:
+        wait_until(start_time)
+
+    latency = LatencyHistogram()
+
+    if rate is None:
+        total_elapsed_ns = 0
+        for _ in range(queries):
+            start = time.perf_counter_ns()
+            result = query()
+            end = time.perf_counter_ns()
+            latency.record((end - start) / 1e6)
+            total_elapsed_ns += end - start
+            if cleanup is not None:
+                cleanup(result)
+            time.sleep(sleep)
+
+        return Stats(queries, total_elapsed_ns / 1e6, latency)
+
+    if rate <= 0:
+        raise ValueError('Open-loop query rate must be positive.')
+
+    # Unseeded so forked worker processes use distinct arrival times.
+    rng = random.Random()
+    corrected = LatencyHistogram()
+    delay = LatencyHistogram()
+
+    test_start = time.perf_counter_ns()
+    scheduled = test_start
+    for _ in range(queries):
+        now = time.perf_counter_ns()
+        if scheduled > now:
+            time.sleep((scheduled - now) / 1e9)
+
+        start = time.perf_counter_ns()
+        result = query()
+        end = time.perf_counter_ns()
+        latency.record((end - start) / 1e6)
+        corrected.record((end - scheduled) / 1e6)
+        delay.record(max(0, start - scheduled) / 1e6)
+        if cleanup is not None:
+            cleanup(result)
+
+        scheduled += int(interarrival_time(rng, rate, arrival) * 1e9)
+
+    total_elapsed_ms = (time.perf_counter_ns() - test_start) / 1e6
+    return Stats(queries, total_elapsed_ms, latency, corrected, delay)
 
 
 def endpoint_test(
@@ -29,6 +175,9 @@ def endpoint_test(
     sleep: float,
     queries: int,
     start_time: float | None = None,
+    *,
+    rate: float | None = None,
+    arrival: ARRIVAL_TYPE = 'poisson',
 ) -> Stats:
     """Endpoint /endpoint route test.
 
@@ -42,32 +191,28 @@ def endpoint_test(
         queries (int): number of queries to make.
         start_time (float): UNIX timestamp to sleep until for starting test.
             Useful for synchronizing workers.
+        rate (float): target queries per second. If provided, queries are
+            issued in an open loop and `sleep` is ignored.
+        arrival (str): inter-arrival time distribution for open-loop tests.
 
     Returns:
         Stats object with results of test.
     """
-    if start_time is not None:
-        wait_until(start_time)
-
-    latencies: list[float] = []
+    url = (
+        f'http://{connector.endpoint_host}:{connector.endpoint_port}/endpoint'
+    )
 
-    for _ in range(queries):
-        start = time.perf_counter_ns()
-        response = requests.get(
-            f'http://{connector.endpoint_host}:{connector.endpoint_port}/endpoint',
-        )
-        end = time.perf_counter_ns()
-        latencies.append((end - start) / 1e6)
+    def _query() -> None:
+        response = requests.get(url)
         assert response.status_code == 200
-        time.sleep(sleep)
 
-    return Stats(
-        queries=queries,
-        total_elapsed_ms=sum(latencies),
-        min_latency_ms=min(latencies),
-        max_latency_ms=max(latencies),
-        avg_latency_ms=sum(latencies) / len(latencies),
-        stdev_latency_ms=stdev(latencies) if len(latencies) > 1 else 0,
+    return run_queries(
+        _query,
+        queries,
+        sleep=sleep,
+        rate=rate,
+        arrival=arrival,
+        start_time=start_time,
     )
 
 
@@ -76,6 +221,9 @@ def evict_test(
     sleep: float,
     queries: int,
     start_time: float | None = None,
+    *,
+    rate: float | None = None,
+    arrival: ARRIVAL_TYPE = 'poisson',
 ) -> Stats:
     """Endpoint /evict route test.
 
@@ -85,30 +233,25 @@ def evict_test(
         queries (int): number of queries to make.
         start_time (float): UNIX timestamp to sleep until for starting test.
             Useful for synchronizing workers.
+        rate (float): target queries per second. If provided, queries are
+            issued in an open loop and `sleep` is ignored.
+        arrival (str): inter-arrival time distribution for open-loop tests.
 
     Returns:
         Stats object with results of test.
     """
-    if start_time is not None:
-        wait_until(start_time)
-
-    latencies: list[float] = []
-
     fake_key = EndpointKey(str(uuid.uuid4()), None)
-    for _ in range(queries):
-        start = time.perf_counter_ns()
+
+    def _query() -> None:
         connector.evict(fake_key)
-        end = time.perf_counter_ns()
-        latencies.append((end - start) / 1e6)
-        time.sleep(sleep)
 
-    return Stats(
-        queries=queries,
-        total_elapsed_ms=sum(latencies),
-        min_latency_ms=min(latencies),
-        max_latency_ms=max(latencies),
-        avg_latency_ms=sum(latencies) / len(latencies),
-        stdev_latency_ms=stdev(latencies) if len(latencies) > 1 else 0,
+    return run_queries(
+        _query,
+        queries,
+        sleep=sleep,
+        rate=rate,
+        arrival=arrival,
+        start_time=start_time,
     )
 
 
@@ -117,6 +260,9 @@ def exists_test(
     sleep: float,
     queries: int,
     start_time: float | None = None,
+    *,
+    rate: float | None = None,
+    arrival: ARRIVAL_TYPE = 'poisson',
 ) -> Stats:
     """Endpoint /exists route test.
 
@@ -126,30 +272,25 @@ def exists_test(
         queries (int): number of queries to make.
         start_time (float): UNIX timestamp to sleep until for starting test.
             Useful for synchronizing workers.
+        rate (float): target queries per second. If provided, queries are
+            issued in an open loop and `sleep` is ignored.
+        arrival (str): inter-arrival time distribution for open-loop tests.
 
     Returns:
         Stats object with results of test.
     """
-    if start_time is not None:
-        wait_until(start_time)
-
-    latencies: list[float] = []
-
     fake_key = EndpointKey(str(uuid.uuid4()), None)
-    for _ in range(queries):
-        start = time.perf_counter_ns()
+
+    def _query() -> None:
         connector.exists(fake_key)
-        end = time.perf_counter_ns()
-        latencies.append((end - start) / 1e6)
-        time.sleep(sleep)
 
-    return Stats(
-        queries=queries,
-        total_elapsed_ms=sum(latencies),
-        min_latency_ms=min(latencies),
-        max_latency_ms=max(latencies),
-        avg_latency_ms=sum(latencies) / len(latencies),
-        stdev_latency_ms=stdev(latencies) if len(latencies) > 1 else 0,
+    return run_queries(
+        _query,
+        queries,
+        sleep=sleep,
+        rate=rate,
+        arrival=arrival,
+        start_time=start_time,
     )
 
 
@@ -159,6 +300,9 @@ def get_test(
     queries: int,
     payload_size: int,
     start_time: float | None = None,
+    *,
+    rate: float | None = None,
+    arrival: ARRIVAL_TYPE = 'poisson',
 ) -> Stats:
     """Endpoint /get route test.
 
@@ -169,35 +313,31 @@ def get_test(
         payload_size (int): payload size in bytes.
         start_time (float): UNIX timestamp to sleep until for starting test.
             Useful for synchronizing workers.
+        rate (float): target queries per second. If provided, queries are
+            issued in an open loop and `sleep` is ignored.
+        arrival (str): inter-arrival time distribution for open-loop tests.
 
     Returns:
         Stats object with results of test.
     """
-    if start_time is not None:
-        wait_until(start_time)
-
-    latencies: list[float] = []
-
     key = connector.put(randbytes(payload_size))
 
-    for _ in range(queries):
-        start = time.perf_counter_ns()
+    def _query() -> None:
         res = connector.get(key)
-        end = time.perf_counter_ns()
-        latencies.append((end - start) / 1e6)
         assert res is not None
-        time.sleep(sleep)
+
+    stats = run_queries(
+        _query,
+        queries,
+        sleep=sleep,
+        rate=rate,
+        arrival=arrival,
+        start_time=start_time,
+    )
 
     connector.evict(key)
 
-    return Stats(
-        queries=queries,
-        total_elapsed_ms=sum(latencies),
-        min_latency_ms=min(latencies),
-        max_latency_ms=max(latencies),
-        avg_latency_ms=sum(latencies) / len(latencies),
-        stdev_latency_ms=stdev(latencies) if len(latencies) > 1 else 0,
-    )
+    return stats
 
 
 def set_test(
@@ -206,6 +346,9 @@ def set_test(
     queries: int,
     payload_size: int,
     start_time: float | None = None,
+    *,
+    rate: float | None = None,
+    arrival: ARRIVAL_TYPE = 'poisson',
 ) -> Stats:
     """Endpoint /set route test.
 
@@ -221,31 +364,25 @@ def set_test(
         payload_size (int): payload size in bytes.
         start_time (float): UNIX timestamp to sleep until for starting test.
             Useful for synchronizing workers.
+        rate (float): target queries per second. If provided, queries are
+            issued in an open loop and `sleep` is ignored.
+        arrival (str): inter-arrival time distribution for open-loop tests.
 
     Returns:
         Stats object with results of test.
     """
-    if start_time is not None:
-        wait_until(start_time)
-
-    latencies: list[float] = []
-
     data = randbytes(payload_size)
 
-    for _ in range(queries):
-        # Note we do put/evict here to keep connector memory in check
-        start = time.perf_counter_ns()
-        key = connector.put(data)
-        end = time.perf_counter_ns()
-        latencies.append((end - start) / 1e6)
-        connector.evict(key)
-        time.sleep(sleep)
-
-    return Stats(
-        queries=queries,
-        total_elapsed_ms=sum(latencies),
-        min_latency_ms=min(latencies),
-        max_latency_ms=max(latencies),
-        avg_latency_ms=sum(latencies) / len(latencies),
-        stdev_latency_ms=stdev(latencies) if len(latencies) > 1 else 0,
+    def _query() -> EndpointKey:
+        return connector.put(data)
+
+    # Note we do put/evict here to keep connector memory in check
+    return run_queries(
+        _query,
+        queries,
+        cleanup=connector.evict,
+        sleep=sleep,
+        rate=rate,
+        arrival=arrival,
+        start_time=start_time,
     )
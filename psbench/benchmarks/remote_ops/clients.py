@@ -0,0 +1,228 @@
+"""Concurrent client operations.
+
+Each logical client repeatedly performs an operation while the other clients
+do the same so the timings reflect what a Redis server or endpoint sustains
+under many simultaneous workers rather than single-stream latency.
+"""
+
+from __future__ import annotations
+
+import asyncio
+import time
+import uuid
+from collections.abc import Awaitable
+from collections.abc import Callable
+from typing import Any
+from typing import NamedTuple
+
+import redis.asyncio
+from proxystore.endpoint.endpoint import Endpoint
+
+from psbench.benchmarks.remote_ops.config import OP_TYPE
+from psbench.utils import randbytes
+
+
+class ClientsStats(NamedTuple):
+    """Timing of operations performed by concurrent clients.
+
+    Attributes:
+        latencies_ms: latency of each operation across all clients.
+        total_time_ms: elapsed time for all clients to finish.
+    """
+
+    latencies_ms: list[float]
+    total_time_ms: float
+
+
+async def run_clients(
+    operation: Callable[[int], Awaitable[Any]],
+    *,
+    clients: int,
+    repeat: int,
+) -> ClientsStats:
+    """Run concurrent clients which each perform an operation repeatedly.
+
+    Args:
+        operation: Callable which takes the index of a client and performs
+            one operation for that client.
+        clients: Number of concurrent clients.
+        repeat: Number of operations performed by each client.
+
+    Returns:
+        Latency of each operation and the total elapsed time.
+    """
+    if clients < 1:
+        raise ValueError('Clients must be at least one.')
+
+    latencies_ms: list[float] = []
+
+    async def _client(index: int) -> None:
+        for _ in range(repeat):
+            start = time.perf_counter_ns()
+            await operation(index)
+            end = time.perf_counter_ns()
+            latencies_ms.append((end - start) / 1e6)
+
+    start = time.perf_counter_ns()
+    await asyncio.gather(*(_client(i) for i in range(clients)))
+    end = time.perf_counter_ns()
+
+    return ClientsStats(
+        latencies_ms=latencies_ms,
+        total_time_ms=(end - start) / 1e6,
+    )
+
+
+def _keys(op: OP_TYPE, client: int, batch_size: int) -> list[str]:
+    prefix = 'missing-key' if op in ('evict', 'exists') else 'key'
+    return [f'{prefix}-{client}-{i}' for i in range(batch_size)]
+
+
+async def redis_clients(
+    host: str,
+    port: int,
+    op: OP_TYPE,
+    *,
+    clients: int,
+    payload_size_bytes: int = 0,
+    repeat: int = 1,
+    batch_size: int = 1,
+) -> ClientsStats:
+    """Test Redis operations with concurrent clients.
+
+    Clients share a connection pool with one connection per client. Batches
+    are sent in the same way as
+    [`redis_ops`][psbench.benchmarks.remote_ops.redis_ops]. Each client
+    gets and sets its own keys, and sets overwrite the same keys each time.
+
+    Args:
+        host (str): remote Redis server hostname/IP.
+        port (int): remote Redis server port.
+        op (str): operation to test.
+        clients (int): number of concurrent clients.
+        payload_size_bytes (int): size of payload for get/set operations.
+        repeat (int): number of operations performed by each client.
+        batch_size (int): number of keys per operation.
+
+    Returns:
+        Latency of each operation and the total elapsed time.
+    """
+    client: redis.asyncio.Redis[Any] = redis.asyncio.Redis(
+        host=host,
+        port=port,
+        max_connections=clients,
+    )
+    data = randbytes(payload_size_bytes)
+    keys = [_keys(op, i, batch_size) for i in range(clients)]
+
+    async def _pipeline(command: str, index: int) -> None:
+        async with client.pipeline(transaction=False) as pipeline:
+            for key in keys[index]:
+                getattr(pipeline, command)(key)
+            await pipeline.execute()
+
+    async def _operation(index: int) -> None:
+        client_keys = keys[index]
+        if op in ('evict', 'exists'):
+            command = 'delete' if op == 'evict' else 'exists'
+            if batch_size == 1:
+                await getattr(client, command)(client_keys[0])
+            else:
+                await _pipeline(command, index)
+        elif op == 'get':
+            if batch_size == 1:
+                res = await client.get(client_keys[0])
+                assert isinstance(res, bytes)
+            else:
+                values = await client.mget(client_keys)
+                assert all(isinstance(value, bytes) for value in values)
+        elif op == 'set':
+            if batch_size == 1:
+                await client.set(client_keys[0], data)
+            else:
+                await client.mset(dict.fromkeys(client_keys, data))
+        else:
+            raise AssertionError(f'Unsupported operation {op}')
+
+    try:
+        # Open one connection per client before timing.
+        await asyncio.gather(*(client.ping() for _ in range(clients)))
+        if op == 'get':
+            for client_keys in keys:
+                await client.mset(dict.fromkeys(client_keys, data))
+
+        stats = await run_clients(_operation, clients=clients, repeat=repeat)
+
+        if op in ('get', 'set'):
+            await client.delete(*(key for ks in keys for key in ks))
+    finally:
+        # The redis type stubs predate aclose() which replaces close().
+        await client.aclose()  # type: ignore[attr-defined]
+
+    return stats
+
+
+async def endpoint_clients(
+    endpoint: Endpoint,
+    target_endpoint: uuid.UUID | None,
+    op: OP_TYPE,
+    *,
+    clients: int,
+    payload_size_bytes: int = 0,
+    repeat: int = 1,
+    batch_size: int = 1,
+) -> ClientsStats:
+    """Test endpoint operations with concurrent clients.
+
+    Clients share the local endpoint. Batches are concurrent requests in
+    the same way as
+    [`endpoint_ops`][psbench.benchmarks.remote_ops.endpoint_ops]. Each
+    client gets and sets its own keys, and sets overwrite the same keys each
+    time.
+
+    Args:
+        endpoint (Endpoint): local endpoint.
+        target_endpoint (UUID): optional UUID of target endpoint to perform
+            operation on (local endpoint forwards op to target).
+        op (str): operation to test.
+        clients (int): number of concurrent clients.
+        payload_size_bytes (int): size of payload for get/set operations.
+        repeat (int): number of operations performed by each client.
+        batch_size (int): number of keys per operation.
+
+    Returns:
+        Latency of each operation and the total elapsed time.
+    """
+    data = randbytes(payload_size_bytes)
+    keys = [_keys(op, i, batch_size) for i in range(clients)]
+
+    async def _operation(index: int) -> None:
+        client_keys = keys[index]
+        aws: list[Awaitable[Any]]
+        if op == 'evict':
+            aws = [endpoint.evict(k, target_endpoint) for k in client_keys]
+        elif op == 'exists':
+            aws = [endpoint.exists(k, target_endpoint) for k in client_keys]
+        elif op == 'get':
+            aws = [endpoint.get(k, target_endpoint) for k in client_keys]
+        elif op == 'set':
+            aws = [endpoint.set(k, data, target_endpoint) for k in client_keys]
+        else:
+            raise AssertionError(f'Unsupported operation {op}')
+        res = await asyncio.gather(*aws)
+        if op == 'get':
+            assert all(isinstance(value, bytes) for value in res)
+
+    if op == 'get':
+        for client_keys in keys:
+            for key in client_keys:
+                await endpoint.set(key, data, target_endpoint)
+
+    stats = await run_clients(_operation, clients=clients, repeat=repeat)
+
+    if op in ('get', 'set'):
+        for client_keys in keys:
+            for key in client_keys:
+                await endpoint.evict(key, target_endpoint)
+
+    return stats
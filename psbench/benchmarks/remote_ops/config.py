@@ -14,6 +14,8 @@ else:  # pragma: <3.11 cover
     from typing_extensions import Self
 
 from pydantic import BaseModel
+from pydantic import Field
+from pydantic import PositiveInt
 
 BACKEND_TYPE = Literal['endpoint', 'redis']
 OP_TYPE = Literal['evict', 'exists', 'get', 'set']
@@ -24,19 +26,33 @@ class RunConfig(BaseModel):
     ops: List[OP_TYPE]  # noqa: UP006
     payload_sizes: List[int]  # noqa: UP006
     repeat: int
+    batch_sizes: List[PositiveInt] = Field(  # noqa: UP006
+        default_factory=lambda: [1],
+    )
+    clients: List[PositiveInt] = Field(  # noqa: UP006
+        default_factory=lambda: [1],
+    )
 
 
 class RunResult(BaseModel):
     backend: BACKEND_TYPE
     op: OP_TYPE
     payload_size_bytes: Optional[int]  # noqa: UP045
+    batch_size: int = 1
+    clients: int = 1
     repeat: int
     total_time_ms: float
     avg_time_ms: float
     min_time_ms: float
     max_time_ms: float
     stdev_time_ms: float
+    p50_time_ms: float
+    p90_time_ms: float
+    p99_time_ms: float
+    p999_time_ms: float
     avg_bandwidth_mbps: Optional[float]  # noqa: UP045
+    ops_per_s: Optional[float] = None  # noqa: UP045
+    aggregate_bandwidth_mbps: Optional[float] = None  # noqa: UP045
 
 
 class BenchmarkMatrix(BaseModel):
@@ -49,6 +65,15 @@ class BenchmarkMatrix(BaseModel):
     relay_server: Optional[str]  # noqa: UP045
     repeat: int
     use_uvloop: bool
+    batch_sizes: List[PositiveInt] = Field(  # noqa: UP006
+        default_factory=lambda: [1],
+    )
+    clients: List[PositiveInt] = Field(  # noqa: UP006
+        default_factory=lambda: [1],
+    )
+    local: bool = False
+    local_latency_ms: float = 0
+    local_bandwidth_mbps: Optional[float] = None  # noqa: UP045
 
     @staticmethod
     def add_parser_group(
@@ -58,6 +83,8 @@ class BenchmarkMatrix(BaseModel):
         group = parser.add_argument_group(title='Benchmark Parameters')
 
         args_str = ' '.join(argv) if argv is not None else ''
+        # Remote servers are not needed with the local stand-ins.
+        local = argv is not None and '--local' in argv
         group.add_argument(
             'backend',
             choices=['endpoint', 'redis'],
@@ -65,17 +92,17 @@ class BenchmarkMatrix(BaseModel):
         )
         group.add_argument(
             '--endpoint',
-            required='endpoint' in args_str,
+            required='endpoint' in args_str and not local,
             help='Remote Endpoint UUID',
         )
         group.add_argument(
             '--redis-host',
-            required='redis' in args_str,
+            required='redis' in args_str and not local,
             help='Redis server hostname/IP',
         )
         group.add_argument(
             '--redis-port',
-            required='redis' in args_str,
+            required='redis' in args_str and not local,
             help='Redis server port',
         )
         group.add_argument(
@@ -89,14 +116,59 @@ class BenchmarkMatrix(BaseModel):
             '--payload-sizes',
             type=int,
             nargs='+',
-            default=0,
+            default=[0],
             help='Payload sizes for get/set operations',
         )
+        group.add_argument(
+            '--batch-sizes',
+            metavar='N',
+            type=int,
+            nargs='+',
+            default=[1],
+            help=(
+                'Number of keys per batched operation. Redis batches use '
+                'pipelines or MGET/MSET and endpoint batches are concurrent '
+                'requests'
+            ),
+        )
+        group.add_argument(
+            '--clients',
+            metavar='N',
+            type=int,
+            nargs='+',
+            default=[1],
+            help=(
+                'Number of concurrent clients. Multiple Redis clients share '
+                'an asyncio connection pool and multiple endpoint clients '
+                'share the local endpoint'
+            ),
+        )
         group.add_argument(
             '--relay-server',
-            required='endpoint' in args_str,
+            required='endpoint' in args_str and not local,
             help='Relay server address for connecting to the remote endpoint',
         )
+        group.add_argument(
+            '--local',
+            action='store_true',
+            help=(
+                'Run against an in-process Redis server or endpoint stand-in '
+                'rather than a remote server'
+            ),
+        )
+        group.add_argument(
+            '--local-latency-ms',
+            metavar='MS',
+            type=float,
+            default=0,
+            help='One-way network latency emulated by the --local stand-ins',
+        )
+        group.add_argument(
+            '--local-bandwidth-mbps',
+            metavar='MBPS',
+            type=float,
+            help='Bandwidth cap in MB/s emulated by the --local stand-ins',
+        )
         group.add_argument(
             '--no-uvloop',
             action='store_true',
@@ -115,6 +187,11 @@ class BenchmarkMatrix(BaseModel):
             relay_server=kwargs['relay_server'],
             repeat=kwargs.get('repeat', 1),
             use_uvloop=not kwargs['no_uvloop'],
+            batch_sizes=kwargs.get('batch_sizes', [1]),
+            clients=kwargs.get('clients', [1]),
+            local=kwargs.get('local', False),
+            local_latency_ms=kwargs.get('local_latency_ms', 0),
+            local_bandwidth_mbps=kwargs.get('local_bandwidth_mbps'),
         )
 
     def configs(self) -> tuple[RunConfig, ...]:
@@ -123,5 +200,7 @@ class BenchmarkMatrix(BaseModel):
             ops=self.ops,
             payload_sizes=self.payload_sizes,
             repeat=self.repeat,
+            batch_sizes=self.batch_sizes,
+            clients=self.clients,
         )
         return (config,)
@@ -1,17 +1,31 @@
 from __future__ import annotations
 
+import asyncio
 import time
 import uuid
+from collections.abc import Awaitable
+from typing import TypeVar
 
 from proxystore.endpoint.endpoint import Endpoint
 
 from psbench.utils import randbytes
 
+T = TypeVar('T')
+
+
+async def _gather(*aws: Awaitable[T]) -> list[T]:
+    # Await a single operation directly so unbatched latencies do not include
+    # the overhead of scheduling a task.
+    if len(aws) == 1:
+        return [await aws[0]]
+    return list(await asyncio.gather(*aws))
+
 
 async def test_evict(
     endpoint: Endpoint,
     target_endpoint: uuid.UUID | None,
     repeat: int = 1,
+    batch_size: int = 1,
 ) -> list[float]:
     """Test endpoint eviction.
 
@@ -20,6 +34,8 @@ async def test_evict(
         target_endpoint (UUID): optional UUID of target endpoint to perform
             operation on (local endpoint forwards op to target).
         repeat (int): repeat the operation this many times (default: 1).
+        batch_size (int): number of concurrent operations to await together
+            with [`asyncio.gather()`][asyncio.gather] (default: 1).
 
     Returns:
         list of times for each operation to complete.
@@ -28,7 +44,12 @@ async def test_evict(
 
     for _ in range(repeat):
         start = time.perf_counter_ns()
-        await endpoint.evict('missing-key', target_endpoint)
+        await _gather(
+            *(
+                endpoint.evict(f'missing-key-{i}', target_endpoint)
+                for i in range(batch_size)
+            ),
+        )
         end = time.perf_counter_ns()
         times_ms.append((end - start) / 1e6)
 
@@ -39,6 +60,7 @@ async def test_exists(
     endpoint: Endpoint,
     target_endpoint: uuid.UUID | None,
     repeat: int = 1,
+    batch_size: int = 1,
 ) -> list[float]:
     """Test endpoint key exists.
 
@@ -47,6 +69,8 @@ async def test_exists(
         target_endpoint (UUID): optional UUID of target endpoint to perform
             operation on (local endpoint forwards op to target).
         repeat (int): repeat the operation this many times (default: 1).
+        batch_size (int): number of concurrent operations to await together
+            with [`asyncio.gather()`][asyncio.gather] (default: 1).
 
     Returns:
         list of times for each operation to complete.
@@ -55,7 +79,12 @@ async def test_exists(
 
     for _ in range(repeat):
         start = time.perf_counter_ns()
-        await endpoint.exists('missing-key', target_endpoint)
+        await _gather(
+            *(
+                endpoint.exists(f'missing-key-{i}', target_endpoint)
+                for i in range(batch_size)
+            ),
+        )
         end = time.perf_counter_ns()
         times_ms.append((end - start) / 1e6)
 
@@ -67,6 +96,7 @@ async def test_get(
     target_endpoint: uuid.UUID | None,
     payload_size_bytes: int,
     repeat: int = 1,
+    batch_size: int = 1,
 ) -> list[float]:
     """Test endpoint get data.
 
@@ -77,6 +107,8 @@ async def test_get(
         payload_size_bytes (int): size of payload to request from target
             endpoint.
         repeat (int): repeat the operation this many times (default: 1).
+        batch_size (int): number of concurrent operations to await together
+            with [`asyncio.gather()`][asyncio.gather] (default: 1).
 
     Returns:
         list of times for each operation to complete.
@@ -84,16 +116,21 @@ async def test_get(
     times_ms: list[float] = []
 
     data = randbytes(payload_size_bytes)
-    await endpoint.set('key', data, target_endpoint)
+    keys = [f'key-{i}' for i in range(batch_size)]
+    for key in keys:
+        await endpoint.set(key, data, target_endpoint)
 
     for _ in range(repeat):
         start = time.perf_counter_ns()
-        res = await endpoint.get('key', target_endpoint)
-        assert isinstance(res, bytes)
+        res = await _gather(
+            *(endpoint.get(key, target_endpoint) for key in keys),
+        )
+        assert all(isinstance(value, bytes) for value in res)
         end = time.perf_counter_ns()
         times_ms.append((end - start) / 1e6)
 
-    await endpoint.evict('key')
+    for key in keys:
+        await endpoint.evict(key, target_endpoint)
 
     return times_ms
 
@@ -103,6 +140,7 @@ async def test_set(
     target_endpoint: uuid.UUID | None,
     payload_size_bytes: int,
     repeat: int = 1,
+    batch_size: int = 1,
 ) -> list[float]:
     """Test endpoint set data.
 
@@ -113,6 +151,8 @@ async def test_set(
         payload_size_bytes (int): size of payload to request from target
             endpoint.
         repeat (int): repeat the operation this many times (default: 1).
+        batch_size (int): number of concurrent operations to await together
+            with [`asyncio.gather()`][asyncio.gather] (default: 1).
 
     Returns:
         list of times for each operation to complete.
@@ -122,13 +162,16 @@ async def test_set(
     data = randbytes(payload_size_bytes)
 
     for i in range(repeat):
-        key = f'key-{i}'
+        keys = [f'key-{i}-{j}' for j in range(batch_size)]
         start = time.perf_counter_ns()
-        await endpoint.set(key, data, target_endpoint)
+        await _gather(
+            *(endpoint.set(key, data, target_endpoint) for key in keys),
+        )
         end = time.perf_counter_ns()
         times_ms.append((end - start) / 1e6)
 
-        # Evict key immediately to keep memory usage low
-        await endpoint.evict(key)
+        # Evict keys immediately to keep memory usage low
+        for key in keys:
+            await endpoint.evict(key, target_endpoint)
 
     return times_ms
@@ -0,0 +1,407 @@
+"""Local stand-ins for remote Redis servers and endpoints.
+
+The stand-ins run on the local machine so the remote operations benchmark
+can run without a Redis server, remote endpoint, or relay server. Both
+stand-ins send data over an
+[`EmulatedLink`][psbench.benchmarks.remote_ops.local.EmulatedLink] with an
+optional latency and bandwidth cap so batching, pipelining, and concurrency
+can be compared reproducibly on one machine.
+"""
+
+from __future__ import annotations
+
+import asyncio
+import contextlib
+import logging
+import sys
+import threading
+import uuid
+from collections.abc import AsyncGenerator
+from collections.abc import Sequence
+from types import TracebackType
+from typing import Any
+
+if sys.version_info >= (3, 11):  # pragma: >=3.11 cover
+    from typing import Self
+else:  # pragma: <3.11 cover
+    from typing_extensions import Self
+
+from proxystore.endpoint.endpoint import Endpoint
+
+logger = logging.getLogger(__name__)
+
+
+class EmulatedLink:
+    """Network link with a fixed latency and a bandwidth cap.
+
+    Transfers are serialized on the link so concurrent transfers share the
+    bandwidth. Times are in seconds of the event loop clock.
+
+    Args:
+        latency_ms: one-way latency added to each transfer.
+        bandwidth_mbps: bandwidth cap in MB/s. No cap if `None`.
+    """
+
+    def __init__(
+        self,
+        latency_ms: float = 0,
+        bandwidth_mbps: float | None = None,
+    ) -> None:
+        if latency_ms < 0:
+            raise ValueError('Latency cannot be negative.')
+        if bandwidth_mbps is not None and bandwidth_mbps <= 0:
+            raise ValueError('Bandwidth must be greater than zero.')
+
+        self.latency_ms = latency_ms
+        self.bandwidth_mbps = bandwidth_mbps
+        self._free_at = 0.0
+
+    def deliver_at(self, now: float, nbytes: int) -> float:
+        """Get the time a transfer started at `now` is delivered."""
+        if self.bandwidth_mbps is None:
+            sent = now
+        else:
+            sent = max(now, self._free_at) + nbytes / (
+                self.bandwidth_mbps * 1e6
+            )
+            self._free_at = sent
+        return sent + self.latency_ms / 1000
+
+
+def _bulk(value: bytes | None) -> list[bytes]:
+    if value is None:
+        return [b'$-1\r\n']
+    return [b'$%d\r\n' % len(value), value, b'\r\n']
+
+
+def _integer(value: int) -> list[bytes]:
+    return [b':%d\r\n' % value]
+
+
+async def _read_command(
+    reader: asyncio.StreamReader,
+) -> tuple[list[bytes], int] | None:
+    line = await reader.readline()
+    if not line:
+        return None
+    if not line.startswith(b'*'):
+        # Inline commands are used by tools like redis-cli and telnet.
+        return line.split(), len(line)
+
+    nbytes = len(line)
+    args: list[bytes] = []
+    for _ in range(int(line[1:])):
+        header = await reader.readline()
+        size = int(header[1:])
+        data = await reader.readexactly(size + 2)
+        args.append(data[:-2])
+        nbytes += len(header) + len(data)
+    return args, nbytes
+
+
+class LocalRedisServer:
+    """In-process Redis server stand-in.
+
+    Serves the subset of the Redis protocol (RESP) used by the remote
+    operations benchmark (`PING`, `GET`, `SET`, `MGET`, `MSET`, `DEL`, and
+    `EXISTS`) from an asyncio TCP server in a background thread. Each
+    response is delayed by the time for the request and response to
+    traverse the link.
+
+    Example:
+        ```python
+        import redis
+
+        with LocalRedisServer(latency_ms=1) as server:
+            client = redis.StrictRedis(host=server.host, port=server.port)
+            client.set('key', b'value')
+        ```
+
+    Args:
+        host: address to bind to.
+        port: port to bind to. A free port is chosen if `0`.
+        latency_ms: one-way latency of the emulated link.
+        bandwidth_mbps: bandwidth cap in MB/s of the emulated link.
+    """
+
+    def __init__(
+        self,
+        host: str = '127.0.0.1',
+        port: int = 0,
+        *,
+        latency_ms: float = 0,
+        bandwidth_mbps: float | None = None,
+    ) -> None:
+        self.host = host
+        self.port = port
+        self.link = EmulatedLink(latency_ms, bandwidth_mbps)
+        self.data: dict[bytes, bytes] = {}
+
+        self._started = threading.Event()
+        self._thread: threading.Thread | None = None
+        self._loop: asyncio.AbstractEventLoop | None = None
+        self._stop: asyncio.Event | None = None
+        self._handlers: dict[asyncio.Task[Any], asyncio.StreamWriter] = {}
+        self._error: BaseException | None = None
+
+    def __enter__(self) -> Self:
+        self.start()
+        return self
+
+    def __exit__(
+        self,
+        exc_type: type[BaseException] | None,
+        exc_value: BaseException | None,
+        exc_traceback: TracebackType | None,
+    ) -> None:
+        self.stop()
+
+    def start(self) -> None:
+        """Start the server in a background thread.
+
+        Raises:
+            RuntimeError: if the server is already running.
+        """
+        if self._thread is not None:
+            raise RuntimeError('The server is already running.')
+        self._started.clear()
+        self._thread = threading.Thread(
+            target=asyncio.run,
+            args=(self._serve(),),
+            name='local-redis-server',
+            daemon=True,
+        )
+        self._thread.start()
+        self._started.wait()
+        if self._error is not None:
+            self._thread.join()
+            self._thread = None
+            raise self._error
+
+    def stop(self) -> None:
+        """Stop the server and wait for the background thread to exit."""
+        if self._thread is None:
+            return
+        assert self._loop is not None
+        assert self._stop is not None
+        self._loop.call_soon_threadsafe(self._stop.set)
+        self._thread.join()
+        self._thread = None
+
+    async def _serve(self) -> None:
+        self._loop = asyncio.get_running_loop()
+        self._stop = asyncio.Event()
+        try:
+            server = await asyncio.start_server(
+                self._handle,
+                self.host,
+                self.port,
+            )
+        except OSError as e:
+            self._error = e
+            self._started.set()
+            return
+
+        self.port = server.sockets[0].getsockname()[1]
+        logger.debug(
+            f'Local Redis server listening on {self.host}:{self.port}',
+        )
+        self._started.set()
+
+        await self._stop.wait()
+        server.close()
+        # Clients may keep connections open indefinitely so close them
+        # rather than waiting.
+        for writer in self._handlers.values():
+            writer.close()
+        await asyncio.gather(*self._handlers, return_exceptions=True)
+        await server.wait_closed()
+
+    async def _handle(
+        self,
+        reader: asyncio.StreamReader,
+        writer: asyncio.StreamWriter,
+    ) -> None:
+        loop = asyncio.get_running_loop()
+        # Responses are written in order once delivered over the link.
+        responses: asyncio.Queue[tuple[float, list[bytes]] | None] = (
+            asyncio.Queue()
+        )
+
+        async def _write_responses() -> None:
+            while (item := await responses.get()) is not None:
+                deliver_at, response = item
+                await asyncio.sleep(max(0, deliver_at - loop.time()))
+                writer.writelines(response)
+                await writer.drain()
+
+        handler = asyncio.current_task()
+        assert handler is not None
+        self._handlers[handler] = writer
+        write_task = asyncio.create_task(_write_responses())
+        try:
+            while (command := await _read_command(reader)) is not None:
+                args, request_bytes = command
+                now = loop.time()
+                response = self._execute(args)
+                response_bytes = sum(len(part) for part in response)
+                arrived = self.link.deliver_at(now, request_bytes)
+                deliver_at = self.link.deliver_at(arrived, response_bytes)
+                responses.put_nowait((deliver_at, response))
+            responses.put_nowait(None)
+            await write_task
+        except (ConnectionError, asyncio.IncompleteReadError):
+            write_task.cancel()
+        finally:
+            self._handlers.pop(handler, None)
+            writer.close()
+
+    def _execute(self, args: Sequence[bytes]) -> list[bytes]:
+        if len(args) == 0:
+            return [b'-ERR empty command\r\n']
+
+        name = args[0].upper()
+        keys = args[1:]
+        if name == b'PING':
+            return [b'+PONG\r\n']
+        elif name in (b'CLIENT', b'SELECT'):
+            # redis-py sends CLIENT SETINFO when connecting.
+            return [b'+OK\r\n']
+        elif name == b'GET' and len(keys) == 1:
+            return _bulk(self.data.get(keys[0]))
+        elif name == b'SET' and len(keys) >= 2:
+            self.data[keys[0]] = keys[1]
+            return [b'+OK\r\n']
+        elif name == b'MGET':
+            response = [b'*%d\r\n' % len(keys)]
+            for key in keys:
+                response.extend(_bulk(self.data.get(key)))
+            return response
+        elif name == b'MSET' and len(keys) % 2 == 0:
+            self.data.update(zip(keys[::2], keys[1::2], strict=True))
+            return [b'+OK\r\n']
+        elif name == b'DEL':
+            count = sum(self.data.pop(key, None) is not None for key in keys)
+            return _integer(count)
+        elif name == b'EXISTS':
+            return _integer(sum(key in self.data for key in keys))
+        else:
+            command = args[0].decode(errors='replace')
+            return [b"-ERR unknown command '%s'\r\n" % command.encode()]
+
+
+class LocalPeerNetwork:
+    """In-process network which connects endpoints without a relay server.
+
+    Args:
+        latency_ms: one-way latency of the emulated link.
+        bandwidth_mbps: bandwidth cap in MB/s of the emulated link.
+    """
+
+    def __init__(
+        self,
+        latency_ms: float = 0,
+        bandwidth_mbps: float | None = None,
+    ) -> None:
+        self.link = EmulatedLink(latency_ms, bandwidth_mbps)
+        self._peers: dict[uuid.UUID, LocalPeerManager] = {}
+
+    def register(self, peer: LocalPeerManager) -> None:
+        """Register a peer with the network."""
+        self._peers[peer.uuid] = peer
+
+    def unregister(self, peer: LocalPeerManager) -> None:
+        """Unregister a peer from the network."""
+        self._peers.pop(peer.uuid, None)
+
+    def send(
+        self,
+        source: uuid.UUID,
+        target: uuid.UUID,
+        message: bytes,
+    ) -> None:
+        """Deliver a message to a peer once it traverses the link.
+
+        Raises:
+            ValueError: if the target peer is not registered.
+        """
+        if target not in self._peers:
+            raise ValueError(f'Peer {target} is not connected.')
+        loop = asyncio.get_running_loop()
+        deliver_at = self.link.deliver_at(loop.time(), len(message))
+        loop.call_at(
+            deliver_at,
+            self._peers[target].deliver,
+            source,
+            message,
+        )
+
+
+class LocalPeerManager:
+    """Peer manager stand-in for endpoints on a local peer network.
+
+    Implements the subset of the
+    [`PeerManager`][proxystore.p2p.manager.PeerManager] interface used by
+    an [`Endpoint`][proxystore.endpoint.endpoint.Endpoint].
+
+    Args:
+        network: network to connect to.
+        name: name of the peer.
+        peer_uuid: UUID of the peer. A new UUID is generated if `None`.
+    """
+
+    def __init__(
+        self,
+        network: LocalPeerNetwork,
+        name: str,
+        peer_uuid: uuid.UUID | None = None,
+    ) -> None:
+        self.network = network
+        self.name = name
+        self.uuid = peer_uuid if peer_uuid is not None else uuid.uuid4()
+        self._messages: asyncio.Queue[tuple[uuid.UUID, bytes]] = (
+            asyncio.Queue()
+        )
+
+    async def async_init(self) -> None:
+        """Connect to the network."""
+        self.network.register(self)
+
+    async def close(self) -> None:
+        """Disconnect from the network."""
+        self.network.unregister(self)
+
+    def deliver(self, source: uuid.UUID, message: bytes) -> None:
+        """Deliver a message to this peer."""
+        self._messages.put_nowait((source, message))
+
+    async def recv(self) -> tuple[uuid.UUID, bytes]:
+        """Receive the next message from a peer."""
+        return await self._messages.get()
+
+    async def send(self, peer_uuid: uuid.UUID, message: Any) -> None:
+        """Send a message to a peer."""
+        self.network.send(self.uuid, peer_uuid, message)
+
+
+@contextlib.asynccontextmanager
+async def local_endpoint_pair(
+    network: LocalPeerNetwork,
+) -> AsyncGenerator[tuple[Endpoint, Endpoint], None]:
+    """Create a local and a remote endpoint connected by a local network.
+
+    Yields:
+        Tuple of the local and remote endpoints. Operations on the local
+        endpoint which target the remote endpoint traverse the network.
+    """
+    # The endpoints only use the subset of the PeerManager interface
+    # implemented by LocalPeerManager.
+    async with (
+        Endpoint(
+            peer_manager=LocalPeerManager(network, 'local'),  # type: ignore[arg-type]
+        ) as local,
+        Endpoint(
+            peer_manager=LocalPeerManager(network, 'remote'),  # type: ignore[arg-type]
+        ) as remote,
+    ):
+        yield local, remote
@@ -7,9 +7,10 @@ and Redis servers.
 from __future__ import annotations
 
 import asyncio
+import contextlib
+import itertools
 import logging
 import socket
-import statistics
 import sys
 import uuid
 from typing import Any
@@ -27,21 +28,75 @@ from proxystore.p2p.relay.client import RelayClient
 import psbench.benchmarks.remote_ops.endpoint_ops as endpoint_ops
 import psbench.benchmarks.remote_ops.redis_ops as redis_ops
 from psbench.benchmarks.protocol import ContextManagerAddIn
+from psbench.benchmarks.remote_ops.clients import endpoint_clients
+from psbench.benchmarks.remote_ops.clients import redis_clients
+from psbench.benchmarks.remote_ops.config import BACKEND_TYPE
 from psbench.benchmarks.remote_ops.config import OP_TYPE
 from psbench.benchmarks.remote_ops.config import RunConfig
 from psbench.benchmarks.remote_ops.config import RunResult
+from psbench.benchmarks.remote_ops.local import local_endpoint_pair
+from psbench.benchmarks.remote_ops.local import LocalPeerNetwork
+from psbench.benchmarks.remote_ops.local import LocalRedisServer
+from psbench.histogram import LatencyHistogram
 from psbench.logging import BENCH_LOG_LEVEL
 from psbench.logging import TEST_LOG_LEVEL
 
 logger = logging.getLogger('remote-ops')
 
 
+def _summarize(
+    backend: BACKEND_TYPE,
+    op: OP_TYPE,
+    times_ms: list[float],
+    *,
+    payload_size: int,
+    repeat: int,
+    batch_size: int = 1,
+    clients: int = 1,
+    total_time_ms: float | None = None,
+) -> RunResult:
+    # Operations are serial with a single client so the total time is the
+    # sum of the operation times. Otherwise, the total time is the elapsed
+    # time for all clients to finish.
+    total_time_ms = sum(times_ms) if total_time_ms is None else total_time_ms
+    times = LatencyHistogram.from_values(times_ms)
+    has_payload = op in ('get', 'set')
+    payload_mb = payload_size * batch_size / 1e6
+    ops_per_s = len(times_ms) * batch_size / (total_time_ms / 1000)
+
+    return RunResult(
+        backend=backend,
+        op=op,
+        payload_size_bytes=payload_size if has_payload else None,
+        batch_size=batch_size,
+        clients=clients,
+        repeat=repeat,
+        total_time_ms=total_time_ms,
+        avg_time_ms=times.mean,
+        min_time_ms=times.min,
+        max_time_ms=times.max,
+        stdev_time_ms=times.stdev,
+        p50_time_ms=times.percentile(50),
+        p90_time_ms=times.percentile(90),
+        p99_time_ms=times.percentile(99),
+        p999_time_ms=times.percentile(99.9),
+        avg_bandwidth_mbps=(
+            payload_mb / (times.mean / 1000) if has_payload else None
+        ),
+        ops_per_s=ops_per_s,
+        aggregate_bandwidth_mbps=(
+            ops_per_s * payload_size / 1e6 if has_payload else None
+        ),
+    )
+
+
 async def run_endpoint(
     endpoint: Endpoint,
     remote_endpoint: uuid.UUID | None,
     op: OP_TYPE,
     payload_size: int = 0,
     repeat: int = 3,
+    batch_size: int = 1,
 ) -> RunResult:
     """Run test for single operation and measure performance.
 
@@ -54,6 +109,9 @@ async def run_endpoint(
             than or equal to three, the slowest and fastest times will be
             dropped to account for the first op being slower while establishing
             a connection.
+        batch_size (int): number of keys per batched operation. Reported
+            times are per batch and the bandwidth is the aggregate bandwidth
+            of the batch.
 
     Returns:
         RunResult with summary of test run.
@@ -65,12 +123,14 @@ async def run_endpoint(
             endpoint,
             remote_endpoint,
             repeat,
+            batch_size,
         )
     elif op == 'exists':
         times_ms = await endpoint_ops.test_exists(
             endpoint,
             remote_endpoint,
             repeat,
+            batch_size,
         )
     elif op == 'get':
         times_ms = await endpoint_ops.test_get(
@@ -78,6 +138,7 @@ async def run_endpoint(
             remote_endpoint,
             payload_size,
             repeat,
+            batch_size,
         )
     elif op == 'set':
         times_ms = await endpoint_ops.test_set(
@@ -85,6 +146,7 @@ async def run_endpoint(
             remote_endpoint,
             payload_size,
             repeat,
+            batch_size,
         )
     else:
         raise AssertionError(f'Unsupported operation {op}')
@@ -92,25 +154,13 @@ async def run_endpoint(
     if len(times_ms) >= 3:
         times_ms = times_ms[1:-1]
 
-    avg_time_s = sum(times_ms) / 1000 / len(times_ms)
-    payload_mb = payload_size / 1e6
-    avg_bandwidth_mbps = (
-        payload_mb / avg_time_s if op in ('get', 'set') else None
-    )
-
-    return RunResult(
-        backend='endpoint',
-        op=op,
-        payload_size_bytes=payload_size if op in ('get', 'set') else None,
+    return _summarize(
+        'endpoint',
+        op,
+        times_ms,
+        payload_size=payload_size,
         repeat=repeat,
-        total_time_ms=sum(times_ms),
-        avg_time_ms=sum(times_ms) / len(times_ms),
-        min_time_ms=min(times_ms),
-        max_time_ms=max(times_ms),
-        stdev_time_ms=(
-            statistics.stdev(times_ms) if len(times_ms) > 1 else 0.0
-        ),
-        avg_bandwidth_mbps=avg_bandwidth_mbps,
+        batch_size=batch_size,
     )
 
 
@@ -119,6 +169,7 @@ def run_redis(
     op: OP_TYPE,
     payload_size: int = 0,
     repeat: int = 3,
+    batch_size: int = 1,
 ) -> RunResult:
     """Run test for single operation and measure performance.
 
@@ -130,6 +181,9 @@ def run_redis(
             than or equal to three, the slowest and fastest times will be
             dropped to account for the first op being slower while establishing
             a connection.
+        batch_size (int): number of keys per batched operation. Reported
+            times are per batch and the bandwidth is the aggregate bandwidth
+            of the batch.
 
     Returns:
         RunResult with summary of test run.
@@ -137,38 +191,138 @@ def run_redis(
     logger.log(TEST_LOG_LEVEL, f'starting remote redis test for {op}')
 
     if op == 'evict':
-        times_ms = redis_ops.test_evict(client, repeat)
+        times_ms = redis_ops.test_evict(client, repeat, batch_size)
     elif op == 'exists':
-        times_ms = redis_ops.test_exists(client, repeat)
+        times_ms = redis_ops.test_exists(client, repeat, batch_size)
     elif op == 'get':
-        times_ms = redis_ops.test_get(client, payload_size, repeat)
+        times_ms = redis_ops.test_get(
+            client,
+            payload_size,
+            repeat,
+            batch_size,
+        )
     elif op == 'set':
-        times_ms = redis_ops.test_set(client, payload_size, repeat)
+        times_ms = redis_ops.test_set(
+            client,
+            payload_size,
+            repeat,
+            batch_size,
+        )
     else:
         raise AssertionError(f'Unsupported operation {op}')
 
     if len(times_ms) >= 3:
         times_ms = times_ms[1:-1]
 
-    avg_time_s = sum(times_ms) / 1000 / len(times_ms)
-    payload_mb = payload_size / 1e6
-    avg_bandwidth_mbps = (
-        payload_mb / avg_time_s if op in ('get', 'set') else None
+    return _summarize(
+        'redis',
+        op,
+        times_ms,
+        payload_size=payload_size,
+        repeat=repeat,
+        batch_size=batch_size,
     )
 
-    return RunResult(
-        backend='redis',
-        op=op,
-        payload_size_bytes=payload_size if op in ('get', 'set') else None,
+
+async def run_endpoint_clients(
+    endpoint: Endpoint,
+    remote_endpoint: uuid.UUID | None,
+    op: OP_TYPE,
+    payload_size: int = 0,
+    repeat: int = 3,
+    batch_size: int = 1,
+    clients: int = 2,
+) -> RunResult:
+    """Run test for single operation with concurrent clients.
+
+    Args:
+        endpoint (Endpoint): local endpoint shared by the clients.
+        remote_endpoint (UUID): UUID of remote endpoint to peer with.
+        op (str): endpoint operation to test.
+        payload_size (int): bytes to send/receive for GET/SET operations.
+        repeat (int): number of operations performed by each client.
+        batch_size (int): number of keys per batched operation.
+        clients (int): number of concurrent clients.
+
+    Returns:
+        RunResult with summary of test run.
+    """
+    logger.log(
+        TEST_LOG_LEVEL,
+        f'starting endpoint peering test for {op} with {clients} clients',
+    )
+
+    stats = await endpoint_clients(
+        endpoint,
+        remote_endpoint,
+        op,
+        clients=clients,
+        payload_size_bytes=payload_size,
+        repeat=repeat,
+        batch_size=batch_size,
+    )
+
+    return _summarize(
+        'endpoint',
+        op,
+        stats.latencies_ms,
+        payload_size=payload_size,
         repeat=repeat,
-        total_time_ms=sum(times_ms),
-        avg_time_ms=sum(times_ms) / len(times_ms),
-        min_time_ms=min(times_ms),
-        max_time_ms=max(times_ms),
-        stdev_time_ms=(
-            statistics.stdev(times_ms) if len(times_ms) > 1 else 0.0
+        batch_size=batch_size,
+        clients=clients,
+        total_time_ms=stats.total_time_ms,
+    )
+
+
+def run_redis_clients(
+    host: str,
+    port: int,
+    op: OP_TYPE,
+    payload_size: int = 0,
+    repeat: int = 3,
+    batch_size: int = 1,
+    clients: int = 2,
+) -> RunResult:
+    """Run test for single operation with concurrent clients.
+
+    Args:
+        host (str): remote Redis server hostname/IP.
+        port (int): remote Redis server port.
+        op (str): endpoint operation to test.
+        payload_size (int): bytes to send/receive for GET/SET operations.
+        repeat (int): number of operations performed by each client.
+        batch_size (int): number of keys per batched operation.
+        clients (int): number of concurrent clients.
+
+    Returns:
+        RunResult with summary of test run.
+    """
+    logger.log(
+        TEST_LOG_LEVEL,
+        f'starting remote redis test for {op} with {clients} clients',
+    )
+
+    stats = asyncio.run(
+        redis_clients(
+            host,
+            port,
+            op,
+            clients=clients,
+            payload_size_bytes=payload_size,
+            repeat=repeat,
+            batch_size=batch_size,
         ),
-        avg_bandwidth_mbps=avg_bandwidth_mbps,
+    )
+
+    return _summarize(
+        'redis',
+        op,
+        stats.latencies_ms,
+        payload_size=payload_size,
+        repeat=repeat,
+        batch_size=batch_size,
+        clients=clients,
+        total_time_ms=stats.total_time_ms,
     )
 
 
@@ -179,6 +333,9 @@ async def runner_endpoint(
     payload_sizes: list[int],
     repeat: int,
     relay_server: str | None = None,
+    batch_sizes: list[int] | None = None,
+    clients: list[int] | None = None,
+    network: LocalPeerNetwork | None = None,
 ) -> list[RunResult]:
     """Run matrix of test test configurations with an Endpoint.
 
@@ -188,29 +345,58 @@ async def runner_endpoint(
         payload_sizes (int): bytes to send/receive for GET/SET operations.
         repeat (int): number of times to repeat operations.
         relay_server (str): relay server address
+        batch_sizes (int): number of keys per batched operation.
+        clients (int): numbers of concurrent clients.
+        network (LocalPeerNetwork): optional local network to connect a
+            local and remote endpoint with instead of a relay server. The
+            `remote_endpoint` and `relay_server` are ignored if provided.
     """
+    batch_sizes = batch_sizes if batch_sizes is not None else [1]
+    clients = clients if clients is not None else [1]
     results: list[RunResult] = []
-    manager = (
-        PeerManager(RelayClient(relay_server))
-        if relay_server is not None
-        else None
-    )
-    async with Endpoint(
-        name=socket.gethostname(),
-        uuid=uuid.uuid4(),
-        peer_manager=manager,
-    ) as endpoint:
-        for op in ops:
+    async with contextlib.AsyncExitStack() as stack:
+        if network is not None:
+            endpoint, remote = await stack.enter_async_context(
+                local_endpoint_pair(network),
+            )
+            remote_endpoint = remote.uuid
+        else:
+            manager = (
+                PeerManager(RelayClient(relay_server))
+                if relay_server is not None
+                else None
+            )
+            endpoint = await stack.enter_async_context(
+                Endpoint(
+                    name=socket.gethostname(),
+                    uuid=uuid.uuid4(),
+                    peer_manager=manager,
+                ),
+            )
+
+        for op, batch_size, n in itertools.product(ops, batch_sizes, clients):
             for i, payload_size in enumerate(payload_sizes):
                 # Only need to repeat for payload_size for GET/SET
                 if i == 0 or op in ['get', 'set']:
-                    result = await run_endpoint(
-                        endpoint,
-                        remote_endpoint=remote_endpoint,
-                        op=op,
-                        payload_size=payload_size,
-                        repeat=repeat,
-                    )
+                    if n == 1:
+                        result = await run_endpoint(
+                            endpoint,
+                            remote_endpoint=remote_endpoint,
+                            op=op,
+                            payload_size=payload_size,
+                            repeat=repeat,
+                            batch_size=batch_size,
+                        )
+                    else:
+                        result = await run_endpoint_clients(
+                            endpoint,
+                            remote_endpoint=remote_endpoint,
+                            op=op,
+                            payload_size=payload_size,
+                            repeat=repeat,
+                            batch_size=batch_size,
+                            clients=n,
+                        )
                     logger.log(TEST_LOG_LEVEL, results)
                     results.append(result)
     return results
@@ -223,6 +409,8 @@ def runner_redis(
     *,
     payload_sizes: list[int],
     repeat: int,
+    batch_sizes: list[int] | None = None,
+    clients: list[int] | None = None,
 ) -> list[RunResult]:
     """Run matrix of test test configurations with a Redis server.
 
@@ -232,19 +420,37 @@ def runner_redis(
         ops (str): endpoint operations to test.
         payload_sizes (int): bytes to send/receive for GET/SET operations.
         repeat (int): number of times to repeat operations.
+        batch_sizes (int): number of keys per batched operation.
+        clients (int): numbers of concurrent clients. A single client uses a
+            synchronous Redis client and multiple clients share an asyncio
+            Redis connection pool.
     """
+    batch_sizes = batch_sizes if batch_sizes is not None else [1]
+    clients = clients if clients is not None else [1]
     client = redis.StrictRedis(host=host, port=port)
     results: list[RunResult] = []
-    for op in ops:
+    for op, batch_size, n in itertools.product(ops, batch_sizes, clients):
         for i, payload_size in enumerate(payload_sizes):
             # Only need to repeat for payload_size for GET/SET
             if i == 0 or op in ['get', 'set']:
-                result = run_redis(
-                    client,
-                    op=op,
-                    payload_size=payload_size,
-                    repeat=repeat,
-                )
+                if n == 1:
+                    result = run_redis(
+                        client,
+                        op=op,
+                        payload_size=payload_size,
+                        repeat=repeat,
+                        batch_size=batch_size,
+                    )
+                else:
+                    result = run_redis_clients(
+                        host,
+                        port,
+                        op=op,
+                        payload_size=payload_size,
+                        repeat=repeat,
+                        batch_size=batch_size,
+                        clients=n,
+                    )
                 logger.log(TEST_LOG_LEVEL, result)
                 results.append(result)
     return results
@@ -262,6 +468,9 @@ class Benchmark(ContextManagerAddIn):
         redis_host: str | None = None,
         redis_port: int | None = None,
         use_uvloop: bool = False,
+        local: bool = False,
+        local_latency_ms: float = 0,
+        local_bandwidth_mbps: float | None = None,
     ) -> None:
         if use_uvloop:
             try:
@@ -288,6 +497,9 @@ class Benchmark(ContextManagerAddIn):
         self.redis_host = redis_host
         self.redis_port = redis_port
         self.use_uvloop = use_uvloop
+        self.local = local
+        self.local_latency_ms = local_latency_ms
+        self.local_bandwidth_mbps = local_bandwidth_mbps
         super().__init__()
 
     def config(self) -> dict[str, Any]:
@@ -297,6 +509,9 @@ class Benchmark(ContextManagerAddIn):
             'redis_host': self.redis_host,
             'redis_port': self.redis_port,
             'use_uvloop': self.use_uvloop,
+            'local': self.local,
+            'local_latency_ms': self.local_latency_ms,
+            'local_bandwidth_mbps': self.local_bandwidth_mbps,
         }
 
     def run(self, config: RunConfig) -> list[RunResult]:
@@ -313,8 +528,32 @@ class Benchmark(ContextManagerAddIn):
                     payload_sizes=config.payload_sizes,
                     repeat=config.repeat,
                     relay_server=self.relay_server,
+                    batch_sizes=config.batch_sizes,
+                    clients=config.clients,
+                    network=(
+                        LocalPeerNetwork(
+                            self.local_latency_ms,
+                            self.local_bandwidth_mbps,
+                        )
+                        if self.local
+                        else None
+                    ),
                 ),
             )
+        elif config.backend == 'redis' and self.local:
+            with LocalRedisServer(
+                latency_ms=self.local_latency_ms,
+                bandwidth_mbps=self.local_bandwidth_mbps,
+            ) as server:
+                results = runner_redis(
+                    server.host,
+                    server.port,
+                    config.ops,
+                    payload_sizes=config.payload_sizes,
+                    repeat=config.repeat,
+                    batch_sizes=config.batch_sizes,
+                    clients=config.clients,
+                )
         elif config.backend == 'redis':
             assert self.redis_host is not None
             assert self.redis_port is not None
@@ -324,6 +563,8 @@ class Benchmark(ContextManagerAddIn):
                 config.ops,
                 payload_sizes=config.payload_sizes,
                 repeat=config.repeat,
+                batch_sizes=config.batch_sizes,
+                clients=config.clients,
             )
         else:
             raise AssertionError('Unreachable.')
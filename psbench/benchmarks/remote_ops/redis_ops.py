@@ -8,24 +8,42 @@ import redis
 from psbench.utils import randbytes
 
 
+def _pipeline(
+    client: redis.StrictRedis[Any],
+    command: str,
+    keys: list[str],
+) -> list[Any]:
+    with client.pipeline(transaction=False) as pipeline:
+        for key in keys:
+            getattr(pipeline, command)(key)
+        return pipeline.execute()
+
+
 def test_evict(
     client: redis.StrictRedis[Any],
     repeat: int = 1,
+    batch_size: int = 1,
 ) -> list[float]:
     """Test Redis eviction.
 
     Args:
         client (StrictRedis): client connection to remote Redis server.
         repeat (int): repeat the operation this many times (default: 1).
+        batch_size (int): number of keys per operation. Batches are sent
+            in a single pipeline (default: 1).
 
     Returns:
         list of times for each operation to complete.
     """
     times_ms: list[float] = []
+    keys = [f'missing-key-{i}' for i in range(batch_size)]
 
     for _ in range(repeat):
         start = time.perf_counter_ns()
-        client.delete('missing-key')
+        if batch_size == 1:
+            client.delete('missing-key')
+        else:
+            _pipeline(client, 'delete', keys)
         end = time.perf_counter_ns()
         times_ms.append((end - start) / 1e6)
 
@@ -35,21 +53,28 @@ def test_evict(
 def test_exists(
     client: redis.StrictRedis[Any],
     repeat: int = 1,
+    batch_size: int = 1,
 ) -> list[float]:
     """Test Redis key exists.
 
     Args:
         client (StrictRedis): client connection to remote Redis server.
         repeat (int): repeat the operation this many times (default: 1).
+        batch_size (int): number of keys per operation. Batches are sent
+            in a single pipeline (default: 1).
 
     Returns:
         list of times for each operation to complete.
     """
     times_ms: list[float] = []
+    keys = [f'missing-key-{i}' for i in range(batch_size)]
 
     for _ in range(repeat):
         start = time.perf_counter_ns()
-        client.exists('missing-key')
+        if batch_size == 1:
+            client.exists('missing-key')
+        else:
+            _pipeline(client, 'exists', keys)
         end = time.perf_counter_ns()
         times_ms.append((end - start) / 1e6)
 
@@ -60,6 +85,7 @@ def test_get(
     client: redis.StrictRedis[Any],
     payload_size_bytes: int,
     repeat: int = 1,
+    batch_size: int = 1,
 ) -> list[float]:
     """Test Redis get data.
 
@@ -68,6 +94,8 @@ def test_get(
         payload_size_bytes (int): size of payload to request from target
             endpoint.
         repeat (int): repeat the operation this many times (default: 1).
+        batch_size (int): number of keys per operation. Batches are sent
+            with a single `MGET` (default: 1).
 
     Returns:
         list of times for each operation to complete.
@@ -75,16 +103,23 @@ def test_get(
     times_ms: list[float] = []
 
     data = randbytes(payload_size_bytes)
-    client.set('key', data)
+    keys = (
+        ['key'] if batch_size == 1 else [f'key-{i}' for i in range(batch_size)]
+    )
+    client.mset(dict.fromkeys(keys, data))
 
     for _ in range(repeat):
         start = time.perf_counter_ns()
-        res = client.get('key')
-        assert isinstance(res, bytes)
+        if batch_size == 1:
+            res = client.get('key')
+            assert isinstance(res, bytes)
+        else:
+            values = client.mget(keys)
+            assert all(isinstance(value, bytes) for value in values)
         end = time.perf_counter_ns()
         times_ms.append((end - start) / 1e6)
 
-    client.delete('key')
+    client.delete(*keys)
 
     return times_ms
 
@@ -93,6 +128,7 @@ def test_set(
     client: redis.StrictRedis[Any],
     payload_size_bytes: int,
     repeat: int = 1,
+    batch_size: int = 1,
 ) -> list[float]:
     """Test Redis set data.
 
@@ -101,6 +137,8 @@ def test_set(
         payload_size_bytes (int): size of payload to request from target
             endpoint.
         repeat (int): repeat the operation this many times (default: 1).
+        batch_size (int): number of keys per operation. Batches are sent
+            with a single `MSET` (default: 1).
 
     Returns:
         list of times for each operation to complete.
@@ -110,13 +148,23 @@ def test_set(
     data = randbytes(payload_size_bytes)
 
     for i in range(repeat):
-        key = f'key-{i}'
-        start = time.perf_counter_ns()
-        client.set(key, data)
-        end = time.perf_counter_ns()
+        if batch_size == 1:
+            key = f'key-{i}'
+            start = time.perf_counter_ns()
+            client.set(key, data)
+            end = time.perf_counter_ns()
+            keys = [key]
+        else:
+            mapping: dict[Any, bytes] = {
+                f'key-{i}-{j}': data for j in range(batch_size)
+            }
+            start = time.perf_counter_ns()
+            client.mset(mapping)
+            end = time.perf_counter_ns()
+            keys = list(mapping)
         times_ms.append((end - start) / 1e6)
 
-        # Evict key immediately to keep memory usage low
-        client.delete(key)
+        # Evict keys immediately to keep memory usage low
+        client.delete(*keys)
 
     return times_ms
@@ -0,0 +1,123 @@
+from __future__ import annotations
+
+import argparse
+import itertools
+import sys
+from typing import Any
+from typing import List  # noqa: UP035
+
+if sys.version_info >= (3, 11):  # pragma: >=3.11 cover
+    from typing import Self
+else:  # pragma: <3.11 cover
+    from typing_extensions import Self
+
+from pydantic import BaseModel
+from pydantic import Field
+
+from psbench.benchmarks.serialization.serializers import COMPRESSION_TYPE
+from psbench.benchmarks.serialization.serializers import SERIALIZER_TYPE
+from psbench.payload import PAYLOAD_KINDS
+from psbench.payload import PayloadKind
+
+
+class RunConfig(BaseModel):
+    serializer: SERIALIZER_TYPE
+    compression: COMPRESSION_TYPE
+    payload_kind: PayloadKind
+    payload_size_bytes: int
+    iterations: int = Field(1, ge=1)
+
+
+class RunResult(BaseModel):
+    serializer: SERIALIZER_TYPE
+    compression: COMPRESSION_TYPE
+    payload_kind: PayloadKind
+    payload_size_bytes: int
+    serialized_size_bytes: int
+    iterations: int
+    serialize_ms: float
+    deserialize_ms: float
+    serialize_bandwidth_mbps: float
+    deserialize_bandwidth_mbps: float
+    serialize_peak_memory_bytes: int
+    deserialize_peak_memory_bytes: int
+
+
+class BenchmarkMatrix(BaseModel):
+    serializers: List[SERIALIZER_TYPE]  # noqa: UP006
+    compressions: List[COMPRESSION_TYPE]  # noqa: UP006
+    payload_kinds: List[PayloadKind]  # noqa: UP006
+    payload_sizes: List[int]  # noqa: UP006
+    iterations: int
+
+    @staticmethod
+    def add_parser_group(parser: argparse.ArgumentParser) -> None:
+        group = parser.add_argument_group(title='Benchmark Parameters')
+        group.add_argument(
+            '--serializers',
+            choices=['proxystore', 'pickle', 'pickle-oob'],
+            nargs='+',
+            default=['proxystore', 'pickle', 'pickle-oob'],
+            help=(
+                'Serializers to test: the default ProxyStore serializer or '
+                'pickle protocol 5 with in-band or out-of-band buffers'
+            ),
+        )
+        group.add_argument(
+            '--compressions',
+            choices=['none', 'zlib', 'lzma', 'bz2'],
+            nargs='+',
+            default=['none'],
+            help='Compression layers to apply after serialization',
+        )
+        group.add_argument(
+            '--payload-kinds',
+            choices=PAYLOAD_KINDS,
+            nargs='+',
+            default=['bytes'],
+            help='Kinds of payloads to serialize',
+        )
+        group.add_argument(
+            '--payload-sizes',
+            metavar='BYTES',
+            type=int,
+            nargs='+',
+            required=True,
+            help='Payload sizes in bytes',
+        )
+        group.add_argument(
+            '--iterations',
+            metavar='N',
+            type=int,
+            default=10,
+            help='Serialize/deserialize round trips to average within a run',
+        )
+
+    @classmethod
+    def from_args(cls, **kwargs: Any) -> Self:
+        return cls(
+            serializers=kwargs['serializers'],
+            compressions=kwargs['compressions'],
+            payload_kinds=kwargs['payload_kinds'],
+            payload_sizes=kwargs['payload_sizes'],
+            iterations=kwargs['iterations'],
+        )
+
+    def configs(self) -> tuple[RunConfig, ...]:
+        return tuple(
+            RunConfig(
+                serializer=serializer,
+                compression=compression,
+                payload_kind=payload_kind,
+                payload_size_bytes=payload_size,
+                iterations=self.iterations,
+            )
+            for serializer, compression, payload_kind, payload_size in (
+                itertools.product(
+                    self.serializers,
+                    self.compressions,
+                    self.payload_kinds,
+                    self.payload_sizes,
+                )
+            )
+        )
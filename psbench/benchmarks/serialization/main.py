@@ -0,0 +1,126 @@
+"""Serialization microbenchmark.
+
+Isolates the serialization and compression costs which dominate
+`store.put` and `factory.resolve` times for large objects.
+"""
+
+from __future__ import annotations
+
+import gc
+import logging
+import statistics
+import time
+import tracemalloc
+from collections.abc import Callable
+from typing import Any
+from typing import TypeVar
+
+from psbench.benchmarks.protocol import ContextManagerAddIn
+from psbench.benchmarks.serialization.config import RunConfig
+from psbench.benchmarks.serialization.config import RunResult
+from psbench.benchmarks.serialization.serializers import deserialize
+from psbench.benchmarks.serialization.serializers import serialize
+from psbench.config.payload import PayloadConfig
+from psbench.logging import TEST_LOG_LEVEL
+from psbench.payload import payload_nbytes
+
+logger = logging.getLogger('serialization')
+
+T = TypeVar('T')
+
+
+def measure_peak_memory(function: Callable[[], T]) -> tuple[T, int]:
+    """Measure the peak memory allocated while calling a function.
+
+    Memory is traced with [`tracemalloc`][tracemalloc] so this should not
+    be used while timing the function.
+
+    Returns:
+        Tuple of the function result and the peak bytes allocated above the
+        memory allocated before the call.
+    """
+    tracemalloc.start()
+    try:
+        baseline = tracemalloc.get_traced_memory()[0]
+        tracemalloc.reset_peak()
+        result = function()
+        peak = tracemalloc.get_traced_memory()[1]
+    finally:
+        tracemalloc.stop()
+    return result, max(0, peak - baseline)
+
+
+class Benchmark(ContextManagerAddIn):
+    name = 'Serialization'
+    config_type = RunConfig
+    result_type = RunResult
+
+    def __init__(self, payload: PayloadConfig | None = None) -> None:
+        # The kind of the payload config is ignored in favor of the
+        # payload kind of each run config.
+        self.payload = payload if payload is not None else PayloadConfig()
+        super().__init__()
+
+    def config(self) -> dict[str, Any]:
+        return {'payload': self.payload}
+
+    def run(self, config: RunConfig) -> RunResult:
+        payload = self.payload.model_copy(
+            update={'kind': config.payload_kind},
+        )
+        obj = payload.generate(config.payload_size_bytes)
+        payload_mb = payload_nbytes(obj) / 1e6
+
+        def _serialize() -> Any:
+            return serialize(obj, config.serializer, config.compression)
+
+        def _deserialize() -> Any:
+            return deserialize(
+                serialized,
+                config.serializer,
+                config.compression,
+            )
+
+        # Peak memory is measured in a separate round trip because tracing
+        # allocations slows down the timed round trips.
+        gc.collect()
+        serialized, serialize_peak = measure_peak_memory(_serialize)
+        _, deserialize_peak = measure_peak_memory(_deserialize)
+
+        serialize_times_ms: list[float] = []
+        deserialize_times_ms: list[float] = []
+        for _ in range(config.iterations):
+            start = time.perf_counter_ns()
+            serialized = _serialize()
+            end = time.perf_counter_ns()
+            serialize_times_ms.append((end - start) / 1e6)
+
+            start = time.perf_counter_ns()
+            _deserialize()
+            end = time.perf_counter_ns()
+            deserialize_times_ms.append((end - start) / 1e6)
+
+        serialize_ms = statistics.mean(serialize_times_ms)
+        deserialize_ms = statistics.mean(deserialize_times_ms)
+        logger.log(
+            TEST_LOG_LEVEL,
+            f'Serialized {config.payload_kind} payload with '
+            f'{config.serializer} (compression={config.compression}): '
+            f'serialize={serialize_ms:.3f} ms, '
+            f'deserialize={deserialize_ms:.3f} ms',
+        )
+
+        return RunResult(
+            serializer=config.serializer,
+            compression=config.compression,
+            payload_kind=config.payload_kind,
+            payload_size_bytes=config.payload_size_bytes,
+            serialized_size_bytes=serialized.nbytes,
+            iterations=config.iterations,
+            serialize_ms=serialize_ms,
+            deserialize_ms=deserialize_ms,
+            serialize_bandwidth_mbps=payload_mb / (serialize_ms / 1000),
+            deserialize_bandwidth_mbps=payload_mb / (deserialize_ms / 1000),
+            serialize_peak_memory_bytes=serialize_peak,
+            deserialize_peak_memory_bytes=deserialize_peak,
+        )
@@ -0,0 +1,125 @@
+"""Serializers and compression layers under test."""
+
+from __future__ import annotations
+
+import bz2
+import lzma
+import pickle
+import zlib
+from collections.abc import Callable
+from typing import Any
+from typing import Literal
+from typing import NamedTuple
+
+from proxystore.serialize import deserialize as proxystore_deserialize
+from proxystore.serialize import serialize as proxystore_serialize
+
+SERIALIZER_TYPE = Literal['proxystore', 'pickle', 'pickle-oob']
+COMPRESSION_TYPE = Literal['none', 'zlib', 'lzma', 'bz2']
+
+_COMPRESSORS: dict[
+    str,
+    tuple[Callable[[Any], bytes], Callable[[Any], bytes]],
+] = {
+    'zlib': (zlib.compress, zlib.decompress),
+    'lzma': (lzma.compress, lzma.decompress),
+    'bz2': (bz2.compress, bz2.decompress),
+}
+
+
+class Serialized(NamedTuple):
+    """Serialized object.
+
+    Attributes:
+        data: serialized object (the pickle stream for `pickle-oob`).
+        buffers: out-of-band buffers for `pickle-oob`. Buffers reference the
+            memory of the original object unless compressed.
+    """
+
+    data: bytes
+    buffers: list[bytes | memoryview]
+
+    @property
+    def nbytes(self) -> int:
+        """Total size of the serialized data and buffers."""
+        return len(self.data) + sum(
+            memoryview(buffer).nbytes for buffer in self.buffers
+        )
+
+
+def serialize(
+    obj: Any,
+    serializer: SERIALIZER_TYPE,
+    compression: COMPRESSION_TYPE = 'none',
+) -> Serialized:
+    """Serialize and optionally compress an object.
+
+    Args:
+        obj: object to serialize.
+        serializer: `proxystore` for the default ProxyStore serializer,
+            `pickle` for pickle protocol 5 with in-band buffers, or
+            `pickle-oob` for pickle protocol 5 with out-of-band buffers.
+        compression: compress the serialized data and any out-of-band
+            buffers.
+
+    Raises:
+        ValueError: if the serializer or compression is unknown.
+    """
+    buffers: list[bytes | memoryview] = []
+    if serializer == 'proxystore':
+        data = proxystore_serialize(obj)
+    elif serializer == 'pickle':
+        data = pickle.dumps(obj, protocol=5)
+    elif serializer == 'pickle-oob':
+        pickle_buffers: list[pickle.PickleBuffer] = []
+        data = pickle.dumps(
+            obj,
+            protocol=5,
+            buffer_callback=pickle_buffers.append,
+        )
+        buffers = [buffer.raw() for buffer in pickle_buffers]
+    else:
+        raise ValueError(f'Unknown serializer {serializer!r}.')
+
+    if compression != 'none':
+        compress = _get_compressor(compression)[0]
+        data = compress(data)
+        buffers = [compress(buffer) for buffer in buffers]
+
+    return Serialized(data, buffers)
+
+
+def deserialize(
+    serialized: Serialized,
+    serializer: SERIALIZER_TYPE,
+    compression: COMPRESSION_TYPE = 'none',
+) -> Any:
+    """Decompress and deserialize an object.
+
+    Raises:
+        ValueError: if the serializer or compression is unknown.
+    """
+    data: bytes = serialized.data
+    buffers = serialized.buffers
+    if compression != 'none':
+        decompress = _get_compressor(compression)[1]
+        data = decompress(data)
+        buffers = [decompress(buffer) for buffer in buffers]
+
+    if serializer == 'proxystore':
+        return proxystore_deserialize(data)
+    elif serializer == 'pickle':
+        return pickle.loads(data)
+    elif serializer == 'pickle-oob':
+        return pickle.loads(data, buffers=buffers)
+    else:
+        raise ValueError(f'Unknown serializer {serializer!r}.')
+
+
+def _get_compressor(
+    compression: str,
+) -> tuple[Callable[[Any], bytes], Callable[[Any], bytes]]:
+    try:
+        return _COMPRESSORS[compression]
+    except KeyError:
+        raise ValueError(f'Unknown compression {compression!r}.') from None
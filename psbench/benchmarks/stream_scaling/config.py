@@ -4,6 +4,7 @@ import argparse
 import itertools
 import sys
 from typing import Any
+from typing import cast
 from typing import List  # noqa: UP035
 from typing import Literal
 
@@ -13,6 +14,10 @@ else:  # pragma: <3.11 cover
     from typing_extensions import Self
 
 from pydantic import BaseModel
+from pydantic import Field
+from pydantic import PositiveInt
+
+DISPATCH_POLICY_TYPE = Literal['fifo', 'credit']
 
 
 class RunConfig(BaseModel):
@@ -22,6 +27,11 @@ class RunConfig(BaseModel):
     task_sleep: float
     method: str
     adios_file: str
+    producers: int = Field(1, ge=1)
+    dispatchers: int = Field(1, ge=1)
+    dispatch_policy: str = 'fifo'
+    prefetch: int = 1
+    batch_size: int = Field(1, ge=1)
 
 
 class RunResult(BaseModel):
@@ -29,6 +39,7 @@ class RunResult(BaseModel):
     connector: str
     stream: str
     data_size_bytes: int
+    payload_kind: str = 'bytes'
     task_count: int
     task_sleep: float
     method: str
@@ -36,6 +47,64 @@ class RunResult(BaseModel):
     completed_tasks: int
     start_submit_tasks_timestamp: float
     end_tasks_done_timestamp: float
+    producers: int = 1
+    dispatchers: int = 1
+    dispatch_policy: str = 'fifo'
+    prefetch: int = 1
+    batch_size: int = 1
+    items_per_s: float
+    max_dispatcher_backlog: int
+    latency_p50_s: float
+    latency_p99_s: float
+
+
+class DispatcherResult(BaseModel):
+    start_submit_tasks_timestamp: float
+    data_size_bytes: int
+    method: str
+    producers: int
+    dispatchers: int
+    dispatch_policy: str
+    batch_size: int
+    dispatcher: int
+    topic: str
+    max_running_tasks: int
+    completed_tasks: int
+    items_per_s: float
+    max_backlog: int
+    max_prefetched: int
+    stream_wait_s: float
+    task_wait_s: float
+
+
+class QueueDepthResult(BaseModel):
+    start_submit_tasks_timestamp: float
+    data_size_bytes: int
+    method: str
+    dispatch_policy: str
+    prefetch: int
+    dispatcher: int
+    timestamp: float
+    prefetched_items: int
+    running_tasks: int
+
+
+class ItemResult(BaseModel):
+    start_submit_tasks_timestamp: float
+    data_size_bytes: int
+    method: str
+    producers: int
+    dispatchers: int
+    producer: int
+    sequence: int
+    dispatcher: int
+    publish_timestamp: float
+    dispatch_timestamp: float
+    resolve_timestamp: float
+    done_timestamp: float
+    publish_to_dispatch_s: float
+    dispatch_to_resolve_s: float
+    resolve_to_done_s: float
 
 
 class BenchmarkMatrix(BaseModel):
@@ -45,6 +114,20 @@ class BenchmarkMatrix(BaseModel):
     task_count: int
     task_sleep: int
     adios_file: str
+    producers: List[PositiveInt] = Field(  # noqa: UP006
+        default_factory=lambda: [1],
+    )
+    dispatchers: List[PositiveInt] = Field(  # noqa: UP006
+        default_factory=lambda: [1],
+    )
+    dispatch_policy: List[DISPATCH_POLICY_TYPE] = Field(  # noqa: UP006
+        default_factory=lambda: cast(list[DISPATCH_POLICY_TYPE], ['fifo']),
+    )
+    prefetch: int = 1
+    batch_size: List[PositiveInt] = Field(  # noqa: UP006
+        default_factory=lambda: [1],
+    )
+    item_results_format: Literal['csv', 'npz'] = 'csv'
 
     @staticmethod
     def add_parser_group(parser: argparse.ArgumentParser) -> None:
@@ -90,6 +173,70 @@ class BenchmarkMatrix(BaseModel):
             default='/tmp/psbench-adios-stream',
             help='ADIOS stream file path',
         )
+        group.add_argument(
+            '--producers',
+            metavar='INT',
+            nargs='+',
+            type=int,
+            default=[1],
+            help=(
+                'Number of generator tasks publishing to the stream. Each '
+                'uses one of the max workers'
+            ),
+        )
+        group.add_argument(
+            '--dispatchers',
+            metavar='INT',
+            nargs='+',
+            type=int,
+            default=[1],
+            help=(
+                'Number of dispatcher threads which each consume their own '
+                'topic and submit compute tasks'
+            ),
+        )
+        group.add_argument(
+            '--dispatch-policy',
+            choices=['fifo', 'credit'],
+            nargs='+',
+            default=['fifo'],
+            help=(
+                'Dispatcher policy. "fifo" waits on the oldest task once the '
+                'compute workers are full and "credit" prefetches stream '
+                'items and submits a task whenever any task completes'
+            ),
+        )
+        group.add_argument(
+            '--prefetch',
+            metavar='INT',
+            type=int,
+            default=1,
+            help=(
+                'Max stream items consumed but not yet submitted by each '
+                'dispatcher with the credit policy'
+            ),
+        )
+        group.add_argument(
+            '--batch-size',
+            metavar='INT',
+            nargs='+',
+            type=int,
+            default=[1],
+            help=(
+                'Number of stream items published in each broker message '
+                'and processed by each compute task'
+            ),
+        )
+        group.add_argument(
+            '--item-results-format',
+            choices=['csv', 'npz'],
+            default='csv',
+            help=(
+                'Format of the per-item and queue depth results. "npz" '
+                'writes batches of rows as NumPy arrays which keeps up with '
+                'higher item rates than "csv"'
+            ),
+        )
 
     @classmethod
     def from_args(cls, **kwargs: Any) -> Self:
@@ -100,6 +247,12 @@ class BenchmarkMatrix(BaseModel):
             task_count=kwargs['task_count'],
             task_sleep=kwargs['task_sleep'],
             adios_file=kwargs['adios_file'],
+            producers=kwargs.get('producers', [1]),
+            dispatchers=kwargs.get('dispatchers', [1]),
+            dispatch_policy=kwargs.get('dispatch_policy', ['fifo']),
+            prefetch=kwargs.get('prefetch', 1),
+            batch_size=kwargs.get('batch_size', [1]),
+            item_results_format=kwargs.get('item_results_format', 'csv'),
         )
 
     def configs(self) -> tuple[RunConfig, ...]:
@@ -111,9 +264,20 @@ class BenchmarkMatrix(BaseModel):
                 task_sleep=self.task_sleep,
                 method=method,
                 adios_file=self.adios_file,
+                producers=producers,
+                dispatchers=dispatchers,
+                dispatch_policy=policy,
+                prefetch=self.prefetch,
+                batch_size=batch_size,
             )
-            for size, method in itertools.product(
-                self.data_size_bytes,
-                self.stream_method,
+            for size, method, producers, dispatchers, policy, batch_size in (
+                itertools.product(
+                    self.data_size_bytes,
+                    self.stream_method,
+                    self.producers,
+                    self.dispatchers,
+                    self.dispatch_policy,
+                    self.batch_size,
+                )
             )
         )
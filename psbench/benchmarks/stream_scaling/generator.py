@@ -1,8 +1,11 @@
 from __future__ import annotations
 
 import time
+from collections.abc import Sequence
 from typing import Any
+from typing import NamedTuple
 
+from proxystore.serialize import serialize
 from proxystore.store.base import Store
 from proxystore.store.config import StoreConfig
 from proxystore.store.future import Future
@@ -12,30 +15,64 @@ from proxystore.stream.protocols import MessagePublisher
 from psbench.benchmarks.stream_scaling.config import RunConfig
 from psbench.benchmarks.stream_scaling.shims import Adios2Publisher
 from psbench.benchmarks.stream_scaling.shims import ProducerShim
+from psbench.config.payload import PayloadConfig
 from psbench.config.stream import StreamConfig
-from psbench.utils import randbytes
+from psbench.payload import get_payload_pool
+from psbench.payload import PayloadPoolStats
 from psbench.utils import wait_until
 
 
+class GeneratorStats(NamedTuple):
+    """Statistics of a generator task.
+
+    Attributes:
+        pool: payload pool statistics which are cumulative over all runs
+            executed by the worker process.
+        publish_timestamps: timestamps of each item published to each topic.
+    """
+
+    pool: PayloadPoolStats
+    publish_timestamps: dict[str, list[float]]
+
+
 def generate_data(
     publisher: MessagePublisher,
     stop_generator: Future[bool],
     *,
     item_size_bytes: int,
     max_items: int,
-    topic: str,
+    topic: str | Sequence[str],
     interval: float = 0,
     pregenerate: bool = False,
-) -> None:
+    payload: PayloadConfig | None = None,
+    serialize_payload: bool = False,
+) -> dict[str, list[float]]:
+    # Items are published to multiple topics in round-robin order.
+    topics = [topic] if isinstance(topic, str) else list(topic)
+    publish_timestamps: dict[str, list[float]] = {t: [] for t in topics}
     sent_items = 0
+    pool = get_payload_pool()
+    # Grow the pool before publishing so the first item is not delayed.
+    pool.reserve(item_size_bytes)
+
+    def _generate(index: int) -> Any:
+        data = (
+            pool.get(item_size_bytes)
+            if payload is None
+            else payload.generate(item_size_bytes, index, pool)
+        )
+        # Publishers which send raw bytes need non-bytes payloads serialized.
+        if serialize_payload and not isinstance(data, bytes):
+            return serialize(data)
+        return data
 
-    data: bytes | None = None
+    message: Any = None
     if pregenerate:
         # Pregenerate the data when the data size is too large or the interval
         # is too small to keep up. Note that the StreamProducer will still
         # create unique events and items in the store even though the data
         # is the same each time.
-        data = randbytes(item_size_bytes)
+        message = _generate(0)
 
     while sent_items < max_items:
         interval_end = time.time() + interval
@@ -43,14 +80,20 @@ def generate_data(
             break
 
         if not pregenerate:
-            data = randbytes(item_size_bytes)
+            message = _generate(sent_items)
 
-        assert data is not None
-        publisher.send_message(topic, data)
+        assert message is not None
+        item_topic = topics[sent_items % len(topics)]
+        # Recorded before sending so an item is never consumed before it
+        # is published.
+        publish_timestamps[item_topic].append(time.time())
+        publisher.send_message(item_topic, message)
         sent_items += 1
 
         wait_until(interval_end)
 
+    return publish_timestamps
+
 
 def generator_task(
     run_config: RunConfig,
@@ -60,7 +103,12 @@ def generator_task(
     *,
     interval: float = 0,
     pregenerate: bool = False,
-) -> None:
+    payload: PayloadConfig | None = None,
+    topics: Sequence[str] | None = None,
+    max_items: int | None = None,
+    producer_id: int = 0,
+) -> GeneratorStats:
+    topics = list(topics) if topics is not None else [stream_config.topic]
     publisher: MessagePublisher
     if run_config.method in ('default', 'proxy'):
         base_publisher = stream_config.get_publisher()
@@ -68,30 +116,52 @@ def generator_task(
         store: Store[Any] = Store.from_config(store_config)
         producer = StreamProducer[bytes](
             base_publisher,
-            stores={stream_config.topic: store},
+            batch_size=run_config.batch_size,
+            stores=dict.fromkeys(topics, store),
         )
         publisher = ProducerShim(
             producer,
             direct_to_publisher=run_config.method == 'default',
+            producer_id=producer_id,
+            batch_size=run_config.batch_size,
         )
     elif run_config.method == 'adios':
-        publisher = Adios2Publisher(run_config.adios_file)
+        publisher = Adios2Publisher(
+            run_config.adios_file,
+            producer_id=producer_id,
+        )
     else:
         raise AssertionError(f'Unknown stream method {run_config.method}.')
 
-    generate_data(
+    publish_timestamps = generate_data(
         publisher,
         stop_generator,
         item_size_bytes=run_config.data_size_bytes,
-        max_items=run_config.task_count,
+        max_items=(
+            max_items if max_items is not None else run_config.task_count
+        ),
         pregenerate=pregenerate,
         interval=interval,
-        topic=stream_config.topic,
+        topic=topics,
+        payload=payload,
+        serialize_payload=run_config.method in ('default', 'adios'),
     )
 
     if run_config.method in ('default', 'proxy'):
         assert isinstance(publisher, ProducerShim)
-        publisher.close_topic(stream_config.topic)
+        for topic in topics:
+            publisher.close_topic(topic)
         publisher.close()
+        # Batched items are published when the batch is flushed which can
+        # be after the item is sent to the producer.
+        publish_timestamps = {
+            topic: publisher.publish_timestamps[topic] for topic in topics
+        }
     else:
         publisher.close()
+
+    # Stats are cumulative over all runs executed by this worker process.
+    return GeneratorStats(
+        pool=get_payload_pool().stats(),
+        publish_timestamps=publish_timestamps,
+    )
@@ -1,28 +1,45 @@
 from __future__ import annotations
 
 import collections
+import concurrent.futures
 import logging
 import os
+import queue
 import shutil
+import threading
 import time
+from collections.abc import Sequence
 from concurrent.futures import Executor
 from concurrent.futures import Future
+from concurrent.futures import ThreadPoolExecutor
 from typing import Any
+from typing import NamedTuple
 
+import numpy
 from parsl.concurrent import ParslPoolExecutor
 from proxystore.proxy import Proxy
+from proxystore.proxy import resolve
+from proxystore.serialize import deserialize
 from proxystore.store.base import Store
 from proxystore.store.future import Future as ProxyFuture
 from proxystore.stream import StreamConsumer
 
 from psbench.benchmarks.protocol import ContextManagerAddIn
+from psbench.benchmarks.stream_scaling.config import DispatcherResult
+from psbench.benchmarks.stream_scaling.config import ItemResult
+from psbench.benchmarks.stream_scaling.config import QueueDepthResult
 from psbench.benchmarks.stream_scaling.config import RunConfig
 from psbench.benchmarks.stream_scaling.config import RunResult
 from psbench.benchmarks.stream_scaling.generator import generator_task
+from psbench.benchmarks.stream_scaling.generator import GeneratorStats
 from psbench.benchmarks.stream_scaling.shims import Adios2Subscriber
 from psbench.benchmarks.stream_scaling.shims import ConsumerShim
+from psbench.benchmarks.stream_scaling.shims import ItemStamp
+from psbench.config import PayloadConfig
 from psbench.config import StreamConfig
+from psbench.connectors.wan import connector_name
 from psbench.logging import TEST_LOG_LEVEL
+from psbench.results import ResultLogger
 
 adios_import_error: Exception | None = None
 try:
@@ -33,15 +50,49 @@ except ImportError as e:  # pragma: no cover
 logger = logging.getLogger('stream-scaling')
 
 
+class TaskTiming(NamedTuple):
+    """Timestamps of a compute task.
+
+    Attributes:
+        start: time the task started executing.
+        resolved: time the input data was resolved.
+        done: time the task finished.
+    """
+
+    start: float
+    resolved: float
+    done: float
+
+
 def warmup_task() -> None:
     pass
 
 
-def compute_task(data: bytes, sleep: float) -> None:
+def compute_task(
+    data: Any,
+    sleep: float,
+    deserialize_payload: bool = False,
+) -> TaskTiming:
+    start = time.time()
     # Resolve data if necessary
-    assert isinstance(data, bytes)
+    if isinstance(data, Proxy):
+        resolve(data)
+    elif deserialize_payload:
+        deserialize(data)
+    resolved = time.time()
 
     time.sleep(sleep)
+    return TaskTiming(start, resolved, time.time())
+
+
+def compute_batch_task(
+    data: Sequence[Any],
+    sleep: float,
+    deserialize_payload: bool = False,
+) -> list[TaskTiming]:
+    # Items are processed in order and each takes the same time as it would
+    # in its own task.
+    return [compute_task(item, sleep, deserialize_payload) for item in data]
 
 
 def compute_task_adios(
@@ -49,15 +100,21 @@ def compute_task_adios(
     sleep: float,
     adios_file: str,
     topic: str,
-    expected_size: int,
-) -> None:
+    expected_size: int | None,
+    deserialize_payload: bool = False,
+) -> TaskTiming:
+    start = time.time()
     with adios2.FileReader(adios_file) as reader:
         array = reader.read(topic, step_selection=[step, 1])
         data = array.tobytes()
-        assert len(data) == expected_size
+        assert expected_size is None or len(data) == expected_size
         assert isinstance(data, bytes)
+        if deserialize_payload:
+            deserialize(data)
+    resolved = time.time()
 
     time.sleep(sleep)
+    return TaskTiming(start, resolved, time.time())
 
 
 def pregenerate(
@@ -74,11 +131,420 @@ def pregenerate(
     #   - 25 x 100MB: 5.7s (4.4 items/s) (100MB in 228 ms)
     # To err on the safe side, I've chose 100 MB in 0.25 s as the
     # example interval. Note that this was on a pretty fast workstation.
+    # Items are now copied from a PayloadPool rather than generated with
+    # randbytes so the estimate is conservative, but the time to publish
+    # an item still grows with its size.
     example_rate = example_size / example_time
     expected_time = size / example_rate
     return expected_time > interval
 
 
+class ItemTiming(NamedTuple):
+    """Timestamps of a stream item from publish to compute task done.
+
+    Attributes:
+        stamp: identity and publish time of the item.
+        dispatch: time the compute task for the item was submitted.
+        task: timestamps of the compute task.
+    """
+
+    stamp: ItemStamp
+    dispatch: float
+    task: TaskTiming
+
+
+class QueueDepth(NamedTuple):
+    """Sample of the items held by a dispatcher.
+
+    Attributes:
+        timestamp: time of the sample.
+        prefetched: items consumed from the stream but not yet submitted.
+        running: submitted compute tasks which have not been waited on.
+    """
+
+    timestamp: float
+    prefetched: int
+    running: int
+
+
+class DispatcherStats(NamedTuple):
+    """Statistics of a dispatcher.
+
+    Attributes:
+        completed_tasks: number of compute tasks completed.
+        consume_timestamps: timestamps of each item consumed from the stream.
+        stream_wait_s: time spent waiting on the next item in the stream.
+        task_wait_s: time spent waiting on compute tasks to finish.
+        end_timestamp: timestamp when all compute tasks finished.
+        item_timings: timestamps of each item in the order completed.
+        queue_depths: samples of the items held by the dispatcher each time
+            the number changed. Only recorded by the credit dispatch policy.
+    """
+
+    completed_tasks: int
+    consume_timestamps: list[float]
+    stream_wait_s: float
+    task_wait_s: float
+    end_timestamp: float
+    item_timings: list[ItemTiming]
+    queue_depths: list[QueueDepth]
+
+
+def submit_compute_task(
+    executor: Executor,
+    items: Sequence[Any],
+    *,
+    config: RunConfig,
+    topic: str,
+    deserialize_payload: bool = False,
+) -> Future[TaskTiming] | Future[list[TaskTiming]]:
+    """Submit the compute task for a batch of stream items.
+
+    A batch task is only used when the batch size is greater than one.
+    """
+    if not isinstance(executor, ThreadPoolExecutor):
+        # Items received directly from the subscriber are views of the
+        # message, which cannot be pickled, so they are only copied when
+        # the task is sent to another process.
+        items = [
+            bytes(item) if isinstance(item, memoryview) else item
+            for item in items
+        ]
+    if isinstance(executor, ParslPoolExecutor):  # pragma: no cover
+        for item in items:
+            if isinstance(item, Proxy):
+                # Quick hack because Parsl will accidentally resolve
+                # proxy when it scans tasks inputs for any special
+                # files.
+                item.__proxy_wrapped__ = None
+    if config.batch_size > 1:
+        return executor.submit(
+            compute_batch_task,
+            list(items),
+            sleep=config.task_sleep,
+            deserialize_payload=deserialize_payload,
+        )
+    (item,) = items
+    if config.method == 'adios':
+        assert isinstance(item, int)
+        return executor.submit(
+            compute_task_adios,
+            item,
+            sleep=config.task_sleep,
+            adios_file=config.adios_file,
+            topic=topic,
+            expected_size=(
+                None if deserialize_payload else config.data_size_bytes
+            ),
+            deserialize_payload=deserialize_payload,
+        )
+    else:
+        return executor.submit(
+            compute_task,
+            item,
+            sleep=config.task_sleep,
+            deserialize_payload=deserialize_payload,
+        )
+
+
+def _next_batch(
+    consumer: ConsumerShim | Adios2Subscriber,
+    batch_size: int,
+    consume_timestamps: list[float],
+) -> list[tuple[ItemStamp, Any]]:
+    # The last batch is partial and an empty batch means the stream is done.
+    batch: list[tuple[ItemStamp, Any]] = []
+    while len(batch) < batch_size:
+        try:
+            batch.append(consumer.next_with_stamp())
+        except StopIteration:
+            break
+        consume_timestamps.append(time.time())
+    return batch
+
+
+def _item_timings(
+    stamps: Sequence[ItemStamp],
+    dispatched: float,
+    result: TaskTiming | list[TaskTiming],
+) -> list[ItemTiming]:
+    timings = [result] if isinstance(result, TaskTiming) else result
+    return [
+        ItemTiming(stamp, dispatched, timing)
+        for stamp, timing in zip(stamps, timings, strict=True)
+    ]
+
+
+def dispatch(
+    executor: Executor,
+    consumer: ConsumerShim | Adios2Subscriber,
+    *,
+    config: RunConfig,
+    topic: str,
+    max_running_tasks: int,
+    deserialize_payload: bool = False,
+) -> DispatcherStats:
+    """Submit a compute task for each batch of items in the stream.
+
+    With the `'fifo'` dispatch policy, tasks are waited on in FIFO order
+    once `max_running_tasks` are running. With the `'credit'` policy, a
+    background thread prefetches up to `config.prefetch` batches from the
+    stream and a task is submitted whenever any running task completes.
+    In both cases, all remaining tasks are waited on once the stream is
+    closed.
+    """
+    if config.dispatch_policy == 'fifo':
+        return _dispatch_fifo(
+            executor,
+            consumer,
+            config=config,
+            topic=topic,
+            max_running_tasks=max_running_tasks,
+            deserialize_payload=deserialize_payload,
+        )
+    elif config.dispatch_policy == 'credit':
+        return _dispatch_credit(
+            executor,
+            consumer,
+            config=config,
+            topic=topic,
+            max_running_tasks=max_running_tasks,
+            deserialize_payload=deserialize_payload,
+        )
+    else:
+        raise AssertionError(
+            f'Unsupported dispatch policy {config.dispatch_policy}.',
+        )
+
+
+def _dispatch_fifo(
+    executor: Executor,
+    consumer: ConsumerShim | Adios2Subscriber,
+    *,
+    config: RunConfig,
+    topic: str,
+    max_running_tasks: int,
+    deserialize_payload: bool,
+) -> DispatcherStats:
+    completed_tasks = 0
+    consume_timestamps: list[float] = []
+    item_timings: list[ItemTiming] = []
+    stream_wait_s = 0.0
+    task_wait_s = 0.0
+    running_tasks: collections.deque[
+        tuple[
+            list[ItemStamp],
+            float,
+            Future[TaskTiming] | Future[list[TaskTiming]],
+        ]
+    ] = collections.deque()
+
+    def _wait_oldest() -> None:
+        nonlocal completed_tasks, task_wait_s
+        wait_start = time.perf_counter()
+        stamps, dispatched, task_future = running_tasks.popleft()
+        item_timings.extend(
+            _item_timings(stamps, dispatched, task_future.result()),
+        )
+        task_wait_s += time.perf_counter() - wait_start
+        completed_tasks += len(stamps)
+
+    i = 0
+    while True:
+        wait_start = time.perf_counter()
+        batch = _next_batch(consumer, config.batch_size, consume_timestamps)
+        if len(batch) == 0:
+            break
+        stream_wait_s += time.perf_counter() - wait_start
+        i += 1
+
+        dispatched = time.time()
+        task_future = submit_compute_task(
+            executor,
+            [item for _, item in batch],
+            config=config,
+            topic=topic,
+            deserialize_payload=deserialize_payload,
+        )
+        logger.log(
+            TEST_LOG_LEVEL,
+            f'Submitted compute task {i} from topic {topic}',
+        )
+        running_tasks.append(
+            ([stamp for stamp, _ in batch], dispatched, task_future),
+        )
+
+        # Only start waiting on old tasks once we've filled the
+        # available compute workers.
+        if len(running_tasks) >= max_running_tasks:
+            _wait_oldest()
+
+    logger.log(TEST_LOG_LEVEL, f'Finished consuming topic {topic}')
+
+    # Wait on remaining tasks. There should be max_running_tasks number
+    # of tasks remaining unless a KeyboardInterrupt occurred.
+    while len(running_tasks) > 0:
+        _wait_oldest()
+
+    return DispatcherStats(
+        completed_tasks=completed_tasks,
+        consume_timestamps=consume_timestamps,
+        stream_wait_s=stream_wait_s,
+        task_wait_s=task_wait_s,
+        end_timestamp=time.time(),
+        item_timings=item_timings,
+        queue_depths=[],
+    )
+
+
+def _dispatch_credit(
+    executor: Executor,
+    consumer: ConsumerShim | Adios2Subscriber,
+    *,
+    config: RunConfig,
+    topic: str,
+    max_running_tasks: int,
+    deserialize_payload: bool,
+) -> DispatcherStats:
+    completed_tasks = 0
+    consume_timestamps: list[float] = []
+    item_timings: list[ItemTiming] = []
+    queue_depths: list[QueueDepth] = []
+    stream_wait_s = 0.0
+    task_wait_s = 0.0
+    # Consumed batches waiting for a credit. None marks the end of the
+    # stream.
+    prefetched: queue.Queue[list[tuple[ItemStamp, Any]] | None]
+    prefetched = queue.Queue()
+    # Taken before reading a batch from the stream and released once the
+    # batch is dispatched so the stream is only read ahead by the prefetch
+    # depth.
+    prefetch_slots = threading.Semaphore(config.prefetch)
+    running_tasks: dict[Future[Any], tuple[list[ItemStamp], float]] = {}
+    stop_prefetch = threading.Event()
+
+    def _record_depth() -> None:
+        queue_depths.append(
+            QueueDepth(time.time(), prefetched.qsize(), len(running_tasks)),
+        )
+
+    def _prefetch() -> None:
+        nonlocal stream_wait_s
+        try:
+            while True:
+                prefetch_slots.acquire()
+                if stop_prefetch.is_set():
+                    break
+                wait_start = time.perf_counter()
+                batch = _next_batch(
+                    consumer,
+                    config.batch_size,
+                    consume_timestamps,
+                )
+                if len(batch) == 0:
+                    break
+                stream_wait_s += time.perf_counter() - wait_start
+                prefetched.put(batch)
+                _record_depth()
+        finally:
+            prefetched.put(None)
+
+    def _wait_any() -> None:
+        nonlocal completed_tasks, task_wait_s
+        wait_start = time.perf_counter()
+        done, _ = concurrent.futures.wait(
+            running_tasks,
+            return_when=concurrent.futures.FIRST_COMPLETED,
+        )
+        task_wait_s += time.perf_counter() - wait_start
+        for task_future in done:
+            stamps, dispatched = running_tasks.pop(task_future)
+            item_timings.extend(
+                _item_timings(stamps, dispatched, task_future.result()),
+            )
+            completed_tasks += len(stamps)
+        _record_depth()
+
+    pool = ThreadPoolExecutor(1, thread_name_prefix='prefetch')
+    prefetch_future = pool.submit(_prefetch)
+
+    i = 0
+    try:
+        while True:
+            # Each running task holds one of the max_running_tasks credits.
+            if len(running_tasks) >= max_running_tasks:
+                _wait_any()
+                continue
+
+            batch = prefetched.get()
+            if batch is None:
+                break
+            prefetch_slots.release()
+            i += 1
+
+            dispatched = time.time()
+            task_future = submit_compute_task(
+                executor,
+                [item for _, item in batch],
+                config=config,
+                topic=topic,
+                deserialize_payload=deserialize_payload,
+            )
+            logger.log(
+                TEST_LOG_LEVEL,
+                f'Submitted compute task {i} from topic {topic}',
+            )
+            running_tasks[task_future] = (
+                [stamp for stamp, _ in batch],
+                dispatched,
+            )
+            _record_depth()
+    except BaseException:
+        # Stop the prefetch thread without waiting on it because it may be
+        # blocked reading the stream until the producers are stopped.
+        stop_prefetch.set()
+        prefetch_slots.release()
+        pool.shutdown(wait=False)
+        raise
+
+    pool.shutdown()
+    # Raise any exception from consuming the stream.
+    prefetch_future.result()
+
+    logger.log(TEST_LOG_LEVEL, f'Finished consuming topic {topic}')
+
+    while len(running_tasks) > 0:
+        _wait_any()
+
+    return DispatcherStats(
+        completed_tasks=completed_tasks,
+        consume_timestamps=consume_timestamps,
+        stream_wait_s=stream_wait_s,
+        task_wait_s=task_wait_s,
+        end_timestamp=time.time(),
+        item_timings=item_timings,
+        queue_depths=queue_depths,
+    )
+
+
+def max_backlog(
+    published: Sequence[float],
+    consumed: Sequence[float],
+) -> int:
+    """Get the max number of items published but not yet consumed."""
+    # Consume events sort before publish events with the same timestamp.
+    events = sorted(
+        [(timestamp, 1) for timestamp in published]
+        + [(timestamp, -1) for timestamp in consumed],
+    )
+    backlog = 0
+    peak = 0
+    for _, change in events:
+        backlog += change
+        peak = max(peak, backlog)
+    return peak
+
+
 class Benchmark(ContextManagerAddIn):
     name = 'Stream Scaling'
     config_type = RunConfig
@@ -89,30 +555,83 @@ class Benchmark(ContextManagerAddIn):
         executor: Executor,
         store: Store[Any],
         stream_config: StreamConfig,
+        payload: PayloadConfig | None = None,
+        dispatcher_logger: ResultLogger[DispatcherResult] | None = None,
+        item_logger: ResultLogger[ItemResult] | None = None,
+        queue_logger: ResultLogger[QueueDepthResult] | None = None,
     ) -> None:
         self.executor = executor
         self.store = store
         self.stream_config = stream_config
+        self.payload = payload if payload is not None else PayloadConfig()
+        self.dispatcher_logger = dispatcher_logger
+        self.item_logger = item_logger
+        self.queue_logger = queue_logger
         super().__init__([self.executor, self.store])
 
     def config(self) -> dict[str, Any]:
         return {
             'executor': self.executor.__class__.__name__,
-            'connector': self.store.connector.__class__.__name__,
+            'connector': connector_name(self.store.connector),
             'stream-config': self.stream_config,
+            'payload': self.payload,
         }
 
     def run(self, config: RunConfig) -> RunResult:
+        if config.method == 'adios' and (
+            config.producers > 1 or config.dispatchers > 1
+        ):
+            raise ValueError(
+                'The adios method supports only one producer and dispatcher.',
+            )
         if (
             config.method == 'adios' and adios_import_error is not None
         ):  # pragma: no cover
             raise adios_import_error
 
-        compute_workers = config.max_workers - 1
-        producer_interval = config.task_sleep / compute_workers
-        pregen_data = pregenerate(config.data_size_bytes, producer_interval)
+        if config.method == 'adios' and config.batch_size > 1:
+            raise ValueError('The adios method does not support batching.')
+        if config.dispatch_policy == 'credit' and config.prefetch < 1:
+            raise ValueError(
+                'The credit dispatch policy requires prefetch >= 1.',
+            )
+
+        compute_workers = config.max_workers - config.producers
+        if compute_workers < max(1, config.dispatchers):
+            raise ValueError(
+                f'Max workers ({config.max_workers}) must be greater than '
+                f'the number of producers ({config.producers}) plus '
+                f'dispatchers ({config.dispatchers}).',
+            )
+        # Each producer publishes at a fraction of the total item rate.
+        producer_interval = (
+            config.task_sleep / compute_workers * config.producers
+        )
+        # Only random bytes payloads are cheap enough to generate per item.
+        pregen_data = self.payload.kind != 'bytes' or pregenerate(
+            config.data_size_bytes,
+            producer_interval,
+        )
+        # Payloads published as raw bytes are serialized by the generator.
+        deserialize_payload = self.payload.kind != 'bytes'
+        # Each dispatcher consumes its own topic and gets an equal share of
+        # the compute workers.
+        topics = (
+            [self.stream_config.topic]
+            if config.dispatchers == 1
+            else [
+                f'{self.stream_config.topic}-{d}'
+                for d in range(config.dispatchers)
+            ]
+        )
+        max_running_tasks = [
+            compute_workers // config.dispatchers
+            + (1 if d < compute_workers % config.dispatchers else 0)
+            for d in range(config.dispatchers)
+        ]
         logger.log(TEST_LOG_LEVEL, f'Compute workers: {compute_workers}')
-        logger.log(TEST_LOG_LEVEL, 'Generator workers: 1')
+        logger.log(TEST_LOG_LEVEL, f'Generator workers: {config.producers}')
+        logger.log(TEST_LOG_LEVEL, f'Dispatchers: {config.dispatchers}')
         logger.log(
             TEST_LOG_LEVEL,
             f'Generator item interval: {producer_interval}',
@@ -122,42 +641,61 @@ class Benchmark(ContextManagerAddIn):
         self.executor.submit(warmup_task).result()
         logger.log(TEST_LOG_LEVEL, 'Warmup task completed')
 
-        stop_generator: ProxyFuture[bool] = self.store.future()
-        generator_task_future = self.executor.submit(
-            generator_task,
-            run_config=config,
-            store_config=self.store.config(),
-            stream_config=self.stream_config,
-            stop_generator=stop_generator,
-            pregenerate=pregen_data,
-            interval=producer_interval,
-        )
-        logger.log(
-            TEST_LOG_LEVEL,
-            'Submitted generator task: '
-            f'item_size_bytes={config.data_size_bytes}, '
-            f'max_items={config.task_count}, '
-            f'interval_seconds={producer_interval}, '
-            f'pregenerate={pregen_data}, '
-            f'method={config.method}',
-        )
-        completed_tasks = 0
-        running_tasks: collections.deque[Future[bytes] | Future[None]] = (
-            collections.deque()
-        )
-
         # The type of consumer is almost that of the Subscriber protocol but
-        # the Adios2Subscriber is slightly different.
-        consumer: Any
+        # the Adios2Subscriber is slightly different. Stream consumers are
+        # subscribed before the generators start so no items are missed.
+        consumers: list[Any] = []
         if config.method in ('default', 'proxy'):
-            subscriber = self.stream_config.get_subscriber()
-            assert subscriber is not None
-            base_consumer = StreamConsumer[bytes](subscriber)
-            consumer = ConsumerShim(
-                base_consumer,
-                direct_from_subscriber=config.method == 'default',
+            for topic in topics:
+                subscriber = self.stream_config.get_subscriber(topic)
+                assert subscriber is not None
+                base_consumer = StreamConsumer[bytes](subscriber)
+                consumers.append(
+                    ConsumerShim(
+                        base_consumer,
+                        direct_from_subscriber=config.method == 'default',
+                        producers=config.producers,
+                        batched=config.batch_size > 1,
+                    ),
+                )
+        elif config.method != 'adios':
+            raise AssertionError(f'Unsupported method {config.method}.')
+
+        stop_generator: ProxyFuture[bool] = self.store.future()
+        generator_futures: list[Future[GeneratorStats]] = []
+        for p in range(config.producers):
+            # Producers start publishing to different topics and the
+            # remaining items are split among the first producers.
+            offset = p % config.dispatchers
+            max_items = config.task_count // config.producers + (
+                1 if p < config.task_count % config.producers else 0
+            )
+            generator_futures.append(
+                self.executor.submit(
+                    generator_task,
+                    run_config=config,
+                    store_config=self.store.config(),
+                    stream_config=self.stream_config,
+                    stop_generator=stop_generator,
+                    pregenerate=pregen_data,
+                    interval=producer_interval,
+                    payload=self.payload,
+                    topics=topics[offset:] + topics[:offset],
+                    max_items=max_items,
+                    producer_id=p,
+                ),
+            )
+            logger.log(
+                TEST_LOG_LEVEL,
+                f'Submitted generator task {p + 1}/{config.producers}: '
+                f'item_size_bytes={config.data_size_bytes}, '
+                f'max_items={max_items}, '
+                f'interval_seconds={producer_interval}, '
+                f'pregenerate={pregen_data}, '
+                f'method={config.method}',
             )
-        elif config.method == 'adios':
+
+        if config.method == 'adios':
             waited = 0
             while True:
                 if waited > 60:  # pragma: no cover
@@ -167,79 +705,76 @@ class Benchmark(ContextManagerAddIn):
                 time.sleep(1)
                 waited += 1
 
-            consumer = Adios2Subscriber(
-                config.adios_file,
-                topic=self.stream_config.topic,
-                direct=False,
+            consumers.append(
+                Adios2Subscriber(
+                    config.adios_file,
+                    topic=self.stream_config.topic,
+                    direct=False,
+                ),
             )
-        else:
-            raise AssertionError(f'Unsupported method {config.method}.')
 
         start = time.time()
 
+        dispatcher_stats: list[DispatcherStats] = []
         try:
-            for i, item in enumerate(consumer):
-                if isinstance(self.executor, ParslPoolExecutor) and isinstance(
-                    item,
-                    Proxy,
-                ):  # pragma: no cover
-                    # Quick hack because Parsl will accidentally resolve
-                    # proxy when it scans tasks inputs for any special
-                    # files.
-                    item.__proxy_wrapped__ = None
-                if config.method == 'adios':
-                    task_future = self.executor.submit(
-                        compute_task_adios,
-                        item,
-                        sleep=config.task_sleep,
-                        adios_file=config.adios_file,
-                        topic=self.stream_config.topic,
-                        expected_size=config.data_size_bytes,
-                    )
-                else:
-                    task_future = self.executor.submit(
-                        compute_task,
-                        item,
-                        sleep=config.task_sleep,
-                    )
-                logger.log(
-                    TEST_LOG_LEVEL,
-                    f'Submitted compute task {i + 1}/{config.task_count}',
+            if config.dispatchers == 1:
+                dispatcher_stats.append(
+                    dispatch(
+                        self.executor,
+                        consumers[0],
+                        config=config,
+                        topic=topics[0],
+                        max_running_tasks=max_running_tasks[0],
+                        deserialize_payload=deserialize_payload,
+                    ),
                 )
-                running_tasks.append(task_future)
-
-                # Only start waiting on old tasks once we've filled the
-                # available compute workers.
-                if len(running_tasks) >= compute_workers:
-                    oldest_task_future = running_tasks.popleft()
-                    oldest_task_future.result()
-                    completed_tasks += 1
+            else:
+                with ThreadPoolExecutor(
+                    config.dispatchers,
+                    thread_name_prefix='dispatcher',
+                ) as pool:
+                    dispatcher_futures = [
+                        pool.submit(
+                            dispatch,
+                            self.executor,
+                            consumer,
+                            config=config,
+                            topic=topic,
+                            max_running_tasks=max_running,
+                            deserialize_payload=deserialize_payload,
+                        )
+                        for consumer, topic, max_running in zip(
+                            consumers,
+                            topics,
+                            max_running_tasks,
+                            strict=True,
+                        )
+                    ]
+                    dispatcher_stats.extend(
+                        future.result() for future in dispatcher_futures
+                    )
         except KeyboardInterrupt:  # pragma: no cover
             logger.warning(
                 'Caught KeyboardInterrupt... sending stop signal to generator',
             )
             stop_generator.set_result(True)
         finally:
-            logger.log(TEST_LOG_LEVEL, 'Waiting on generator task')
-            generator_task_future.result()
-
-        logger.log(
-            TEST_LOG_LEVEL,
-            'Finished submitting new compute tasks',
-        )
-
-        consumer.close()
-
-        logger.log(TEST_LOG_LEVEL, 'Waiting on generator task')
-        generator_task_future.result()
-
-        # Wait on remaining tasks. There should be compute_workers number
-        # of tasks remaining unless a KeyboardInterrupt occurred.
-        logger.log(TEST_LOG_LEVEL, 'Waiting on outstanding compute tasks')
-        while len(running_tasks) > 0:
-            task = running_tasks.popleft()
-            task.result()
-            completed_tasks += 1
+            logger.log(TEST_LOG_LEVEL, 'Waiting on generator tasks')
+            generator_stats = [future.result() for future in generator_futures]
+
+        for consumer in consumers:
+            consumer.close()
+
+        for p, generator in enumerate(generator_stats):
+            pool_stats = generator.pool
+            logger.log(
+                TEST_LOG_LEVEL,
+                f'Generator {p} payload pool (cumulative for worker): '
+                f'payloads={pool_stats.payload_count}, '
+                f'bytes={pool_stats.payload_bytes}, '
+                f'generation_time_s={pool_stats.payload_time_s:.3f}, '
+                f'pool_fill_time_s={pool_stats.fill_time_s:.3f}',
+            )
 
         logger.log(TEST_LOG_LEVEL, 'All compute tasks finished')
 
@@ -248,12 +783,122 @@ class Benchmark(ContextManagerAddIn):
 
         end = time.time()
 
+        backlogs: list[int] = []
+        for d, (topic, stats) in enumerate(
+            zip(topics, dispatcher_stats, strict=True),
+        ):
+            published = [
+                timestamp
+                for generator in generator_stats
+                for timestamp in generator.publish_timestamps.get(topic, [])
+            ]
+            backlog = max_backlog(published, stats.consume_timestamps)
+            backlogs.append(backlog)
+            if self.dispatcher_logger is not None:
+                self.dispatcher_logger.log(
+                    DispatcherResult(
+                        start_submit_tasks_timestamp=start,
+                        data_size_bytes=config.data_size_bytes,
+                        method=config.method,
+                        producers=config.producers,
+                        dispatchers=config.dispatchers,
+                        dispatch_policy=config.dispatch_policy,
+                        batch_size=config.batch_size,
+                        dispatcher=d,
+                        topic=topic,
+                        max_running_tasks=max_running_tasks[d],
+                        completed_tasks=stats.completed_tasks,
+                        items_per_s=(
+                            stats.completed_tasks
+                            / (stats.end_timestamp - start)
+                        ),
+                        max_backlog=backlog,
+                        max_prefetched=max(
+                            (depth.prefetched for depth in stats.queue_depths),
+                            default=0,
+                        ),
+                        stream_wait_s=stats.stream_wait_s,
+                        task_wait_s=stats.task_wait_s,
+                    ),
+                )
+
+        latencies: list[float] = []
+        for d, stats in enumerate(dispatcher_stats):
+            if self.queue_logger is not None:
+                for depth in stats.queue_depths:
+                    self.queue_logger.log(
+                        QueueDepthResult(
+                            start_submit_tasks_timestamp=start,
+                            data_size_bytes=config.data_size_bytes,
+                            method=config.method,
+                            dispatch_policy=config.dispatch_policy,
+                            prefetch=config.prefetch,
+                            dispatcher=d,
+                            timestamp=depth.timestamp,
+                            prefetched_items=depth.prefetched,
+                            running_tasks=depth.running,
+                        ),
+                    )
+            for timing in stats.item_timings:
+                latencies.append(timing.task.done - timing.stamp.timestamp)
+                if self.item_logger is not None:
+                    self.item_logger.log(
+                        ItemResult(
+                            start_submit_tasks_timestamp=start,
+                            data_size_bytes=config.data_size_bytes,
+                            method=config.method,
+                            producers=config.producers,
+                            dispatchers=config.dispatchers,
+                            producer=timing.stamp.producer,
+                            sequence=timing.stamp.sequence,
+                            dispatcher=d,
+                            publish_timestamp=timing.stamp.timestamp,
+                            dispatch_timestamp=timing.dispatch,
+                            resolve_timestamp=timing.task.resolved,
+                            done_timestamp=timing.task.done,
+                            publish_to_dispatch_s=(
+                                timing.dispatch - timing.stamp.timestamp
+                            ),
+                            dispatch_to_resolve_s=(
+                                timing.task.resolved - timing.dispatch
+                            ),
+                            resolve_to_done_s=(
+                                timing.task.done - timing.task.resolved
+                            ),
+                        ),
+                    )
+        # The runner checkpoints a run once its result is logged so the side
+        # results must also be written out by then.
+        for side_logger in (
+            self.dispatcher_logger,
+            self.queue_logger,
+            self.item_logger,
+        ):
+            if side_logger is not None:
+                side_logger.flush()
+
+        latency_p50, latency_p99 = (
+            numpy.percentile(latencies, [50, 99])
+            if len(latencies) > 0
+            else (float('nan'), float('nan'))
+        )
+        logger.log(
+            TEST_LOG_LEVEL,
+            f'Item latency (publish to done): p50={latency_p50:.6f}s, '
+            f'p99={latency_p99:.6f}s',
+        )
+
+        completed_tasks = sum(
+            stats.completed_tasks for stats in dispatcher_stats
+        )
+
         assert self.stream_config.kind is not None
         return RunResult(
             executor=self.executor.__class__.__name__,
-            connector=self.store.connector.__class__.__name__,
+            connector=connector_name(self.store.connector),
             stream=self.stream_config.kind,
             data_size_bytes=config.data_size_bytes,
+            payload_kind=self.payload.kind,
             task_count=config.task_count,
             task_sleep=config.task_sleep,
             method=config.method,
@@ -261,4 +906,13 @@ class Benchmark(ContextManagerAddIn):
             completed_tasks=completed_tasks,
             start_submit_tasks_timestamp=start,
             end_tasks_done_timestamp=end,
+            producers=config.producers,
+            dispatchers=config.dispatchers,
+            dispatch_policy=config.dispatch_policy,
+            prefetch=config.prefetch,
+            batch_size=config.batch_size,
+            items_per_s=completed_tasks / (end - start),
+            max_dispatcher_backlog=max(backlogs, default=0),
+            latency_p50_s=latency_p50,
+            latency_p99_s=latency_p99,
         )
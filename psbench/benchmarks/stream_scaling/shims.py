@@ -1,6 +1,11 @@
 from __future__ import annotations
 
+import collections
+import struct
 import sys
+import time
+from collections.abc import Sequence
+from typing import NamedTuple
 
 if sys.version_info >= (3, 11):  # pragma: >=3.11 cover
     from typing import Self
@@ -13,6 +18,9 @@ from proxystore.stream import StreamConsumer
 from proxystore.stream import StreamProducer
 from proxystore.stream.protocols import MessagePublisher
 
+from psbench.streams.zeromq import ZeroMQPublisher
+from psbench.streams.zeromq import ZeroMQSubscriber
+
 adios_import_error: Exception | None = None
 try:
     import adios2
@@ -21,18 +29,89 @@ except ImportError as e:  # pragma: no cover
 
 CLOSE_SENTINAL = b'<publisher-close-topic-sentinal>'
 
+_STAMP_STRUCT = struct.Struct('!iqd')
+STAMP_SIZE = _STAMP_STRUCT.size
+_BATCH_COUNT_STRUCT = struct.Struct('!I')
+_BATCH_LENGTH_STRUCT = struct.Struct('!Q')
+
+
+def pack_batch(
+    messages: Sequence[bytes],
+    headers: Sequence[bytes] | None = None,
+) -> bytes:
+    """Pack messages into a single length-prefixed message.
+
+    Args:
+        messages: messages to pack.
+        headers: optional header to prepend to each message. The headers are
+            packed with the messages so the messages are not copied to
+            prepend the headers beforehand.
+    """
+    if headers is None:
+        headers = [b''] * len(messages)
+    parts = [_BATCH_COUNT_STRUCT.pack(len(messages))]
+    for header, message in zip(headers, messages, strict=True):
+        parts.append(_BATCH_LENGTH_STRUCT.pack(len(header) + len(message)))
+        parts.append(header)
+        parts.append(message)
+    return b''.join(parts)
+
+
+def unpack_batch(data: bytes) -> list[memoryview]:
+    """Unpack the messages packed by `pack_batch()`.
+
+    The messages are views of the data so they are not copied.
+    """
+    view = memoryview(data)
+    (count,) = _BATCH_COUNT_STRUCT.unpack_from(data)
+    offset = _BATCH_COUNT_STRUCT.size
+    messages = []
+    for _ in range(count):
+        (length,) = _BATCH_LENGTH_STRUCT.unpack_from(data, offset)
+        offset += _BATCH_LENGTH_STRUCT.size
+        messages.append(view[offset : offset + length])
+        offset += length
+    return messages
+
+
+class ItemStamp(NamedTuple):
+    """Identity and publish time of a stream item.
+
+    Attributes:
+        producer: index of the producer which published the item.
+        sequence: sequence number of the item within the producer.
+        timestamp: time the item was published.
+    """
+
+    producer: int
+    sequence: int
+    timestamp: float
+
+    def pack(self) -> bytes:
+        """Pack the stamp into a fixed size header."""
+        return _STAMP_STRUCT.pack(*self)
+
+    @classmethod
+    def unpack(cls, data: bytes | memoryview) -> ItemStamp:
+        """Unpack the stamp from the header at the start of the data."""
+        return cls(*_STAMP_STRUCT.unpack_from(data))
+
 
 class Adios2Publisher:
-    def __init__(self, stream_file: str) -> None:
+    def __init__(self, stream_file: str, producer_id: int = 0) -> None:
         if adios_import_error is not None:  # pragma: no cover
             raise adios_import_error
 
         self.stream = adios2.Stream(stream_file, 'w')
+        self.producer_id = producer_id
+        self._sequence = 0
 
     def close(self) -> None:
         self.stream.close()
 
     def send_message(self, topic: str, message: bytes) -> None:
+        stamp = ItemStamp(self.producer_id, self._sequence, time.time())
+        self._sequence += 1
         self.stream.begin_step()
         array = numpy.frombuffer(message, dtype=numpy.int8)
         self.stream.write(
@@ -42,6 +121,14 @@ class Adios2Publisher:
             start=[0],
             count=[array.shape[0]],
         )
+        stamp_array = numpy.frombuffer(stamp.pack(), dtype=numpy.int8)
+        self.stream.write(
+            f'{topic}-stamp',
+            stamp_array,
+            shape=stamp_array.shape,
+            start=[0],
+            count=[stamp_array.shape[0]],
+        )
         self.stream.end_step()
 
 
@@ -63,15 +150,21 @@ class Adios2Subscriber:
         return self
 
     def __next__(self) -> bytes | int:
+        return self.next_with_stamp()[1]
+
+    def next_with_stamp(self) -> tuple[ItemStamp, bytes | int]:
         # Cycle to the next step internally in self.stream.
         next(self.stream)
 
+        stamp = ItemStamp.unpack(
+            self.stream.read(f'{self.topic}-stamp').tobytes(),
+        )
         if self.direct:  # pragma: no cover
             array = self.stream.read(self.topic)
             message = array.tobytes()
-            return message
+            return stamp, message
         else:
-            return self.stream.current_step()
+            return stamp, self.stream.current_step()
 
     def close(self) -> None:
         self.stream.close()
@@ -82,50 +175,166 @@ class ConsumerShim:
         self,
         consumer: StreamConsumer[bytes],
         direct_from_subscriber: bool = False,
+        producers: int = 1,
+        batched: bool = False,
     ) -> None:
         self.consumer = consumer
         self.direct_from_subscriber = direct_from_subscriber
+        # Each producer closes the topic so the stream only ends once all
+        # producers have closed the topic.
+        self.producers = producers
+        self._closed_producers = 0
+        # Messages received directly from the subscriber are batches packed
+        # by the ProducerShim.
+        self.batched = batched
+        self._buffer: collections.deque[bytes | memoryview] = (
+            collections.deque()
+        )
 
     def __iter__(self) -> Self:
         return self
 
-    def __next__(self) -> Proxy[bytes] | bytes:
+    def __next__(self) -> Proxy[bytes] | bytes | memoryview:
+        return self.next_with_stamp()[1]
+
+    def next_with_stamp(
+        self,
+    ) -> tuple[ItemStamp, Proxy[bytes] | bytes | memoryview]:
+        while self._closed_producers < self.producers:
+            try:
+                return self._next()
+            except StopIteration:
+                self._closed_producers += 1
+        raise StopIteration
+
+    def _next(self) -> tuple[ItemStamp, Proxy[bytes] | bytes | memoryview]:
         if self.direct_from_subscriber:
-            data = next(self.consumer.subscriber)
-            if data == CLOSE_SENTINAL:
-                raise StopIteration
-            assert isinstance(data, (Proxy, bytes))
-            return data
+            if len(self._buffer) == 0:
+                subscriber = self.consumer.subscriber
+                parts: list[bytes]
+                if isinstance(subscriber, ZeroMQSubscriber):
+                    parts = subscriber.next_message_parts()
+                else:
+                    message = next(subscriber)
+                    assert isinstance(message, bytes)
+                    parts = [message]
+                if parts == [CLOSE_SENTINAL]:
+                    raise StopIteration
+                if len(parts) == 2:
+                    # Unbatched ZeroMQ messages are sent as the stamp
+                    # header and the data.
+                    header, item = parts
+                    return ItemStamp.unpack(header), item
+                (message,) = parts
+                if self.batched:
+                    self._buffer.extend(unpack_batch(message))
+                else:
+                    self._buffer.append(message)
+            data = self._buffer.popleft()
+            # A view strips the stamp without copying the data.
+            return ItemStamp.unpack(data), memoryview(data)[STAMP_SIZE:]
         else:
-            return next(self.consumer)
+            metadata, item = self.consumer.next_with_metadata()
+            return ItemStamp(**metadata), item
 
     def close(self) -> None:
         self.consumer.close()
 
 
 class ProducerShim:
+    """Producer which stamps each item with its identity and publish time.
+
+    Attributes:
+        publish_timestamps: time each item was published to the broker for
+            each topic. Items in a batch are published when the batch is
+            flushed rather than when each item is sent to this producer.
+    """
+
     def __init__(
         self,
         producer: StreamProducer[bytes],
         direct_to_publisher: bool = False,
         proxy_evict: bool = True,
+        producer_id: int = 0,
+        batch_size: int = 1,
     ) -> None:
         self.producer = producer
         self.direct_to_publisher = direct_to_publisher
         self.proxy_evict = proxy_evict
+        self.producer_id = producer_id
+        # Messages sent directly to the publisher are packed into batches.
+        # Otherwise, the StreamProducer handles batching.
+        self.batch_size = batch_size
+        self._sequence = 0
+        self._buffers: dict[str, list[tuple[bytes, bytes]]] = (
+            collections.defaultdict(list)
+        )
+        self.publish_timestamps: dict[str, list[float]] = (
+            collections.defaultdict(list)
+        )
+        # Items sent to each topic which have not been published.
+        self._pending: dict[str, int] = collections.defaultdict(int)
+
+    def _record_publish(self, topic: str) -> None:
+        # Recorded before publishing so an item is never consumed before it
+        # is published.
+        pending = self._pending.pop(topic, 0)
+        self.publish_timestamps[topic].extend([time.time()] * pending)
 
     def send_message(self, topic: str, data: bytes) -> None:
         assert isinstance(self.producer.publisher, MessagePublisher)
+        stamp = ItemStamp(self.producer_id, self._sequence, time.time())
+        self._sequence += 1
+        self._pending[topic] += 1
+        # Both the StreamProducer and the direct batches are flushed once
+        # the batch is full.
+        if self._pending[topic] >= self.batch_size:
+            self._record_publish(topic)
+        if self.direct_to_publisher:
+            # Raw messages have no metadata so the stamp is a header. The
+            # header is kept separate until the message is sent so the data
+            # is not copied to prepend the header.
+            header = stamp.pack()
+            publisher = self.producer.publisher
+            if self.batch_size > 1:
+                self._buffers[topic].append((header, data))
+                if len(self._buffers[topic]) >= self.batch_size:
+                    self.flush_topic(topic)
+            elif isinstance(publisher, ZeroMQPublisher):
+                publisher.send_message_parts(topic, (header, data))
+            else:
+                # Other publishers only send single-part messages.
+                publisher.send_message(topic, header + data)
+        else:
+            self.producer.send(
+                topic,
+                data,
+                evict=self.proxy_evict,
+                metadata=stamp._asdict(),
+            )
+
+    def flush_topic(self, topic: str) -> None:
+        assert isinstance(self.producer.publisher, MessagePublisher)
+        self._record_publish(topic)
         if self.direct_to_publisher:
-            self.producer.publisher.send_message(topic, data)
+            buffered = self._buffers.pop(topic, [])
+            if len(buffered) > 0:
+                headers, messages = zip(*buffered, strict=True)
+                self.producer.publisher.send_message(
+                    topic,
+                    pack_batch(messages, headers),
+                )
         else:
-            self.producer.send(topic, data, evict=self.proxy_evict)
+            self.producer.flush_topic(topic)
 
     def close_topic(self, topic: str) -> None:
         assert isinstance(self.producer.publisher, MessagePublisher)
         if self.direct_to_publisher:
+            self.flush_topic(topic)
             self.producer.publisher.send_message(topic, CLOSE_SENTINAL)
         else:
+            # Closing the topic flushes any partial batch.
+            self._record_publish(topic)
             self.producer.close_topics(topic)
 
     def close(self) -> None:
@@ -14,6 +14,7 @@ from typing import NamedTuple
 
 from parsl.concurrent import ParslPoolExecutor
 from proxystore.proxy import Proxy
+from proxystore.proxy import resolve
 from proxystore.store.base import Store
 from proxystore.store.future import Future as ProxyFuture
 
@@ -21,6 +22,8 @@ from psbench.benchmarks.protocol import ContextManagerAddIn
 from psbench.benchmarks.task_pipelining.config import RunConfig
 from psbench.benchmarks.task_pipelining.config import RunResult
 from psbench.benchmarks.task_pipelining.config import SubmissionMethod
+from psbench.config.payload import PayloadConfig
+from psbench.connectors.wan import connector_name
 from psbench.executor.dask import DaskExecutor
 from psbench.utils import randbytes
 
@@ -48,10 +51,12 @@ class TaskTimes(NamedTuple):
 
 
 def sequential_no_proxy_task(
-    data: bytes,
+    data: Any,
     overhead_fraction: float,
     sleep: float,
-) -> tuple[bytes, TaskTimes]:
+    payload: PayloadConfig | None = None,
+    payload_index: int = 0,
+) -> tuple[Any, TaskTimes]:
     import time
 
     start_timestamp = time.time()
@@ -61,7 +66,7 @@ def sequential_no_proxy_task(
     time.sleep(overhead_fraction * sleep)
 
     start_resolve_timestamp = time.time()
-    assert isinstance(data, bytes)
+    assert not isinstance(data, Proxy)
     end_resolve_timestamp = time.time()
 
     resolve_time = end_resolve_timestamp - start_resolve_timestamp
@@ -69,7 +74,11 @@ def sequential_no_proxy_task(
     time.sleep(max(compute_sleep - resolve_time, 0))
 
     start_generate_timestamp = time.time()
-    result = randbytes(len(data))
+    result = (
+        randbytes(len(data))
+        if payload is None
+        else payload.generate_like(data, payload_index)
+    )
     end_generate_timestamp = time.time()
 
     times = TaskTimes(
@@ -84,11 +93,13 @@ def sequential_no_proxy_task(
 
 
 def sequential_proxy_task(
-    data: Proxy[bytes],
+    data: Proxy[Any],
     overhead_fraction: float,
     sleep: float,
     prepopulate: bool = False,
-) -> Proxy[tuple[Proxy[bytes], TaskTimes]]:
+    payload: PayloadConfig | None = None,
+    payload_index: int = 0,
+) -> Proxy[tuple[Proxy[Any], TaskTimes]]:
     import time
 
     start_timestamp = time.time()
@@ -102,7 +113,6 @@ def sequential_proxy_task(
 
     start_resolve_timestamp = time.time()
     resolve(data)
-    assert isinstance(data, bytes)
     end_resolve_timestamp = time.time()
 
     resolve_time = end_resolve_timestamp - start_resolve_timestamp
@@ -112,7 +122,11 @@ def sequential_proxy_task(
     start_generate_timestamp = time.time()
     store = get_store(data)
     assert store is not None
-    result = randbytes(len(data))
+    result = (
+        randbytes(len(data))
+        if payload is None
+        else payload.generate_like(data, payload_index)
+    )
     proxy = store.proxy(result, evict=True, populate_target=prepopulate)
     end_generate_timestamp = time.time()
 
@@ -128,11 +142,13 @@ def sequential_proxy_task(
 
 
 def pipelined_task(
-    data: Proxy[bytes],
-    future: ProxyFuture[bytes],
+    data: Proxy[Any],
+    future: ProxyFuture[Any],
     overhead_fraction: float,
     sleep: float,
     prepopulate: bool = False,
+    payload: PayloadConfig | None = None,
+    payload_index: int = 0,
 ) -> TaskTimes:
     import time
 
@@ -146,7 +162,6 @@ def pipelined_task(
 
     start_resolve_timestamp = time.time()
     resolve(data)
-    assert isinstance(data, bytes)
     end_resolve_timestamp = time.time()
 
     resolve_time = end_resolve_timestamp - start_resolve_timestamp
@@ -154,7 +169,11 @@ def pipelined_task(
     time.sleep(max(compute_sleep - resolve_time, 0))
 
     start_generate_timestamp = time.time()
-    result = randbytes(len(data))
+    result = (
+        randbytes(len(data))
+        if payload is None
+        else payload.generate_like(data, payload_index)
+    )
     future.set_result(result)
     end_generate_timestamp = time.time()
 
@@ -174,11 +193,16 @@ def run_sequential_workflow(
     task_data_bytes: int,
     task_overhead_fraction: float,
     task_sleep: float,
+    payload: PayloadConfig | None = None,
 ) -> RunResult:
     start = time.perf_counter_ns()
 
     # Create the initial data for the first task
-    data = randbytes(task_data_bytes)
+    data = (
+        randbytes(task_data_bytes)
+        if payload is None
+        else payload.generate(task_data_bytes)
+    )
     if store is not None:
         data = store.proxy(data, evict=True, populate_target=True)
 
@@ -190,13 +214,15 @@ def run_sequential_workflow(
 
     task_timestamps: list[list[float]] = []
 
-    for _ in range(task_chain_length):
+    for i in range(task_chain_length):
         task_submitted = time.time()
         future: Future[Any] = executor.submit(
             sequential_task,  # type: ignore[arg-type]
             data,
             overhead_fraction=task_overhead_fraction,
             sleep=task_sleep,
+            payload=payload,
+            payload_index=i + 1,
         )
         data, task_time = future.result()
         task_received = time.time()
@@ -205,14 +231,15 @@ def run_sequential_workflow(
         )
 
     # Resolve the final resulting data
-    assert isinstance(data, bytes)
+    if isinstance(data, Proxy):
+        resolve(data)
 
     end = time.perf_counter_ns()
 
     method = 'sequential-no-proxy' if store is None else 'sequential-proxy'
     return RunResult(
         executor=executor.__class__.__name__,
-        connector=store.connector.__class__.__name__
+        connector=connector_name(store.connector)
         if store is not None
         else 'None',
         submission_method=method,
@@ -220,6 +247,7 @@ def run_sequential_workflow(
         task_data_bytes=task_data_bytes,
         task_overhead_fraction=task_overhead_fraction,
         task_sleep=task_sleep,
+        payload_kind='bytes' if payload is None else payload.kind,
         task_timestamps=TaskTimes.serialize(task_timestamps),
         workflow_makespan_ms=(end - start) / 1e6,
     )
@@ -232,6 +260,7 @@ def run_pipelined_workflow(
     task_data_bytes: int,
     task_overhead_fraction: float,
     task_sleep: float,
+    payload: PayloadConfig | None = None,
 ) -> RunResult:
     start = time.perf_counter_ns()
 
@@ -241,15 +270,19 @@ def run_pipelined_workflow(
     task_received: list[float] = []
 
     # Create the initial data for the first task
-    data = randbytes(task_data_bytes)
+    data = (
+        randbytes(task_data_bytes)
+        if payload is None
+        else payload.generate(task_data_bytes)
+    )
     proxy = store.proxy(data, evict=True, populate_target=True)
 
-    proxies: queue.Queue[Proxy[bytes]] = queue.Queue()
+    proxies: queue.Queue[Proxy[Any]] = queue.Queue()
     proxies.put(proxy)
 
     def submitter() -> None:
-        for _ in range(task_chain_length):
-            data_future: ProxyFuture[bytes] = store.future(
+        for i in range(task_chain_length):
+            data_future: ProxyFuture[Any] = store.future(
                 evict=True,
                 polling_interval=0.001,
             )
@@ -263,6 +296,8 @@ def run_pipelined_workflow(
                     executor,
                     (DaskExecutor, ParslPoolExecutor),
                 ),
+                payload=payload,
+                payload_index=i + 1,
             )
             task_submitted.append(time.time())
             task_futures.put(task_future)
@@ -290,7 +325,7 @@ def run_pipelined_workflow(
     receiver_thread.join()
 
     # Resolve the final resulting data
-    assert isinstance(proxy, bytes)
+    resolve(proxy)
 
     end = time.perf_counter_ns()
 
@@ -306,12 +341,13 @@ def run_pipelined_workflow(
 
     return RunResult(
         executor=executor.__class__.__name__,
-        connector=store.connector.__class__.__name__,
+        connector=connector_name(store.connector),
         submission_method='pipelined-proxy-future',
         task_chain_length=task_chain_length,
         task_data_bytes=task_data_bytes,
         task_overhead_fraction=task_overhead_fraction,
         task_sleep=task_sleep,
+        payload_kind='bytes' if payload is None else payload.kind,
         task_timestamps=TaskTimes.serialize(task_timestamps),
         workflow_makespan_ms=(end - start) / 1e6,
     )
@@ -322,15 +358,22 @@ class Benchmark(ContextManagerAddIn):
     config_type = RunConfig
     result_type = RunResult
 
-    def __init__(self, executor: Executor, store: Store[Any]) -> None:
+    def __init__(
+        self,
+        executor: Executor,
+        store: Store[Any],
+        payload: PayloadConfig | None = None,
+    ) -> None:
         self.executor = executor
         self.store = store
+        self.payload = payload if payload is not None else PayloadConfig()
         super().__init__(managers=[self.executor, self.store])
 
     def config(self) -> dict[str, Any]:
         return {
             'executor': self.executor.__class__.__name__,
-            'connector': self.store.connector.__class__.__name__,
+            'connector': connector_name(self.store.connector),
+            'payload': self.payload,
         }
 
     def run(self, config: RunConfig) -> RunResult:
@@ -343,6 +386,7 @@ class Benchmark(ContextManagerAddIn):
                 task_data_bytes=config.task_data_bytes,
                 task_overhead_fraction=config.task_overhead_fraction,
                 task_sleep=config.task_sleep,
+                payload=self.payload,
             )
         elif method == SubmissionMethod.SEQUENTIAL_PROXY:
             result = run_sequential_workflow(
@@ -352,6 +396,7 @@ class Benchmark(ContextManagerAddIn):
                 task_data_bytes=config.task_data_bytes,
                 task_overhead_fraction=config.task_overhead_fraction,
                 task_sleep=config.task_sleep,
+                payload=self.payload,
             )
         elif method == SubmissionMethod.PIPELINED_PROXY_FUTURE:
             result = run_pipelined_workflow(
@@ -361,6 +406,7 @@ class Benchmark(ContextManagerAddIn):
                 task_data_bytes=config.task_data_bytes,
                 task_overhead_fraction=config.task_overhead_fraction,
                 task_sleep=config.task_sleep,
+                payload=self.payload,
             )
         else:
             raise AssertionError('Unreachable.')
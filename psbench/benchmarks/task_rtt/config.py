@@ -13,12 +13,15 @@ else:  # pragma: <3.11 cover
     from typing_extensions import Self
 
 from pydantic import BaseModel
+from pydantic import Field
 
 
 class RunConfig(BaseModel):
     sleep: float
     input_size_bytes: int
     output_size_bytes: int
+    concurrency: int = 1
+    total_tasks: int = 1
 
 
 class RunResult(BaseModel):
@@ -26,8 +29,15 @@ class RunResult(BaseModel):
     task_name: str
     input_size_bytes: int
     output_size_bytes: int
+    payload_kind: str = 'bytes'
     task_sleep_seconds: float
+    concurrency: int = 1
+    total_tasks: int = 1
     total_time_ms: float
+    throughput_tasks_per_s: Optional[float] = None  # noqa: UP045
+    latency_p50_ms: Optional[float] = None  # noqa: UP045
+    latency_p90_ms: Optional[float] = None  # noqa: UP045
+    latency_p99_ms: Optional[float] = None  # noqa: UP045
     input_get_ms: Optional[float] = None  # noqa: UP045
     input_put_ms: Optional[float] = None  # noqa: UP045
     input_proxy_ms: Optional[float] = None  # noqa: UP045
@@ -42,6 +52,9 @@ class BenchmarkMatrix(BaseModel):
     sleep: float
     input_sizes: List[int]  # noqa: UP006
     output_sizes: List[int]  # noqa: UP006
+    concurrency: List[int] = Field(default_factory=lambda: [1])  # noqa: UP006
+    total_tasks: int = 1
+    zero_copy: bool = False
 
     @staticmethod
     def add_parser_group(parser: argparse.ArgumentParser) -> None:
@@ -66,6 +79,34 @@ class BenchmarkMatrix(BaseModel):
             required=True,
             help='Task output size in bytes',
         )
+        group.add_argument(
+            '--concurrency',
+            metavar='N',
+            type=int,
+            nargs='+',
+            default=[1],
+            help='Maximum number of tasks in-flight at once',
+        )
+        group.add_argument(
+            '--total-tasks',
+            metavar='M',
+            type=int,
+            default=1,
+            help=(
+                'Total tasks to complete per run. Each run keeps up to '
+                '--concurrency tasks outstanding until all have completed'
+            ),
+        )
+        group.add_argument(
+            '--zero-copy',
+            action='store_true',
+            default=False,
+            help=(
+                'Wrap task inputs and outputs so executors which pickle with '
+                'protocol 5 and out-of-band buffers avoid copying the data '
+                '(cannot be used with ProxyStore or IPFS)'
+            ),
+        )
 
     @classmethod
     def from_args(cls, **kwargs: Any) -> Self:
@@ -73,6 +114,9 @@ class BenchmarkMatrix(BaseModel):
             sleep=kwargs['task_sleep'],
             input_sizes=kwargs['input_sizes'],
             output_sizes=kwargs['output_sizes'],
+            concurrency=kwargs['concurrency'],
+            total_tasks=kwargs['total_tasks'],
+            zero_copy=kwargs.get('zero_copy', False),
         )
 
     def configs(self) -> tuple[RunConfig, ...]:
@@ -81,9 +125,12 @@ class BenchmarkMatrix(BaseModel):
                 sleep=self.sleep,
                 input_size_bytes=input_size,
                 output_size_bytes=output_size,
+                concurrency=concurrency,
+                total_tasks=self.total_tasks,
             )
-            for input_size, output_size in itertools.product(
+            for input_size, output_size, concurrency in itertools.product(
                 self.input_sizes,
                 self.output_sizes,
+                self.concurrency,
             )
         )
@@ -1,13 +1,20 @@
 from __future__ import annotations
 
+import itertools
 import logging
 import os
+import queue
 import shutil
+import statistics
 import sys
 import time
 import uuid
+from collections.abc import Callable
 from concurrent.futures import Executor
+from concurrent.futures import Future
 from typing import Any
+from typing import NamedTuple
+from typing import TypeVar
 
 if sys.version_info >= (3, 11):  # pragma: >=3.11 cover
     pass
@@ -26,11 +33,124 @@ from psbench.benchmarks.task_rtt.config import RunResult
 from psbench.benchmarks.task_rtt.tasks import pong
 from psbench.benchmarks.task_rtt.tasks import pong_ipfs
 from psbench.benchmarks.task_rtt.tasks import pong_proxy
+from psbench.benchmarks.task_rtt.tasks import pong_zero_copy
+from psbench.benchmarks.task_rtt.tasks import ProxyStats
+from psbench.benchmarks.task_rtt.tasks import ZeroCopyPayload
+from psbench.config.payload import PayloadConfig
+from psbench.connectors.wan import connector_name
 from psbench.logging import BENCH_LOG_LEVEL
 from psbench.utils import randbytes
 
 logger = logging.getLogger('task-rtt')
 
+T = TypeVar('T')
+
+
+class InFlightStats(NamedTuple):
+    """Timing of a group of tasks executed with bounded concurrency."""
+
+    total_time_ms: float
+    latencies_ms: list[float]
+
+    @property
+    def throughput_tasks_per_s(self) -> float:
+        return len(self.latencies_ms) / (self.total_time_ms / 1000)
+
+    def percentile(self, q: float) -> float:
+        """Compute the q-th percentile of the task latencies."""
+        if len(self.latencies_ms) == 1:
+            return self.latencies_ms[0]
+        quantiles = statistics.quantiles(
+            self.latencies_ms,
+            n=1000,
+            method='inclusive',
+        )
+        return quantiles[round(q * 10) - 1]
+
+
+def run_in_flight(
+    submit: Callable[[], Future[T]],
+    complete: Callable[[T], None],
+    *,
+    concurrency: int = 1,
+    total_tasks: int = 1,
+) -> InFlightStats:
+    """Keep up to `concurrency` tasks outstanding until all have completed.
+
+    A new task is submitted as soon as any outstanding task finishes
+    (i.e., `FIRST_COMPLETED` semantics). Completion is signalled via
+    `add_done_callback` rather than
+    [`wait()`][concurrent.futures.wait] because not all executors (e.g.,
+    Dask) return [`concurrent.futures.Future`][concurrent.futures.Future]
+    instances.
+
+    Args:
+        submit: Callable which submits a single task and returns its future.
+        complete: Callable invoked in the calling thread with the result of
+            each completed task. This is included in the task's latency.
+        concurrency: Maximum number of tasks in-flight at once.
+        total_tasks: Total number of tasks to submit.
+
+    Returns:
+        Total elapsed time and the latency of each task in completion order.
+    """
+    if concurrency < 1 or total_tasks < 1:
+        raise ValueError('Concurrency and total tasks must be at least one.')
+
+    completed: queue.SimpleQueue[Future[T]] = queue.SimpleQueue()
+    submit_times: dict[Future[T], int] = {}
+    latencies_ms: list[float] = []
+    submitted = 0
+
+    start = time.perf_counter_ns()
+    while len(latencies_ms) < total_tasks:
+        while submitted < total_tasks and len(submit_times) < concurrency:
+            submit_time = time.perf_counter_ns()
+            future = submit()
+            submit_times[future] = submit_time
+            future.add_done_callback(completed.put)
+            submitted += 1
+
+        future = completed.get()
+        complete(future.result())
+        done_time = time.perf_counter_ns()
+        latencies_ms.append((done_time - submit_times.pop(future)) / 1e6)
+    end = time.perf_counter_ns()
+
+    return InFlightStats(
+        total_time_ms=(end - start) / 1e6,
+        latencies_ms=latencies_ms,
+    )
+
+
+def _result(
+    stats: InFlightStats,
+    *,
+    proxystore_backend: str,
+    input_size: int,
+    output_size: int,
+    task_sleep: float,
+    concurrency: int,
+    payload_kind: str = 'bytes',
+    **kwargs: Any,
+) -> RunResult:
+    return RunResult(
+        proxystore_backend=proxystore_backend,
+        task_name='pong',
+        input_size_bytes=input_size,
+        output_size_bytes=output_size,
+        payload_kind=payload_kind,
+        task_sleep_seconds=task_sleep,
+        concurrency=concurrency,
+        total_tasks=len(stats.latencies_ms),
+        total_time_ms=stats.total_time_ms,
+        throughput_tasks_per_s=stats.throughput_tasks_per_s,
+        latency_p50_ms=stats.percentile(50),
+        latency_p90_ms=stats.percentile(90),
+        latency_p99_ms=stats.percentile(99),
+        **kwargs,
+    )
+
 
 def time_task(
     *,
@@ -38,38 +158,123 @@ def time_task(
     input_size: int,
     output_size: int,
     task_sleep: float,
+    concurrency: int = 1,
+    total_tasks: int = 1,
+    payload: PayloadConfig | None = None,
 ) -> RunResult:
-    """Execute and time a single task.
+    """Execute and time tasks.
 
     Args:
         executor (Executor): Executor to submit task through.
         input_size (int): number of bytes to send as input to task.
         output_size (int): number of bytes task should return.
         task_sleep (int): number of seconds to sleep inside task.
+        concurrency (int): maximum number of tasks in-flight at once.
+        total_tasks (int): total number of tasks to execute.
+        payload (PayloadConfig): configuration for generating task inputs
+            and outputs. Defaults to random bytes.
 
     Returns:
         RunResult
     """
-    data = randbytes(input_size)
-    start = time.perf_counter_ns()
-    fut = executor.submit(
-        pong,
-        data,
-        result_size=output_size,
-        sleep=task_sleep,
-    )
-    result = fut.result()
+    payload = payload if payload is not None else PayloadConfig()
+    data = payload.generate(input_size)
+    # Task results use indices after the input so seeded payloads differ.
+    payload_indices = itertools.count(1)
+
+    def _submit() -> Future[Any]:
+        return executor.submit(
+            pong,
+            data,
+            result_size=output_size,
+            sleep=task_sleep,
+            payload=payload,
+            payload_index=next(payload_indices),
+        )
 
-    end = time.perf_counter_ns()
-    assert isinstance(result, bytes)
+    def _complete(result: Any) -> None:
+        assert result is not None
 
-    return RunResult(
+    stats = run_in_flight(
+        _submit,
+        _complete,
+        concurrency=concurrency,
+        total_tasks=total_tasks,
+    )
+
+    return _result(
+        stats,
         proxystore_backend='',
-        task_name='pong',
-        input_size_bytes=input_size,
-        output_size_bytes=output_size,
-        task_sleep_seconds=task_sleep,
-        total_time_ms=(end - start) / 1e6,
+        input_size=input_size,
+        output_size=output_size,
+        task_sleep=task_sleep,
+        concurrency=concurrency,
+        payload_kind=payload.kind,
+    )
+
+
+def time_task_zero_copy(
+    *,
+    executor: Executor,
+    input_size: int,
+    output_size: int,
+    task_sleep: float,
+    concurrency: int = 1,
+    total_tasks: int = 1,
+    payload: PayloadConfig | None = None,
+) -> RunResult:
+    """Execute and time tasks with zero-copy wrapped inputs and outputs.
+
+    Inputs and outputs are wrapped in a
+    [`ZeroCopyPayload`][psbench.benchmarks.task_rtt.tasks.ZeroCopyPayload]
+    so executors which serialize with pickle protocol 5 and out-of-band
+    buffers avoid copying the data during pickling.
+
+    Args:
+        executor (Executor): Executor to submit task through.
+        input_size (int): number of bytes to send as input to task.
+        output_size (int): number of bytes task should return.
+        task_sleep (int): number of seconds to sleep inside task.
+        concurrency (int): maximum number of tasks in-flight at once.
+        total_tasks (int): total number of tasks to execute.
+        payload (PayloadConfig): configuration for generating task inputs
+            and outputs. Defaults to random bytes.
+
+    Returns:
+        RunResult
+    """
+    payload = payload if payload is not None else PayloadConfig()
+    data = ZeroCopyPayload(payload.generate(input_size))
+    payload_indices = itertools.count(1)
+
+    def _submit() -> Future[ZeroCopyPayload]:
+        return executor.submit(
+            pong_zero_copy,
+            data,
+            result_size=output_size,
+            sleep=task_sleep,
+            payload=payload,
+            payload_index=next(payload_indices),
+        )
+
+    def _complete(result: ZeroCopyPayload) -> None:
+        assert isinstance(result, ZeroCopyPayload)
+
+    stats = run_in_flight(
+        _submit,
+        _complete,
+        concurrency=concurrency,
+        total_tasks=total_tasks,
+    )
+
+    return _result(
+        stats,
+        proxystore_backend='ZeroCopy',
+        input_size=input_size,
+        output_size=output_size,
+        task_sleep=task_sleep,
+        concurrency=concurrency,
+        payload_kind=payload.kind,
     )
 
 
@@ -81,8 +286,10 @@ def time_task_ipfs(
     input_size: int,
     output_size: int,
     task_sleep: float,
+    concurrency: int = 1,
+    total_tasks: int = 1,
 ) -> RunResult:
-    """Execute and time a single task with IPFS for transfer.
+    """Execute and time tasks with IPFS for transfer.
 
     Args:
         executor (Executor): Executor to submit task through.
@@ -91,39 +298,46 @@ def time_task_ipfs(
         input_size (int): number of bytes to send as input to task.
         output_size (int): number of bytes task should return.
         task_sleep (int): number of seconds to sleep inside task.
+        concurrency (int): maximum number of tasks in-flight at once.
+        total_tasks (int): total number of tasks to execute.
 
     Returns:
         RunResult
     """
     data = randbytes(input_size)
-    start = time.perf_counter_ns()
-
     os.makedirs(ipfs_local_dir, exist_ok=True)
-    filepath = os.path.join(ipfs_local_dir, str(uuid.uuid4()))
-    cid = ipfs.add_data(data, filepath)
-
-    fut = executor.submit(
-        pong_ipfs,
-        cid,
-        ipfs_remote_dir,
-        result_size=output_size,
-        sleep=task_sleep,
-    )
-    result = fut.result()
 
-    if result is not None:
-        data = ipfs.get_data(result)
+    def _submit() -> Future[str | None]:
+        filepath = os.path.join(ipfs_local_dir, str(uuid.uuid4()))
+        cid = ipfs.add_data(data, filepath)
 
-    end = time.perf_counter_ns()
-    assert isinstance(data, bytes)
+        return executor.submit(
+            pong_ipfs,
+            cid,
+            ipfs_remote_dir,
+            result_size=output_size,
+            sleep=task_sleep,
+        )
 
-    return RunResult(
+    def _complete(result: str | None) -> None:
+        if result is not None:
+            output = ipfs.get_data(result)
+            assert isinstance(output, bytes)
+
+    stats = run_in_flight(
+        _submit,
+        _complete,
+        concurrency=concurrency,
+        total_tasks=total_tasks,
+    )
+
+    return _result(
+        stats,
         proxystore_backend='IPFS',
-        task_name='pong',
-        input_size_bytes=input_size,
-        output_size_bytes=output_size,
-        task_sleep_seconds=task_sleep,
-        total_time_ms=(end - start) / 1e6,
+        input_size=input_size,
+        output_size=output_size,
+        task_sleep=task_sleep,
+        concurrency=concurrency,
     )
 
 
@@ -134,8 +348,14 @@ def time_task_proxy(
     input_size: int,
     output_size: int,
     task_sleep: float,
+    concurrency: int = 1,
+    total_tasks: int = 1,
+    payload: PayloadConfig | None = None,
 ) -> RunResult:
-    """Execute and time a single task with proxied inputs.
+    """Execute and time tasks with proxied inputs.
+
+    When more than one task is executed, the reported proxy operation times
+    are averaged across tasks.
 
     Args:
         executor (Executor): Executor to submit task through.
@@ -143,53 +363,80 @@ def time_task_proxy(
         input_size (int): number of bytes to send as input to task.
         output_size (int): number of bytes task should return.
         task_sleep (int): number of seconds to sleep inside task.
+        concurrency (int): maximum number of tasks in-flight at once.
+        total_tasks (int): total number of tasks to execute.
+        payload (PayloadConfig): configuration for generating task inputs
+            and outputs. Defaults to random bytes.
 
     Returns:
         RunResult
     """
-    data = randbytes(input_size)
-    start = time.perf_counter_ns()
+    payload = payload if payload is not None else PayloadConfig()
+    data = payload.generate(input_size)
+    payload_indices = itertools.count(1)
+    inputs: list[Proxy[Any]] = []
+    outputs: list[Proxy[Any]] = []
+    task_stats: list[ProxyStats] = []
+
+    def _submit() -> Future[tuple[Proxy[Any], ProxyStats | None]]:
+        proxy: Proxy[Any] = store.proxy(data, evict=True)
+        inputs.append(proxy)
+        return executor.submit(
+            pong_proxy,
+            proxy,
+            evict_result=False,
+            result_size=output_size,
+            sleep=task_sleep,
+            payload=payload,
+            payload_index=next(payload_indices),
+        )
 
-    proxy: Proxy[bytes] = store.proxy(data, evict=True)
-    fut = executor.submit(
-        pong_proxy,
-        proxy,
-        evict_result=False,
-        result_size=output_size,
-        sleep=task_sleep,
+    def _complete(result: tuple[Proxy[Any], ProxyStats | None]) -> None:
+        output, stats = result
+        proxystore.proxy.resolve(output)
+        key = get_key(output)
+        assert key is not None
+        store.evict(key)
+        assert isinstance(output, Proxy)
+        assert stats is not None
+        outputs.append(output)
+        task_stats.append(stats)
+
+    stats = run_in_flight(
+        _submit,
+        _complete,
+        concurrency=concurrency,
+        total_tasks=total_tasks,
     )
-    (result, task_proxy_stats) = fut.result()
-
-    proxystore.proxy.resolve(result)
-    key = get_key(result)
-    assert key is not None
-    store.evict(key)
-    end = time.perf_counter_ns()
-    assert isinstance(result, bytes)
-    assert isinstance(result, Proxy)
 
     assert store.metrics is not None
-    input_metrics = store.metrics.get_metrics(proxy)
-    output_metrics = store.metrics.get_metrics(result)
-    assert input_metrics is not None
-    assert output_metrics is not None
-    assert task_proxy_stats is not None
-
-    return RunResult(
-        proxystore_backend=store.connector.__class__.__name__,
-        task_name='pong',
-        input_size_bytes=input_size,
-        output_size_bytes=output_size,
-        task_sleep_seconds=task_sleep,
-        total_time_ms=(end - start) / 1e6,
-        input_get_ms=task_proxy_stats.input_get_ms,
-        input_put_ms=input_metrics.times['store.put'].avg_time_ms,
-        input_proxy_ms=input_metrics.times['store.proxy'].avg_time_ms,
-        input_resolve_ms=task_proxy_stats.input_resolve_ms,
-        output_get_ms=output_metrics.times['store.get'].avg_time_ms,
-        output_put_ms=task_proxy_stats.output_put_ms,
-        output_proxy_ms=task_proxy_stats.output_proxy_ms,
-        output_resolve_ms=output_metrics.times['factory.resolve'].avg_time_ms,
+    input_metrics = [store.metrics.get_metrics(p) for p in inputs]
+    output_metrics = [store.metrics.get_metrics(p) for p in outputs]
+    assert all(m is not None for m in input_metrics)
+    assert all(m is not None for m in output_metrics)
+
+    def _avg_time_ms(metrics: list[Any], attr: str) -> float:
+        return statistics.mean(m.times[attr].avg_time_ms for m in metrics)
+
+    def _avg_stat(attr: str) -> float:
+        return statistics.mean(getattr(s, attr) for s in task_stats)
+
+    return _result(
+        stats,
+        proxystore_backend=connector_name(store.connector),
+        input_size=input_size,
+        output_size=output_size,
+        task_sleep=task_sleep,
+        concurrency=concurrency,
+        payload_kind=payload.kind,
+        input_get_ms=_avg_stat('input_get_ms'),
+        input_put_ms=_avg_time_ms(input_metrics, 'store.put'),
+        input_proxy_ms=_avg_time_ms(input_metrics, 'store.proxy'),
+        input_resolve_ms=_avg_stat('input_resolve_ms'),
+        output_get_ms=_avg_time_ms(output_metrics, 'store.get'),
+        output_put_ms=_avg_stat('output_put_ms'),
+        output_proxy_ms=_avg_stat('output_proxy_ms'),
+        output_resolve_ms=_avg_time_ms(output_metrics, 'factory.resolve'),
     )
 
 
@@ -205,17 +452,27 @@ class Benchmark(ContextManagerAddIn):
         use_ipfs: bool = False,
         ipfs_local_dir: str | None = None,
         ipfs_remote_dir: str | None = None,
+        payload: PayloadConfig | None = None,
+        zero_copy: bool = False,
     ) -> None:
         if store is not None and use_ipfs:
             raise ValueError(
                 'IPFS and ProxyStore cannot be used at the same time.',
             )
+        if zero_copy and (store is not None or use_ipfs):
+            raise ValueError(
+                'Zero-copy submission cannot be used with ProxyStore or IPFS.',
+            )
+        self.payload = payload if payload is not None else PayloadConfig()
+        if use_ipfs and self.payload.kind != 'bytes':
+            raise ValueError('IPFS only supports bytes payloads.')
 
         self.executor = executor
         self.store = store
         self.use_ipfs = use_ipfs
         self.ipfs_local_dir = ipfs_local_dir
         self.ipfs_remote_dir = ipfs_remote_dir
+        self.zero_copy = zero_copy
         super().__init__(managers=[self.executor, self.store])
 
     def close(self) -> None:
@@ -236,7 +493,7 @@ class Benchmark(ContextManagerAddIn):
 
     def config(self) -> dict[str, Any]:
         connector = (
-            self.store.connector.__class__.__name__
+            connector_name(self.store.connector)
             if self.store is not None
             else 'None'
         )
@@ -246,6 +503,8 @@ class Benchmark(ContextManagerAddIn):
             'use_ipfs': self.use_ipfs,
             'ipfs_local_dir': self.ipfs_local_dir,
             'ipfs_remote_dir': self.ipfs_remote_dir,
+            'payload': self.payload,
+            'zero_copy': self.zero_copy,
         }
 
     def run(self, config: RunConfig) -> RunResult:
@@ -256,6 +515,9 @@ class Benchmark(ContextManagerAddIn):
                 input_size=config.input_size_bytes,
                 output_size=config.output_size_bytes,
                 task_sleep=config.sleep,
+                concurrency=config.concurrency,
+                total_tasks=config.total_tasks,
+                payload=self.payload,
             )
         elif self.use_ipfs:
             assert self.ipfs_local_dir is not None
@@ -267,6 +529,18 @@ class Benchmark(ContextManagerAddIn):
                 input_size=config.input_size_bytes,
                 output_size=config.output_size_bytes,
                 task_sleep=config.sleep,
+                concurrency=config.concurrency,
+                total_tasks=config.total_tasks,
+            )
+        elif self.zero_copy:
+            result = time_task_zero_copy(
+                executor=self.executor,
+                input_size=config.input_size_bytes,
+                output_size=config.output_size_bytes,
+                task_sleep=config.sleep,
+                concurrency=config.concurrency,
+                total_tasks=config.total_tasks,
+                payload=self.payload,
             )
         else:
             result = time_task(
@@ -274,5 +548,8 @@ class Benchmark(ContextManagerAddIn):
                 input_size=config.input_size_bytes,
                 output_size=config.output_size_bytes,
                 task_sleep=config.sleep,
+                concurrency=config.concurrency,
+                total_tasks=config.total_tasks,
+                payload=self.payload,
             )
         return result
@@ -1,9 +1,19 @@
 from __future__ import annotations
 
+import pickle
+import sys
+from typing import Any
 from typing import NamedTuple
 
 from proxystore.proxy import Proxy
 
+from psbench.config.payload import PayloadConfig
+
+if sys.version_info >= (3, 11):  # pragma: >=3.11 cover
+    from typing import Self
+else:  # pragma: <3.11 cover
+    from typing_extensions import Self
+
 
 class ProxyStats(NamedTuple):
     """Proxy stats from within task."""
@@ -14,25 +24,107 @@ class ProxyStats(NamedTuple):
     output_proxy_ms: float | None = None
 
 
-def pong(data: bytes, *, result_size: int = 0, sleep: float = 0) -> bytes:
+class ZeroCopyPayload:
+    """Payload wrapper which exposes its buffer to pickle protocol 5.
+
+    Pickling bytes copies the bytes into the pickle stream. This wrapper
+    instead pickles bytes-like payloads as a
+    [`PickleBuffer`][pickle.PickleBuffer] so serializers which use protocol 5
+    with a `buffer_callback` (e.g., Dask) can transfer the buffer out-of-band
+    without copying. Serializers which do not use out-of-band buffers pickle
+    the buffer in-band as before. Other payloads, such as NumPy arrays, are
+    pickled as normal because they already support out-of-band buffers.
+
+    Attributes:
+        data: wrapped payload. Bytes-like payloads may be a
+            [`memoryview`][memoryview] or other buffer after unpickling.
+    """
+
+    def __init__(self, data: Any) -> None:
+        self.data = data
+
+    def __reduce_ex__(
+        self,
+        protocol: Any,
+    ) -> tuple[type[Self], tuple[Any, ...]]:
+        if protocol >= 5 and isinstance(
+            self.data,
+            (bytes, bytearray, memoryview),
+        ):
+            return (type(self), (pickle.PickleBuffer(self.data),))
+        return (type(self), (self.data,))
+
+
+def pong(
+    data: Any,
+    *,
+    result_size: int = 0,
+    sleep: float = 0,
+    payload: PayloadConfig | None = None,
+    payload_index: int = 0,
+) -> Any:
     """Task that takes data and returns more data.
 
     Args:
-        data (bytes): input data.
+        data (Any): input data.
         result_size (int): size of results byte array (default: 0).
         sleep (float): seconds to sleep for to simulate work (default: 0).
+        payload (PayloadConfig): configuration for generating the result.
+            Defaults to random bytes.
+        payload_index (int): index of the generated result so seeded
+            results differ between tasks (default: 0).
 
     Returns:
-        bytes
+        Result data.
     """
     import time
 
     from psbench.utils import randbytes
 
-    assert isinstance(data, bytes)
+    assert not isinstance(data, Proxy)
+    time.sleep(sleep)
+
+    if payload is None:
+        return randbytes(result_size)
+    return payload.generate(result_size, payload_index)
+
+
+def pong_zero_copy(
+    data: ZeroCopyPayload,
+    *,
+    result_size: int = 0,
+    sleep: float = 0,
+    payload: PayloadConfig | None = None,
+    payload_index: int = 0,
+) -> ZeroCopyPayload:
+    """Task that takes and returns zero-copy wrapped data.
+
+    Args:
+        data (ZeroCopyPayload): wrapped input data.
+        result_size (int): size of results byte array (default: 0).
+        sleep (float): seconds to sleep for to simulate work (default: 0).
+        payload (PayloadConfig): configuration for generating the result.
+            Defaults to random bytes.
+        payload_index (int): index of the generated result so seeded
+            results differ between tasks (default: 0).
+
+    Returns:
+        Wrapped result data.
+    """
+    import time
+
+    from psbench.benchmarks.task_rtt.tasks import ZeroCopyPayload
+    from psbench.utils import randbytes
+
+    assert isinstance(data, ZeroCopyPayload)
     time.sleep(sleep)
 
-    return randbytes(result_size)
+    result = (
+        randbytes(result_size)
+        if payload is None
+        else payload.generate(result_size, payload_index)
+    )
+    return ZeroCopyPayload(result)
 
 
 def pong_ipfs(
@@ -74,21 +166,27 @@ def pong_ipfs(
 
 
 def pong_proxy(
-    data: Proxy[bytes],
+    data: Proxy[Any],
     *,
     evict_result: bool = True,
     result_size: int = 0,
     sleep: float = 0,
-) -> tuple[Proxy[bytes], ProxyStats | None]:
+    payload: PayloadConfig | None = None,
+    payload_index: int = 0,
+) -> tuple[Proxy[Any], ProxyStats | None]:
     """Task that takes a proxy of data and return a proxy of data.
 
     Args:
-        data (Proxy[bytes]): input data.
+        data (Proxy[Any]): input data.
         evict_result (bool): Set evict flag in returned proxy (default: True).
         result_size (int): size of results byte array.
         sleep (float): seconds to sleep for to simulate work (default: 0). If
             the sleep is non-zero, the input proxy will be asynchronously
             resolved during the sleep.
+        payload (PayloadConfig): configuration for generating the result.
+            Defaults to random bytes.
+        payload_index (int): index of the generated result so seeded
+            results differ between tasks (default: 0).
 
     Returns:
         Tuple of bytes and ProxyStats is stat tracking on the store is enabled.
@@ -102,6 +200,7 @@ def pong_proxy(
 
     from proxystore.proxy import is_resolved
     from proxystore.proxy import Proxy
+    from proxystore.proxy import resolve
     from proxystore.store import get_store
     from proxystore.store.utils import resolve_async
 
@@ -115,14 +214,18 @@ def pong_proxy(
         resolve_async(data)
         time.sleep(sleep)
 
-    assert isinstance(data, bytes)
+    resolve(data)
     assert isinstance(data, Proxy)
 
-    result_data = randbytes(result_size)
+    result_data = (
+        randbytes(result_size)
+        if payload is None
+        else payload.generate(result_size, payload_index)
+    )
     store = get_store(data)
     if store is None:  # pragma: no cover
         raise RuntimeError('Cannot find ProxyStore backend to use.')
-    result: Proxy[bytes] = store.proxy(result_data, evict=evict_result)
+    result: Proxy[Any] = store.proxy(result_data, evict=evict_result)
 
     stats: ProxyStats | None = None
     if store.metrics is not None:
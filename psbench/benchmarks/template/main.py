@@ -18,6 +18,7 @@ from proxystore.store.base import Store
 
 from psbench.benchmarks.template.config import RunConfig
 from psbench.benchmarks.template.config import RunResult
+from psbench.connectors.wan import connector_name
 
 logger = logging.getLogger('template')
 
@@ -50,7 +51,7 @@ class Benchmark:
 
     def config(self) -> dict[str, Any]:
         connector = (
-            self.store.connector.__class__.__name__
+            connector_name(self.store.connector)
             if self.store is not None
             else 'None'
         )
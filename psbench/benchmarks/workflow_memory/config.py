@@ -5,6 +5,7 @@ import enum
 import sys
 from typing import Any
 from typing import List  # noqa: UP035
+from typing import Literal
 from typing import Optional
 
 if sys.version_info >= (3, 11):  # pragma: >=3.11 cover
@@ -39,6 +40,7 @@ class RunResult(BaseModel):
     stage_bytes_sizes: str
     stage_repeat: int
     task_sleep: float
+    payload_kind: str = 'bytes'
     workflow_start_timestamp: float
     workflow_end_timestamp: float
     workflow_makespan_s: float
@@ -51,6 +53,8 @@ class BenchmarkMatrix(BaseModel):
     stage_repeat: int
     task_sleep: float
     memory_profile_interval: float
+    memory_profiler: Literal['system', 'high-frequency'] = 'system'
+    memory_server_pids: List[int] = []  # noqa: UP006
 
     @staticmethod
     def add_parser_group(parser: argparse.ArgumentParser) -> None:
@@ -103,6 +107,28 @@ class BenchmarkMatrix(BaseModel):
             type=float,
             help='Seconds between logging system memory utilization',
         )
+        group.add_argument(
+            '--memory-profiler',
+            choices=['system', 'high-frequency'],
+            default='system',
+            help=(
+                'Memory profiler type. The high-frequency profiler samples '
+                'system memory from /proc into a ring buffer (use with a '
+                'small interval such as 0.001) and reports the peak memory '
+                'of each run'
+            ),
+        )
+        group.add_argument(
+            '--memory-server-pids',
+            default=[],
+            metavar='PID',
+            nargs='+',
+            type=int,
+            help=(
+                'PIDs of local data servers (e.g., Redis or a ProxyStore '
+                'endpoint) to log the memory utilization of'
+            ),
+        )
 
     @classmethod
     def from_args(cls, **kwargs: Any) -> Self:
@@ -118,6 +144,8 @@ class BenchmarkMatrix(BaseModel):
             stage_repeat=kwargs['stage_repeat'],
             task_sleep=kwargs['task_sleep'],
             memory_profile_interval=kwargs['memory_profile_interval'],
+            memory_profiler=kwargs.get('memory_profiler', 'system'),
+            memory_server_pids=kwargs.get('memory_server_pids', []),
         )
 
     def configs(self) -> tuple[RunConfig, ...]:
@@ -3,10 +3,12 @@
 from __future__ import annotations
 
 import gc
+import itertools
 import logging
 import sys
 import time
 from collections.abc import Callable
+from collections.abc import Iterator
 from collections.abc import Sequence
 from concurrent.futures import Executor
 from concurrent.futures import Future
@@ -30,6 +32,8 @@ from psbench.benchmarks.protocol import ContextManagerAddIn
 from psbench.benchmarks.workflow_memory.config import DataManagement
 from psbench.benchmarks.workflow_memory.config import RunConfig
 from psbench.benchmarks.workflow_memory.config import RunResult
+from psbench.config.payload import PayloadConfig
+from psbench.connectors.wan import connector_name
 from psbench.utils import randbytes
 
 logger = logging.getLogger('workflow-memory')
@@ -37,23 +41,37 @@ logger = logging.getLogger('workflow-memory')
 T = TypeVar('T')
 
 
+def _generate(
+    size_bytes: int,
+    payload: PayloadConfig | None,
+    index: int = 0,
+) -> Any:
+    if payload is None:
+        return randbytes(size_bytes)
+    return payload.generate(size_bytes, index)
+
+
 def task_no_proxy(
-    *data: bytes,
+    *data: Any,
     output_size_bytes: int,
     sleep: float,
-) -> bytes:
+    payload: PayloadConfig | None = None,
+    payload_index: int = 0,
+) -> Any:
     import time
 
-    assert all(isinstance(d, bytes) for d in data)
+    assert not any(isinstance(d, Proxy) for d in data)
     time.sleep(sleep)
-    return randbytes(output_size_bytes)
+    return _generate(output_size_bytes, payload, payload_index)
 
 
 def task_proxy(
-    *data: Proxy[bytes],
+    *data: Proxy[Any],
     output_size_bytes: int,
     sleep: float,
-) -> Proxy[bytes]:
+    payload: PayloadConfig | None = None,
+    payload_index: int = 0,
+) -> Proxy[Any]:
     import time
 
     from proxystore.proxy import is_resolved
@@ -64,11 +82,10 @@ def task_proxy(
         # isinstance is not guaranteed to resolve the proxy when
         # populate_target=True.
         resolve(d)
-        assert isinstance(d, bytes)
     assert all(is_resolved(d) for d in data)
     time.sleep(sleep)
 
-    output = randbytes(output_size_bytes)
+    output = _generate(output_size_bytes, payload, payload_index)
     store = get_store(data[0])
     assert store is not None
 
@@ -80,9 +97,15 @@ def _generate_start_data(
     data_count: int,
     data_bytes: int,
     store: Store[Any] | None,
+    payload: PayloadConfig | None = None,
+    payload_indices: Iterator[int] | None = None,
 ) -> tuple[Any, ...]:
+    indices = itertools.count() if payload_indices is None else payload_indices
     if data_management is DataManagement.NONE:
-        return tuple(randbytes(data_bytes) for _ in range(data_count))
+        return tuple(
+            _generate(data_bytes, payload, next(indices))
+            for _ in range(data_count)
+        )
     elif (
         data_management is DataManagement.DEFAULT_PROXY
         or data_management is DataManagement.MANUAL_PROXY
@@ -90,7 +113,7 @@ def _generate_start_data(
         assert store is not None
         return tuple(
             store.proxy(
-                randbytes(data_bytes),
+                _generate(data_bytes, payload, next(indices)),
                 evict=False,
                 populate_target=True,
             )
@@ -99,7 +122,10 @@ def _generate_start_data(
     elif data_management is DataManagement.OWNED_PROXY:
         assert store is not None
         return tuple(
-            store.owned_proxy(randbytes(data_bytes), populate_target=True)
+            store.owned_proxy(
+                _generate(data_bytes, payload, next(indices)),
+                populate_target=True,
+            )
             for _ in range(data_count)
         )
     else:
@@ -135,6 +161,8 @@ def _run_workflow_stage(
     stage_task_count: int,
     stage_output_bytes: int,
     sleep: float,
+    payload: PayloadConfig | None = None,
+    payload_indices: Iterator[int] | None = None,
 ) -> tuple[Any, ...]:
     # Returns list of output data of tasks. This could be proxies or bytes.
     task: Callable[..., Any]
@@ -149,6 +177,7 @@ def _run_workflow_stage(
     else:
         raise AssertionError(f'Unknown data management: {data_management}.')
 
+    indices = itertools.count() if payload_indices is None else payload_indices
     futures: list[Future[Any]] = []
 
     # This will have length equal to stage_size
@@ -177,7 +206,12 @@ def _run_workflow_stage(
         future: Future[Any] = submit(
             executor.submit,
             args=(task, *task_input),
-            kwargs={'output_size_bytes': stage_output_bytes, 'sleep': sleep},
+            kwargs={
+                'output_size_bytes': stage_output_bytes,
+                'sleep': sleep,
+                'payload': payload,
+                'payload_index': next(indices),
+            },
         )
         futures.append(future)
 
@@ -196,6 +230,7 @@ def run_workflow(
     stage_bytes_sizes: Sequence[int],
     stage_repeat: int,
     sleep: float,
+    payload: PayloadConfig | None = None,
 ) -> RunResult:
     start_timestamp = time.time()
 
@@ -206,6 +241,8 @@ def run_workflow(
         )
 
     proxy_keys: list[tuple[Any, ...]] = []
+    # Unique index per generated payload so seeded payloads differ.
+    payload_indices = itertools.count()
 
     for _ in range(stage_repeat):
         current_data = _generate_start_data(
@@ -213,6 +250,8 @@ def run_workflow(
             data_count=stage_task_counts[0],
             data_bytes=stage_bytes_sizes[0],
             store=store,
+            payload=payload,
+            payload_indices=payload_indices,
         )
 
         for stage_index, stage_task_count in enumerate(stage_task_counts):
@@ -226,6 +265,8 @@ def run_workflow(
                 stage_task_count=stage_task_count,
                 stage_output_bytes=stage_bytes_sizes[stage_index + 1],
                 sleep=sleep,
+                payload=payload,
+                payload_indices=payload_indices,
             )
             if data_management is DataManagement.MANUAL_PROXY:
                 assert store is not None
@@ -254,13 +295,14 @@ def run_workflow(
     return RunResult(
         executor=executor.__class__.__name__,
         connector=(
-            'None' if store is None else store.connector.__class__.__name__
+            'None' if store is None else connector_name(store.connector)
         ),
         data_management=data_management.value,
         stage_task_counts='-'.join(str(s) for s in stage_task_counts),
         stage_bytes_sizes='-'.join(str(s) for s in stage_bytes_sizes),
         stage_repeat=stage_repeat,
         task_sleep=sleep,
+        payload_kind='bytes' if payload is None else payload.kind,
         workflow_start_timestamp=start_timestamp,
         workflow_end_timestamp=end_timestamp,
         workflow_makespan_s=(end_timestamp - start_timestamp),
@@ -272,15 +314,22 @@ class Benchmark(ContextManagerAddIn):
     config_type = RunConfig
     result_type = RunResult
 
-    def __init__(self, executor: Executor, store: Store[Any]) -> None:
+    def __init__(
+        self,
+        executor: Executor,
+        store: Store[Any],
+        payload: PayloadConfig | None = None,
+    ) -> None:
         self.executor = executor
         self.store = store
+        self.payload = payload if payload is not None else PayloadConfig()
         super().__init__(managers=[self.executor, self.store])
 
     def config(self) -> dict[str, Any]:
         return {
             'executor': self.executor.__class__.__name__,
-            'connector': self.store.connector.__class__.__name__,
+            'connector': connector_name(self.store.connector),
+            'payload': self.payload,
         }
 
     def run(self, config: RunConfig) -> RunResult:
@@ -299,6 +348,7 @@ class Benchmark(ContextManagerAddIn):
             stage_bytes_sizes=config.stage_bytes_sizes,
             stage_repeat=config.stage_repeat,
             sleep=config.task_sleep,
+            payload=self.payload,
         )
 
         return result
@@ -0,0 +1,146 @@
+"""Checkpointing for resumable benchmark runs.
+
+The [`runner()`][psbench.runner.runner] appends an entry to a checkpoint
+manifest after the results of each run are logged. An entry is the hash of
+the run config, the repeat index of the run, and optionally the value of the
+result field used for adaptive repetition. When a benchmark is resumed,
+runs with an entry in the manifest are skipped and new results are appended
+to the existing results file.
+"""
+
+from __future__ import annotations
+
+import glob
+import hashlib
+import os
+import sys
+from datetime import datetime
+from types import TracebackType
+
+if sys.version_info >= (3, 11):  # pragma: >=3.11 cover
+    from typing import Self
+else:  # pragma: <3.11 cover
+    from typing_extensions import Self
+
+from pydantic import BaseModel
+
+from psbench.utils import make_parent_dirs
+
+
+def config_hash(config: BaseModel) -> str:
+    """Get a stable hash of a run config."""
+    return hashlib.sha256(config.model_dump_json().encode()).hexdigest()
+
+
+class CheckpointManifest:
+    """Manifest of completed runs.
+
+    Each line of the manifest file is `<config hash> <repeat index>`,
+    optionally followed by the value of the adaptive repetition field. The
+    file is only appended to so a manifest can be shared across multiple
+    invocations of a benchmark. Malformed lines (e.g., a partial write when
+    the process was killed) are ignored.
+
+    Args:
+        filepath (str): path to manifest file. Created if it does not exist.
+    """
+
+    def __init__(self, filepath: str) -> None:
+        self.filepath = filepath
+        self._completed: dict[tuple[str, int], float | None] = {}
+
+        if os.path.isfile(filepath):
+            with open(filepath) as f:
+                for line in f:
+                    self._parse_line(line)
+
+        make_parent_dirs(filepath)
+        self.f = open(filepath, 'a')  # noqa: SIM115
+
+    def __enter__(self) -> Self:
+        return self
+
+    def __exit__(
+        self,
+        exc_type: type[BaseException] | None,
+        exc_value: BaseException | None,
+        exc_traceback: TracebackType | None,
+    ) -> None:
+        self.close()
+
+    def __len__(self) -> int:
+        return len(self._completed)
+
+    def _parse_line(self, line: str) -> None:
+        parts = line.split()
+        if len(parts) not in (2, 3) or not parts[1].isdigit():
+            return
+        value: float | None = None
+        if len(parts) == 3:
+            try:
+                value = float(parts[2])
+            except ValueError:
+                return
+        self._completed[(parts[0], int(parts[1]))] = value
+
+    def completed(self, config: BaseModel, repeat_index: int) -> bool:
+        """Check if a run has been completed."""
+        return (config_hash(config), repeat_index) in self._completed
+
+    def value(self, config: BaseModel, repeat_index: int) -> float | None:
+        """Get the value recorded with a completed run, if any."""
+        return self._completed.get((config_hash(config), repeat_index))
+
+    def mark_completed(
+        self,
+        config: BaseModel,
+        repeat_index: int,
+        value: float | None = None,
+    ) -> None:
+        """Record that a run has been completed.
+
+        Args:
+            config: run config.
+            repeat_index: repeat index of the run.
+            value: optional value of the adaptive repetition field so the
+                confidence interval can be restored when resuming.
+        """
+        entry = (config_hash(config), repeat_index)
+        self._completed[entry] = value
+        suffix = f' {value!r}' if value is not None else ''
+        self.f.write(f'{entry[0]} {entry[1]}{suffix}\n')
+        self.f.flush()
+        os.fsync(self.f.fileno())
+
+    def close(self) -> None:
+        """Close the manifest file."""
+        self.f.close()
+
+
+def get_run_dir(
+    parent_dir: str,
+    benchmark_name: str,
+    resume: bool = False,
+) -> str:
+    """Get the run directory for an invocation of a benchmark.
+
+    Args:
+        parent_dir (str): directory containing run directories.
+        benchmark_name (str): name of the benchmark.
+        resume (bool): return the most recent existing run directory for the
+            benchmark, if one exists, rather than a new run directory.
+
+    Returns:
+        Path to run directory named with the benchmark name and a timestamp.
+    """
+    if resume:
+        # Timestamps are formatted so lexicographic order is time order.
+        pattern = os.path.join(parent_dir, f'{benchmark_name}-[0-9]*')
+        existing = sorted(p for p in glob.glob(pattern) if os.path.isdir(p))
+        if len(existing) > 0:
+            return existing[-1]
+
+    return os.path.join(
+        parent_dir,
+        f'{benchmark_name}-{datetime.now().strftime("%Y-%m-%d-%H-%M-%S")}',
+    )
@@ -6,6 +6,7 @@ from psbench.config.executor import GlobusComputeConfig
 from psbench.config.executor import ParslConfig
 from psbench.config.general import GeneralConfig
 from psbench.config.ipfs import IPFSConfig
+from psbench.config.payload import PayloadConfig
 from psbench.config.store import StoreConfig
 from psbench.config.stream import StreamConfig
 
@@ -16,6 +17,7 @@ __all__ = [
     'GlobusComputeConfig',
     'IPFSConfig',
     'ParslConfig',
+    'PayloadConfig',
     'StoreConfig',
     'StreamConfig',
 ]
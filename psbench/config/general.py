@@ -3,6 +3,7 @@ from __future__ import annotations
 import argparse
 import sys
 from typing import Any
+from typing import Optional
 from typing import Union
 
 if sys.version_info >= (3, 11):  # pragma: >=3.11 cover
@@ -13,20 +14,63 @@ else:  # pragma: <3.11 cover
 from pydantic import BaseModel
 
 from psbench.logging import TEST_LOG_LEVEL
+from psbench.runner import AdaptiveRepeat
 
 
 class GeneralConfig(BaseModel):
+    checkpoint_file: str = 'checkpoint.txt'
+    ci_confidence: float = 0.95
+    ci_field: Optional[str] = None  # noqa: UP045
+    ci_target: float = 0.05
     csv_file: str = 'results.csv'
     log_file: str = 'log.txt'
     log_level: Union[int, str] = TEST_LOG_LEVEL  # noqa: UP007
     log_file_level: Union[int, str] = 'INFO'  # noqa: UP007
+    min_repeat: int = 3
     repeat: int = 1
+    resume: bool = False
     run_dir: str = 'runs/'
+    warmup: int = 0
 
     @staticmethod
     def add_parser_group(parser: argparse.ArgumentParser) -> None:
         group = parser.add_argument_group(title='General Configuration')
 
+        group.add_argument(
+            '--checkpoint-file',
+            default='checkpoint.txt',
+            help=(
+                'Name of checkpoint manifest of completed runs inside '
+                '--run-dir'
+            ),
+        )
+        group.add_argument(
+            '--ci-field',
+            default=None,
+            metavar='FIELD',
+            help=(
+                'Adaptively repeat each benchmark configuration until the '
+                'confidence interval of the mean of this result field '
+                'converges (e.g., total_time_ms)'
+            ),
+        )
+        group.add_argument(
+            '--ci-target',
+            default=0.05,
+            metavar='FRACTION',
+            type=float,
+            help=(
+                'Target confidence interval half-width relative to the mean '
+                'when --ci-field is set'
+            ),
+        )
+        group.add_argument(
+            '--ci-confidence',
+            default=0.95,
+            metavar='FRACTION',
+            type=float,
+            help='Confidence level of the interval when --ci-field is set',
+        )
         group.add_argument(
             '--csv-file',
             default='results.csv',
@@ -54,7 +98,35 @@ class GeneralConfig(BaseModel):
             default=1,
             metavar='INT',
             type=int,
-            help='Repeat each benchmark configuration',
+            help=(
+                'Repeat each benchmark configuration (maximum repeats when '
+                '--ci-field is set)'
+            ),
+        )
+        group.add_argument(
+            '--min-repeat',
+            default=3,
+            metavar='INT',
+            type=int,
+            help='Minimum repeats when --ci-field is set',
+        )
+        group.add_argument(
+            '--warmup',
+            default=0,
+            metavar='INT',
+            type=int,
+            help=(
+                'Discarded warmup runs of each benchmark configuration when '
+                '--ci-field is set'
+            ),
+        )
+        group.add_argument(
+            '--resume',
+            action='store_true',
+            help=(
+                'Resume the most recent run of the benchmark in --run-dir, '
+                'skipping runs found in the checkpoint manifest'
+            ),
         )
         group.add_argument(
             '--run-dir',
@@ -71,6 +143,14 @@ class GeneralConfig(BaseModel):
     def from_args(cls, **kwargs: Any) -> Self:
         options: dict[str, Any] = {}
 
+        if 'checkpoint_file' in kwargs:
+            options['checkpoint_file'] = kwargs['checkpoint_file']
+        if 'ci_confidence' in kwargs:
+            options['ci_confidence'] = kwargs['ci_confidence']
+        if 'ci_field' in kwargs:
+            options['ci_field'] = kwargs['ci_field']
+        if 'ci_target' in kwargs:
+            options['ci_target'] = kwargs['ci_target']
         if 'csv_file' in kwargs:
             options['csv_file'] = kwargs['csv_file']
         if 'log_file' in kwargs:
@@ -79,9 +159,39 @@ class GeneralConfig(BaseModel):
             options['log_level'] = kwargs['log_level']
         if 'log_file_level' in kwargs:
             options['log_file_level'] = kwargs['log_file_level']
+        if 'min_repeat' in kwargs:
+            options['min_repeat'] = kwargs['min_repeat']
         if 'repeat' in kwargs:
             options['repeat'] = kwargs['repeat']
+        if 'resume' in kwargs:
+            options['resume'] = kwargs['resume']
         if 'run_dir' in kwargs:
             options['run_dir'] = kwargs['run_dir']
+        if 'warmup' in kwargs:
+            options['warmup'] = kwargs['warmup']
 
         return cls(**options)
+
+    def get_adaptive_repeat(self) -> AdaptiveRepeat | None:
+        """Get the adaptive repetition config if `ci_field` is set.
+
+        Raises:
+            ValueError: if `repeat`, the maximum number of repeats, is less
+                than `min_repeat`.
+        """
+        if self.ci_field is None:
+            return None
+        if self.repeat < self.min_repeat:
+            raise ValueError(
+                f'The maximum repeats (--repeat {self.repeat}) must be at '
+                f'least the minimum repeats (--min-repeat {self.min_repeat}) '
+                'when --ci-field is set.',
+            )
+        return AdaptiveRepeat(
+            field=self.ci_field,
+            min_repeat=self.min_repeat,
+            max_repeat=self.repeat,
+            target=self.ci_target,
+            confidence=self.ci_confidence,
+            warmup=self.warmup,
+        )
@@ -0,0 +1,111 @@
+from __future__ import annotations
+
+import argparse
+import sys
+from typing import Any
+from typing import List  # noqa: UP035
+from typing import Optional
+
+if sys.version_info >= (3, 11):  # pragma: >=3.11 cover
+    from typing import Self
+else:  # pragma: <3.11 cover
+    from typing_extensions import Self
+
+from pydantic import BaseModel
+from pydantic import Field
+
+from psbench.payload import generate_payload
+from psbench.payload import PAYLOAD_KINDS
+from psbench.payload import payload_nbytes
+from psbench.payload import PayloadKind
+from psbench.payload import PayloadPool
+
+
+class PayloadConfig(BaseModel):
+    kind: PayloadKind = 'bytes'
+    dtype: str = 'float64'
+    shape: List[int] = Field(default_factory=list)  # noqa: UP006
+    compressibility: float = Field(0.5, ge=0, le=1)
+    seed: Optional[int] = None  # noqa: UP045
+
+    @staticmethod
+    def add_parser_group(
+        parser: argparse.ArgumentParser,
+        include_kind: bool = True,
+    ) -> None:
+        group = parser.add_argument_group(title='Payload Configuration')
+        if include_kind:
+            group.add_argument(
+                '--payload-kind',
+                choices=PAYLOAD_KINDS,
+                default='bytes',
+                help='Kind of data to generate for task and stream payloads',
+            )
+        group.add_argument(
+            '--payload-dtype',
+            default='float64',
+            help='Data type of ndarray payloads',
+        )
+        group.add_argument(
+            '--payload-shape',
+            metavar='DIM',
+            type=int,
+            nargs='+',
+            default=[],
+            help=(
+                'Trailing dimensions of ndarray payloads. The leading '
+                'dimension is set by the payload size'
+            ),
+        )
+        group.add_argument(
+            '--payload-compressibility',
+            metavar='FRACTION',
+            type=float,
+            default=0.5,
+            help='Fraction of compressible payloads which is zeros',
+        )
+        group.add_argument(
+            '--payload-seed',
+            metavar='SEED',
+            type=int,
+            default=None,
+            help='Seed for deterministic payloads',
+        )
+
+    @classmethod
+    def from_args(cls, **kwargs: Any) -> Self:
+        return cls(
+            kind=kwargs.get('payload_kind', 'bytes'),
+            dtype=kwargs.get('payload_dtype', 'float64'),
+            shape=kwargs.get('payload_shape', []),
+            compressibility=kwargs.get('payload_compressibility', 0.5),
+            seed=kwargs.get('payload_seed'),
+        )
+
+    def generate(
+        self,
+        size_bytes: int,
+        index: int = 0,
+        pool: PayloadPool | None = None,
+    ) -> Any:
+        """Generate a payload.
+
+        Args:
+            size_bytes: approximate size of the payload in bytes.
+            index: index of the payload. When seeded, payloads with the
+                same index are identical.
+            pool: optional pool to generate unseeded bytes payloads from.
+        """
+        return generate_payload(
+            self.kind,
+            size_bytes,
+            seed=None if self.seed is None else (self.seed, index),
+            dtype=self.dtype,
+            shape=self.shape,
+            compressibility=self.compressibility,
+            pool=pool,
+        )
+
+    def generate_like(self, payload: Any, index: int = 0) -> Any:
+        """Generate a payload of the same size as an existing payload."""
+        return self.generate(payload_nbytes(payload), index)
@@ -26,6 +26,11 @@ from proxystore_ex.connectors.dim.zmq import ZeroMQConnector
 from pydantic import BaseModel
 from pydantic import Field
 
+from psbench.connectors.mmap_file import MMapFileConnector
+from psbench.connectors.mmap_file import zero_copy_deserialize
+from psbench.connectors.shm import SharedMemoryConnector
+from psbench.connectors.wan import WANConnector
+
 
 class StoreConfig(BaseModel):
     connector: Optional[str] = None  # noqa: UP045
@@ -47,6 +52,8 @@ class StoreConfig(BaseModel):
                 'redis',
                 'endpoint',
                 'margo',
+                'mmap-file',
+                'shm',
                 'ucx',
                 'zmq',
             ],
@@ -87,7 +94,7 @@ class StoreConfig(BaseModel):
         group.add_argument(
             '--ps-file-dir',
             metavar='DIR',
-            required=required and connector_type == 'file',
+            required=required and connector_type in ('file', 'mmap-file'),
             help='Temp directory to store ProxyStore objects in',
         )
         group.add_argument(
@@ -129,6 +136,16 @@ class StoreConfig(BaseModel):
             metavar='INTERFACE',
             help='Interface name to be used by the DIMs',
         )
+        group.add_argument(
+            '--ps-wan-profile',
+            default=None,
+            metavar='PROFILE',
+            help=(
+                'Emulate a wide-area network by delaying connector '
+                'operations. Comma-separated latency, bandwidth, and loss '
+                '(e.g., "20ms,1Gbps,0.1%%loss") with optional "jitter=2ms"'
+            ),
+        )
 
     @classmethod
     def from_args(cls, **kwargs: Any) -> Self:
@@ -178,6 +195,12 @@ class StoreConfig(BaseModel):
                 address=self.options['address'],
                 interface=self.options['interface'],
             )
+        elif self.connector == 'mmap-file':
+            connector = MMapFileConnector(self.options['file_dir'])
+            # The default deserializer would copy the memory-mapped buffer.
+            kwargs.setdefault('deserializer', zero_copy_deserialize)
+        elif self.connector == 'shm':
+            connector = SharedMemoryConnector()
         elif self.connector == 'ucx':
             connector = UCXConnector(  # type: ignore[assignment]
                 port=self.options['port'],
@@ -193,6 +216,9 @@ class StoreConfig(BaseModel):
         else:
             raise ValueError(f'Invalid backend: {self.connector}')
 
+        if self.options.get('wan_profile') is not None:
+            connector = WANConnector(connector, self.options['wan_profile'])
+
         store = Store(f'{self.connector}-store', connector, **kwargs)
 
         if register:
@@ -20,6 +20,12 @@ from proxystore.stream.shims.redis import RedisPublisher
 from proxystore.stream.shims.redis import RedisSubscriber
 from pydantic import BaseModel
 
+from psbench.streams import queue as queue_stream
+from psbench.streams import zeromq as zeromq_stream
+
+# Stream brokers which run locally and do not need server addresses.
+LOCAL_STREAMS = ('queue', 'zmq')
+
 
 class StreamConfig(BaseModel):
     kind: Optional[str]  # noqa: UP045
@@ -33,12 +39,22 @@ class StreamConfig(BaseModel):
         argv: Sequence[str] | None = None,
     ) -> None:
         group = parser.add_argument_group(title='Stream Broker Configuration')
+
+        stream_kind: str | None = None
+        if argv is not None and '--stream' in argv:
+            stream_kind = argv[argv.index('--stream') + 1].lower()
+
         group.add_argument(
             '--stream',
-            choices=('kafka', 'redis'),
+            choices=('kafka', 'queue', 'redis', 'zmq'),
             type=str.lower,
             required=required,
-            help='Stream broker to use',
+            help=(
+                'Stream broker to use. The queue broker is in-process so is '
+                'only valid for a single process or the thread executor. The '
+                'zmq broker spawns a local forwarder in the subscriber '
+                'process.'
+            ),
         )
         group.add_argument(
             '--stream-topic',
@@ -49,8 +65,14 @@ class StreamConfig(BaseModel):
             '--stream-servers',
             metavar='ADDR',
             nargs='+',
-            required=required,
-            help='Stream broker server address(es)',
+            required=required and stream_kind not in LOCAL_STREAMS,
+            help=(
+                'Stream broker server address(es). Not used by the queue '
+                'broker. For the zmq broker, the HOST:PORT addresses of the '
+                'forwarder for publishers and subscribers (default: '
+                f'{zeromq_stream.DEFAULT_FRONTEND} '
+                f'{zeromq_stream.DEFAULT_BACKEND})'
+            ),
         )
 
     @classmethod
@@ -58,9 +80,23 @@ class StreamConfig(BaseModel):
         return cls(
             kind=kwargs.get('stream'),
             topic=kwargs['stream_topic'],
-            servers=kwargs.get('stream_servers', ()),
+            servers=kwargs.get('stream_servers') or (),
         )
 
+    def _zmq_addresses(self) -> tuple[str, str]:
+        if len(self.servers) == 0:
+            return (
+                zeromq_stream.DEFAULT_FRONTEND,
+                zeromq_stream.DEFAULT_BACKEND,
+            )
+        elif len(self.servers) == 2:
+            return self.servers[0], self.servers[1]
+        else:
+            raise ValueError(
+                'The zmq stream broker requires two server addresses: the '
+                'forwarder addresses for publishers and subscribers.',
+            )
+
     def get_publisher(self) -> Publisher | None:
         if self.kind is None:
             return None
@@ -71,28 +107,43 @@ class StreamConfig(BaseModel):
                 {'bootstrap_servers': ','.join(self.servers)},
             )
             publisher = KafkaPublisher(producer)
+        elif self.kind == 'queue':
+            publisher = queue_stream.get_publisher()
         elif self.kind == 'redis':
             host, port = self.servers[0].split(':')
             publisher = RedisPublisher(host, int(port))
+        elif self.kind == 'zmq':
+            frontend, _ = self._zmq_addresses()
+            publisher = zeromq_stream.ZeroMQPublisher(frontend)
         else:
             raise ValueError(f'Unknown stream broker type: {self.kind}')
 
         return publisher
 
-    def get_subscriber(self) -> Subscriber | None:
+    def get_subscriber(self, topic: str | None = None) -> Subscriber | None:
         if self.kind is None:
             return None
 
+        topic = topic if topic is not None else self.topic
+
         subscriber: Subscriber
         if self.kind == 'kafka':
             consumer = confluent_kafka.Consumer(
                 {'bootstrap_servers': ','.join(self.servers)},
             )
-            consumer.subscribe([self.topic])
+            consumer.subscribe([topic])
             subscriber = KafkaSubscriber(consumer)
+        elif self.kind == 'queue':
+            subscriber = queue_stream.get_subscriber(topic)
         elif self.kind == 'redis':
             host, port = self.servers[0].split(':')
-            subscriber = RedisSubscriber(host, int(port), topic=self.topic)
+            subscriber = RedisSubscriber(host, int(port), topic=topic)
+        elif self.kind == 'zmq':
+            # Subscribers are created by the benchmark process so the
+            # forwarder is started there and lives until the process exits.
+            frontend, backend = self._zmq_addresses()
+            zeromq_stream.start_forwarder(frontend, backend)
+            subscriber = zeromq_stream.ZeroMQSubscriber(backend, topic=topic)
         else:
             raise ValueError(f'Unknown stream broker type: {self.kind}')
 
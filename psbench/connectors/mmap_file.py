@@ -0,0 +1,107 @@
+"""Memory-mapped file connector.
+
+The [`FileConnector`][proxystore.connectors.file.FileConnector] reads each
+object into a new bytes object so every process which resolves a large
+object holds a private copy of it. The
+[`MMapFileConnector`][psbench.connectors.mmap_file.MMapFileConnector]
+instead memory-maps the object file so pages are read lazily and shared
+through the page cache by all processes on the same node.
+"""
+
+from __future__ import annotations
+
+import io
+import mmap
+import os
+from typing import Any
+
+import numpy
+from proxystore.connectors.file import FileConnector
+from proxystore.connectors.file import FileKey
+from proxystore.serialize import BytesLike
+from proxystore.serialize import deserialize
+
+# Upper bound on the size of the header of a serialized NumPy array.
+_NPY_HEADER_MAX_BYTES = 65536 + 16
+
+
+class MMapFileConnector(FileConnector):
+    """Connector to a shared file system with memory-mapped gets.
+
+    Objects are written once in the same way as the
+    [`FileConnector`][proxystore.connectors.file.FileConnector], but
+    [`get()`][psbench.connectors.mmap_file.MMapFileConnector.get] returns
+    a read-only [`memoryview`][memoryview] of a memory-mapping of the object
+    file rather than reading the file.
+
+    Note:
+        ProxyStore's default deserializer copies the buffer so stores using
+        this connector should be created with
+        [`zero_copy_deserialize()`][psbench.connectors.mmap_file.zero_copy_deserialize]
+        as the deserializer.
+    """
+
+    def get(self, key: FileKey) -> BytesLike | None:
+        """Get a read-only view of the object associated with the key.
+
+        Returns:
+            View of the object or `None` if the object does not exist.
+        """
+        path = os.path.join(self.store_dir, key.filename)
+        if not os.path.exists(path + '.ready'):
+            return None
+        with open(path, 'rb') as f:
+            if os.fstat(f.fileno()).st_size == 0:
+                return b''
+            # The mapping stays valid after the file is closed or evicted and
+            # is unmapped when the view is garbage collected.
+            mapping = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+        return memoryview(mapping)
+
+
+def _deserialize_ndarray(view: memoryview) -> numpy.ndarray[Any, Any] | None:
+    stream = io.BytesIO(bytes(view[:_NPY_HEADER_MAX_BYTES]))
+    try:
+        version = numpy.lib.format.read_magic(stream)
+        if version == (1, 0):
+            header = numpy.lib.format.read_array_header_1_0(stream)
+        elif version == (2, 0):
+            header = numpy.lib.format.read_array_header_2_0(stream)
+        else:
+            return None
+    except ValueError:
+        return None
+
+    shape, fortran_order, dtype = header
+    if dtype.hasobject:
+        return None
+    array = numpy.frombuffer(
+        view,
+        dtype=dtype,
+        count=int(numpy.prod(shape, dtype=numpy.int64)),
+        offset=stream.tell(),
+    )
+    return array.reshape(shape, order='F' if fortran_order else 'C')
+
+
+def zero_copy_deserialize(buffer: BytesLike) -> Any:
+    """Deserialize an object without copying large buffers.
+
+    Drop-in replacement for ProxyStore's
+    [`deserialize()`][proxystore.serialize.deserialize] which copies the
+    buffer before deserializing. Bytes objects are returned as a view of the
+    buffer and NumPy arrays without object dtypes are returned as arrays
+    backed by the buffer. All other objects are deserialized with ProxyStore.
+
+    Warning:
+        Returned views and arrays are read-only if the buffer is read-only.
+    """
+    view = memoryview(buffer).cast('B')
+    identifier = bytes(view[:3])
+    if identifier == b'BS\n':
+        return view[3:]
+    elif identifier == b'NP\n':
+        array = _deserialize_ndarray(view[3:])
+        if array is not None:
+            return array
+    return deserialize(buffer)
@@ -0,0 +1,182 @@
+"""POSIX shared-memory connector.
+
+Objects are stored in named shared-memory segments so the connector is
+limited to processes on a single node (e.g., with a
+[`ProcessPoolExecutor`][concurrent.futures.ProcessPoolExecutor]) but
+provides a lower-bound transport cost to compare other connectors against.
+"""
+
+from __future__ import annotations
+
+import mmap
+import sys
+import uuid
+from collections.abc import Sequence
+from multiprocessing import resource_tracker
+from multiprocessing.shared_memory import SharedMemory
+from types import TracebackType
+from typing import Any
+from typing import NamedTuple
+
+if sys.version_info >= (3, 11):  # pragma: >=3.11 cover
+    from typing import Self
+else:  # pragma: <3.11 cover
+    from typing_extensions import Self
+
+from proxystore.serialize import BytesLike
+
+
+class SharedMemoryKey(NamedTuple):
+    """Key to an object in a shared-memory segment.
+
+    Attributes:
+        name: name of the shared-memory segment.
+        size: size of the object in bytes. Segments may be larger than the
+            object because segments cannot be empty and may be rounded up to
+            a multiple of the page size.
+    """
+
+    name: str
+    size: int
+
+
+def _untrack(segment: SharedMemory) -> None:
+    # The resource tracker unlinks segments created or attached to by a
+    # process when the process exits, but the lifetime of objects is managed
+    # by the connector and objects are often evicted by a different process.
+    resource_tracker.unregister(segment._name, 'shared_memory')  # type: ignore[attr-defined]
+
+
+class SharedMemoryConnector:
+    """Connector to POSIX shared memory.
+
+    Each object is written to a new named shared-memory segment.
+    [`get()`][psbench.connectors.shm.SharedMemoryConnector.get] is zero-copy
+    and returns a read-only [`memoryview`][memoryview] of the segment which
+    remains valid after the object is evicted.
+
+    Note:
+        Segments are only removed when evicted or, if `clear` is set, when
+        the connector which created the segment is closed. Segments created
+        by other processes that are not evicted will remain until the system
+        is restarted.
+
+    Args:
+        prefix: prefix of segment names.
+        clear: remove segments created by this connector instance that have
+            not been evicted when the connector is closed.
+    """
+
+    def __init__(self, prefix: str = 'psbench', *, clear: bool = True) -> None:
+        self.prefix = prefix
+        self.clear = clear
+        self._created: set[str] = set()
+
+    def __enter__(self) -> Self:
+        return self
+
+    def __exit__(
+        self,
+        exc_type: type[BaseException] | None,
+        exc_value: BaseException | None,
+        exc_traceback: TracebackType | None,
+    ) -> None:
+        self.close()
+
+    def __repr__(self) -> str:
+        return f'{self.__class__.__name__}(prefix={self.prefix})'
+
+    def close(self, clear: bool | None = None) -> None:
+        """Close the connector and clean up.
+
+        Args:
+            clear: remove segments created by this connector instance that
+                have not been evicted. Overrides the default value of `clear`
+                provided when the connector was instantiated.
+        """
+        clear = self.clear if clear is None else clear
+        if clear:
+            for name in list(self._created):
+                self.evict(SharedMemoryKey(name, 0))
+        self._created.clear()
+
+    def config(self) -> dict[str, Any]:
+        """Get the connector configuration."""
+        return {'prefix': self.prefix, 'clear': self.clear}
+
+    @classmethod
+    def from_config(cls, config: dict[str, Any]) -> SharedMemoryConnector:
+        """Create a new connector instance from a configuration."""
+        return cls(**config)
+
+    def evict(self, key: SharedMemoryKey) -> None:
+        """Evict the object associated with the key.
+
+        Existing views of the object returned by
+        [`get()`][psbench.connectors.shm.SharedMemoryConnector.get] remain
+        valid until released.
+        """
+        self._created.discard(key.name)
+        try:
+            segment = SharedMemory(name=key.name)
+        except FileNotFoundError:
+            return
+        segment.close()
+        # Unlinking also unregisters the segment from the resource tracker.
+        segment.unlink()
+
+    def exists(self, key: SharedMemoryKey) -> bool:
+        """Check if an object associated with the key exists."""
+        try:
+            segment = SharedMemory(name=key.name)
+        except FileNotFoundError:
+            return False
+        _untrack(segment)
+        segment.close()
+        return True
+
+    def get(self, key: SharedMemoryKey) -> BytesLike | None:
+        """Get a read-only view of the object associated with the key.
+
+        Returns:
+            View of the object or `None` if the object does not exist.
+        """
+        try:
+            segment = SharedMemory(name=key.name)
+        except FileNotFoundError:
+            return None
+        _untrack(segment)
+        try:
+            # Map the segment separately from the SharedMemory instance so the
+            # segment can be closed while the view is alive. The mapping is
+            # released when the view is garbage collected.
+            mapping = mmap.mmap(segment._fd, 0, access=mmap.ACCESS_READ)  # type: ignore[attr-defined]
+        finally:
+            segment.close()
+        return memoryview(mapping)[: key.size]
+
+    def get_batch(
+        self,
+        keys: Sequence[SharedMemoryKey],
+    ) -> list[BytesLike | None]:
+        """Get a batch of objects associated with the keys."""
+        return [self.get(key) for key in keys]
+
+    def put(self, obj: BytesLike) -> SharedMemoryKey:
+        """Put an object in a new shared-memory segment."""
+        size = memoryview(obj).nbytes
+        segment = SharedMemory(
+            name=f'{self.prefix}-{uuid.uuid4().hex[:16]}',
+            create=True,
+            size=max(1, size),
+        )
+        _untrack(segment)
+        assert segment.buf is not None
+        segment.buf[:size] = memoryview(obj).cast('B')
+        segment.close()
+        self._created.add(segment.name)
+        return SharedMemoryKey(segment.name, size)
+
+    def put_batch(self, objs: Sequence[BytesLike]) -> list[SharedMemoryKey]:
+        """Put a batch of objects in new shared-memory segments."""
+        return [self.put(obj) for obj in objs]
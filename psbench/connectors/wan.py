@@ -0,0 +1,328 @@
+"""Wide-area network emulation connector.
+
+Benchmarks run on a single node use connectors with negligible network
+delay. The [`WANConnector`][psbench.connectors.wan.WANConnector] wraps any
+connector and delays each operation according to a
+[`WANProfile`][psbench.connectors.wan.WANProfile] so the behavior of
+applications across slow links can be studied without special hardware.
+"""
+
+from __future__ import annotations
+
+import math
+import random
+import re
+import sys
+import threading
+import time
+from collections.abc import Sequence
+from types import TracebackType
+from typing import Any
+from typing import NamedTuple
+
+if sys.version_info >= (3, 11):  # pragma: >=3.11 cover
+    from typing import Self
+else:  # pragma: <3.11 cover
+    from typing_extensions import Self
+
+from proxystore.connectors.protocols import Connector
+from proxystore.serialize import BytesLike
+from proxystore.utils.imports import get_object_path
+from proxystore.utils.imports import import_from_path
+
+# Approximate payload bytes per TCP segment used to estimate how many
+# segments of an operation could be lost.
+_SEGMENT_BYTES = 1448
+# Minimum TCP retransmission timeout on Linux.
+_MIN_RTO_MS = 200
+
+_TIME_UNITS = {'us': 1e-3, 'ms': 1, 's': 1e3}
+_RATE_PREFIXES = {'': 1, 'k': 1e3, 'm': 1e6, 'g': 1e9, 't': 1e12}
+_TIME_PATTERN = re.compile(r'^(\d+(?:\.\d*)?)\s*(us|ms|s)$')
+_RATE_PATTERN = re.compile(r'^(\d+(?:\.\d*)?)\s*([kKmMgGtT]?)(bps|Bps|B/s)$')
+_LOSS_PATTERN = re.compile(r'^(\d+(?:\.\d*)?)\s*%\s*(?:loss)?$')
+
+
+def _parse_time_ms(value: str) -> float:
+    match = _TIME_PATTERN.match(value)
+    if match is None:
+        raise ValueError(f'Invalid time "{value}". Expected e.g. "20ms".')
+    return float(match.group(1)) * _TIME_UNITS[match.group(2)]
+
+
+def _parse_rate_bytes(value: str) -> float:
+    match = _RATE_PATTERN.match(value)
+    if match is None:
+        raise ValueError(
+            f'Invalid bandwidth "{value}". Expected e.g. "1Gbps" or '
+            '"100MB/s".',
+        )
+    rate = float(match.group(1)) * _RATE_PREFIXES[match.group(2).lower()]
+    # Lowercase "b" is bits and uppercase "B" is bytes.
+    rate = rate / 8 if match.group(3) == 'bps' else rate
+    if rate <= 0:
+        raise ValueError('Bandwidth must be greater than zero.')
+    return rate
+
+
+def _parse_loss(value: str) -> float:
+    match = _LOSS_PATTERN.match(value)
+    if match is None:
+        raise ValueError(f'Invalid loss "{value}". Expected e.g. "0.1%loss".')
+    loss = float(match.group(1)) / 100
+    if loss >= 1:
+        raise ValueError('Loss must be less than 100%.')
+    return loss
+
+
+class WANProfile(NamedTuple):
+    """Characteristics of an emulated wide-area network link.
+
+    Attributes:
+        latency_ms: mean latency added to each operation.
+        jitter_ms: standard deviation of the normally distributed latency.
+        bandwidth_bytes_per_s: bandwidth limit in bytes per second. No limit
+            if `None`.
+        loss: probability that a TCP segment is lost and retransmitted.
+    """
+
+    latency_ms: float = 0
+    jitter_ms: float = 0
+    bandwidth_bytes_per_s: float | None = None
+    loss: float = 0
+
+    @classmethod
+    def from_str(cls, spec: str) -> Self:
+        """Parse a profile from a string.
+
+        The string is a comma-separated list of characteristics. Each is an
+        optional `name=` followed by a value. The name can be omitted for
+        the latency, bandwidth, and loss because they are inferred from the
+        units of the value.
+
+        Example:
+            ```python
+            WANProfile.from_str('20ms,1Gbps,0.1%loss')
+            WANProfile.from_str('latency=20ms,jitter=2ms,bandwidth=100MB/s')
+            ```
+
+        Raises:
+            ValueError: if the string cannot be parsed.
+        """
+        values: dict[str, Any] = {}
+        for item in spec.split(','):
+            token = item.strip()
+            if token == '':
+                continue
+            name, _, value = token.rpartition('=')
+            name = name.strip().lower()
+            value = value.strip()
+            if name == '':
+                if _TIME_PATTERN.match(value):
+                    name = 'latency'
+                elif _RATE_PATTERN.match(value):
+                    name = 'bandwidth'
+                elif _LOSS_PATTERN.match(value):
+                    name = 'loss'
+                else:
+                    raise ValueError(f'Unknown WAN characteristic "{token}".')
+
+            if name == 'latency':
+                values['latency_ms'] = _parse_time_ms(value)
+            elif name == 'jitter':
+                values['jitter_ms'] = _parse_time_ms(value)
+            elif name == 'bandwidth':
+                values['bandwidth_bytes_per_s'] = _parse_rate_bytes(value)
+            elif name == 'loss':
+                values['loss'] = _parse_loss(value)
+            else:
+                raise ValueError(f'Unknown WAN characteristic "{name}".')
+        return cls(**values)
+
+
+class TokenBucket:
+    """Thread-safe token bucket which limits the rate of transfers.
+
+    Transfers larger than the bucket are allowed and put the bucket into
+    debt so concurrent transfers share the rate.
+
+    Args:
+        rate: tokens (bytes) added per second.
+        capacity: maximum number of tokens in the bucket.
+    """
+
+    def __init__(self, rate: float, capacity: float) -> None:
+        self.rate = rate
+        self.capacity = capacity
+        self._tokens = capacity
+        self._updated = time.perf_counter()
+        self._lock = threading.Lock()
+
+    def consume(self, tokens: float) -> float:
+        """Consume tokens from the bucket.
+
+        Returns:
+            Time in seconds to wait before the tokens are available.
+        """
+        with self._lock:
+            now = time.perf_counter()
+            elapsed = now - self._updated
+            self._tokens = min(
+                self.capacity,
+                self._tokens + elapsed * self.rate,
+            )
+            self._updated = now
+            self._tokens -= tokens
+            return max(0, -self._tokens / self.rate)
+
+
+class WANConnector:
+    """Connector wrapper which emulates a wide-area network link.
+
+    Each operation on the wrapped connector is delayed by the latency with
+    normally distributed jitter, the time to transfer the object through a
+    [`TokenBucket`][psbench.connectors.wan.TokenBucket] limited to the
+    bandwidth, and, if a segment of the transfer is lost, a TCP
+    retransmission timeout. Batch operations pay the latency once.
+
+    Note:
+        The delay is applied in the calling thread so concurrent operations
+        overlap their latency but share the bandwidth. Each process which
+        uses the connector has its own bandwidth limit.
+
+    Args:
+        connector: connector to wrap or a tuple of the import path and
+            configuration of a connector.
+        profile: link characteristics or a string parsed by
+            [`WANProfile.from_str()`][psbench.connectors.wan.WANProfile.from_str].
+        seed: random seed for the jitter and loss.
+    """
+
+    def __init__(
+        self,
+        connector: Connector[Any] | tuple[str, dict[str, Any]],
+        profile: WANProfile | str,
+        *,
+        seed: int | None = None,
+    ) -> None:
+        if isinstance(connector, tuple):
+            path, config = connector
+            connector = import_from_path(path).from_config(config)
+        assert not isinstance(connector, tuple)
+        self.connector = connector
+        self.profile = (
+            WANProfile.from_str(profile)
+            if isinstance(profile, str)
+            else WANProfile(*profile)
+        )
+        self.seed = seed
+
+        self._random = random.Random(seed)
+        self._random_lock = threading.Lock()
+        rate = self.profile.bandwidth_bytes_per_s
+        # The bucket holds 10 ms of traffic so short bursts are not delayed.
+        self._bucket = (
+            TokenBucket(rate, capacity=rate / 100)
+            if rate is not None
+            else None
+        )
+
+    def __enter__(self) -> Self:
+        return self
+
+    def __exit__(
+        self,
+        exc_type: type[BaseException] | None,
+        exc_value: BaseException | None,
+        exc_traceback: TracebackType | None,
+    ) -> None:
+        self.close()
+
+    def __repr__(self) -> str:
+        return f'{self.__class__.__name__}({self.connector!r}, {self.profile})'
+
+    def _delay(self, nbytes: int = 0) -> None:
+        latency_ms = self.profile.latency_ms
+        with self._random_lock:
+            if self.profile.jitter_ms > 0:
+                latency_ms += self._random.gauss(0, self.profile.jitter_ms)
+            segments = max(1, math.ceil(nbytes / _SEGMENT_BYTES))
+            lost = self._random.random() < 1 - (1 - self.profile.loss) ** (
+                segments
+            )
+
+        delay_s = max(0, latency_ms) / 1000
+        if lost:
+            rto_ms = max(
+                _MIN_RTO_MS,
+                self.profile.latency_ms + 4 * self.profile.jitter_ms,
+            )
+            delay_s += rto_ms / 1000
+        if self._bucket is not None and nbytes > 0:
+            delay_s += self._bucket.consume(nbytes)
+        if delay_s > 0:
+            time.sleep(delay_s)
+
+    def close(self) -> None:
+        """Close the wrapped connector."""
+        self.connector.close()
+
+    def config(self) -> dict[str, Any]:
+        """Get the connector configuration."""
+        return {
+            'connector': (
+                get_object_path(type(self.connector)),
+                self.connector.config(),
+            ),
+            'profile': tuple(self.profile),
+            'seed': self.seed,
+        }
+
+    @classmethod
+    def from_config(cls, config: dict[str, Any]) -> WANConnector:
+        """Create a new connector instance from a configuration."""
+        return cls(**config)
+
+    def evict(self, key: Any) -> None:
+        """Evict the object associated with the key."""
+        self._delay()
+        self.connector.evict(key)
+
+    def exists(self, key: Any) -> bool:
+        """Check if an object associated with the key exists."""
+        self._delay()
+        return self.connector.exists(key)
+
+    def get(self, key: Any) -> BytesLike | None:
+        """Get the serialized object associated with the key."""
+        obj = self.connector.get(key)
+        self._delay(len(obj) if obj is not None else 0)
+        return obj
+
+    def get_batch(self, keys: Sequence[Any]) -> list[BytesLike | None]:
+        """Get a batch of serialized objects associated with the keys."""
+        objs = self.connector.get_batch(keys)
+        self._delay(sum(len(obj) for obj in objs if obj is not None))
+        return objs
+
+    def put(self, obj: BytesLike) -> Any:
+        """Put a serialized object in the store."""
+        self._delay(len(obj))
+        return self.connector.put(obj)
+
+    def put_batch(self, objs: Sequence[BytesLike]) -> list[Any]:
+        """Put a batch of serialized objects in the store."""
+        self._delay(sum(len(obj) for obj in objs))
+        return self.connector.put_batch(objs)
+
+
+def connector_name(connector: Connector[Any]) -> str:
+    """Get the name of a connector to record in benchmark results.
+
+    Connectors wrapped in a
+    [`WANConnector`][psbench.connectors.wan.WANConnector] are named after
+    the wrapped connector with a `+WAN` suffix, e.g., `FileConnector+WAN`.
+    """
+    if isinstance(connector, WANConnector):
+        return f'{connector_name(connector.connector)}+WAN'
+    return connector.__class__.__name__
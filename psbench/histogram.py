@@ -0,0 +1,166 @@
+"""Mergeable log-bucketed latency histograms.
+
+Latencies are recorded into a fixed number of buckets in the style of
+HdrHistogram. Each power of two (in nanoseconds) is split into linearly
+spaced sub-buckets so the relative error of any reported percentile is
+bounded regardless of the magnitude of the latency. Recording is O(1) and
+histograms from different workers or processes can be merged exactly.
+"""
+
+from __future__ import annotations
+
+import math
+from collections.abc import Iterable
+
+# Each power of two is divided into 2**SUB_BUCKET_BITS sub-buckets which
+# bounds the relative error of a bucket to 2**-SUB_BUCKET_BITS (< 1%).
+SUB_BUCKET_BITS = 7
+# Largest trackable value is 2**MAX_VALUE_BITS ns (~9.8 hours). Larger values
+# are clamped into the last bucket but min/max/mean remain exact.
+MAX_VALUE_BITS = 45
+
+_SUB_BUCKETS = 1 << SUB_BUCKET_BITS
+_MAX_SHIFT = MAX_VALUE_BITS - SUB_BUCKET_BITS - 1
+_NUM_BUCKETS = _SUB_BUCKETS * (_MAX_SHIFT + 2)
+
+
+def _bucket_index(value_ns: int) -> int:
+    if value_ns < 2 * _SUB_BUCKETS:
+        return value_ns
+    shift = value_ns.bit_length() - SUB_BUCKET_BITS - 1
+    if shift > _MAX_SHIFT:
+        return _NUM_BUCKETS - 1
+    return _SUB_BUCKETS * shift + (value_ns >> shift)
+
+
+def _bucket_midpoint(index: int) -> float:
+    if index < 2 * _SUB_BUCKETS:
+        return float(index)
+    shift = index // _SUB_BUCKETS - 1
+    lower = (index - _SUB_BUCKETS * shift) << shift
+    return lower + ((1 << shift) - 1) / 2
+
+
+class LatencyHistogram:
+    """Log-bucketed histogram of latencies in milliseconds.
+
+    Example:
+        ```python
+        from psbench.histogram import LatencyHistogram
+
+        histogram = LatencyHistogram()
+        for latency_ms in (1.0, 2.0, 3.0):
+            histogram.record(latency_ms)
+
+        other = LatencyHistogram.from_values([4.0])
+        histogram.merge(other)
+
+        histogram.percentile(99)
+        ```
+
+    Note:
+        The count, min, max, mean, and standard deviation are tracked exactly.
+        Other percentiles are approximated by the midpoint of the bucket
+        containing the percentile (clamped to the min and max values) so have
+        a relative error less than 1%.
+    """
+
+    def __init__(self) -> None:
+        self.counts = [0] * _NUM_BUCKETS
+        self.count = 0
+        self.min = math.inf
+        self.max = -math.inf
+        self._mean = 0.0
+        # Sum of squared differences from the mean (Welford's algorithm).
+        self._m2 = 0.0
+
+    @classmethod
+    def from_values(cls, values_ms: Iterable[float]) -> LatencyHistogram:
+        """Create a histogram from existing latency values."""
+        histogram = cls()
+        for value in values_ms:
+            histogram.record(value)
+        return histogram
+
+    @property
+    def mean(self) -> float:
+        """Mean of the recorded values."""
+        self._check_not_empty()
+        return self._mean
+
+    @property
+    def stdev(self) -> float:
+        """Sample standard deviation of the recorded values."""
+        self._check_not_empty()
+        return math.sqrt(self._m2 / (self.count - 1)) if self.count > 1 else 0
+
+    def record(self, value_ms: float) -> None:
+        """Record a latency in milliseconds."""
+        self.counts[_bucket_index(max(0, int(value_ms * 1e6)))] += 1
+        self.count += 1
+        self.min = min(self.min, value_ms)
+        self.max = max(self.max, value_ms)
+        delta = value_ms - self._mean
+        self._mean += delta / self.count
+        self._m2 += delta * (value_ms - self._mean)
+
+    def merge(self, other: LatencyHistogram) -> None:
+        """Merge the values recorded in another histogram into this one."""
+        if other.count == 0:
+            return
+
+        for i, count in enumerate(other.counts):
+            if count > 0:
+                self.counts[i] += count
+
+        # Parallel variance algorithm of Chan et al.
+        count = self.count + other.count
+        delta = other._mean - self._mean
+        self._m2 += other._m2 + delta**2 * self.count * other.count / count
+        self._mean += delta * other.count / count
+        self.count = count
+        self.min = min(self.min, other.min)
+        self.max = max(self.max, other.max)
+
+    def percentile(self, q: float) -> float:
+        """Get the q-th percentile of the recorded values.
+
+        Args:
+            q (float): percentile in the range [0, 100].
+
+        Returns:
+            Approximate latency in milliseconds.
+
+        Raises:
+            ValueError: if `q` is not in [0, 100] or the histogram is empty.
+        """
+        if not 0 <= q <= 100:
+            raise ValueError(f'Percentile must be in [0, 100] but got {q}.')
+        self._check_not_empty()
+        if q == 100:
+            return self.max
+
+        # Rounding guards against float error (e.g., 0.999 * 1000 > 999).
+        rank = max(1, math.ceil(round(q / 100 * self.count, 9)))
+        seen = 0
+        for i, count in enumerate(self.counts):  # pragma: no branch
+            seen += count
+            if seen >= rank:
+                value = _bucket_midpoint(i) / 1e6
+                return min(max(value, self.min), self.max)
+
+        raise AssertionError('Unreachable.')  # pragma: no cover
+
+    def _check_not_empty(self) -> None:
+        if self.count == 0:
+            raise ValueError('Histogram contains no values.')
+
+
+def merge_histograms(
+    histograms: Iterable[LatencyHistogram],
+) -> LatencyHistogram:
+    """Merge histograms into a new histogram."""
+    merged = LatencyHistogram()
+    for histogram in histograms:
+        merged.merge(histogram)
+    return merged
@@ -1,13 +1,19 @@
 from __future__ import annotations
 
 import multiprocessing
+import os
 import pathlib
 import time
+from collections.abc import Collection
+from collections.abc import Sequence
+from typing import Any
 from typing import NamedTuple
 
+import numpy
 import psutil
 
 from psbench.results import CSVResultLogger
+from psbench.utils import make_parent_dirs
 
 
 class MemoryUsage(NamedTuple):
@@ -30,16 +36,117 @@ class MemoryUsage(NamedTuple):
         )
 
 
+class TrackedProcess(NamedTuple):
+    """Process tree to track the memory usage of.
+
+    Attributes:
+        role: role of the process (e.g., `'client'`, `'workers'`, or
+            `'server'`). Usage of processes with the same role is summed.
+        pid: process ID of the root of the tree.
+        children: include descendants of the root process.
+    """
+
+    role: str
+    pid: int
+    children: bool = True
+
+
+class ProcessMemoryUsage(NamedTuple):
+    unix_timestamp: float
+    role: str
+    processes: int
+    rss_bytes: int
+    uss_bytes: int
+    pss_bytes: int
+
+
+def collect_process_memory_usage(
+    tracked: Sequence[TrackedProcess],
+    exclude: Collection[int] = (),
+) -> list[ProcessMemoryUsage]:
+    """Collect the memory usage of each role of tracked processes.
+
+    A process is attributed to the first tracked process tree which contains
+    it. E.g., to separate a client from the workers it spawned, track
+    `TrackedProcess('client', pid, children=False)` followed by
+    `TrackedProcess('workers', pid)`. Processes which have exited or cannot
+    be accessed are skipped.
+
+    Args:
+        tracked: process trees to track.
+        exclude: process IDs to exclude.
+
+    Returns:
+        Summed usage of the processes of each role in the order the roles
+        first appear in `tracked`.
+    """
+    timestamp = time.time()
+    claimed = set(exclude)
+    totals: dict[str, list[int]] = {}
+
+    for tracked_process in tracked:
+        total = totals.setdefault(tracked_process.role, [0, 0, 0, 0])
+        try:
+            root = psutil.Process(tracked_process.pid)
+            processes = [root]
+            if tracked_process.children:
+                processes.extend(root.children(recursive=True))
+        except psutil.NoSuchProcess:
+            continue
+
+        for process in processes:
+            if process.pid in claimed:
+                continue
+            claimed.add(process.pid)
+            try:
+                info = process.memory_full_info()
+            except (psutil.NoSuchProcess, psutil.AccessDenied):
+                continue
+            total[0] += 1
+            total[1] += info.rss
+            total[2] += info.uss
+            # PSS is only available on Linux
+            total[3] += getattr(info, 'pss', 0)
+
+    return [
+        ProcessMemoryUsage(timestamp, role, *total)
+        for role, total in totals.items()
+    ]
+
+
 class SystemMemoryProfiler(multiprocessing.Process):
+    """Process which periodically logs memory usage.
+
+    Args:
+        polling_interval_seconds: seconds between samples.
+        csv_file: optional CSV file to log system memory usage to.
+        tracked_processes: optional process trees to log the memory usage of
+            by role. The profiler process itself is always excluded.
+        process_csv_file: CSV file to log the memory usage of the tracked
+            processes to. Required if `tracked_processes` is provided.
+    """
+
     def __init__(
         self,
         polling_interval_seconds: float = 1.0,
         csv_file: str | pathlib.Path | None = None,
+        *,
+        tracked_processes: Sequence[TrackedProcess] = (),
+        process_csv_file: str | pathlib.Path | None = None,
     ):
+        if len(tracked_processes) > 0 and process_csv_file is None:
+            raise ValueError(
+                'A process CSV file is required to track processes.',
+            )
+
         self._polling_interval_seconds = polling_interval_seconds
         self._memory_log: list[MemoryUsage] = []
         self._stop_event = multiprocessing.Event()
         self._csv_file = str(csv_file) if csv_file is not None else None
+        self._tracked_processes = tuple(tracked_processes)
+        self._process_csv_file = (
+            str(process_csv_file) if process_csv_file is not None else None
+        )
         super().__init__()
 
     def run(self) -> None:
@@ -54,15 +161,227 @@ class SystemMemoryProfiler(multiprocessing.Process):
             else None
         )
 
+        process_csv_logger = (
+            CSVResultLogger(self._process_csv_file, ProcessMemoryUsage)
+            if self._process_csv_file is not None
+            else None
+        )
+
         while not self._stop_event.is_set():
             usage = MemoryUsage.from_current_system_usage()
             self._memory_log.append(usage)
             if csv_logger is not None:  # pragma: no branch
                 csv_logger.log(usage)
+            if process_csv_logger is not None:
+                for process_usage in collect_process_memory_usage(
+                    self._tracked_processes,
+                    exclude=(os.getpid(),),
+                ):
+                    process_csv_logger.log(process_usage)
             time.sleep(self._polling_interval_seconds)
 
         if csv_logger is not None:  # pragma: no branch
             csv_logger.close()
+        if process_csv_logger is not None:
+            process_csv_logger.close()
 
     def stop(self) -> None:
         self._stop_event.set()
+
+
+SAMPLE_DTYPE = numpy.dtype(
+    [('unix_timestamp', 'f8'), ('used_bytes', 'i8')],
+)
+
+
+class ProcMemoryReader:
+    """Read memory usage directly from `/proc` with minimal overhead.
+
+    File descriptors are opened once and re-read with `pread` to avoid the
+    overhead of psutil and reopening files on each sample.
+
+    Args:
+        pids: if empty, read the used system memory (`MemTotal` minus
+            `MemAvailable` in `/proc/meminfo`). Otherwise, read the sum of the
+            resident set sizes of the processes (`/proc/<pid>/statm`).
+    """
+
+    def __init__(self, pids: Sequence[int] = ()) -> None:
+        self._page_size = os.sysconf('SC_PAGE_SIZE')
+        paths = (
+            [f'/proc/{pid}/statm' for pid in pids]
+            if len(pids) > 0
+            else ['/proc/meminfo']
+        )
+        self._statm = len(pids) > 0
+        self._fds = [os.open(path, os.O_RDONLY) for path in paths]
+
+    def read(self) -> int:
+        """Read used memory in bytes."""
+        if self._statm:
+            # Second field of statm is resident pages
+            return sum(
+                int(os.pread(fd, 256, 0).split()[1]) * self._page_size
+                for fd in self._fds
+            )
+
+        total = available = 0
+        for line in os.pread(self._fds[0], 4096, 0).splitlines():
+            if line.startswith(b'MemTotal:'):
+                total = int(line.split()[1]) * 1024
+            elif line.startswith(b'MemAvailable:'):
+                available = int(line.split()[1]) * 1024
+                break
+        return total - available
+
+    def close(self) -> None:
+        """Close file descriptors."""
+        for fd in self._fds:
+            os.close(fd)
+
+
+class HighFrequencyMemoryProfiler(multiprocessing.Process):
+    """Process which samples memory usage at a high frequency.
+
+    Unlike the
+    [`SystemMemoryProfiler`][psbench.memory.SystemMemoryProfiler], samples
+    are stored in a preallocated NumPy ring buffer and memory usage is read
+    directly from `/proc` so sampling at 1 kHz is feasible. Samples are
+    written in bulk to a CSV file when the profiler is stopped. Samples are
+    appended if the file exists (e.g., when resuming a benchmark). If the
+    ring buffer fills, the oldest samples are overwritten.
+
+    Note:
+        Only supported on Linux.
+
+    Args:
+        polling_interval_seconds: seconds between samples.
+        csv_file: CSV file to append samples to when stopped.
+        capacity: number of samples in the ring buffer. The default is one
+            hour of samples at 1 kHz.
+        pids: optional processes to sum the resident set sizes of instead of
+            sampling used system memory.
+    """
+
+    def __init__(
+        self,
+        polling_interval_seconds: float = 0.001,
+        csv_file: str | pathlib.Path | None = None,
+        *,
+        capacity: int = 3_600_000,
+        pids: Sequence[int] = (),
+    ):
+        self._polling_interval_seconds = polling_interval_seconds
+        self._csv_file = str(csv_file) if csv_file is not None else None
+        self._capacity = capacity
+        self._pids = tuple(pids)
+        self._stop_event = multiprocessing.Event()
+        super().__init__()
+
+    def run(self) -> None:
+        if self._stop_event.is_set():
+            raise RuntimeError(
+                'HighFrequencyMemoryProfiler has already finished.',
+            )
+
+        samples = numpy.zeros(self._capacity, dtype=SAMPLE_DTYPE)
+        reader = ProcMemoryReader(self._pids)
+        count = 0
+
+        next_sample = time.perf_counter()
+        while not self._stop_event.is_set():
+            samples[count % self._capacity] = (time.time(), reader.read())
+            count += 1
+            next_sample += self._polling_interval_seconds
+            delay = next_sample - time.perf_counter()
+            if delay > 0:
+                time.sleep(delay)
+
+        reader.close()
+
+        if count > self._capacity:
+            samples = numpy.roll(samples, -(count % self._capacity))
+        else:
+            samples = samples[:count]
+
+        if self._csv_file is not None:  # pragma: no branch
+            make_parent_dirs(self._csv_file)
+            has_header = (
+                os.path.isfile(self._csv_file)
+                and os.path.getsize(self._csv_file) > 0
+            )
+            with open(self._csv_file, 'a') as f:
+                numpy.savetxt(
+                    f,
+                    samples,
+                    fmt=['%.6f', '%d'],
+                    delimiter=',',
+                    header=(
+                        ''
+                        if has_header
+                        else ','.join(SAMPLE_DTYPE.names or ())
+                    ),
+                    comments='',
+                )
+
+    def stop(self) -> None:
+        self._stop_event.set()
+
+
+def load_memory_samples(
+    csv_file: str | pathlib.Path,
+) -> numpy.ndarray[Any, Any]:
+    """Load samples written by a `HighFrequencyMemoryProfiler`."""
+    return numpy.loadtxt(
+        csv_file,
+        dtype=SAMPLE_DTYPE,
+        delimiter=',',
+        skiprows=1,
+        ndmin=1,
+    )
+
+
+class MemoryPeak(NamedTuple):
+    start_timestamp: float
+    end_timestamp: float
+    baseline_used_bytes: int
+    peak_used_bytes: int
+    peak_timestamp: float
+    time_to_peak_s: float
+
+
+def find_memory_peak(
+    samples: numpy.ndarray[Any, Any],
+    start_timestamp: float,
+    end_timestamp: float,
+) -> MemoryPeak | None:
+    """Find the peak memory usage within a time window.
+
+    Args:
+        samples: samples from a `HighFrequencyMemoryProfiler`.
+        start_timestamp: start of the window (e.g., the
+            `workflow_start_timestamp` of a run).
+        end_timestamp: end of the window (e.g., the
+            `workflow_end_timestamp` of a run).
+
+    Returns:
+        Peak usage and the time from the start of the window to the peak or
+        `None` if there are no samples within the window. The baseline is
+        the first sample in the window.
+    """
+    timestamps = samples['unix_timestamp']
+    window = samples[
+        (timestamps >= start_timestamp) & (timestamps <= end_timestamp)
+    ]
+    if len(window) == 0:
+        return None
+
+    peak = window[numpy.argmax(window['used_bytes'])]
+    return MemoryPeak(
+        start_timestamp=start_timestamp,
+        end_timestamp=end_timestamp,
+        baseline_used_bytes=int(window['used_bytes'][0]),
+        peak_used_bytes=int(peak['used_bytes']),
+        peak_timestamp=float(peak['unix_timestamp']),
+        time_to_peak_s=float(peak['unix_timestamp']) - start_timestamp,
+    )
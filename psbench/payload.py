@@ -0,0 +1,376 @@
+"""Pooled payload generation.
+
+Generating a fresh random payload for every task or stream item (e.g., with
+[`random.randbytes()`][random.randbytes]) is slow enough at large sizes
+(hundreds of milliseconds for 100 MB) to skew the timing of the code being
+benchmarked. A [`PayloadPool`][psbench.payload.PayloadPool] instead fills a
+random buffer once per process, growing it to the size of the largest
+payload requested, and builds each payload from a rotating slice of the
+buffer prefixed with a unique header. Building a payload costs a single copy
+and the payload contents are still unique.
+
+The pool is opt-in because it keeps a buffer of the largest payload alive
+for the rest of the process, which would skew benchmarks that measure
+memory. Benchmarks which generate payloads in a rate-critical loop pass a
+pool to [`generate_payload()`][psbench.payload.generate_payload]. Small
+payloads are cheap to generate directly so only payloads of at least
+`POOL_MIN_PAYLOAD_BYTES` use the pool.
+
+Opaque random bytes are a best case for pickle and a worst case for
+compression so [`generate_payload()`][psbench.payload.generate_payload]
+can also generate NumPy arrays, compressible bytes, and nested containers of
+many small Python objects.
+"""
+
+from __future__ import annotations
+
+import itertools
+import os
+import random
+import struct
+import threading
+import time
+from collections.abc import Sequence
+from typing import Any
+from typing import get_args
+from typing import Literal
+from typing import NamedTuple
+
+import numpy
+
+# Per-payload header of the creating process ID and a sequence number.
+HEADER_FORMAT = '<QQ'
+HEADER_SIZE = struct.calcsize(HEADER_FORMAT)
+# Smaller unseeded payloads are generated with random.randbytes() even when
+# a pool is provided so generating a small payload does not fill the pool.
+POOL_MIN_PAYLOAD_BYTES = 64 * 1024
+
+PayloadKind = Literal['bytes', 'ndarray', 'compressible', 'nested']
+PAYLOAD_KINDS: tuple[str, ...] = get_args(PayloadKind)
+
+# Compressible payloads are built from blocks with a random prefix and zero
+# suffix so the compressibility is uniform throughout the payload.
+COMPRESSIBLE_BLOCK_BYTES = 4096
+# Approximate pickled size of one record in a nested payload.
+NESTED_RECORD_BYTES = 84
+
+# Offset between the starting positions of consecutive payloads. A large
+# prime spreads consecutive payloads across the pool.
+_ROTATION_STRIDE = 1_000_003
+
+
+class PayloadPoolStats(NamedTuple):
+    """Generation statistics of a [`PayloadPool`][psbench.payload.PayloadPool].
+
+    Attributes:
+        pool_size_bytes: size of the random buffer.
+        fill_time_s: total time spent filling the random buffer.
+        payload_count: number of payloads generated.
+        payload_bytes: total bytes of payloads generated.
+        payload_time_s: total time spent generating payloads.
+    """
+
+    pool_size_bytes: int
+    fill_time_s: float
+    payload_count: int
+    payload_bytes: int
+    payload_time_s: float
+
+
+class PayloadPool:
+    """Pool of random bytes which payloads are generated from.
+
+    Example:
+        ```python
+        from psbench.payload import PayloadPool
+
+        pool = PayloadPool(1_000_000, seed=0)
+        a = pool.get(100)
+        b = pool.get(100)
+        assert a != b
+        ```
+
+    Note:
+        The pool grows to the size of the largest payload so payloads never
+        repeat content. Call [`reserve()`][psbench.payload.PayloadPool.reserve]
+        before a timed region to keep the cost of growing the pool out of
+        the timing. Payloads smaller than the header size are truncated
+        headers so are not guaranteed to be unique.
+
+    Args:
+        size_bytes: initial size of the random buffer. Rounded up to a
+            multiple of eight bytes.
+        seed: seed for the random number generator.
+    """
+
+    def __init__(
+        self,
+        size_bytes: int = 0,
+        *,
+        seed: int | None = None,
+    ) -> None:
+        if size_bytes < 0:
+            raise ValueError(
+                f'Pool size must not be negative but got {size_bytes}.',
+            )
+
+        self._generator = numpy.random.default_rng(seed).bit_generator
+        self._words = numpy.zeros(0, dtype=numpy.uint64)
+        self._buffer = memoryview(self._words).cast('B').toreadonly()
+        self._fill_time_s = 0.0
+
+        self._pid = os.getpid()
+        self._counter = itertools.count()
+        self._lock = threading.Lock()
+        self._payload_count = 0
+        self._payload_bytes = 0
+        self._payload_time_s = 0.0
+
+        self.reserve(size_bytes)
+
+    @property
+    def size_bytes(self) -> int:
+        """Size of the random buffer."""
+        return len(self._buffer)
+
+    def reserve(self, size_bytes: int) -> None:
+        """Grow the random buffer to at least `size_bytes`."""
+        with self._lock:
+            if size_bytes <= len(self._buffer):
+                return
+            start = time.perf_counter()
+            new_words = -(-size_bytes // 8) - len(self._words)
+            self._words = numpy.concatenate(
+                (self._words, self._generator.random_raw(new_words)),
+            )
+            self._buffer = memoryview(self._words).cast('B').toreadonly()
+            self._fill_time_s += time.perf_counter() - start
+
+    def get(self, size: int) -> bytes:
+        """Get a unique payload.
+
+        Args:
+            size: size of the payload in bytes.
+
+        Returns:
+            Payload with a unique header followed by a slice of the pool.
+        """
+        start = time.perf_counter()
+        self.reserve(size)
+        buffer = self._buffer
+        index = next(self._counter)
+        header = struct.pack(HEADER_FORMAT, self._pid, index)[:size]
+
+        # The body is a rotation of the buffer which is at least as large as
+        # the body so wraps around the end of the buffer at most once.
+        remaining = size - len(header)
+        chunks: list[bytes | memoryview] = [header]
+        if remaining > 0:
+            offset = (index * _ROTATION_STRIDE) % len(buffer)
+            first = buffer[offset : offset + remaining]
+            chunks.append(first)
+            chunks.append(buffer[: remaining - len(first)])
+        payload = b''.join(chunks)
+
+        elapsed = time.perf_counter() - start
+        with self._lock:
+            self._payload_count += 1
+            self._payload_bytes += size
+            self._payload_time_s += elapsed
+
+        return payload
+
+    def view(self, size: int, offset: int = 0) -> memoryview:
+        """Get a zero-copy view of the pool.
+
+        Unlike [`get()`][psbench.payload.PayloadPool.get], views are not
+        unique and are read-only. Views are useful where the consumer accepts
+        a buffer and the contents do not need to differ between calls.
+
+        Raises:
+            ValueError: if the view extends past the end of the pool.
+        """
+        if offset < 0 or offset + size > len(self._buffer):
+            raise ValueError(
+                f'View of {size} bytes at offset {offset} exceeds the pool '
+                f'size of {len(self._buffer)} bytes.',
+            )
+        return self._buffer[offset : offset + size]
+
+    def stats(self) -> PayloadPoolStats:
+        """Get the generation statistics of the pool."""
+        with self._lock:
+            return PayloadPoolStats(
+                pool_size_bytes=len(self._buffer),
+                fill_time_s=self._fill_time_s,
+                payload_count=self._payload_count,
+                payload_bytes=self._payload_bytes,
+                payload_time_s=self._payload_time_s,
+            )
+
+
+_pool: PayloadPool | None = None
+_pool_lock = threading.Lock()
+
+
+def _reset_payload_pool_in_child() -> None:
+    # The lock may have been held by another thread at the time of the fork
+    # and the pool would produce payloads with the parent's process ID.
+    global _pool, _pool_lock  # noqa: PLW0603
+
+    _pool = None
+    _pool_lock = threading.Lock()
+
+
+os.register_at_fork(after_in_child=_reset_payload_pool_in_child)
+
+
+def get_payload_pool() -> PayloadPool:
+    """Get the payload pool of this process.
+
+    The pool is created on first use. A forked child process creates its
+    own pool so the headers of payloads remain unique.
+    """
+    global _pool  # noqa: PLW0603
+
+    with _pool_lock:
+        if _pool is None:
+            _pool = PayloadPool()
+        return _pool
+
+
+def _generate_ndarray(
+    rng: numpy.random.Generator,
+    size_bytes: int,
+    dtype: numpy.dtype[Any],
+    shape: Sequence[int],
+) -> numpy.ndarray[Any, Any]:
+    row_size = dtype.itemsize * int(numpy.prod(shape, dtype=numpy.int64))
+    full_shape = (size_bytes // row_size, *shape)
+    if dtype.kind in ('f', 'c'):
+        return rng.standard_normal(full_shape).astype(dtype)
+    elif dtype.kind in ('i', 'u'):
+        count = int(numpy.prod(full_shape, dtype=numpy.int64))
+        raw = rng.bytes(count * dtype.itemsize)
+        return numpy.frombuffer(raw, dtype=dtype).reshape(full_shape).copy()
+    else:
+        raise ValueError(
+            f'Unsupported payload dtype {dtype}. Expected a float, complex, '
+            'or integer dtype.',
+        )
+
+
+def _generate_compressible(
+    rng: numpy.random.Generator,
+    size_bytes: int,
+    compressibility: float,
+) -> bytes:
+    blocks = -(-size_bytes // COMPRESSIBLE_BLOCK_BYTES)
+    random_bytes = round(COMPRESSIBLE_BLOCK_BYTES * (1 - compressibility))
+    data = numpy.zeros((blocks, COMPRESSIBLE_BLOCK_BYTES), dtype=numpy.uint8)
+    data[:, :random_bytes] = numpy.frombuffer(
+        rng.bytes(blocks * random_bytes),
+        dtype=numpy.uint8,
+    ).reshape(blocks, random_bytes)
+    return data.reshape(-1)[:size_bytes].tobytes()
+
+
+def _generate_nested(
+    rng: numpy.random.Generator,
+    size_bytes: int,
+) -> dict[str, Any]:
+    count = max(1, size_bytes // NESTED_RECORD_BYTES)
+    ids = rng.integers(0, 2**31, count).tolist()
+    values = rng.random((count, 5)).tolist()
+    return {
+        'records': [
+            {
+                'id': ids[i],
+                'name': f'record-{ids[i]:08x}',
+                'value': values[i][0],
+                'values': values[i][1:],
+            }
+            for i in range(count)
+        ],
+    }
+
+
+def generate_payload(
+    kind: PayloadKind,
+    size_bytes: int,
+    *,
+    seed: int | Sequence[int] | None = None,
+    dtype: str = 'float64',
+    shape: Sequence[int] = (),
+    compressibility: float = 0.5,
+    pool: PayloadPool | None = None,
+) -> Any:
+    """Generate a payload.
+
+    Kinds of payloads:
+
+    * `bytes`: random bytes. Unseeded payloads of at least
+      `POOL_MIN_PAYLOAD_BYTES` are generated by the `pool`, if provided.
+    * `ndarray`: array of `dtype` with shape `(n, *shape)` where `n` is
+      the largest number of rows that fit in `size_bytes`. Float arrays are
+      normally distributed.
+    * `compressible`: bytes where a `compressibility` fraction of each 4 kB
+      block is zeros so a compressor can reduce the size by approximately
+      that fraction.
+    * `nested`: dictionary containing a list of small record dictionaries.
+      The pickled size is approximately `size_bytes`.
+
+    Args:
+        kind: kind of payload.
+        size_bytes: approximate size of the payload in bytes.
+        seed: seed for the random number generator. Payloads generated with
+            the same arguments and seed are identical.
+        dtype: data type of `ndarray` payloads.
+        shape: trailing dimensions of `ndarray` payloads.
+        compressibility: fraction in [0, 1] of `compressible` payloads which
+            is zeros.
+        pool: pool to generate unseeded `bytes` payloads from. Otherwise,
+            the payloads are generated with
+            [`random.randbytes()`][random.randbytes].
+
+    Raises:
+        ValueError: if the `kind`, `dtype`, or `compressibility` is invalid.
+    """
+    if kind == 'bytes' and seed is None:
+        if pool is None or size_bytes < POOL_MIN_PAYLOAD_BYTES:
+            return random.randbytes(size_bytes)
+        return pool.get(size_bytes)
+
+    rng = numpy.random.default_rng(seed)
+    if kind == 'bytes':
+        return rng.bytes(size_bytes)
+    elif kind == 'ndarray':
+        return _generate_ndarray(rng, size_bytes, numpy.dtype(dtype), shape)
+    elif kind == 'compressible':
+        if not 0 <= compressibility <= 1:
+            raise ValueError(
+                'Compressibility must be in [0, 1] but got '
+                f'{compressibility}.',
+            )
+        return _generate_compressible(rng, size_bytes, compressibility)
+    elif kind == 'nested':
+        return _generate_nested(rng, size_bytes)
+    else:
+        raise ValueError(
+            f'Unknown payload kind {kind!r}. Expected one of {PAYLOAD_KINDS}.',
+        )
+
+
+def payload_nbytes(payload: Any) -> int:
+    """Get the approximate size of a payload in bytes.
+
+    Used to generate a payload of the same size as another.
+    """
+    if isinstance(payload, (bytes, bytearray, memoryview)):
+        return len(payload)
+    elif isinstance(payload, numpy.ndarray):
+        return payload.nbytes
+    elif isinstance(payload, dict) and 'records' in payload:
+        return len(payload['records']) * NESTED_RECORD_BYTES
+    else:
+        raise TypeError(f'Unsupported payload type {type(payload)}.')
@@ -2,14 +2,23 @@ from __future__ import annotations
 
 import csv
 import dataclasses
+import glob
 import os
+import queue
 import sys
+import threading
+import time
+import types
 from collections.abc import Sequence
 from types import TracebackType
 from typing import Any
 from typing import cast
 from typing import ClassVar
 from typing import Generic
+from typing import get_args
+from typing import get_origin
+from typing import get_type_hints
+from typing import Literal
 from typing import NamedTuple
 from typing import overload
 from typing import Protocol
@@ -22,6 +31,7 @@ if sys.version_info >= (3, 11):  # pragma: >=3.11 cover
 else:  # pragma: <3.11 cover
     from typing_extensions import Self
 
+import numpy
 from pydantic import BaseModel
 
 from psbench.utils import make_parent_dirs
@@ -64,6 +74,8 @@ class ResultLogger(Protocol[DTYPE]):
 
     def log(self, data: DTYPE) -> None: ...
 
+    def flush(self) -> None: ...
+
     def close(self) -> None: ...
 
 
@@ -85,6 +97,9 @@ class BasicResultLogger(Generic[DTYPE]):
     def log(self, data: DTYPE) -> None:
         self.results.append(data)
 
+    def flush(self) -> None:
+        pass
+
     def close(self) -> None:
         pass
 
@@ -140,11 +155,300 @@ class CSVResultLogger(Generic[DTYPE]):
             raise AssertionError
         self.f.flush()
 
+    def flush(self) -> None:
+        """Flush logged rows to disk."""
+        self.f.flush()
+        os.fsync(self.f.fileno())
+
     def close(self) -> None:
         """Close file handles."""
         self.f.close()
 
 
+class AsyncResultLogger(Generic[DTYPE]):
+    """Logger which writes rows to another logger in a background thread.
+
+    Logged rows are put in a bounded queue which is drained by a writer
+    thread, so the thread calling `log()` does not wait on I/O unless the
+    queue is full (backpressure).
+
+    Note:
+        The underlying logger is closed when this logger is closed.
+
+    Note:
+        Rows still in the queue when the process crashes are lost. Call
+        `flush()` to wait for queued rows to be written, e.g., before
+        recording a run in a checkpoint manifest.
+
+    Args:
+        logger: logger to write rows to.
+        maxsize: maximum number of rows in the queue.
+    """
+
+    def __init__(self, logger: ResultLogger[DTYPE], maxsize: int = 1000):
+        self.logger = logger
+        self._queue: queue.Queue[tuple[DTYPE] | None] = queue.Queue(maxsize)
+        self._error: BaseException | None = None
+        self._closed = False
+        self._thread = threading.Thread(
+            target=self._writer,
+            name='async-result-logger',
+            daemon=True,
+        )
+        self._thread.start()
+
+    def __enter__(self) -> Self:
+        return self
+
+    def __exit__(
+        self,
+        exc_type: type[BaseException] | None,
+        exc_value: BaseException | None,
+        exc_traceback: TracebackType | None,
+    ) -> None:
+        self.close()
+
+    def _writer(self) -> None:
+        while True:
+            item = self._queue.get()
+            if item is None:
+                self._queue.task_done()
+                return
+            # Keep draining after an error so callers blocked on a full
+            # queue or in flush() return.
+            if self._error is None:
+                try:
+                    self.logger.log(item[0])
+                except BaseException as e:
+                    self._error = e
+            self._queue.task_done()
+
+    def _raise_error(self) -> None:
+        if self._error is not None:
+            raise RuntimeError(
+                'Failed to write row in background thread.',
+            ) from self._error
+
+    def log(self, data: DTYPE) -> None:
+        """Queue new row.
+
+        Raises:
+            RuntimeError: if the logger is closed or a previous row failed to
+                be written by the background thread.
+        """
+        if self._closed:
+            raise RuntimeError('Logger has already been closed.')
+        self._raise_error()
+        self._queue.put((data,))
+
+    def flush(self) -> None:
+        """Wait for queued rows to be written and flush the underlying logger.
+
+        Raises:
+            RuntimeError: if a row failed to be written by the background
+                thread.
+        """
+        self._queue.join()
+        self._raise_error()
+        if not self._closed:
+            self.logger.flush()
+
+    def close(self) -> None:
+        """Write queued rows and close the underlying logger.
+
+        Raises:
+            RuntimeError: if a row failed to be written by the background
+                thread.
+        """
+        if self._closed:
+            return
+        self._closed = True
+        self._queue.put(None)
+        self._thread.join()
+        self.logger.close()
+        self._raise_error()
+
+
+class NPZResultLogger(Generic[DTYPE]):
+    """Columnar logger which writes batches of rows as NumPy `.npz` chunks.
+
+    Rows are buffered by column and converted to typed arrays derived from
+    the field types of the data type when a chunk is written. Chunks are
+    written when `batch_size` rows are buffered, when a row is logged at least
+    `flush_interval` seconds after the last chunk was written, and on close.
+    Each chunk is written to a temporary file and then atomically renamed so
+    a crash can only lose rows which have not yet been written.
+
+    Integer, float, and boolean fields are stored as `int64`, `float64`, and
+    `bool` arrays, respectively. Optional numeric fields are stored as
+    `float64` arrays where `None` is `NaN`. All other fields are stored as
+    unicode string arrays where `None` is an empty string.
+
+    Use [`load_npz_results()`][psbench.results.load_npz_results] to read the
+    chunks back into a single table.
+
+    Args:
+        dirpath: directory to write chunks to. Created if it does not exist.
+            New chunks are appended to existing chunks in the directory.
+        data_type: type of the rows.
+        batch_size: maximum number of rows to buffer.
+        flush_interval: maximum seconds between writing chunks.
+
+    Raises:
+        ValueError: if existing chunks in `dirpath` have different fields.
+    """
+
+    def __init__(
+        self,
+        dirpath: str,
+        data_type: type[DTYPE],
+        *,
+        batch_size: int = 1000,
+        flush_interval: float = 10,
+    ) -> None:
+        self.dirpath = dirpath
+        self.batch_size = batch_size
+        self.flush_interval = flush_interval
+        self.fields = list(field_names(data_type))
+        self.dtypes = _column_dtypes(data_type)
+
+        chunks = _npz_chunks(dirpath)
+        if len(chunks) > 0:
+            with numpy.load(chunks[-1]) as chunk:
+                if set(chunk.files) != set(self.fields):
+                    raise ValueError(
+                        f'Directory {dirpath} contains chunks with fields '
+                        f'{chunk.files} which do not match {self.fields}.',
+                    )
+        os.makedirs(dirpath, exist_ok=True)
+
+        self._next_chunk = len(chunks)
+        self._columns: dict[str, list[Any]] = {f: [] for f in self.fields}
+        self._rows = 0
+        self._last_flush = time.monotonic()
+
+    def __enter__(self) -> Self:
+        return self
+
+    def __exit__(
+        self,
+        exc_type: type[BaseException] | None,
+        exc_value: BaseException | None,
+        exc_traceback: TracebackType | None,
+    ) -> None:
+        self.close()
+
+    def log(self, data: DTYPE) -> None:
+        """Buffer new row."""
+        for field in self.fields:
+            self._columns[field].append(getattr(data, field))
+        self._rows += 1
+
+        if (
+            self._rows >= self.batch_size
+            or time.monotonic() - self._last_flush >= self.flush_interval
+        ):
+            self.flush()
+
+    def flush(self) -> None:
+        """Write buffered rows as a new chunk."""
+        self._last_flush = time.monotonic()
+        if self._rows == 0:
+            return
+
+        arrays: dict[str, Any] = {
+            field: _column_array(self._columns[field], self.dtypes[field])
+            for field in self.fields
+        }
+        filepath = os.path.join(
+            self.dirpath,
+            f'chunk-{self._next_chunk:06d}.npz',
+        )
+        tmp_filepath = f'{filepath}.tmp'
+        with open(tmp_filepath, 'wb') as f:
+            numpy.savez(f, **arrays)
+            f.flush()
+            os.fsync(f.fileno())
+        os.replace(tmp_filepath, filepath)
+
+        self._next_chunk += 1
+        self._columns = {f: [] for f in self.fields}
+        self._rows = 0
+
+    def close(self) -> None:
+        """Write remaining buffered rows."""
+        self.flush()
+
+
+def load_npz_results(dirpath: str) -> dict[str, numpy.ndarray[Any, Any]]:
+    """Load chunks written by an `NPZResultLogger` into a single table.
+
+    Args:
+        dirpath: directory containing the chunks.
+
+    Returns:
+        Mapping of field names to arrays containing the values of the field
+        for all rows in the order the rows were logged.
+    """
+    columns: dict[str, list[numpy.ndarray[Any, Any]]] = {}
+    for chunk_path in _npz_chunks(dirpath):
+        with numpy.load(chunk_path) as chunk:
+            for field in chunk.files:
+                columns.setdefault(field, []).append(chunk[field])
+    return {
+        field: numpy.concatenate(arrays) for field, arrays in columns.items()
+    }
+
+
+def _npz_chunks(dirpath: str) -> list[str]:
+    return sorted(glob.glob(os.path.join(dirpath, 'chunk-*.npz')))
+
+
+def _column_dtype(annotation: Any) -> str:
+    origin = get_origin(annotation)
+    args = get_args(annotation)
+    if origin is Literal:
+        arg_types = {type(arg) for arg in args}
+        return _column_dtype(arg_types.pop()) if len(arg_types) == 1 else 'U'
+    if origin is Union or origin is types.UnionType:
+        non_none = [arg for arg in args if arg is not type(None)]
+        if len(non_none) != 1:
+            return 'U'
+        dtype = _column_dtype(non_none[0])
+        return 'f8' if dtype in ('?', 'i8') else dtype
+    if annotation is bool:
+        return '?'
+    if annotation is int:
+        return 'i8'
+    if annotation is float:
+        return 'f8'
+    return 'U'
+
+
+def _column_dtypes(data_type: Any) -> dict[str, str]:
+    if isinstance(data_type, type) and issubclass(data_type, BaseModel):
+        hints = {
+            name: field.annotation
+            for name, field in data_type.model_fields.items()
+        }
+    else:
+        hints = get_type_hints(data_type)
+    return {
+        name: _column_dtype(hints[name]) for name in field_names(data_type)
+    }
+
+
+def _column_array(values: list[Any], dtype: str) -> numpy.ndarray[Any, Any]:
+    if dtype == 'U':
+        return numpy.array(['' if v is None else str(v) for v in values])
+    if dtype == 'f8':
+        return numpy.array(
+            [numpy.nan if v is None else v for v in values],
+            dtype=dtype,
+        )
+    return numpy.array(values, dtype=dtype)
+
+
 @overload
 def field_names(data_type: type[DTYPE]) -> Sequence[str]: ...
 
@@ -5,10 +5,11 @@ import logging
 import os
 import sys
 from collections.abc import Sequence
-from datetime import datetime
 
 from psbench.benchmarks.endpoint_qps.config import BenchmarkMatrix
 from psbench.benchmarks.endpoint_qps.main import Benchmark
+from psbench.checkpoint import CheckpointManifest
+from psbench.checkpoint import get_run_dir
 from psbench.config import GeneralConfig
 from psbench.logging import BENCH_LOG_LEVEL
 from psbench.logging import init_logging
@@ -33,9 +34,10 @@ def main(argv: Sequence[str] | None = None) -> int:
     args = vars(parser.parse_args(argv))
 
     general_config = GeneralConfig.from_args(**args)
-    general_config.run_dir = os.path.join(
+    general_config.run_dir = get_run_dir(
         general_config.run_dir,
-        f'{benchmark_name}-{datetime.now().strftime("%Y-%m-%d-%H-%M-%S")}',
+        benchmark_name,
+        resume=general_config.resume,
     )
 
     log_file = os.path.join(general_config.run_dir, general_config.log_file)
@@ -53,12 +55,21 @@ def main(argv: Sequence[str] | None = None) -> int:
     logger.log(BENCH_LOG_LEVEL, 'Benchmark initialized')
 
     csv_file = os.path.join(general_config.run_dir, general_config.csv_file)
-    with CSVResultLogger(csv_file, benchmark.result_type) as csv_logger:
+    checkpoint_file = os.path.join(
+        general_config.run_dir,
+        general_config.checkpoint_file,
+    )
+    with (
+        CSVResultLogger(csv_file, benchmark.result_type) as csv_logger,
+        CheckpointManifest(checkpoint_file) as checkpoint,
+    ):
         runner(
             benchmark,
             matrix.configs(),
             csv_logger,
             repeat=general_config.repeat,
+            adaptive=general_config.get_adaptive_repeat(),
+            checkpoint=checkpoint,
         )
 
     logger.log(
@@ -5,10 +5,11 @@ import logging
 import os
 import sys
 from collections.abc import Sequence
-from datetime import datetime
 
 from psbench.benchmarks.remote_ops.config import BenchmarkMatrix
 from psbench.benchmarks.remote_ops.main import Benchmark
+from psbench.checkpoint import CheckpointManifest
+from psbench.checkpoint import get_run_dir
 from psbench.config import GeneralConfig
 from psbench.logging import BENCH_LOG_LEVEL
 from psbench.logging import init_logging
@@ -31,11 +32,15 @@ def main(argv: Sequence[str] | None = None) -> int:
     GeneralConfig.add_parser_group(parser)
 
     args = vars(parser.parse_args(argv))
+    if args['ci_field'] is not None:
+        # Repeats are handled internally by the benchmark.
+        parser.error('--ci-field is not supported by this benchmark.')
 
     general_config = GeneralConfig.from_args(**args)
-    general_config.run_dir = os.path.join(
+    general_config.run_dir = get_run_dir(
         general_config.run_dir,
-        f'{benchmark_name}-{datetime.now().strftime("%Y-%m-%d-%H-%M-%S")}',
+        benchmark_name,
+        resume=general_config.resume,
     )
 
     log_file = os.path.join(general_config.run_dir, general_config.log_file)
@@ -55,17 +60,28 @@ def main(argv: Sequence[str] | None = None) -> int:
         redis_host=matrix.redis_host,
         redis_port=matrix.redis_port,
         use_uvloop=matrix.use_uvloop,
+        local=matrix.local,
+        local_latency_ms=matrix.local_latency_ms,
+        local_bandwidth_mbps=matrix.local_bandwidth_mbps,
     )
     logger.log(BENCH_LOG_LEVEL, 'Benchmark initialized')
 
     csv_file = os.path.join(general_config.run_dir, general_config.csv_file)
-    with CSVResultLogger(csv_file, benchmark.result_type) as csv_logger:
+    checkpoint_file = os.path.join(
+        general_config.run_dir,
+        general_config.checkpoint_file,
+    )
+    with (
+        CSVResultLogger(csv_file, benchmark.result_type) as csv_logger,
+        CheckpointManifest(checkpoint_file) as checkpoint,
+    ):
         runner(
             benchmark,
             matrix.configs(),
             csv_logger,
             # Benchmark.run() will internally handle the repeats.
             repeat=1,
+            checkpoint=checkpoint,
         )
 
     logger.log(
@@ -0,0 +1,88 @@
+from __future__ import annotations
+
+import argparse
+import logging
+import os
+import sys
+from collections.abc import Sequence
+
+from psbench.benchmarks.serialization.config import BenchmarkMatrix
+from psbench.benchmarks.serialization.main import Benchmark
+from psbench.checkpoint import CheckpointManifest
+from psbench.checkpoint import get_run_dir
+from psbench.config import GeneralConfig
+from psbench.config import PayloadConfig
+from psbench.logging import BENCH_LOG_LEVEL
+from psbench.logging import init_logging
+from psbench.results import CSVResultLogger
+from psbench.runner import runner
+
+benchmark_name = Benchmark.name.lower().replace(' ', '-')
+logger = logging.getLogger(f'run.{benchmark_name}')
+
+
+def main(argv: Sequence[str] | None = None) -> int:
+    argv = argv if argv is not None else sys.argv[1:]
+
+    parser = argparse.ArgumentParser(
+        description='Serialization throughput and memory benchmark.',
+        formatter_class=argparse.ArgumentDefaultsHelpFormatter,
+    )
+
+    BenchmarkMatrix.add_parser_group(parser)
+    # Payload kinds are a benchmark parameter so --payload-kind is omitted.
+    PayloadConfig.add_parser_group(parser, include_kind=False)
+    GeneralConfig.add_parser_group(parser)
+
+    args = vars(parser.parse_args(argv))
+
+    general_config = GeneralConfig.from_args(**args)
+    general_config.run_dir = get_run_dir(
+        general_config.run_dir,
+        benchmark_name,
+        resume=general_config.resume,
+    )
+
+    log_file = os.path.join(general_config.run_dir, general_config.log_file)
+    init_logging(
+        log_file,
+        general_config.log_level,
+        general_config.log_file_level,
+        force=True,
+    )
+
+    matrix = BenchmarkMatrix.from_args(**args)
+    payload_config = PayloadConfig.from_args(**args)
+    logger.log(BENCH_LOG_LEVEL, 'All configurations loaded')
+
+    benchmark = Benchmark(payload=payload_config)
+    logger.log(BENCH_LOG_LEVEL, 'Benchmark initialized')
+
+    csv_file = os.path.join(general_config.run_dir, general_config.csv_file)
+    checkpoint_file = os.path.join(
+        general_config.run_dir,
+        general_config.checkpoint_file,
+    )
+    with (
+        CSVResultLogger(csv_file, benchmark.result_type) as csv_logger,
+        CheckpointManifest(checkpoint_file) as checkpoint,
+    ):
+        runner(
+            benchmark,
+            matrix.configs(),
+            csv_logger,
+            repeat=general_config.repeat,
+            adaptive=general_config.get_adaptive_repeat(),
+            checkpoint=checkpoint,
+        )
+
+    logger.log(
+        BENCH_LOG_LEVEL,
+        f'All logs and results saved to: {general_config.run_dir}',
+    )
+
+    return 0
+
+
+if __name__ == '__main__':
+    raise SystemExit(main())
@@ -5,17 +5,26 @@ import logging
 import os
 import sys
 from collections.abc import Sequence
-from datetime import datetime
 
 from psbench.benchmarks.stream_scaling.config import BenchmarkMatrix
+from psbench.benchmarks.stream_scaling.config import DispatcherResult
+from psbench.benchmarks.stream_scaling.config import ItemResult
+from psbench.benchmarks.stream_scaling.config import QueueDepthResult
+from psbench.benchmarks.stream_scaling.config import RunResult
 from psbench.benchmarks.stream_scaling.main import Benchmark
+from psbench.checkpoint import CheckpointManifest
+from psbench.checkpoint import get_run_dir
 from psbench.config import ExecutorConfig
 from psbench.config import GeneralConfig
+from psbench.config import PayloadConfig
 from psbench.config import StoreConfig
 from psbench.config import StreamConfig
 from psbench.logging import BENCH_LOG_LEVEL
 from psbench.logging import init_logging
+from psbench.results import AsyncResultLogger
 from psbench.results import CSVResultLogger
+from psbench.results import NPZResultLogger
+from psbench.results import ResultLogger
 from psbench.runner import runner
 
 benchmark_name = Benchmark.name.lower().replace(' ', '-')
@@ -31,17 +40,24 @@ def main(argv: Sequence[str] | None = None) -> int:
     )
 
     BenchmarkMatrix.add_parser_group(parser)
+    PayloadConfig.add_parser_group(parser)
     ExecutorConfig.add_parser_group(parser, required=True, argv=argv)
     StoreConfig.add_parser_group(parser, required=True, argv=argv)
     StreamConfig.add_parser_group(parser, required=True, argv=argv)
     GeneralConfig.add_parser_group(parser)
 
     args = vars(parser.parse_args(argv))
+    if args['stream'] == 'queue' and args['executor'] != 'thread':
+        parser.error(
+            'The queue stream broker is in-process so requires the thread '
+            'executor.',
+        )
 
     general_config = GeneralConfig.from_args(**args)
-    general_config.run_dir = os.path.join(
+    general_config.run_dir = get_run_dir(
         general_config.run_dir,
-        f'{benchmark_name}-{datetime.now().strftime("%Y-%m-%d-%H-%M-%S")}',
+        benchmark_name,
+        resume=general_config.resume,
     )
 
     log_file = os.path.join(general_config.run_dir, general_config.log_file)
@@ -58,6 +74,7 @@ def main(argv: Sequence[str] | None = None) -> int:
         **args,
     )
     store_config = StoreConfig.from_args(**args)
+    payload_config = PayloadConfig.from_args(**args)
     stream_config = StreamConfig.from_args(**args)
     logger.log(BENCH_LOG_LEVEL, 'All configurations loaded')
 
@@ -67,21 +84,62 @@ def main(argv: Sequence[str] | None = None) -> int:
     store = store_config.get_store()
     assert store is not None
 
-    benchmark = Benchmark(
-        executor,
-        store,
-        stream_config=stream_config,
+    csv_file = os.path.join(general_config.run_dir, general_config.csv_file)
+    checkpoint_file = os.path.join(
+        general_config.run_dir,
+        general_config.checkpoint_file,
     )
-    logger.log(BENCH_LOG_LEVEL, 'Benchmark initialized')
+    # Only the extension is replaced in case the directory contains '.csv'.
+    csv_root, csv_ext = os.path.splitext(csv_file)
+    dispatcher_file = f'{csv_root}-dispatchers{csv_ext}'
+    item_logger: ResultLogger[ItemResult]
+    queue_logger: ResultLogger[QueueDepthResult]
+    if matrix.item_results_format == 'npz':
+        # Each NPZ logger writes chunks to a directory.
+        item_logger = NPZResultLogger(
+            f'{csv_root}-items',
+            ItemResult,
+        )
+        queue_logger = NPZResultLogger(
+            f'{csv_root}-queue-depth',
+            QueueDepthResult,
+        )
+    else:
+        item_logger = CSVResultLogger(
+            f'{csv_root}-items{csv_ext}',
+            ItemResult,
+        )
+        queue_logger = CSVResultLogger(
+            f'{csv_root}-queue-depth{csv_ext}',
+            QueueDepthResult,
+        )
+    csv_logger = CSVResultLogger(csv_file, RunResult)
+    with (
+        AsyncResultLogger(csv_logger) as result_logger,
+        CSVResultLogger(dispatcher_file, DispatcherResult) as dispatcher_csv,
+        item_logger as item_csv,
+        queue_logger as queue_csv,
+        CheckpointManifest(checkpoint_file) as checkpoint,
+    ):
+        benchmark = Benchmark(
+            executor,
+            store,
+            stream_config=stream_config,
+            payload=payload_config,
+            dispatcher_logger=dispatcher_csv,
+            item_logger=item_csv,
+            queue_logger=queue_csv,
+        )
+        logger.log(BENCH_LOG_LEVEL, 'Benchmark initialized')
 
-    csv_file = os.path.join(general_config.run_dir, general_config.csv_file)
-    with CSVResultLogger(csv_file, benchmark.result_type) as csv_logger:
         with benchmark:
             runner(
                 benchmark,
                 matrix.configs(),
-                csv_logger,
+                result_logger,
                 repeat=general_config.repeat,
+                adaptive=general_config.get_adaptive_repeat(),
+                checkpoint=checkpoint,
             )
 
     logger.log(
@@ -5,15 +5,18 @@ import logging
 import os
 import sys
 from collections.abc import Sequence
-from datetime import datetime
 
 from psbench.benchmarks.task_pipelining.config import BenchmarkMatrix
 from psbench.benchmarks.task_pipelining.main import Benchmark
+from psbench.checkpoint import CheckpointManifest
+from psbench.checkpoint import get_run_dir
 from psbench.config import ExecutorConfig
 from psbench.config import GeneralConfig
+from psbench.config import PayloadConfig
 from psbench.config import StoreConfig
 from psbench.logging import BENCH_LOG_LEVEL
 from psbench.logging import init_logging
+from psbench.results import AsyncResultLogger
 from psbench.results import CSVResultLogger
 from psbench.runner import runner
 
@@ -30,6 +33,7 @@ def main(argv: Sequence[str] | None = None) -> int:
     )
 
     BenchmarkMatrix.add_parser_group(parser)
+    PayloadConfig.add_parser_group(parser)
     ExecutorConfig.add_parser_group(parser, required=True, argv=argv)
     StoreConfig.add_parser_group(parser, required=True, argv=argv)
     GeneralConfig.add_parser_group(parser)
@@ -37,9 +41,10 @@ def main(argv: Sequence[str] | None = None) -> int:
     args = vars(parser.parse_args(argv))
 
     general_config = GeneralConfig.from_args(**args)
-    general_config.run_dir = os.path.join(
+    general_config.run_dir = get_run_dir(
         general_config.run_dir,
-        f'{benchmark_name}-{datetime.now().strftime("%Y-%m-%d-%H-%M-%S")}',
+        benchmark_name,
+        resume=general_config.resume,
     )
 
     log_file = os.path.join(general_config.run_dir, general_config.log_file)
@@ -56,6 +61,7 @@ def main(argv: Sequence[str] | None = None) -> int:
         **args,
     )
     store_config = StoreConfig.from_args(**args)
+    payload_config = PayloadConfig.from_args(**args)
     logger.log(BENCH_LOG_LEVEL, 'All configurations loaded')
 
     # We'll let the Benchmark object handle entering and exit these context
@@ -64,16 +70,26 @@ def main(argv: Sequence[str] | None = None) -> int:
     store = store_config.get_store()
     assert store is not None
 
-    benchmark = Benchmark(executor, store)
+    benchmark = Benchmark(executor, store, payload=payload_config)
     logger.log(BENCH_LOG_LEVEL, 'Benchmark initialized')
 
     csv_file = os.path.join(general_config.run_dir, general_config.csv_file)
-    with CSVResultLogger(csv_file, benchmark.result_type) as csv_logger:
+    checkpoint_file = os.path.join(
+        general_config.run_dir,
+        general_config.checkpoint_file,
+    )
+    csv_logger = CSVResultLogger(csv_file, benchmark.result_type)
+    with (
+        AsyncResultLogger(csv_logger) as result_logger,
+        CheckpointManifest(checkpoint_file) as checkpoint,
+    ):
         runner(
             benchmark,
             matrix.configs(),
-            csv_logger,
+            result_logger,
             repeat=general_config.repeat,
+            adaptive=general_config.get_adaptive_repeat(),
+            checkpoint=checkpoint,
         )
 
     logger.log(
@@ -5,13 +5,15 @@ import logging
 import os
 import sys
 from collections.abc import Sequence
-from datetime import datetime
 
 from psbench.benchmarks.task_rtt.config import BenchmarkMatrix
 from psbench.benchmarks.task_rtt.main import Benchmark
+from psbench.checkpoint import CheckpointManifest
+from psbench.checkpoint import get_run_dir
 from psbench.config import ExecutorConfig
 from psbench.config import GeneralConfig
 from psbench.config import IPFSConfig
+from psbench.config import PayloadConfig
 from psbench.config import StoreConfig
 from psbench.logging import BENCH_LOG_LEVEL
 from psbench.logging import init_logging
@@ -31,6 +33,7 @@ def main(argv: Sequence[str] | None = None) -> int:
     )
 
     BenchmarkMatrix.add_parser_group(parser)
+    PayloadConfig.add_parser_group(parser)
     ExecutorConfig.add_parser_group(parser, required=True, argv=argv)
     StoreConfig.add_parser_group(parser, required=False, argv=argv)
     IPFSConfig.add_parser_group(parser, required=False, argv=argv)
@@ -39,9 +42,10 @@ def main(argv: Sequence[str] | None = None) -> int:
     args = vars(parser.parse_args(argv))
 
     general_config = GeneralConfig.from_args(**args)
-    general_config.run_dir = os.path.join(
+    general_config.run_dir = get_run_dir(
         general_config.run_dir,
-        f'{benchmark_name}-{datetime.now().strftime("%Y-%m-%d-%H-%M-%S")}',
+        benchmark_name,
+        resume=general_config.resume,
     )
 
     log_file = os.path.join(general_config.run_dir, general_config.log_file)
@@ -59,6 +63,7 @@ def main(argv: Sequence[str] | None = None) -> int:
     )
     store_config = StoreConfig.from_args(**args)
     ipfs_config = IPFSConfig.from_args(**args)
+    payload_config = PayloadConfig.from_args(**args)
     logger.log(BENCH_LOG_LEVEL, 'All configurations loaded')
 
     benchmark = Benchmark(
@@ -67,16 +72,27 @@ def main(argv: Sequence[str] | None = None) -> int:
         use_ipfs=ipfs_config.use_ipfs,
         ipfs_local_dir=ipfs_config.local_dir,
         ipfs_remote_dir=ipfs_config.remote_dir,
+        payload=payload_config,
+        zero_copy=matrix.zero_copy,
     )
     logger.log(BENCH_LOG_LEVEL, 'Benchmark initialized')
 
     csv_file = os.path.join(general_config.run_dir, general_config.csv_file)
-    with CSVResultLogger(csv_file, benchmark.result_type) as csv_logger:
+    checkpoint_file = os.path.join(
+        general_config.run_dir,
+        general_config.checkpoint_file,
+    )
+    with (
+        CSVResultLogger(csv_file, benchmark.result_type) as csv_logger,
+        CheckpointManifest(checkpoint_file) as checkpoint,
+    ):
         runner(
             benchmark,
             matrix.configs(),
             csv_logger,
             repeat=general_config.repeat,
+            adaptive=general_config.get_adaptive_repeat(),
+            checkpoint=checkpoint,
         )
 
     logger.log(
@@ -1,20 +1,28 @@
 from __future__ import annotations
 
 import argparse
+import csv
 import logging
 import os
 import sys
 from collections.abc import Sequence
-from datetime import datetime
 
 from psbench.benchmarks.workflow_memory.config import BenchmarkMatrix
 from psbench.benchmarks.workflow_memory.main import Benchmark
+from psbench.checkpoint import CheckpointManifest
+from psbench.checkpoint import get_run_dir
 from psbench.config import ExecutorConfig
 from psbench.config import GeneralConfig
+from psbench.config import PayloadConfig
 from psbench.config import StoreConfig
 from psbench.logging import BENCH_LOG_LEVEL
 from psbench.logging import init_logging
+from psbench.memory import find_memory_peak
+from psbench.memory import HighFrequencyMemoryProfiler
+from psbench.memory import load_memory_samples
+from psbench.memory import MemoryPeak
 from psbench.memory import SystemMemoryProfiler
+from psbench.memory import TrackedProcess
 from psbench.results import CSVResultLogger
 from psbench.runner import runner
 
@@ -22,6 +30,38 @@ benchmark_name = Benchmark.name.lower().replace(' ', '-')
 logger = logging.getLogger(f'run.{benchmark_name}')
 
 
+def _log_memory_peaks(
+    memory_file: str,
+    results_file: str,
+    peaks_file: str,
+) -> None:
+    samples = load_memory_samples(memory_file)
+    with open(results_file, newline='') as f:
+        runs = list(csv.DictReader(f))
+
+    # The samples and results include those of earlier invocations when
+    # resuming so the peaks of all runs are recomputed.
+    if os.path.exists(peaks_file):
+        os.remove(peaks_file)
+    with CSVResultLogger(peaks_file, MemoryPeak) as peaks_logger:
+        for run in runs:
+            peak = find_memory_peak(
+                samples,
+                float(run['workflow_start_timestamp']),
+                float(run['workflow_end_timestamp']),
+            )
+            # Samples of a run may have been overwritten if the ring buffer
+            # of the profiler filled.
+            if peak is not None:
+                peaks_logger.log(peak)
+                logger.log(
+                    BENCH_LOG_LEVEL,
+                    f'Run ({run["data_management"]}) peak memory: '
+                    f'{peak.peak_used_bytes - peak.baseline_used_bytes} '
+                    f'bytes above baseline after {peak.time_to_peak_s:.3f}s',
+                )
+
+
 def main(argv: Sequence[str] | None = None) -> int:
     argv = argv if argv is not None else sys.argv[1:]
 
@@ -31,6 +71,7 @@ def main(argv: Sequence[str] | None = None) -> int:
     )
 
     BenchmarkMatrix.add_parser_group(parser)
+    PayloadConfig.add_parser_group(parser)
     ExecutorConfig.add_parser_group(parser, required=True, argv=argv)
     StoreConfig.add_parser_group(parser, required=True, argv=argv)
     GeneralConfig.add_parser_group(parser)
@@ -38,9 +79,10 @@ def main(argv: Sequence[str] | None = None) -> int:
     args = vars(parser.parse_args(argv))
 
     general_config = GeneralConfig.from_args(**args)
-    general_config.run_dir = os.path.join(
+    general_config.run_dir = get_run_dir(
         general_config.run_dir,
-        f'{benchmark_name}-{datetime.now().strftime("%Y-%m-%d-%H-%M-%S")}',
+        benchmark_name,
+        resume=general_config.resume,
     )
 
     log_file = os.path.join(general_config.run_dir, general_config.log_file)
@@ -57,6 +99,7 @@ def main(argv: Sequence[str] | None = None) -> int:
         **args,
     )
     store_config = StoreConfig.from_args(**args)
+    payload_config = PayloadConfig.from_args(**args)
     logger.log(BENCH_LOG_LEVEL, 'All configurations loaded')
 
     # We'll let the Benchmark object handle entering and exit these context
@@ -67,29 +110,73 @@ def main(argv: Sequence[str] | None = None) -> int:
     store = store_config.get_store(cache_size=0)
     assert store is not None
 
-    benchmark = Benchmark(executor, store)
+    benchmark = Benchmark(executor, store, payload=payload_config)
     logger.log(BENCH_LOG_LEVEL, 'Benchmark initialized')
 
     csv_file = os.path.join(general_config.run_dir, general_config.csv_file)
-    memory_file = csv_file.replace('.csv', '-memory.csv')
-
-    memory_profiler = SystemMemoryProfiler(
-        matrix.memory_profile_interval,
-        memory_file,
+    checkpoint_file = os.path.join(
+        general_config.run_dir,
+        general_config.checkpoint_file,
     )
+    csv_root, csv_ext = os.path.splitext(csv_file)
+    memory_file = f'{csv_root}-memory{csv_ext}'
+    process_memory_file = f'{csv_root}-process-memory{csv_ext}'
+    peaks_file = f'{csv_root}-memory-peaks{csv_ext}'
+
+    memory_profiler: SystemMemoryProfiler | HighFrequencyMemoryProfiler
+    if matrix.memory_profiler == 'high-frequency':
+        memory_profiler = HighFrequencyMemoryProfiler(
+            matrix.memory_profile_interval,
+            memory_file,
+        )
+    else:
+        # Executor workers (e.g., Dask or Parsl workers) are descendants of
+        # this process so are attributed to the workers role.
+        tracked_processes = [
+            TrackedProcess('client', os.getpid(), children=False),
+            TrackedProcess('workers', os.getpid()),
+        ] + [
+            TrackedProcess('server', pid) for pid in matrix.memory_server_pids
+        ]
+        memory_profiler = SystemMemoryProfiler(
+            matrix.memory_profile_interval,
+            memory_file,
+            tracked_processes=tracked_processes,
+            process_csv_file=process_memory_file,
+        )
     memory_profiler.start()
 
-    with CSVResultLogger(csv_file, benchmark.result_type) as csv_logger:
+    with (
+        CSVResultLogger(csv_file, benchmark.result_type) as csv_logger,
+        CheckpointManifest(checkpoint_file) as checkpoint,
+    ):
         runner(
             benchmark,
             matrix.configs(),
             csv_logger,
             repeat=general_config.repeat,
+            adaptive=general_config.get_adaptive_repeat(),
+            checkpoint=checkpoint,
         )
 
     memory_profiler.stop()
-    memory_profiler.join(timeout=5.0)
+    # The high-frequency profiler writes all samples once stopped so wait
+    # for the write to finish before reading the samples.
+    memory_profiler.join()
+    if memory_profiler.exitcode != 0:
+        raise RuntimeError(
+            'Memory profiler process exited with code '
+            f'{memory_profiler.exitcode}.',
+        )
     logger.log(BENCH_LOG_LEVEL, f'Memory profile data saved: {memory_file}')
+    if matrix.memory_profiler == 'high-frequency':
+        _log_memory_peaks(memory_file, csv_file, peaks_file)
+        logger.log(BENCH_LOG_LEVEL, f'Memory peak data saved: {peaks_file}')
+    else:
+        logger.log(
+            BENCH_LOG_LEVEL,
+            f'Process memory profile data saved: {process_memory_file}',
+        )
 
     logger.log(
         BENCH_LOG_LEVEL,
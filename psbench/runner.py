@@ -1,15 +1,19 @@
 from __future__ import annotations
 
 import logging
+import math
 import statistics
 import time
 from collections.abc import Sequence
 from typing import TypeVar
 
 from pydantic import BaseModel
+from pydantic import Field
 
 from psbench.benchmarks.protocol import Benchmark
+from psbench.checkpoint import CheckpointManifest
 from psbench.logging import BENCH_LOG_LEVEL
+from psbench.results import field_names
 from psbench.results import ResultLogger
 
 RunConfigT = TypeVar('RunConfigT', bound=BaseModel)
@@ -18,12 +22,113 @@ RunResultT = TypeVar('RunResultT', bound=BaseModel)
 logger = logging.getLogger(__name__)
 
 
+class AdaptiveRepeat(BaseModel):
+    """Adaptive repetition of run configurations.
+
+    Each run configuration is repeated until the relative half-width of the
+    confidence interval of the mean of `field` is at most `target`, subject to
+    `min_repeat` and `max_repeat`.
+
+    Attributes:
+        field: name of the numeric result field to estimate. If a run returns
+            multiple results, the mean of the field across the results is used.
+        min_repeat: minimum number of (non-warmup) runs.
+        max_repeat: maximum number of (non-warmup) runs.
+        target: target half-width of the confidence interval relative to the
+            mean (e.g., `0.05` is +/- 5%).
+        confidence: confidence level of the interval.
+        warmup: number of runs to execute and discard before the measured
+            runs of each configuration.
+    """
+
+    field: str
+    min_repeat: int = Field(3, ge=2)
+    max_repeat: int = 30
+    target: float = Field(0.05, gt=0)
+    confidence: float = Field(0.95, gt=0, lt=1)
+    warmup: int = Field(0, ge=0)
+
+
+def t_quantile(p: float, df: int) -> float:
+    """Approximate quantile of Student's t-distribution.
+
+    Uses the Cornish-Fisher expansion of the t-distribution about the normal
+    distribution (Abramowitz and Stegun 26.7.5) which is accurate to within
+    1% for two or more degrees of freedom.
+
+    Args:
+        p: probability in (0, 1).
+        df: degrees of freedom.
+    """
+    z = statistics.NormalDist().inv_cdf(p)
+    g1 = (z**3 + z) / 4
+    g2 = (5 * z**5 + 16 * z**3 + 3 * z) / 96
+    g3 = (3 * z**7 + 19 * z**5 + 17 * z**3 - 15 * z) / 384
+    g4 = (79 * z**9 + 776 * z**7 + 1482 * z**5 - 1920 * z**3 - 945 * z) / 92160
+    return z + g1 / df + g2 / df**2 + g3 / df**3 + g4 / df**4
+
+
+def relative_ci_half_width(
+    values: Sequence[float],
+    confidence: float,
+) -> float:
+    """Get the half-width of the confidence interval relative to the mean.
+
+    Returns:
+        Relative half-width or infinity if fewer than two values are provided
+        or the mean is zero.
+    """
+    if len(values) < 2 or statistics.mean(values) == 0:
+        return math.inf
+    mean = statistics.mean(values)
+    t = t_quantile((1 + confidence) / 2, len(values) - 1)
+    half_width = t * statistics.stdev(values) / math.sqrt(len(values))
+    return half_width / abs(mean)
+
+
+def _result_value(
+    result: BaseModel | Sequence[BaseModel],
+    field: str,
+) -> float:
+    results = [result] if not isinstance(result, Sequence) else result
+    return statistics.mean(float(getattr(r, field)) for r in results)
+
+
 def runner(
     benchmark: Benchmark[RunConfigT, RunResultT],
     configs: Sequence[RunConfigT],
     result_logger: ResultLogger[RunResultT],
     repeat: int = 1,
+    checkpoint: CheckpointManifest | None = None,
+    adaptive: AdaptiveRepeat | None = None,
 ) -> None:
+    """Run a benchmark for each config.
+
+    Args:
+        benchmark: benchmark to run.
+        configs: run configurations.
+        result_logger: logger to log the results of each run with.
+        repeat: number of times to repeat each run configuration.
+        checkpoint: optional manifest of completed runs. Runs already in the
+            manifest are skipped and runs are added to the manifest after
+            their results are logged and flushed.
+        adaptive: optional adaptive repetition configuration. If provided,
+            `repeat` is ignored and each configuration is repeated until the
+            confidence interval of the chosen result field converges. The
+            value of the field is stored in the checkpoint with each run so
+            the confidence interval includes runs from before resuming.
+
+    Raises:
+        ValueError: if the adaptive field is not a field of the result type.
+    """
+    if adaptive is not None:
+        if adaptive.field not in field_names(benchmark.result_type):
+            raise ValueError(
+                f'Adaptive repeat field {adaptive.field!r} is not a field of '
+                f'{benchmark.result_type.__name__}.',
+            )
+        repeat = adaptive.max_repeat
+
     logger.log(BENCH_LOG_LEVEL, f'Starting benchmark: {benchmark.name}')
     pretty_config = '\n'.join(
         f'- {k}: {v}' for k, v in benchmark.config().items()
@@ -38,22 +143,66 @@ def runner(
             f'Starting run config (repeat={repeat}): {config}',
         )
 
+        warmed_up = adaptive is None
         run_times: list[float] = []
+        values: list[float] = []
         for i in range(repeat):
+            if (
+                adaptive is not None
+                and len(values) >= adaptive.min_repeat
+                and relative_ci_half_width(values, adaptive.confidence)
+                <= adaptive.target
+            ):
+                break
+
+            if checkpoint is not None and checkpoint.completed(config, i):
+                value = checkpoint.value(config, i)
+                if adaptive is not None and value is not None:
+                    values.append(value)
+                logger.log(
+                    BENCH_LOG_LEVEL,
+                    f'Run {i + 1}/{repeat} skipped (found in checkpoint)',
+                )
+                continue
+
+            # Warmup runs are deferred until a run is needed so configs
+            # which completed before resuming are not warmed up.
+            if not warmed_up:
+                assert adaptive is not None
+                for j in range(adaptive.warmup):
+                    benchmark.run(config)
+                    logger.log(
+                        BENCH_LOG_LEVEL,
+                        f'Warmup run {j + 1}/{adaptive.warmup} completed',
+                    )
+                warmed_up = True
+
             run_start = time.perf_counter()
             result = benchmark.run(config)
             run_time = time.perf_counter() - run_start
             run_times.append(run_time)
+            value = None
+            if adaptive is not None:
+                value = _result_value(result, adaptive.field)
+                values.append(value)
 
             results = [result] if not isinstance(result, Sequence) else result
             for result in results:
                 result_logger.log(result)
+            if checkpoint is not None:
+                # Results must be written before the run is recorded or
+                # they would be lost if the process crashes in between.
+                result_logger.flush()
+                checkpoint.mark_completed(config, i, value)
 
             logger.log(
                 BENCH_LOG_LEVEL,
                 f'Run {i + 1}/{repeat} completed in {run_time:.3f}s',
             )
 
+        if len(run_times) == 0:
+            continue
+
         avg_run_time = sum(run_times) / len(run_times)
         std_run_time = (
             0.0 if len(run_times) <= 1 else statistics.stdev(run_times)
@@ -62,6 +211,19 @@ def runner(
             BENCH_LOG_LEVEL,
             f'Average run time: {avg_run_time:.3f} ± {std_run_time:.3f}s',
         )
+        if adaptive is not None:
+            ci = relative_ci_half_width(values, adaptive.confidence)
+            mean = statistics.mean(values)
+            status = (
+                'converged' if ci <= adaptive.target else 'max repeat reached'
+            )
+            logger.log(
+                BENCH_LOG_LEVEL,
+                f'Achieved {adaptive.confidence:.0%} CI of {adaptive.field}: '
+                f'{mean:.3f} ± {ci * abs(mean):.3f} ({ci:.2%} relative, '
+                f'target {adaptive.target:.2%}) after {len(values)} runs '
+                f'({status})',
+            )
 
     benchmark_end = time.perf_counter()
 
@@ -0,0 +1,58 @@
+"""In-process stream broker backed by queues.
+
+Streams on a [`TopicQueues`][psbench.streams.queue.TopicQueues] mapping
+never leave the process so they provide a lower-bound transport cost to
+compare other brokers against. Publishers and subscribers must be in the
+same process (e.g., a single process or tasks run by a
+[`ThreadPoolExecutor`][concurrent.futures.ThreadPoolExecutor]).
+"""
+
+from __future__ import annotations
+
+import queue
+import threading
+from collections.abc import Iterator
+from collections.abc import Mapping
+
+from proxystore.stream.shims.queue import QueuePublisher
+from proxystore.stream.shims.queue import QueueSubscriber
+
+
+class TopicQueues(Mapping[str, 'queue.Queue[bytes]']):
+    """Mapping of topic names to queues which creates queues on access.
+
+    A [`QueuePublisher`][proxystore.stream.shims.queue.QueuePublisher]
+    requires a queue to exist for every topic it publishes to. Creating
+    queues on access lets publishers and subscribers be created in any
+    order without knowing the topics ahead of time.
+    """
+
+    def __init__(self) -> None:
+        self._queues: dict[str, queue.Queue[bytes]] = {}
+        self._lock = threading.Lock()
+
+    def __getitem__(self, topic: str) -> queue.Queue[bytes]:
+        with self._lock:
+            if topic not in self._queues:
+                self._queues[topic] = queue.Queue()
+            return self._queues[topic]
+
+    def __iter__(self) -> Iterator[str]:
+        return iter(list(self._queues))
+
+    def __len__(self) -> int:
+        return len(self._queues)
+
+
+# Queues shared by all publishers and subscribers in this process.
+_topic_queues = TopicQueues()
+
+
+def get_publisher() -> QueuePublisher:
+    """Get a publisher to the in-process queues."""
+    return QueuePublisher(_topic_queues)
+
+
+def get_subscriber(topic: str) -> QueueSubscriber:
+    """Get a subscriber to a topic of the in-process queues."""
+    return QueueSubscriber(_topic_queues[topic])
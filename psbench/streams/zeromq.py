@@ -0,0 +1,291 @@
+"""ZeroMQ stream broker with a locally spawned forwarder.
+
+The ZeroMQ shims in ProxyStore bind the publisher socket so subscribers
+must know the address of every publisher. Here publishers and subscribers
+instead connect to a
+[`ZeroMQForwarder`][psbench.streams.zeromq.ZeroMQForwarder] which runs a
+ZeroMQ proxy between an `XSUB` socket for publishers and an `XPUB` socket
+for subscribers, so any number of producers on any node can publish to
+subscribers without a separate broker deployment.
+
+Note:
+    ZeroMQ pub/sub drops messages published before a subscription has
+    propagated to the publisher (the "slow joiner" problem). The
+    [`ZeroMQPublisher`][psbench.streams.zeromq.ZeroMQPublisher] waits after
+    connecting to give subscriptions time to propagate, and the high-water
+    marks are disabled so messages are not dropped when subscribers fall
+    behind.
+"""
+
+from __future__ import annotations
+
+import logging
+import sys
+import threading
+import time
+from collections.abc import Sequence
+from types import TracebackType
+
+if sys.version_info >= (3, 11):  # pragma: >=3.11 cover
+    from typing import Self
+else:  # pragma: <3.11 cover
+    from typing_extensions import Self
+
+import zmq
+
+logger = logging.getLogger(__name__)
+
+DEFAULT_FRONTEND = '127.0.0.1:5559'
+DEFAULT_BACKEND = '127.0.0.1:5560'
+
+
+def _split_address(address: str) -> tuple[str, int]:
+    host, _, port = address.rpartition(':')
+    return host, int(port)
+
+
+class ZeroMQForwarder:
+    """Forwarder which connects ZeroMQ publishers to subscribers.
+
+    The forwarder runs in a background thread of the process which starts
+    it.
+
+    Example:
+        ```python
+        with ZeroMQForwarder() as forwarder:
+            subscriber = ZeroMQSubscriber(forwarder.backend, topic='data')
+            publisher = ZeroMQPublisher(forwarder.frontend)
+            publisher.send_message('data', b'message')
+            assert subscriber.next_message() == b'message'
+        ```
+
+    Args:
+        frontend: `host:port` address publishers connect to. A free port
+            is chosen if the port is `0`.
+        backend: `host:port` address subscribers connect to. A free port
+            is chosen if the port is `0`.
+    """
+
+    def __init__(
+        self,
+        frontend: str = '127.0.0.1:0',
+        backend: str = '127.0.0.1:0',
+    ) -> None:
+        self.frontend = frontend
+        self.backend = backend
+
+        self._context: zmq.Context[zmq.Socket[bytes]] | None = None
+        self._started = threading.Event()
+        self._thread: threading.Thread | None = None
+        self._error: BaseException | None = None
+
+    def __enter__(self) -> Self:
+        self.start()
+        return self
+
+    def __exit__(
+        self,
+        exc_type: type[BaseException] | None,
+        exc_value: BaseException | None,
+        exc_traceback: TracebackType | None,
+    ) -> None:
+        self.stop()
+
+    def start(self) -> None:
+        """Start the forwarder in a background thread.
+
+        Raises:
+            RuntimeError: if the forwarder is already running.
+            zmq.ZMQError: if the forwarder cannot bind to an address.
+        """
+        if self._thread is not None:
+            raise RuntimeError('The forwarder is already running.')
+        self._started.clear()
+        self._error = None
+        self._context = zmq.Context()
+        self._thread = threading.Thread(
+            target=self._forward,
+            name='zeromq-forwarder',
+            daemon=True,
+        )
+        self._thread.start()
+        self._started.wait()
+        if self._error is not None:
+            self._thread.join()
+            self._thread = None
+            raise self._error
+
+    def stop(self) -> None:
+        """Stop the forwarder and wait for the background thread to exit."""
+        if self._thread is None:
+            return
+        assert self._context is not None
+        # Terminating the context interrupts the proxy in the thread.
+        self._context.term()
+        self._thread.join()
+        self._thread = None
+        self._context = None
+
+    def _bind(self, socket: zmq.Socket[bytes], address: str) -> str:
+        host, port = _split_address(address)
+        if port == 0:
+            port = socket.bind_to_random_port(f'tcp://{host}')
+        else:
+            socket.bind(f'tcp://{host}:{port}')
+        return f'{host}:{port}'
+
+    def _forward(self) -> None:
+        assert self._context is not None
+        xsub = self._context.socket(zmq.XSUB)
+        xpub = self._context.socket(zmq.XPUB)
+        for socket in (xsub, xpub):
+            socket.setsockopt(zmq.LINGER, 0)
+            socket.setsockopt(zmq.SNDHWM, 0)
+            socket.setsockopt(zmq.RCVHWM, 0)
+
+        try:
+            self.frontend = self._bind(xsub, self.frontend)
+            self.backend = self._bind(xpub, self.backend)
+        except zmq.ZMQError as e:
+            self._error = e
+            xsub.close()
+            xpub.close()
+            self._started.set()
+            return
+
+        logger.debug(
+            f'ZeroMQ forwarder listening on {self.frontend} (publishers) '
+            f'and {self.backend} (subscribers)',
+        )
+        self._started.set()
+
+        try:
+            zmq.proxy(xsub, xpub)
+        except zmq.ContextTerminated:
+            pass
+        finally:
+            xsub.close()
+            xpub.close()
+
+
+# Forwarders started in this process keyed by their frontend and backend.
+_forwarders: dict[tuple[str, str], ZeroMQForwarder] = {}
+_forwarders_lock = threading.Lock()
+
+
+def start_forwarder(frontend: str, backend: str) -> ZeroMQForwarder:
+    """Start a forwarder in this process if one is not already running.
+
+    The forwarder runs until the process exits.
+
+    Args:
+        frontend: `host:port` address publishers connect to.
+        backend: `host:port` address subscribers connect to.
+
+    Returns:
+        The forwarder running on the addresses.
+    """
+    with _forwarders_lock:
+        key = (frontend, backend)
+        if key not in _forwarders:
+            forwarder = ZeroMQForwarder(frontend, backend)
+            forwarder.start()
+            _forwarders[key] = forwarder
+        return _forwarders[key]
+
+
+class ZeroMQPublisher:
+    """ZeroMQ publisher which connects to a forwarder.
+
+    Args:
+        address: `host:port` address of the forwarder frontend.
+        connect_delay_s: time to wait after connecting so subscriptions can
+            propagate to the publisher.
+    """
+
+    def __init__(self, address: str, *, connect_delay_s: float = 0.2) -> None:
+        host, port = _split_address(address)
+        self._context: zmq.Context[zmq.Socket[bytes]] = zmq.Context()
+        self._socket = self._context.socket(zmq.PUB)
+        self._socket.setsockopt(zmq.SNDHWM, 0)
+        self._socket.connect(f'tcp://{host}:{port}')
+        time.sleep(connect_delay_s)
+
+    def close(self) -> None:
+        """Close this publisher.
+
+        Messages which have not been sent to the forwarder are sent before
+        closing.
+        """
+        self._socket.close(linger=-1)
+        self._context.term()
+
+    def send_message(self, topic: str, message: bytes) -> None:
+        """Publish a message to the stream.
+
+        Args:
+            topic: Stream topic to publish message to.
+            message: Message as bytes to publish to the stream.
+        """
+        self._socket.send_multipart((topic.encode(), message))
+
+    def send_message_parts(self, topic: str, parts: Sequence[bytes]) -> None:
+        """Publish a message split into parts to the stream.
+
+        Each part is sent as a separate frame so the parts are not copied
+        into a single message before sending.
+
+        Args:
+            topic: Stream topic to publish message to.
+            parts: Parts of the message to publish.
+        """
+        self._socket.send_multipart((topic.encode(), *parts))
+
+
+class ZeroMQSubscriber:
+    """ZeroMQ subscriber which connects to a forwarder.
+
+    This subscriber is an iterable object which yields [`bytes`][bytes]
+    messages indefinitely from the stream while connected to a forwarder.
+
+    Args:
+        address: `host:port` address of the forwarder backend.
+        topic: Topic to subscribe to.
+    """
+
+    def __init__(self, address: str, *, topic: str) -> None:
+        host, port = _split_address(address)
+        self.topic = topic
+        self._context: zmq.Context[zmq.Socket[bytes]] = zmq.Context()
+        self._socket = self._context.socket(zmq.SUB)
+        self._socket.setsockopt(zmq.RCVHWM, 0)
+        self._socket.connect(f'tcp://{host}:{port}')
+        self._socket.setsockopt(zmq.SUBSCRIBE, topic.encode())
+
+    def __iter__(self) -> Self:
+        return self
+
+    def __next__(self) -> bytes:
+        return self.next_message()
+
+    def next_message(self) -> bytes:
+        """Get the next message.
+
+        Messages published in parts are joined into a single message.
+        """
+        parts = self.next_message_parts()
+        return parts[0] if len(parts) == 1 else b''.join(parts)
+
+    def next_message_parts(self) -> list[bytes]:
+        """Get the parts of the next message."""
+        topic = self.topic.encode()
+        while True:
+            received, *parts = self._socket.recv_multipart()
+            # Subscriptions match by prefix so "topic-1" also receives
+            # messages for "topic-10".
+            if received == topic:
+                return parts
+
+    def close(self) -> None:
+        """Close this subscriber."""
+        self._context.destroy()
@@ -0,0 +1,72 @@
+from __future__ import annotations
+
+import asyncio
+import contextlib
+import json
+import socket
+import threading
+from collections.abc import Generator
+
+from aiohttp import web
+
+
+def _create_app() -> web.Application:
+    data: dict[str, bytes] = {}
+
+    async def endpoint(request: web.Request) -> web.Response:
+        return web.json_response({'uuid': 'mock-endpoint'})
+
+    async def evict(request: web.Request) -> web.Response:
+        data.pop(request.query['key'], None)
+        return web.Response()
+
+    async def exists(request: web.Request) -> web.Response:
+        body = json.dumps({'exists': request.query['key'] in data})
+        return web.Response(text=body, content_type='application/json')
+
+    async def get(request: web.Request) -> web.Response:
+        key = request.query['key']
+        if key not in data:
+            return web.Response(status=404)
+        return web.Response(body=data[key])
+
+    async def set_(request: web.Request) -> web.Response:
+        data[request.query['key']] = await request.read()
+        return web.Response()
+
+    app = web.Application()
+    app.router.add_get('/endpoint', endpoint)
+    app.router.add_post('/evict', evict)
+    app.router.add_get('/exists', exists)
+    app.router.add_get('/get', get)
+    app.router.add_post('/set', set_)
+    return app
+
+
+@contextlib.contextmanager
+def serve_mock_endpoint() -> Generator[str, None, None]:
+    """Serve a mock of the endpoint REST API in a background thread.
+
+    Yields:
+        Address of the mock endpoint.
+    """
+    with socket.socket() as s:
+        s.bind(('localhost', 0))
+        port = s.getsockname()[1]
+
+    loop = asyncio.new_event_loop()
+    runner = web.AppRunner(_create_app())
+    loop.run_until_complete(runner.setup())
+    site = web.TCPSite(runner, 'localhost', port)
+    loop.run_until_complete(site.start())
+
+    thread = threading.Thread(target=loop.run_forever, daemon=True)
+    thread.start()
+
+    try:
+        yield f'http://localhost:{port}'
+    finally:
+        loop.call_soon_threadsafe(loop.stop)
+        thread.join(timeout=5)
+        loop.run_until_complete(runner.cleanup())
+        loop.close()
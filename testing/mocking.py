@@ -13,14 +13,15 @@ class MockStrictRedis:
         """Init MockStrictRedis."""
         self.data = {}
 
-    def delete(self, key: str) -> None:
-        """Delete key."""
-        if key in self.data:
-            del self.data[key]
+    def delete(self, *keys: str) -> None:
+        """Delete keys."""
+        for key in keys:
+            if key in self.data:
+                del self.data[key]
 
-    def exists(self, key: str) -> bool:
-        """Check if key exists."""
-        return key in self.data
+    def exists(self, *keys: str) -> int:
+        """Count keys which exist."""
+        return sum(key in self.data for key in keys)
 
     def get(self, key: str) -> Any:
         """Get value with key."""
@@ -36,11 +37,94 @@ class MockStrictRedis:
         """Set value with key."""
         self.data[key] = value
 
+    def mget(self, keys: list[str]) -> list[Any]:
+        """Get values with keys."""
+        return [self.data.get(key) for key in keys]
+
+    def mset(self, mapping: dict[str, Any]) -> None:
+        """Set values with keys."""
+        self.data.update(mapping)
+
+    def pipeline(self, transaction: bool = True) -> MockPipeline:
+        """Create a pipeline."""
+        return MockPipeline(self)
+
+
+class MockPipeline:
+    """Mock Redis pipeline."""
+
+    def __init__(self, client: MockStrictRedis) -> None:
+        """Init MockPipeline."""
+        self.client = client
+        self.commands: list[tuple[str, tuple[Any, ...]]] = []
+
+    def __enter__(self) -> MockPipeline:
+        return self
+
+    def __exit__(self, *args: Any) -> None:
+        self.commands.clear()
+
+    def __getattr__(self, name: str) -> Any:
+        def _queue(*args: Any) -> None:
+            self.commands.append((name, args))
+
+        return _queue
+
+    def execute(self) -> list[Any]:
+        """Execute queued commands."""
+        results = [
+            getattr(self.client, name)(*args) for name, args in self.commands
+        ]
+        self.commands.clear()
+        return results
+
+
+class MockAsyncRedis:
+    """Mock asyncio Redis client backed by a MockStrictRedis."""
+
+    def __init__(self, *args, **kwargs):
+        """Init MockAsyncRedis."""
+        self.client = MockStrictRedis()
+
+    def __getattr__(self, name: str) -> Any:
+        method = getattr(self.client, name)
+
+        async def _call(*args: Any) -> Any:
+            return method(*args)
+
+        return _call
+
+    async def aclose(self) -> None:
+        """Close the client."""
+
+    async def ping(self) -> bool:
+        """Ping the server."""
+        return True
+
+    def pipeline(self, transaction: bool = True) -> MockAsyncPipeline:
+        """Create a pipeline."""
+        return MockAsyncPipeline(self.client)
+
+
+class MockAsyncPipeline(MockPipeline):
+    """Mock asyncio Redis pipeline."""
+
+    async def __aenter__(self) -> MockAsyncPipeline:
+        return self
+
+    async def __aexit__(self, *args: Any) -> None:
+        self.commands.clear()
+
+    async def execute(self) -> list[Any]:  # type: ignore[override]
+        """Execute queued commands."""
+        return super().execute()
+
 
 @contextlib.contextmanager
 def disable_logging(path: str) -> Generator[None, None, None]:
     with (
         mock.patch(f'{path}.runner'),
+        mock.patch(f'{path}.CheckpointManifest'),
         mock.patch(
             f'{path}.init_logging',
         ),
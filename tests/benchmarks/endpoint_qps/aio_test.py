@@ -0,0 +1,164 @@
+from __future__ import annotations
+
+import asyncio
+import time
+from collections.abc import Generator
+from typing import Literal
+
+import aiohttp
+import pytest
+
+from psbench.benchmarks.endpoint_qps.aio import EndpointClient
+from psbench.benchmarks.endpoint_qps.aio import run_clients
+from psbench.benchmarks.endpoint_qps.aio import run_clients_process
+from psbench.benchmarks.endpoint_qps.aio import run_queries_async
+from psbench.benchmarks.endpoint_qps.routes import Stats
+from psbench.histogram import LatencyHistogram
+from testing.endpoint import serve_mock_endpoint
+
+QUERIES = 5
+
+
+@pytest.fixture(scope='module')
+def address() -> Generator[str, None, None]:
+    with serve_mock_endpoint() as address:
+        yield address
+
+
+@pytest.mark.asyncio
+async def test_endpoint_client(address: str) -> None:
+    async with aiohttp.ClientSession() as session:
+        client = EndpointClient(session, address)
+        await client.endpoint()
+        assert not await client.exists('key')
+        assert await client.get('key') is None
+        await client.set('key', b'value')
+        assert await client.exists('key')
+        assert await client.get('key') == b'value'
+        await client.evict('key')
+        assert not await client.exists('key')
+
+
+@pytest.mark.asyncio
+async def test_run_queries_async_closed_loop() -> None:
+    cleaned: list[int] = []
+
+    async def _query() -> int:
+        return 1
+
+    async def _cleanup(value: int) -> None:
+        cleaned.append(value)
+
+    stats = await run_queries_async(_query, QUERIES, cleanup=_cleanup)
+
+    assert stats.queries == QUERIES
+    assert stats.latency.count == QUERIES
+    assert len(cleaned) == QUERIES
+    assert stats.corrected_latency is None
+    assert stats.start_delay is None
+
+
+@pytest.mark.asyncio
+async def test_run_queries_async_open_loop() -> None:
+    async def _query() -> None:
+        pass
+
+    stats = await run_queries_async(_query, QUERIES, rate=1000)
+
+    assert stats.corrected_latency is not None
+    assert stats.start_delay is not None
+    assert stats.corrected_latency.count == QUERIES
+
+
+@pytest.mark.asyncio
+async def test_run_queries_async_shared_histograms() -> None:
+    async def _query() -> None:
+        pass
+
+    histograms = Stats(
+        queries=0,
+        total_elapsed_ms=0,
+        latency=LatencyHistogram(),
+        corrected_latency=LatencyHistogram(),
+        start_delay=LatencyHistogram(),
+    )
+    results = await asyncio.gather(
+        *(
+            run_queries_async(
+                _query,
+                QUERIES,
+                rate=1000,
+                histograms=histograms,
+            )
+            for _ in range(2)
+        ),
+    )
+
+    for stats in results:
+        assert stats.latency is histograms.latency
+    assert histograms.latency.count == 2 * QUERIES
+    assert histograms.corrected_latency is not None
+    assert histograms.corrected_latency.count == 2 * QUERIES
+
+
+@pytest.mark.asyncio
+async def test_run_queries_async_bad_rate() -> None:
+    async def _query() -> None:
+        pass
+
+    with pytest.raises(ValueError, match='must be positive'):
+        await run_queries_async(_query, QUERIES, rate=0)
+
+
+@pytest.mark.parametrize(
+    'route',
+    ('GET', 'SET', 'EXISTS', 'EVICT', 'ENDPOINT'),
+)
+@pytest.mark.asyncio
+async def test_run_clients(
+    address: str,
+    route: Literal['GET', 'SET', 'EXISTS', 'EVICT', 'ENDPOINT'],
+) -> None:
+    stats = await run_clients(
+        address,
+        route,
+        clients=4,
+        queries=QUERIES,
+        payload_size=100,
+        connections=2,
+    )
+
+    assert stats.queries == 4 * QUERIES
+    assert stats.total_elapsed_ms > 0
+    assert stats.latency.count == 4 * QUERIES
+    assert stats.corrected_latency is None
+
+
+@pytest.mark.asyncio
+async def test_run_clients_open_loop(address: str) -> None:
+    stats = await run_clients(
+        address,
+        'EXISTS',
+        clients=2,
+        queries=QUERIES,
+        rate=500,
+        arrival='fixed',
+        start_time=time.time(),
+    )
+
+    assert stats.queries == 2 * QUERIES
+    assert stats.corrected_latency is not None
+    assert stats.start_delay is not None
+    assert stats.start_delay.count == 2 * QUERIES
+
+
+def test_run_clients_process(address: str) -> None:
+    stats = run_clients_process(
+        address,
+        'ENDPOINT',
+        start_time=time.time(),
+        clients=2,
+        queries=QUERIES,
+    )
+
+    assert stats.queries == 2 * QUERIES
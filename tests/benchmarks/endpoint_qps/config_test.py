@@ -24,10 +24,28 @@ def test_benchmark_matrix_argparse() -> None:
             '6',
             '--queries',
             '7',
+            '--rates',
+            '100',
+            '200',
+            '--arrival',
+            'fixed',
+            '--engine',
+            'asyncio',
+            '--clients',
+            '8',
+            '16',
+            '--connections',
+            '4',
         ],
     )
     matrix = BenchmarkMatrix.from_args(**vars(args))
 
+    assert matrix.rates == [100, 200]
+    assert matrix.arrival == 'fixed'
+    assert matrix.engine == 'asyncio'
+    assert matrix.clients == [8, 16]
+    assert matrix.connections == 4
+
     assert matrix.endpoint == 'UUID'
     assert matrix.routes == ['GET']
     assert matrix.payload_size_bytes == [1, 2]
@@ -36,6 +54,16 @@ def test_benchmark_matrix_argparse() -> None:
     assert matrix.total_queries == 7
 
 
+def test_benchmark_matrix_argparse_closed_loop() -> None:
+    parser = argparse.ArgumentParser()
+    BenchmarkMatrix.add_parser_group(parser)
+    args = parser.parse_args(['UUID', '--routes', 'GET'])
+    matrix = BenchmarkMatrix.from_args(**vars(args))
+
+    assert matrix.rates == [None]
+    assert all(config.rate is None for config in matrix.configs())
+
+
 def test_benchmark_matrix_configs() -> None:
     matrix = BenchmarkMatrix(
         endpoint='UUID',
@@ -50,3 +78,36 @@ def test_benchmark_matrix_configs() -> None:
     assert len(configs) == (1 * 2 * 2 * 2)
     for config in configs:
         assert config.endpoint == matrix.endpoint
+
+
+def test_benchmark_matrix_configs_rates() -> None:
+    matrix = BenchmarkMatrix(
+        endpoint='UUID',
+        routes=['GET'],
+        payload_size_bytes=[1],
+        workers=[1],
+        sleep_seconds=[0],
+        total_queries=7,
+        rates=[10, 20, 30],
+    )
+
+    configs = matrix.configs()
+    assert [config.rate for config in configs] == [10, 20, 30]
+
+
+def test_benchmark_matrix_configs_clients() -> None:
+    matrix = BenchmarkMatrix(
+        endpoint='UUID',
+        routes=['GET'],
+        payload_size_bytes=[1],
+        workers=[2],
+        sleep_seconds=[0],
+        total_queries=7,
+        clients=[10, 100, 1000],
+    )
+    assert len(matrix.configs()) == 1
+
+    matrix.engine = 'asyncio'
+    configs = matrix.configs()
+    assert [config.clients for config in configs] == [10, 100, 1000]
+    assert all(config.engine == 'asyncio' for config in configs)
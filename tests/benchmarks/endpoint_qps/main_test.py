@@ -9,12 +9,13 @@ from psbench.benchmarks.endpoint_qps.config import RunConfig
 from psbench.benchmarks.endpoint_qps.main import Benchmark
 from psbench.benchmarks.endpoint_qps.main import run
 from psbench.benchmarks.endpoint_qps.routes import Stats
+from psbench.histogram import LatencyHistogram
 
 
 def call_directly(func, *args, **kwargs):
     result = mock.MagicMock()
     result.get = mock.MagicMock(
-        return_value=Stats(2, 0.1, 0.1, 0.1, 0.1, 0.1),
+        return_value=Stats(2, 0.2, LatencyHistogram.from_values([0.1, 0.1])),
     )
     return result
 
@@ -32,7 +33,59 @@ def test_run(
         ),
         mock.patch('multiprocessing.pool.Pool.apply_async', new=call_directly),
     ):
-        run('UUID', route, payload_size=1, queries=2, sleep=0, workers=2)
+        result = run(
+            'UUID',
+            route,
+            payload_size=1,
+            queries=2,
+            sleep=0,
+            workers=2,
+        )
+
+    assert result.total_queries == 4
+    assert result.p50_latency_ms == pytest.approx(0.1, rel=0.01)
+    assert result.p999_latency_ms == pytest.approx(0.1, rel=0.01)
+
+
+def call_directly_open_loop(func, *args, **kwargs):
+    result = mock.MagicMock()
+    result.get = mock.MagicMock(
+        return_value=Stats(
+            2,
+            0.2,
+            LatencyHistogram.from_values([0.1, 0.1]),
+            LatencyHistogram.from_values([0.1, 0.3]),
+            LatencyHistogram.from_values([0.0, 0.2]),
+        ),
+    )
+    return result
+
+
+def test_run_open_loop() -> None:
+    with (
+        mock.patch(
+            'psbench.benchmarks.endpoint_qps.main.EndpointConnector',
+        ),
+        mock.patch(
+            'multiprocessing.pool.Pool.apply_async',
+            new=call_directly_open_loop,
+        ),
+    ):
+        result = run(
+            'UUID',
+            'EXISTS',
+            queries=2,
+            workers=2,
+            rate=100,
+            arrival='fixed',
+        )
+
+    assert result.target_qps == 100
+    assert result.arrival == 'fixed'
+    assert result.avg_corrected_latency_ms == pytest.approx(0.2)
+    assert result.max_corrected_latency_ms == pytest.approx(0.3)
+    assert result.avg_start_delay_ms == pytest.approx(0.1)
+    assert result.max_start_delay_ms == pytest.approx(0.2)
 
 
 def test_benchmark() -> None:
@@ -54,3 +107,32 @@ def test_benchmark() -> None:
             benchmark.config()
             result = benchmark.run(config)
             assert result.workers == config.workers
+
+
+def test_run_asyncio_engine() -> None:
+    with (
+        mock.patch(
+            'psbench.benchmarks.endpoint_qps.main.EndpointConnector',
+        ),
+        mock.patch('multiprocessing.pool.Pool.apply_async', new=call_directly),
+    ):
+        result = run(
+            'UUID',
+            'GET',
+            payload_size=1,
+            queries=2,
+            workers=2,
+            engine='asyncio',
+            clients=5,
+        )
+
+    assert result.engine == 'asyncio'
+    assert result.clients == 5
+
+
+def test_run_asyncio_engine_too_few_clients() -> None:
+    with mock.patch(
+        'psbench.benchmarks.endpoint_qps.main.EndpointConnector',
+    ):
+        with pytest.raises(ValueError, match='at least one client per worker'):
+            run('UUID', 'GET', workers=2, engine='asyncio', clients=1)
@@ -3,6 +3,7 @@ from __future__ import annotations
 import time
 from collections.abc import Generator
 from typing import Any
+from typing import Literal
 from unittest import mock
 
 import pytest
@@ -11,6 +12,8 @@ from psbench.benchmarks.endpoint_qps.routes import endpoint_test
 from psbench.benchmarks.endpoint_qps.routes import evict_test
 from psbench.benchmarks.endpoint_qps.routes import exists_test
 from psbench.benchmarks.endpoint_qps.routes import get_test
+from psbench.benchmarks.endpoint_qps.routes import merge_stats
+from psbench.benchmarks.endpoint_qps.routes import run_queries
 from psbench.benchmarks.endpoint_qps.routes import set_test
 
 PAYLOAD = 100
@@ -66,3 +69,80 @@ def test_set_route(connector) -> None:
 
     assert stats.queries == QUERIES
     assert stats.total_elapsed_ms > 0
+
+
+def test_run_queries_closed_loop() -> None:
+    cleaned: list[int] = []
+    stats = run_queries(lambda: 1, QUERIES, cleanup=cleaned.append)
+
+    assert stats.queries == QUERIES
+    assert len(cleaned) == QUERIES
+    assert stats.latency.count == QUERIES
+    assert stats.corrected_latency is None
+    assert stats.start_delay is None
+
+
+@pytest.mark.parametrize('arrival', ('fixed', 'poisson'))
+def test_run_queries_open_loop(arrival: Literal['fixed', 'poisson']) -> None:
+    stats = run_queries(lambda: None, QUERIES, rate=1000, arrival=arrival)
+
+    assert stats.queries == QUERIES
+    assert stats.corrected_latency is not None
+    assert stats.start_delay is not None
+    assert stats.start_delay.count == QUERIES
+    assert stats.corrected_latency.mean >= stats.avg_latency_ms
+    assert stats.corrected_latency.max >= stats.max_latency_ms
+
+
+def test_run_queries_open_loop_fixed_rate() -> None:
+    # Ten queries at 100 QPS are spaced 10 ms apart so the test should
+    # take at least 90 ms.
+    stats = run_queries(lambda: None, 10, rate=100, arrival='fixed')
+
+    assert stats.total_elapsed_ms >= 90
+
+
+def test_run_queries_open_loop_queueing_delay() -> None:
+    # Each query takes longer than the inter-arrival time so later queries
+    # start behind schedule and the corrected latency captures that delay.
+    stats = run_queries(
+        lambda: time.sleep(0.005),
+        5,
+        rate=1000,
+        arrival='fixed',
+    )
+
+    assert stats.start_delay is not None
+    assert stats.start_delay.max > 10
+    assert stats.corrected_latency is not None
+    assert stats.corrected_latency.max > stats.max_latency_ms
+
+
+def test_run_queries_bad_rate() -> None:
+    with pytest.raises(ValueError, match='must be positive'):
+        run_queries(lambda: None, QUERIES, rate=0)
+
+
+def test_set_route_open_loop(connector) -> None:
+    stats = set_test(connector, 0, QUERIES, PAYLOAD, rate=1000)
+
+    assert stats.queries == QUERIES
+    assert stats.corrected_latency is not None
+
+
+def test_merge_stats() -> None:
+    a = run_queries(lambda: None, QUERIES)
+    b = run_queries(lambda: None, QUERIES)
+    stats = merge_stats([a, b], total_elapsed_ms=1)
+
+    assert stats.queries == 2 * QUERIES
+    assert stats.latency.count == 2 * QUERIES
+    assert stats.total_elapsed_ms == 1
+    assert stats.corrected_latency is None
+
+    c = run_queries(lambda: None, QUERIES, rate=1000)
+    d = run_queries(lambda: None, QUERIES, rate=1000)
+    stats = merge_stats([c, d], total_elapsed_ms=1)
+    assert stats.corrected_latency is not None
+    assert stats.corrected_latency.count == 2 * QUERIES
+    assert stats.start_delay is not None
@@ -0,0 +1,87 @@
+from __future__ import annotations
+
+import asyncio
+import uuid
+from collections.abc import AsyncGenerator
+from unittest import mock
+
+import pytest
+import pytest_asyncio
+from proxystore.endpoint.endpoint import Endpoint
+
+from psbench.benchmarks.remote_ops.clients import endpoint_clients
+from psbench.benchmarks.remote_ops.clients import redis_clients
+from psbench.benchmarks.remote_ops.clients import run_clients
+from psbench.benchmarks.remote_ops.config import OP_TYPE
+from testing.mocking import MockAsyncRedis
+
+
+@pytest_asyncio.fixture
+async def endpoint() -> AsyncGenerator[Endpoint, None]:
+    async with Endpoint('test-ep', uuid.uuid4()) as ep:
+        yield ep
+
+
+@pytest.mark.asyncio
+async def test_run_clients() -> None:
+    in_flight = 0
+    max_in_flight = 0
+
+    async def _operation(index: int) -> None:
+        nonlocal in_flight, max_in_flight
+        in_flight += 1
+        max_in_flight = max(max_in_flight, in_flight)
+        await asyncio.sleep(0.01)
+        in_flight -= 1
+
+    stats = await run_clients(_operation, clients=4, repeat=2)
+
+    assert len(stats.latencies_ms) == 8
+    assert max_in_flight == 4
+    # Four clients each running two 10 ms operations take at least 20 ms but
+    # less than the 80 ms it would take serially.
+    assert 20 <= stats.total_time_ms < 80
+
+
+@pytest.mark.asyncio
+async def test_run_clients_validation() -> None:
+    with pytest.raises(ValueError, match='at least one'):
+        await run_clients(asyncio.sleep, clients=0, repeat=1)
+
+
+@pytest.mark.asyncio
+@pytest.mark.parametrize('op', ('evict', 'exists', 'get', 'set'))
+@pytest.mark.parametrize('batch_size', (1, 4))
+async def test_redis_clients(op: OP_TYPE, batch_size: int) -> None:
+    redis_client = MockAsyncRedis()
+    with mock.patch('redis.asyncio.Redis', return_value=redis_client):
+        stats = await redis_clients(
+            'localhost',
+            0,
+            op,
+            clients=3,
+            payload_size_bytes=100,
+            repeat=2,
+            batch_size=batch_size,
+        )
+
+    assert len(stats.latencies_ms) == 6
+    assert stats.total_time_ms > 0
+    assert len(redis_client.client.data) == 0
+
+
+@pytest.mark.asyncio
+@pytest.mark.parametrize('op', ('evict', 'exists', 'get', 'set'))
+async def test_endpoint_clients(op: OP_TYPE, endpoint: Endpoint) -> None:
+    stats = await endpoint_clients(
+        endpoint,
+        None,
+        op,
+        clients=3,
+        payload_size_bytes=100,
+        repeat=2,
+        batch_size=2,
+    )
+
+    assert len(stats.latencies_ms) == 6
+    assert stats.total_time_ms > 0
@@ -2,6 +2,9 @@ from __future__ import annotations
 
 import argparse
 
+import pydantic
+import pytest
+
 from psbench.benchmarks.remote_ops.config import BenchmarkMatrix
 
 
@@ -19,6 +22,12 @@ def test_benchmark_matrix_argparse() -> None:
             'ws://localhost',
             '--payload-sizes',
             '100',
+            '--batch-sizes',
+            '1',
+            '16',
+            '--clients',
+            '1',
+            '8',
         ],
     )
     matrix = BenchmarkMatrix.from_args(**vars(args))
@@ -30,7 +39,45 @@ def test_benchmark_matrix_argparse() -> None:
     assert matrix.ops == ['get']
     assert matrix.relay_server == 'ws://localhost'
     assert matrix.payload_sizes == [100]
+    assert matrix.batch_sizes == [1, 16]
+    assert matrix.clients == [1, 8]
     assert matrix.use_uvloop
+    assert not matrix.local
+
+
+@pytest.mark.parametrize('option', ('--batch-sizes', '--clients'))
+@pytest.mark.parametrize('value', ('0', '-1'))
+def test_benchmark_matrix_non_positive_sizes(option: str, value: str) -> None:
+    argv = ['redis', '--local', '--ops', 'get', option, '1', value]
+    parser = argparse.ArgumentParser()
+    BenchmarkMatrix.add_parser_group(parser, argv=argv)
+    args = parser.parse_args(argv)
+
+    with pytest.raises(pydantic.ValidationError):
+        BenchmarkMatrix.from_args(**vars(args))
+
+
+def test_benchmark_matrix_argparse_local() -> None:
+    argv = [
+        'redis',
+        '--local',
+        '--local-latency-ms',
+        '10',
+        '--local-bandwidth-mbps',
+        '100',
+        '--ops',
+        'get',
+    ]
+    parser = argparse.ArgumentParser()
+    BenchmarkMatrix.add_parser_group(parser, argv=argv)
+    args = parser.parse_args(argv)
+    matrix = BenchmarkMatrix.from_args(**vars(args))
+
+    assert matrix.redis_host is None
+    assert matrix.redis_port is None
+    assert matrix.local
+    assert matrix.local_latency_ms == 10
+    assert matrix.local_bandwidth_mbps == 100
 
 
 def test_benchmark_matrix_configs() -> None:
@@ -51,3 +98,5 @@ def test_benchmark_matrix_configs() -> None:
     assert matrix.ops == config.ops
     assert matrix.payload_sizes == config.payload_sizes
     assert matrix.repeat == config.repeat
+    assert config.batch_sizes == [1]
+    assert config.clients == [1]
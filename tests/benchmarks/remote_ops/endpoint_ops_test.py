@@ -38,3 +38,11 @@ async def test_get(endpoint: Endpoint) -> None:
 async def test_set(endpoint: Endpoint) -> None:
     times = await ops.test_set(endpoint, None, 100, 2)
     assert len(times) == 2
+
+
+@pytest.mark.asyncio
+async def test_batched_ops(endpoint: Endpoint) -> None:
+    assert len(await ops.test_evict(endpoint, None, 2, 4)) == 2
+    assert len(await ops.test_exists(endpoint, None, 2, 4)) == 2
+    assert len(await ops.test_get(endpoint, None, 100, 2, 4)) == 2
+    assert len(await ops.test_set(endpoint, None, 100, 2, 4)) == 2
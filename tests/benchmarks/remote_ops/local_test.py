@@ -0,0 +1,147 @@
+from __future__ import annotations
+
+import asyncio
+import socket
+import time
+from typing import Any
+
+import pytest
+import redis
+import redis.asyncio
+
+from psbench.benchmarks.remote_ops.local import EmulatedLink
+from psbench.benchmarks.remote_ops.local import local_endpoint_pair
+from psbench.benchmarks.remote_ops.local import LocalPeerNetwork
+from psbench.benchmarks.remote_ops.local import LocalRedisServer
+
+
+def test_emulated_link() -> None:
+    link = EmulatedLink(latency_ms=10)
+    assert link.deliver_at(1, 1000) == pytest.approx(1.01)
+
+    # 1 MB at 1 MB/s takes one second. The second transfer waits for the
+    # first to finish.
+    link = EmulatedLink(latency_ms=10, bandwidth_mbps=1)
+    assert link.deliver_at(0, 1_000_000) == pytest.approx(1.01)
+    assert link.deliver_at(0, 1_000_000) == pytest.approx(2.01)
+    assert link.deliver_at(5, 0) == pytest.approx(5.01)
+
+
+def test_emulated_link_validation() -> None:
+    with pytest.raises(ValueError, match='negative'):
+        EmulatedLink(latency_ms=-1)
+    with pytest.raises(ValueError, match='greater than zero'):
+        EmulatedLink(bandwidth_mbps=0)
+
+
+def test_local_redis_server() -> None:
+    with LocalRedisServer() as server:
+        client: redis.StrictRedis[Any] = redis.StrictRedis(
+            host=server.host,
+            port=server.port,
+        )
+        assert client.ping()
+        assert client.get('key') is None
+        assert client.set('key', b'value')
+        assert client.get('key') == b'value'
+        assert client.mset({'a': b'1', 'b': b''})
+        assert client.mget(['a', 'b', 'c']) == [b'1', b'', None]
+        assert client.exists('a', 'b', 'c') == 2
+        assert client.delete('a', 'c') == 1
+
+        with client.pipeline(transaction=False) as pipeline:
+            pipeline.exists('key')
+            pipeline.delete('key')
+            pipeline.exists('key')
+            assert pipeline.execute() == [1, 1, 0]
+
+        with pytest.raises(redis.ResponseError, match='unknown command'):
+            client.execute_command('FLUSHALL')
+
+        client.close()
+
+
+def test_local_redis_server_inline_commands() -> None:
+    with LocalRedisServer() as server:
+        with socket.create_connection((server.host, server.port)) as sock:
+            sock.sendall(b'PING\r\n')
+            assert sock.recv(64) == b'+PONG\r\n'
+
+
+def test_local_redis_server_start_stop() -> None:
+    server = LocalRedisServer()
+    server.start()
+    with pytest.raises(RuntimeError, match='already running'):
+        server.start()
+    server.stop()
+    server.stop()
+
+    with LocalRedisServer() as server:
+        with pytest.raises(OSError):
+            LocalRedisServer(port=server.port).start()
+
+
+def test_local_redis_server_latency() -> None:
+    with LocalRedisServer(latency_ms=10) as server:
+        client: redis.StrictRedis[Any] = redis.StrictRedis(
+            host=server.host,
+            port=server.port,
+        )
+        client.ping()
+
+        start = time.perf_counter()
+        client.set('key', b'value')
+        assert time.perf_counter() - start >= 0.02
+
+        # Pipelined commands share the round trip.
+        start = time.perf_counter()
+        with client.pipeline(transaction=False) as pipeline:
+            for _ in range(10):
+                pipeline.exists('key')
+            pipeline.execute()
+        assert time.perf_counter() - start < 0.1
+
+        client.close()
+
+
+@pytest.mark.asyncio
+async def test_local_redis_server_async_client() -> None:
+    with LocalRedisServer(latency_ms=10) as server:
+        client: redis.asyncio.Redis[Any] = redis.asyncio.Redis(
+            host=server.host,
+            port=server.port,
+            max_connections=4,
+        )
+        # Open the connections first because the handshake takes several
+        # round trips. Concurrent clients then pay the latency in parallel.
+        await asyncio.gather(*(client.ping() for _ in range(4)))
+        start = time.perf_counter()
+        await asyncio.gather(*(client.set(f'{i}', b'') for i in range(4)))
+        assert time.perf_counter() - start < 0.08
+        assert await client.exists(*(f'{i}' for i in range(4))) == 4
+        await client.aclose()  # type: ignore[attr-defined]
+
+
+@pytest.mark.asyncio
+async def test_local_endpoint_pair() -> None:
+    network = LocalPeerNetwork(latency_ms=10)
+    async with local_endpoint_pair(network) as (local, remote):
+        start = time.perf_counter()
+        await local.set('key', b'value', remote.uuid)
+        assert time.perf_counter() - start >= 0.02
+
+        assert await local.get('key', remote.uuid) == b'value'
+        assert await local.exists('key', remote.uuid)
+        assert await remote.exists('key')
+        assert not await local.exists('key')
+        await local.evict('key', remote.uuid)
+        assert not await remote.exists('key')
+
+
+@pytest.mark.asyncio
+async def test_local_peer_network_unknown_peer() -> None:
+    network = LocalPeerNetwork()
+    async with local_endpoint_pair(network) as (local, remote):
+        await remote.close()
+        with pytest.raises(ValueError, match='not connected'):
+            network.send(local.uuid, remote.uuid, b'')
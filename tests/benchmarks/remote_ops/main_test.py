@@ -8,6 +8,7 @@ from psbench.benchmarks.remote_ops.config import RunConfig
 from psbench.benchmarks.remote_ops.main import Benchmark
 from psbench.benchmarks.remote_ops.main import runner_endpoint
 from psbench.benchmarks.remote_ops.main import runner_redis
+from testing.mocking import MockAsyncRedis
 from testing.mocking import MockStrictRedis
 
 
@@ -22,6 +23,26 @@ async def test_runner_endpoint() -> None:
     )
 
 
+@pytest.mark.asyncio
+async def test_runner_endpoint_clients() -> None:
+    results = await runner_endpoint(
+        None,
+        ['get', 'exists'],
+        payload_sizes=[100],
+        repeat=2,
+        clients=[1, 4],
+    )
+
+    assert [r.clients for r in results] == [1, 4, 1, 4]
+    for result in results:
+        assert result.ops_per_s is not None
+        assert result.ops_per_s > 0
+    get_1, get_4, _, exists_4 = results
+    assert get_1.aggregate_bandwidth_mbps is not None
+    assert get_4.aggregate_bandwidth_mbps is not None
+    assert exists_4.aggregate_bandwidth_mbps is None
+
+
 def test_runner_redis() -> None:
     with mock.patch('redis.StrictRedis', side_effect=MockStrictRedis):
         runner_redis(
@@ -33,6 +54,52 @@ def test_runner_redis() -> None:
         )
 
 
+def test_runner_redis_batch_sizes() -> None:
+    with mock.patch('redis.StrictRedis', side_effect=MockStrictRedis):
+        results = runner_redis(
+            'localhost',
+            1234,
+            ['get', 'exists'],
+            payload_sizes=[100, 1000],
+            repeat=1,
+            batch_sizes=[1, 4],
+        )
+
+    # get is run for each payload size and exists only once per batch size
+    assert [(r.op, r.batch_size) for r in results] == [
+        ('get', 1),
+        ('get', 1),
+        ('get', 4),
+        ('get', 4),
+        ('exists', 1),
+        ('exists', 4),
+    ]
+    get_1, _, get_4, _, _, _ = results
+    assert get_1.avg_bandwidth_mbps is not None
+    assert get_4.avg_bandwidth_mbps is not None
+
+
+def test_runner_redis_clients() -> None:
+    with (
+        mock.patch('redis.StrictRedis', side_effect=MockStrictRedis),
+        mock.patch('redis.asyncio.Redis', side_effect=MockAsyncRedis),
+    ):
+        results = runner_redis(
+            'localhost',
+            1234,
+            ['get', 'set'],
+            payload_sizes=[100],
+            repeat=2,
+            batch_sizes=[1, 2],
+            clients=[1, 3],
+        )
+
+    assert len(results) == 8
+    for result in results:
+        assert result.ops_per_s is not None
+        assert result.aggregate_bandwidth_mbps is not None
+
+
 def test_benchmark_endpoint() -> None:
     config = RunConfig(
         backend='endpoint',
@@ -52,9 +119,41 @@ def test_benchmark_redis() -> None:
         ops=['get'],
         payload_sizes=[100, 1000],
         repeat=3,
+        batch_sizes=[1, 2],
     )
     with mock.patch('redis.StrictRedis', side_effect=MockStrictRedis):
         with Benchmark(redis_host='localhost', redis_port=0) as benchmark:
             benchmark.config()
             results = benchmark.run(config)
-            assert len(results) == 2
+            assert len(results) == 4
+
+
+def test_benchmark_local_endpoint() -> None:
+    config = RunConfig(
+        backend='endpoint',
+        ops=['get', 'exists'],
+        payload_sizes=[100],
+        repeat=3,
+        clients=[1, 2],
+    )
+    with Benchmark(local=True, local_latency_ms=1) as benchmark:
+        assert benchmark.config()['local']
+        results = benchmark.run(config)
+        assert len(results) == 4
+        # Requests traverse the emulated link to the remote endpoint and back.
+        assert all(r.min_time_ms >= 2 for r in results)
+
+
+def test_benchmark_local_redis() -> None:
+    config = RunConfig(
+        backend='redis',
+        ops=['get', 'set', 'evict', 'exists'],
+        payload_sizes=[100],
+        repeat=3,
+        batch_sizes=[1, 4],
+        clients=[1, 2],
+    )
+    with Benchmark(local=True, local_latency_ms=1) as benchmark:
+        results = benchmark.run(config)
+        assert len(results) == 16
+        assert all(r.min_time_ms >= 2 for r in results)
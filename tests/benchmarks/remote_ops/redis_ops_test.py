@@ -33,3 +33,13 @@ def test_get(client: redis.StrictRedis[Any]) -> None:
 def test_set(client: redis.StrictRedis[Any]) -> None:
     times = ops.test_set(client, 100, 2)
     assert len(times) == 2
+
+
+@pytest.mark.parametrize('batch_size', (1, 4))
+def test_batched_ops(client: redis.StrictRedis[Any], batch_size: int) -> None:
+    assert len(ops.test_evict(client, 2, batch_size)) == 2
+    assert len(ops.test_exists(client, 2, batch_size)) == 2
+    assert len(ops.test_get(client, 100, 2, batch_size)) == 2
+    assert len(ops.test_set(client, 100, 2, batch_size)) == 2
+    # All keys are cleaned up
+    assert len(client.data) == 0  # type: ignore[attr-defined]
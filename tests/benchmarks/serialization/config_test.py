@@ -0,0 +1,59 @@
+from __future__ import annotations
+
+import argparse
+
+from psbench.benchmarks.serialization.config import BenchmarkMatrix
+
+
+def test_benchmark_matrix_argparse() -> None:
+    parser = argparse.ArgumentParser()
+    BenchmarkMatrix.add_parser_group(parser)
+    args = parser.parse_args(
+        [
+            '--serializers',
+            'pickle',
+            'pickle-oob',
+            '--compressions',
+            'none',
+            'zlib',
+            '--payload-kinds',
+            'ndarray',
+            '--payload-sizes',
+            '100',
+            '1000',
+            '--iterations',
+            '5',
+        ],
+    )
+    matrix = BenchmarkMatrix.from_args(**vars(args))
+
+    assert matrix.serializers == ['pickle', 'pickle-oob']
+    assert matrix.compressions == ['none', 'zlib']
+    assert matrix.payload_kinds == ['ndarray']
+    assert matrix.payload_sizes == [100, 1000]
+    assert matrix.iterations == 5
+
+
+def test_benchmark_matrix_argparse_defaults() -> None:
+    parser = argparse.ArgumentParser()
+    BenchmarkMatrix.add_parser_group(parser)
+    args = parser.parse_args(['--payload-sizes', '100'])
+    matrix = BenchmarkMatrix.from_args(**vars(args))
+
+    assert matrix.serializers == ['proxystore', 'pickle', 'pickle-oob']
+    assert matrix.compressions == ['none']
+    assert matrix.payload_kinds == ['bytes']
+
+
+def test_benchmark_matrix_configs() -> None:
+    matrix = BenchmarkMatrix(
+        serializers=['proxystore', 'pickle'],
+        compressions=['none', 'zlib'],
+        payload_kinds=['bytes', 'nested'],
+        payload_sizes=[100, 1000],
+        iterations=3,
+    )
+
+    configs = matrix.configs()
+    assert len(configs) == 16
+    assert all(config.iterations == 3 for config in configs)
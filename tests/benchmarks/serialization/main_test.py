@@ -0,0 +1,42 @@
+from __future__ import annotations
+
+import pytest
+
+from psbench.benchmarks.serialization.config import RunConfig
+from psbench.benchmarks.serialization.main import Benchmark
+from psbench.benchmarks.serialization.main import measure_peak_memory
+from psbench.benchmarks.serialization.serializers import SERIALIZER_TYPE
+from psbench.config.payload import PayloadConfig
+from psbench.payload import PAYLOAD_KINDS
+from psbench.payload import PayloadKind
+
+
+def test_measure_peak_memory() -> None:
+    result, peak = measure_peak_memory(lambda: bytearray(1_000_000))
+
+    assert len(result) == 1_000_000
+    assert peak >= 1_000_000
+
+
+@pytest.mark.parametrize('serializer', ('proxystore', 'pickle', 'pickle-oob'))
+@pytest.mark.parametrize('kind', PAYLOAD_KINDS)
+def test_benchmark(serializer: SERIALIZER_TYPE, kind: PayloadKind) -> None:
+    config = RunConfig(
+        serializer=serializer,
+        compression='zlib',
+        payload_kind=kind,
+        payload_size_bytes=10000,
+        iterations=2,
+    )
+
+    with Benchmark(PayloadConfig(seed=0)) as benchmark:
+        benchmark.config()
+        result = benchmark.run(config)
+
+    assert result.serializer == serializer
+    assert result.payload_kind == kind
+    assert result.serialized_size_bytes > 0
+    assert result.serialize_ms > 0
+    assert result.deserialize_ms > 0
+    assert result.serialize_bandwidth_mbps > 0
+    assert result.serialize_peak_memory_bytes > 0
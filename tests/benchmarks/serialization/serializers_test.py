@@ -0,0 +1,54 @@
+from __future__ import annotations
+
+import numpy
+import pytest
+
+from psbench.benchmarks.serialization.serializers import COMPRESSION_TYPE
+from psbench.benchmarks.serialization.serializers import deserialize
+from psbench.benchmarks.serialization.serializers import serialize
+from psbench.benchmarks.serialization.serializers import SERIALIZER_TYPE
+
+
+@pytest.mark.parametrize('serializer', ('proxystore', 'pickle', 'pickle-oob'))
+@pytest.mark.parametrize('compression', ('none', 'zlib', 'lzma', 'bz2'))
+def test_serialize_round_trip(
+    serializer: SERIALIZER_TYPE,
+    compression: COMPRESSION_TYPE,
+) -> None:
+    array = numpy.arange(1000)
+    data = b'abc' * 100
+
+    serialized = serialize(
+        {'array': array, 'data': data},
+        serializer,
+        compression,
+    )
+    assert serialized.nbytes > 0
+
+    result = deserialize(serialized, serializer, compression)
+    assert numpy.array_equal(result['array'], array)
+    assert result['data'] == data
+
+
+def test_serialize_out_of_band_buffers() -> None:
+    array = numpy.arange(1000)
+
+    serialized = serialize(array, 'pickle-oob')
+    assert len(serialized.buffers) == 1
+    assert len(serialized.data) < array.nbytes
+    assert serialized.nbytes > array.nbytes
+
+    in_band = serialize(array, 'pickle')
+    assert len(in_band.buffers) == 0
+    assert len(in_band.data) > array.nbytes
+
+
+def test_serialize_unknown() -> None:
+    with pytest.raises(ValueError, match='Unknown serializer'):
+        serialize(b'abc', 'unknown')  # type: ignore[arg-type]
+    with pytest.raises(ValueError, match='Unknown compression'):
+        serialize(b'abc', 'pickle', 'unknown')  # type: ignore[arg-type]
+
+    serialized = serialize(b'abc', 'pickle')
+    with pytest.raises(ValueError, match='Unknown serializer'):
+        deserialize(serialized, 'unknown')  # type: ignore[arg-type]
@@ -2,7 +2,11 @@ from __future__ import annotations
 
 import argparse
 
+import pydantic
+import pytest
+
 from psbench.benchmarks.stream_scaling.config import BenchmarkMatrix
+from psbench.benchmarks.stream_scaling.config import RunConfig
 
 
 def test_benchmark_matrix_argparse() -> None:
@@ -22,6 +26,21 @@ def test_benchmark_matrix_argparse() -> None:
             '5',
             '--task-sleep',
             '6',
+            '--producers',
+            '1',
+            '2',
+            '--dispatchers',
+            '3',
+            '--dispatch-policy',
+            'fifo',
+            'credit',
+            '--prefetch',
+            '4',
+            '--batch-size',
+            '1',
+            '8',
+            '--item-results-format',
+            'npz',
         ],
     )
     matrix = BenchmarkMatrix.from_args(**vars(args))
@@ -31,6 +50,48 @@ def test_benchmark_matrix_argparse() -> None:
     assert matrix.stream_method == ['default']
     assert matrix.task_count == 5
     assert matrix.task_sleep == 6
+    assert matrix.producers == [1, 2]
+    assert matrix.dispatchers == [3]
+    assert matrix.dispatch_policy == ['fifo', 'credit']
+    assert matrix.prefetch == 4
+    assert matrix.batch_size == [1, 8]
+    assert matrix.item_results_format == 'npz'
+
+
+@pytest.mark.parametrize('field', ('producers', 'dispatchers', 'batch_size'))
+@pytest.mark.parametrize('value', (0, -1))
+def test_counts_must_be_positive(field: str, value: int) -> None:
+    parser = argparse.ArgumentParser()
+    BenchmarkMatrix.add_parser_group(parser)
+    args = parser.parse_args(
+        [
+            '--data-size-bytes',
+            '1',
+            '--max-workers',
+            '2',
+            '--stream-method',
+            'default',
+            '--task-count',
+            '1',
+            '--task-sleep',
+            '0',
+            f'--{field.replace("_", "-")}',
+            str(value),
+        ],
+    )
+    with pytest.raises(pydantic.ValidationError):
+        BenchmarkMatrix.from_args(**vars(args))
+
+    with pytest.raises(pydantic.ValidationError):
+        RunConfig(
+            data_size_bytes=1,
+            max_workers=2,
+            task_count=1,
+            task_sleep=0,
+            method='default',
+            adios_file='stream',
+            **{field: value},
+        )
 
 
 def test_benchmark_matrix_configs() -> None:
@@ -41,10 +102,15 @@ def test_benchmark_matrix_configs() -> None:
         task_count=5,
         task_sleep=6,
         adios_file='/tmp/adios-stream',
+        producers=[1, 2],
     )
 
     configs = matrix.configs()
-    expected = len(matrix.data_size_bytes) * len(matrix.stream_method)
+    expected = (
+        len(matrix.data_size_bytes)
+        * len(matrix.stream_method)
+        * len(matrix.producers)
+    )
     assert len(configs) == expected
 
     for config in configs:
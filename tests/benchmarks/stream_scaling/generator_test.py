@@ -1,6 +1,7 @@
 from __future__ import annotations
 
 import pathlib
+import queue
 import time
 from unittest import mock
 
@@ -8,14 +9,23 @@ import pytest
 from proxystore.connectors.file import FileConnector
 from proxystore.store.base import Store
 from proxystore.store.future import Future
+from proxystore.stream import StreamConsumer
+from proxystore.stream import StreamProducer
 from proxystore.stream.protocols import MessagePublisher
+from proxystore.stream.shims.queue import QueuePublisher
+from proxystore.stream.shims.queue import QueueSubscriber
 
 from psbench.benchmarks.stream_scaling.config import RunConfig
 from psbench.benchmarks.stream_scaling.generator import generate_data
 from psbench.benchmarks.stream_scaling.generator import generator_task
 from psbench.benchmarks.stream_scaling.shims import ConsumerShim
+from psbench.benchmarks.stream_scaling.shims import pack_batch
 from psbench.benchmarks.stream_scaling.shims import ProducerShim
+from psbench.benchmarks.stream_scaling.shims import unpack_batch
 from psbench.config.stream import StreamConfig
+from psbench.streams.zeromq import ZeroMQForwarder
+from psbench.streams.zeromq import ZeroMQPublisher
+from psbench.streams.zeromq import ZeroMQSubscriber
 from testing.stream import create_stream_pair
 
 
@@ -55,6 +65,197 @@ def test_generator_max_items(
         assert all(len(item) == item_size_bytes for item in items)
 
 
+@pytest.mark.parametrize('direct', (True, False))
+def test_generator_item_stamps(
+    direct: bool,
+    file_store: Store[FileConnector],
+) -> None:
+    stop_generator: Future[bool] = file_store.future()
+    topic = 'topic'
+
+    with create_stream_pair(file_store, topic) as (producer, consumer):
+        producer_shim = ProducerShim(
+            producer,
+            direct_to_publisher=direct,
+            producer_id=3,
+        )
+        consumer_shim = ConsumerShim(consumer, direct_from_subscriber=direct)
+
+        timestamps = generate_data(
+            producer_shim,
+            stop_generator,
+            item_size_bytes=100,
+            max_items=3,
+            topic=topic,
+        )
+        producer_shim.close_topic(topic)
+
+        stamps = []
+        for _ in range(3):
+            stamp, item = consumer_shim.next_with_stamp()
+            assert len(item) == 100
+            # The stamp is stripped from direct messages without a copy.
+            assert isinstance(item, memoryview) == direct
+            stamps.append(stamp)
+
+    assert [stamp.producer for stamp in stamps] == [3, 3, 3]
+    assert [stamp.sequence for stamp in stamps] == [0, 1, 2]
+    for stamp, timestamp in zip(stamps, timestamps[topic], strict=True):
+        assert stamp.timestamp == pytest.approx(timestamp, abs=1)
+
+
+@pytest.mark.parametrize('direct', (True, False))
+def test_generator_batches(
+    direct: bool,
+    file_store: Store[FileConnector],
+) -> None:
+    stop_generator: Future[bool] = file_store.future()
+    topic = 'topic'
+    queue_: queue.Queue[bytes] = queue.Queue()
+
+    with StreamProducer[bytes](
+        QueuePublisher({topic: queue_}),
+        batch_size=3,
+        stores={topic: file_store},
+    ) as producer:
+        producer_shim = ProducerShim(
+            producer,
+            direct_to_publisher=direct,
+            batch_size=3,
+        )
+        generate_data(
+            producer_shim,
+            stop_generator,
+            item_size_bytes=10,
+            max_items=7,
+            topic=topic,
+        )
+        producer_shim.close_topic(topic)
+
+    # Two full batches, one partial batch, and the end of the stream.
+    assert queue_.qsize() == (4 if direct else 3)
+
+    consumer = StreamConsumer[bytes](QueueSubscriber(queue_))
+    consumer_shim = ConsumerShim(
+        consumer,
+        direct_from_subscriber=direct,
+        batched=True,
+    )
+    stamps = []
+    while True:
+        try:
+            stamp, item = consumer_shim.next_with_stamp()
+        except StopIteration:
+            break
+        assert len(item) == 10
+        stamps.append(stamp)
+    assert [stamp.sequence for stamp in stamps] == list(range(7))
+
+
+@pytest.mark.parametrize('direct', (True, False))
+def test_producer_shim_publish_timestamps(
+    direct: bool,
+    file_store: Store[FileConnector],
+) -> None:
+    topic = 'topic'
+    queue_: queue.Queue[bytes] = queue.Queue()
+
+    with StreamProducer[bytes](
+        QueuePublisher({topic: queue_}),
+        batch_size=2,
+        stores={topic: file_store},
+    ) as producer:
+        producer_shim = ProducerShim(
+            producer,
+            direct_to_publisher=direct,
+            batch_size=2,
+        )
+        producer_shim.send_message(topic, b'0')
+        # Batched items are published when the batch is flushed.
+        assert producer_shim.publish_timestamps[topic] == []
+        time.sleep(0.01)
+        flush_time = time.time()
+        producer_shim.send_message(topic, b'1')
+        producer_shim.send_message(topic, b'2')
+        producer_shim.close_topic(topic)
+
+    first, second, last = producer_shim.publish_timestamps[topic]
+    assert first == second >= flush_time
+    assert last >= second
+
+
+def test_pack_batch() -> None:
+    messages = [b'', b'a', b'bc' * 100]
+    assert unpack_batch(pack_batch(messages)) == messages
+    assert unpack_batch(pack_batch([])) == []
+
+
+def test_pack_batch_headers() -> None:
+    unpacked = unpack_batch(pack_batch([b'a', b'bc'], [b'h1', b'h2']))
+    assert unpacked == [b'h1a', b'h2bc']
+    assert all(isinstance(message, memoryview) for message in unpacked)
+
+
+def test_shims_direct_zeromq(file_store: Store[FileConnector]) -> None:
+    # Unbatched items are published as a stamp and a data frame.
+    topic = 'topic'
+    with ZeroMQForwarder() as forwarder:
+        subscriber = ZeroMQSubscriber(forwarder.backend, topic=topic)
+        publisher = ZeroMQPublisher(forwarder.frontend)
+        with (
+            StreamProducer[bytes](
+                publisher,
+                stores={topic: file_store},
+            ) as producer,
+            StreamConsumer[bytes](subscriber) as consumer,
+        ):
+            producer_shim = ProducerShim(producer, direct_to_publisher=True)
+            consumer_shim = ConsumerShim(consumer, direct_from_subscriber=True)
+            producer_shim.send_message(topic, b'first')
+            producer_shim.send_message(topic, b'second')
+            producer_shim.close_topic(topic)
+
+            received = []
+            for _ in range(2):
+                stamp, item = consumer_shim.next_with_stamp()
+                received.append((stamp.sequence, item))
+            assert received == [(0, b'first'), (1, b'second')]
+            with pytest.raises(StopIteration):
+                consumer_shim.next_with_stamp()
+
+
+def test_generator_multiple_topics(file_store: Store[FileConnector]) -> None:
+    stop_generator: Future[bool] = file_store.future()
+    topics = ['topic-0', 'topic-1']
+    queues: dict[str, queue.Queue[bytes]] = {
+        topic: queue.Queue() for topic in topics
+    }
+
+    with StreamProducer[bytes](
+        QueuePublisher(queues),
+        stores=dict.fromkeys(topics, file_store),
+    ) as producer:
+        producer_shim = ProducerShim(producer)
+        timestamps = generate_data(
+            producer_shim,
+            stop_generator,
+            item_size_bytes=1,
+            max_items=3,
+            topic=topics,
+        )
+        for topic in topics:
+            # Each topic is closed by two producers.
+            producer_shim.close_topic(topic)
+            producer_shim.close_topic(topic)
+
+    assert [len(timestamps[topic]) for topic in topics] == [2, 1]
+
+    for topic, expected in zip(topics, (2, 1), strict=True):
+        consumer = StreamConsumer[bytes](QueueSubscriber(queues[topic]))
+        consumer_shim = ConsumerShim(consumer, producers=2)
+        assert len(list(consumer_shim)) == expected
+
+
 def test_generator_interval(file_store: Store[FileConnector]) -> None:
     stop_generator: Future[bool] = file_store.future()
     interval = 0.01
@@ -135,7 +336,7 @@ def test_generator_task(
             spec=MessagePublisher,
         ),
     ):
-        generator_task(
+        stats = generator_task(
             run_config,
             file_store.config(),
             stream_config,
@@ -144,3 +345,8 @@ def test_generator_task(
         )
 
         assert mock_generate.call_count == 1
+        if method == 'adios':
+            assert stats.publish_timestamps == mock_generate.return_value
+        else:
+            # Timestamps are recorded by the producer shim when published.
+            assert stats.publish_timestamps == {'topic': []}
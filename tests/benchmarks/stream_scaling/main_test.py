@@ -2,22 +2,44 @@ from __future__ import annotations
 
 import contextlib
 import pathlib
+import queue
+import socket
+import threading
+import time
+from concurrent.futures import ProcessPoolExecutor
 from concurrent.futures import ThreadPoolExecutor
 from unittest import mock
 
 import pytest
 from proxystore.connectors.file import FileConnector
 from proxystore.store.base import Store
+from proxystore.stream.shims.queue import QueuePublisher
+from proxystore.stream.shims.queue import QueueSubscriber
 
+from psbench.benchmarks.stream_scaling.config import DispatcherResult
+from psbench.benchmarks.stream_scaling.config import ItemResult
+from psbench.benchmarks.stream_scaling.config import QueueDepthResult
 from psbench.benchmarks.stream_scaling.config import RunConfig
 from psbench.benchmarks.stream_scaling.main import Benchmark
+from psbench.benchmarks.stream_scaling.main import compute_batch_task
+from psbench.benchmarks.stream_scaling.main import compute_task
+from psbench.benchmarks.stream_scaling.main import dispatch
+from psbench.benchmarks.stream_scaling.main import max_backlog
+from psbench.benchmarks.stream_scaling.main import submit_compute_task
+from psbench.benchmarks.stream_scaling.main import TaskTiming
+from psbench.benchmarks.stream_scaling.shims import ItemStamp
+from psbench.config import PayloadConfig
 from psbench.config import StreamConfig
+from psbench.payload import PayloadKind
+from psbench.results import BasicResultLogger
 from testing.stream import create_stream_pair
 
 
 @pytest.mark.parametrize('method', ('default', 'proxy', 'adios'))
+@pytest.mark.parametrize('payload_kind', ('bytes', 'nested'))
 def test_benchmark(
     method: str,
+    payload_kind: PayloadKind,
     file_store: Store[FileConnector],
     thread_executor: ThreadPoolExecutor,
     tmp_path: pathlib.Path,
@@ -61,7 +83,12 @@ def test_benchmark(
         )
 
         benchmark = stack.enter_context(
-            Benchmark(thread_executor, file_store, stream_config),
+            Benchmark(
+                thread_executor,
+                file_store,
+                stream_config,
+                payload=PayloadConfig(kind=payload_kind),
+            ),
         )
 
         benchmark.config()
@@ -70,3 +97,493 @@ def test_benchmark(
 
     assert result.data_size_bytes == run_config.data_size_bytes
     assert result.completed_tasks == run_config.task_count
+    assert result.payload_kind == payload_kind
+
+
+@pytest.mark.parametrize('method', ('default', 'proxy'))
+def test_benchmark_multiple_producers_and_dispatchers(
+    method: str,
+    file_store: Store[FileConnector],
+    thread_executor: ThreadPoolExecutor,
+    tmp_path: pathlib.Path,
+) -> None:
+    stream_config = StreamConfig(
+        kind='redis',
+        topic='topic',
+        servers=['localhost:1234'],
+    )
+    run_config = RunConfig(
+        data_size_bytes=100,
+        max_workers=thread_executor._max_workers,
+        task_count=9,
+        task_sleep=0.001,
+        method=method,
+        adios_file=str(tmp_path / 'adios-stream'),
+        producers=2,
+        dispatchers=2,
+    )
+    topics = ['topic-0', 'topic-1']
+    queues: dict[str, queue.Queue[bytes]] = {
+        topic: queue.Queue() for topic in topics
+    }
+    dispatcher_logger = BasicResultLogger(DispatcherResult)
+    item_logger = BasicResultLogger(ItemResult)
+
+    with (
+        mock.patch(
+            'psbench.config.stream.StreamConfig.get_publisher',
+            return_value=QueuePublisher(queues),
+        ),
+        mock.patch(
+            'psbench.config.stream.StreamConfig.get_subscriber',
+            side_effect=lambda topic: QueueSubscriber(queues[topic]),
+        ),
+        Benchmark(
+            thread_executor,
+            file_store,
+            stream_config,
+            dispatcher_logger=dispatcher_logger,
+            item_logger=item_logger,
+        ) as benchmark,
+    ):
+        result = benchmark.run(run_config)
+
+    assert result.completed_tasks == run_config.task_count
+    assert result.producers == run_config.producers
+    assert result.dispatchers == run_config.dispatchers
+    assert result.items_per_s > 0
+    assert result.max_dispatcher_backlog >= 0
+
+    assert len(dispatcher_logger.results) == run_config.dispatchers
+    assert [r.topic for r in dispatcher_logger.results] == topics
+    assert sum(r.completed_tasks for r in dispatcher_logger.results) == 9
+    assert all(r.max_running_tasks == 1 for r in dispatcher_logger.results)
+
+    # Each item is identified by its producer and sequence number.
+    assert len(item_logger.results) == run_config.task_count
+    assert sorted((r.producer, r.sequence) for r in item_logger.results) == [
+        (0, 0),
+        (0, 1),
+        (0, 2),
+        (0, 3),
+        (0, 4),
+        (1, 0),
+        (1, 1),
+        (1, 2),
+        (1, 3),
+    ]
+    for item in item_logger.results:
+        assert item.publish_to_dispatch_s >= 0
+        assert item.dispatch_to_resolve_s >= 0
+        assert item.resolve_to_done_s >= run_config.task_sleep
+    assert result.latency_p50_s <= result.latency_p99_s
+
+
+def test_benchmark_flushes_side_loggers(
+    file_store: Store[FileConnector],
+    thread_executor: ThreadPoolExecutor,
+    tmp_path: pathlib.Path,
+) -> None:
+    stream_config = StreamConfig(
+        kind='redis',
+        topic='topic',
+        servers=['localhost:1234'],
+    )
+    run_config = RunConfig(
+        data_size_bytes=100,
+        max_workers=thread_executor._max_workers,
+        task_count=3,
+        task_sleep=0.001,
+        method='default',
+        adios_file=str(tmp_path / 'adios-stream'),
+    )
+    queues: dict[str, queue.Queue[bytes]] = {'topic': queue.Queue()}
+    loggers = (
+        BasicResultLogger(DispatcherResult),
+        BasicResultLogger(ItemResult),
+        BasicResultLogger(QueueDepthResult),
+    )
+
+    with (
+        mock.patch(
+            'psbench.config.stream.StreamConfig.get_publisher',
+            return_value=QueuePublisher(queues),
+        ),
+        mock.patch(
+            'psbench.config.stream.StreamConfig.get_subscriber',
+            side_effect=lambda topic: QueueSubscriber(queues[topic]),
+        ),
+        mock.patch.object(loggers[0], 'flush') as mock_dispatcher_flush,
+        mock.patch.object(loggers[1], 'flush') as mock_item_flush,
+        mock.patch.object(loggers[2], 'flush') as mock_queue_flush,
+        Benchmark(
+            thread_executor,
+            file_store,
+            stream_config,
+            dispatcher_logger=loggers[0],
+            item_logger=loggers[1],
+            queue_logger=loggers[2],
+        ) as benchmark,
+    ):
+        benchmark.run(run_config)
+
+        # The runner checkpoints a run after it returns so the side results
+        # must already be written out.
+        mock_dispatcher_flush.assert_called_once()
+        mock_item_flush.assert_called_once()
+        mock_queue_flush.assert_called_once()
+
+
+@pytest.mark.parametrize('method', ('default', 'proxy'))
+def test_benchmark_credit_dispatch_policy(
+    method: str,
+    file_store: Store[FileConnector],
+    thread_executor: ThreadPoolExecutor,
+    tmp_path: pathlib.Path,
+) -> None:
+    stream_config = StreamConfig(
+        kind='redis',
+        topic='topic',
+        servers=['localhost:1234'],
+    )
+    run_config = RunConfig(
+        data_size_bytes=100,
+        max_workers=thread_executor._max_workers,
+        task_count=12,
+        task_sleep=0.001,
+        method=method,
+        adios_file=str(tmp_path / 'adios-stream'),
+        dispatch_policy='credit',
+        prefetch=2,
+    )
+    dispatcher_logger = BasicResultLogger(DispatcherResult)
+    queue_logger = BasicResultLogger(QueueDepthResult)
+
+    with contextlib.ExitStack() as stack:
+        producer, consumer = stack.enter_context(
+            create_stream_pair(file_store, stream_config.topic),
+        )
+        stack.enter_context(
+            mock.patch(
+                'psbench.config.stream.StreamConfig.get_publisher',
+                return_value=producer.publisher,
+            ),
+        )
+        stack.enter_context(
+            mock.patch(
+                'psbench.config.stream.StreamConfig.get_subscriber',
+                return_value=consumer.subscriber,
+            ),
+        )
+        benchmark = stack.enter_context(
+            Benchmark(
+                thread_executor,
+                file_store,
+                stream_config,
+                dispatcher_logger=dispatcher_logger,
+                queue_logger=queue_logger,
+            ),
+        )
+        result = benchmark.run(run_config)
+
+    assert result.completed_tasks == run_config.task_count
+    assert result.dispatch_policy == 'credit'
+
+    (dispatcher_result,) = dispatcher_logger.results
+    assert 0 < dispatcher_result.max_prefetched <= run_config.prefetch
+
+    compute_workers = run_config.max_workers - run_config.producers
+    assert len(queue_logger.results) > 0
+    for depth in queue_logger.results:
+        assert depth.prefetched_items <= run_config.prefetch
+        assert depth.running_tasks <= compute_workers
+    assert queue_logger.results[-1].running_tasks == 0
+
+
+class _CountingConsumer:
+    def __init__(
+        self,
+        items: int,
+        block_after: int | None = None,
+        unblock: threading.Event | None = None,
+    ) -> None:
+        self.items = items
+        self.block_after = block_after
+        self.unblock = unblock
+        self.read = 0
+
+    def next_with_stamp(self) -> tuple[ItemStamp, bytes]:
+        if self.read == self.block_after:
+            assert self.unblock is not None
+            self.unblock.wait()
+        if self.read >= self.items:
+            raise StopIteration
+        self.read += 1
+        return ItemStamp(0, self.read, time.time()), b'data'
+
+
+def _credit_config(tmp_path: pathlib.Path) -> RunConfig:
+    return RunConfig(
+        data_size_bytes=4,
+        max_workers=2,
+        task_count=10,
+        task_sleep=0,
+        method='default',
+        adios_file=str(tmp_path / 'adios-stream'),
+        dispatch_policy='credit',
+        prefetch=2,
+    )
+
+
+def test_dispatch_credit_prefetch_bound(
+    thread_executor: ThreadPoolExecutor,
+    tmp_path: pathlib.Path,
+) -> None:
+    consumer = _CountingConsumer(items=10)
+    task_done = threading.Event()
+
+    def _task() -> TaskTiming:
+        task_done.wait()
+        return TaskTiming(0, 0, 0)
+
+    with (
+        ThreadPoolExecutor(1) as pool,
+        mock.patch(
+            'psbench.benchmarks.stream_scaling.main.submit_compute_task',
+            side_effect=lambda *args, **kwargs: thread_executor.submit(_task),
+        ),
+    ):
+        future = pool.submit(
+            dispatch,
+            thread_executor,
+            consumer,  # type: ignore[arg-type]
+            config=_credit_config(tmp_path),
+            topic='topic',
+            max_running_tasks=1,
+        )
+        try:
+            time.sleep(0.1)
+            # One item is held by the running task and two are prefetched.
+            assert consumer.read == 3
+        finally:
+            task_done.set()
+        stats = future.result()
+
+    assert stats.completed_tasks == 10
+
+
+def test_dispatch_credit_error_does_not_drain_stream(
+    tmp_path: pathlib.Path,
+) -> None:
+    # The stream blocks after the first item until the producers would be
+    # stopped, which only happens after the dispatcher raises.
+    unblock = threading.Event()
+    consumer = _CountingConsumer(items=10, block_after=1, unblock=unblock)
+    timer = threading.Timer(5, unblock.set)
+    timer.start()
+
+    start = time.perf_counter()
+    try:
+        with (
+            mock.patch(
+                'psbench.benchmarks.stream_scaling.main.submit_compute_task',
+                side_effect=RuntimeError('submit failed'),
+            ),
+            pytest.raises(RuntimeError, match='submit failed'),
+        ):
+            dispatch(
+                mock.MagicMock(),
+                consumer,  # type: ignore[arg-type]
+                config=_credit_config(tmp_path),
+                topic='topic',
+                max_running_tasks=1,
+            )
+        assert time.perf_counter() - start < 4
+    finally:
+        unblock.set()
+        timer.cancel()
+
+
+@pytest.mark.parametrize(
+    ('method', 'dispatch_policy'),
+    (('default', 'fifo'), ('proxy', 'fifo'), ('default', 'credit')),
+)
+def test_benchmark_batches(
+    method: str,
+    dispatch_policy: str,
+    file_store: Store[FileConnector],
+    thread_executor: ThreadPoolExecutor,
+    tmp_path: pathlib.Path,
+) -> None:
+    stream_config = StreamConfig(
+        kind='redis',
+        topic='topic',
+        servers=['localhost:1234'],
+    )
+    run_config = RunConfig(
+        data_size_bytes=100,
+        max_workers=thread_executor._max_workers,
+        task_count=8,
+        task_sleep=0.001,
+        method=method,
+        adios_file=str(tmp_path / 'adios-stream'),
+        dispatch_policy=dispatch_policy,
+        batch_size=3,
+    )
+    item_logger = BasicResultLogger(ItemResult)
+
+    with contextlib.ExitStack() as stack:
+        producer, consumer = stack.enter_context(
+            create_stream_pair(file_store, stream_config.topic),
+        )
+        stack.enter_context(
+            mock.patch(
+                'psbench.config.stream.StreamConfig.get_publisher',
+                return_value=producer.publisher,
+            ),
+        )
+        stack.enter_context(
+            mock.patch(
+                'psbench.config.stream.StreamConfig.get_subscriber',
+                return_value=consumer.subscriber,
+            ),
+        )
+        benchmark = stack.enter_context(
+            Benchmark(
+                thread_executor,
+                file_store,
+                stream_config,
+                item_logger=item_logger,
+            ),
+        )
+        result = benchmark.run(run_config)
+
+    assert result.completed_tasks == run_config.task_count
+    assert result.batch_size == run_config.batch_size
+    assert sorted(r.sequence for r in item_logger.results) == list(range(8))
+    # Items in a batch are dispatched together.
+    assert len({r.dispatch_timestamp for r in item_logger.results}) <= 3
+
+
+def _open_port() -> int:
+    with socket.socket() as s:
+        s.bind(('127.0.0.1', 0))
+        return s.getsockname()[1]
+
+
+@pytest.mark.parametrize('kind', ('queue', 'zmq'))
+@pytest.mark.parametrize('method', ('default', 'proxy'))
+def test_benchmark_local_stream_brokers(
+    kind: str,
+    method: str,
+    file_store: Store[FileConnector],
+    thread_executor: ThreadPoolExecutor,
+    tmp_path: pathlib.Path,
+) -> None:
+    servers = (
+        [f'127.0.0.1:{_open_port()}', f'127.0.0.1:{_open_port()}']
+        if kind == 'zmq'
+        else []
+    )
+    stream_config = StreamConfig(
+        kind=kind,
+        topic=f'{kind}-{method}-topic',
+        servers=servers,
+    )
+    run_config = RunConfig(
+        data_size_bytes=100,
+        max_workers=thread_executor._max_workers,
+        task_count=8,
+        task_sleep=0.001,
+        method=method,
+        adios_file=str(tmp_path / 'adios-stream'),
+        dispatchers=2,
+    )
+
+    with Benchmark(thread_executor, file_store, stream_config) as benchmark:
+        result = benchmark.run(run_config)
+
+    assert result.stream == kind
+    assert result.completed_tasks == run_config.task_count
+
+
+def test_compute_batch_task() -> None:
+    timings = compute_batch_task([b'a', b'b'], sleep=0.01)
+    assert len(timings) == 2
+    assert timings[0].done <= timings[1].start
+
+
+def test_submit_compute_task_memoryview(
+    process_executor: ProcessPoolExecutor,
+    tmp_path: pathlib.Path,
+) -> None:
+    # Views of direct messages are copied before pickling the task.
+    run_config = RunConfig(
+        data_size_bytes=4,
+        max_workers=1,
+        task_count=1,
+        task_sleep=0,
+        method='default',
+        adios_file=str(tmp_path / 'adios-stream'),
+    )
+    future = submit_compute_task(
+        process_executor,
+        [memoryview(b'headdata')[4:]],
+        config=run_config,
+        topic='topic',
+    )
+    timing = future.result()
+    assert not isinstance(timing, list)
+    assert timing.start <= timing.done
+
+
+def test_benchmark_too_few_workers(
+    file_store: Store[FileConnector],
+    thread_executor: ThreadPoolExecutor,
+    tmp_path: pathlib.Path,
+) -> None:
+    stream_config = StreamConfig(kind='redis', topic='topic', servers=[])
+    run_config = RunConfig(
+        data_size_bytes=100,
+        max_workers=4,
+        task_count=1,
+        task_sleep=0,
+        method='proxy',
+        adios_file=str(tmp_path / 'adios-stream'),
+        producers=2,
+        dispatchers=3,
+    )
+
+    with Benchmark(thread_executor, file_store, stream_config) as benchmark:
+        with pytest.raises(ValueError, match='Max workers'):
+            benchmark.run(run_config)
+
+        run_config.method = 'adios'
+        with pytest.raises(ValueError, match='only one producer'):
+            benchmark.run(run_config)
+
+        run_config.producers = 1
+        run_config.dispatchers = 1
+        run_config.batch_size = 2
+        with pytest.raises(ValueError, match='batching'):
+            benchmark.run(run_config)
+
+        run_config.method = 'proxy'
+        run_config.dispatch_policy = 'credit'
+        run_config.prefetch = 0
+        with pytest.raises(ValueError, match='prefetch'):
+            benchmark.run(run_config)
+
+
+def test_compute_task_timing() -> None:
+    timing = compute_task(b'data', sleep=0.01)
+    assert timing.start <= timing.resolved
+    assert timing.done - timing.resolved >= 0.01
+
+
+def test_max_backlog() -> None:
+    assert max_backlog([], []) == 0
+    assert max_backlog([1, 2, 3], [4, 5, 6]) == 3
+    assert max_backlog([1, 3, 5], [2, 4, 6]) == 1
+    # Items consumed at the same time they are published are not backlogged.
+    assert max_backlog([1, 2], [1, 2]) == 0
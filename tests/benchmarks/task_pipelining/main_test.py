@@ -12,6 +12,7 @@ from psbench.benchmarks.task_pipelining.main import Benchmark
 from psbench.benchmarks.task_pipelining.main import run_pipelined_workflow
 from psbench.benchmarks.task_pipelining.main import run_sequential_workflow
 from psbench.benchmarks.task_pipelining.main import SubmissionMethod
+from psbench.config.payload import PayloadConfig
 
 
 def test_run_sequential_workflow(
@@ -86,3 +87,31 @@ def test_benchmark_run(
 
     assert result.submission_method == config.submission_method.value
     assert result.workflow_makespan_ms > config.task_sleep
+
+
+@pytest.mark.parametrize(
+    'submission_method',
+    (
+        SubmissionMethod.SEQUENTIAL_NO_PROXY,
+        SubmissionMethod.SEQUENTIAL_PROXY,
+        SubmissionMethod.PIPELINED_PROXY_FUTURE,
+    ),
+)
+def test_benchmark_run_payload(
+    submission_method: SubmissionMethod,
+    thread_executor: ThreadPoolExecutor,
+    file_store: Store[FileConnector],
+) -> None:
+    config = RunConfig(
+        submission_method=submission_method,
+        task_chain_length=2,
+        task_data_bytes=1000,
+        task_overhead_fraction=0.1,
+        task_sleep=0.001,
+    )
+    payload = PayloadConfig(kind='nested', seed=0)
+
+    with Benchmark(thread_executor, file_store, payload) as benchmark:
+        result = benchmark.run(config)
+
+    assert result.payload_kind == 'nested'
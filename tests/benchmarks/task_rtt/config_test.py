@@ -19,6 +19,12 @@ def test_benchmark_matrix_argparse() -> None:
             '5',
             '--task-sleep',
             '6',
+            '--concurrency',
+            '1',
+            '8',
+            '--total-tasks',
+            '16',
+            '--zero-copy',
         ],
     )
     matrix = BenchmarkMatrix.from_args(**vars(args))
@@ -26,6 +32,9 @@ def test_benchmark_matrix_argparse() -> None:
     assert matrix.input_sizes == [1, 2]
     assert matrix.output_sizes == [3, 4, 5]
     assert matrix.sleep == 6
+    assert matrix.concurrency == [1, 8]
+    assert matrix.total_tasks == 16
+    assert matrix.zero_copy
 
 
 def test_benchmark_matrix_configs() -> None:
@@ -36,3 +45,17 @@ def test_benchmark_matrix_configs() -> None:
     )
 
     assert len(matrix.configs()) == 6
+
+
+def test_benchmark_matrix_configs_concurrency() -> None:
+    matrix = BenchmarkMatrix(
+        input_sizes=[1],
+        output_sizes=[2],
+        sleep=0,
+        concurrency=[1, 2, 4],
+        total_tasks=8,
+    )
+
+    configs = matrix.configs()
+    assert [c.concurrency for c in configs] == [1, 2, 4]
+    assert all(c.total_tasks == 8 for c in configs)
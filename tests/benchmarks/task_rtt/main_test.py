@@ -1,6 +1,9 @@
 from __future__ import annotations
 
 import pathlib
+import time
+from concurrent.futures import Future
+from concurrent.futures import ProcessPoolExecutor
 from concurrent.futures import ThreadPoolExecutor
 
 import pytest
@@ -10,13 +13,54 @@ from proxystore.store import Store
 
 from psbench.benchmarks.task_rtt.config import RunConfig
 from psbench.benchmarks.task_rtt.main import Benchmark
+from psbench.benchmarks.task_rtt.main import run_in_flight
 from psbench.benchmarks.task_rtt.main import time_task
 from psbench.benchmarks.task_rtt.main import time_task_ipfs
 from psbench.benchmarks.task_rtt.main import time_task_proxy
+from psbench.benchmarks.task_rtt.main import time_task_zero_copy
+from psbench.config.payload import PayloadConfig
+from psbench.payload import PAYLOAD_KINDS
+from psbench.payload import PayloadKind
 from testing.globus_compute import mock_executor
 from testing.ipfs import mock_ipfs
 
 
+def test_run_in_flight(thread_executor: ThreadPoolExecutor) -> None:
+    in_flight = 0
+    max_in_flight = 0
+    completed: list[int] = []
+
+    def _task() -> int:
+        nonlocal in_flight, max_in_flight
+        in_flight += 1
+        max_in_flight = max(max_in_flight, in_flight)
+        time.sleep(0.01)
+        in_flight -= 1
+        return 1
+
+    def _submit() -> Future[int]:
+        return thread_executor.submit(_task)
+
+    stats = run_in_flight(
+        _submit,
+        completed.append,
+        concurrency=2,
+        total_tasks=6,
+    )
+
+    assert len(completed) == 6
+    assert len(stats.latencies_ms) == 6
+    assert max_in_flight <= 2
+    assert stats.total_time_ms >= 30
+    assert stats.throughput_tasks_per_s > 0
+    assert stats.percentile(50) <= stats.percentile(99)
+
+
+def test_run_in_flight_validation() -> None:
+    with pytest.raises(ValueError, match='at least one'):
+        run_in_flight(Future, print, concurrency=0)
+
+
 def test_time_task() -> None:
     gce = mock_executor()
 
@@ -31,6 +75,52 @@ def test_time_task() -> None:
     assert stats.output_size_bytes == 50
     assert stats.task_sleep_seconds == 0.01
     assert stats.total_time_ms >= 10
+    assert stats.total_tasks == 1
+    assert stats.latency_p50_ms is not None
+    assert stats.latency_p50_ms <= stats.total_time_ms
+
+
+def test_time_task_concurrent(thread_executor: ThreadPoolExecutor) -> None:
+    stats = time_task(
+        executor=thread_executor,
+        input_size=100,
+        output_size=50,
+        task_sleep=0.01,
+        concurrency=4,
+        total_tasks=8,
+    )
+
+    assert stats.concurrency == 4
+    assert stats.total_tasks == 8
+    assert stats.throughput_tasks_per_s is not None
+    assert stats.latency_p50_ms is not None
+    assert stats.latency_p99_ms is not None
+    assert stats.latency_p50_ms <= stats.latency_p99_ms
+    # Eight 10 ms tasks run four at a time should take at least 20 ms.
+    assert stats.total_time_ms >= 20
+
+
+@pytest.mark.parametrize('kind', ('bytes', 'ndarray'))
+def test_time_task_zero_copy(
+    kind: PayloadKind,
+    process_executor: ProcessPoolExecutor,
+) -> None:
+    stats = time_task_zero_copy(
+        executor=process_executor,
+        input_size=1000,
+        output_size=100,
+        task_sleep=0.01,
+        concurrency=2,
+        total_tasks=4,
+        payload=PayloadConfig(kind=kind, seed=0),
+    )
+
+    assert stats.proxystore_backend == 'ZeroCopy'
+    assert stats.payload_kind == kind
+    assert stats.input_size_bytes == 1000
+    assert stats.output_size_bytes == 100
+    assert stats.total_tasks == 4
+    assert stats.total_time_ms >= 20
 
 
 def test_time_task_ipfs(tmp_path: pathlib.Path) -> None:
@@ -65,6 +155,19 @@ def test_time_task_ipfs(tmp_path: pathlib.Path) -> None:
         assert stats.task_sleep_seconds == 0.0
         assert stats.total_time_ms >= 0.0
 
+        stats = time_task_ipfs(
+            executor=gce,
+            ipfs_local_dir=str(tmp_path / 'local'),
+            ipfs_remote_dir=str(tmp_path / 'remote'),
+            input_size=100,
+            output_size=50,
+            task_sleep=0.0,
+            concurrency=2,
+            total_tasks=3,
+        )
+
+        assert stats.total_tasks == 3
+
 
 def test_time_task_proxy(local_store: Store[LocalConnector]) -> None:
     gce = mock_executor()
@@ -100,6 +203,26 @@ def test_time_task_proxy(local_store: Store[LocalConnector]) -> None:
     assert stats.output_resolve_ms > 0
 
 
+def test_time_task_proxy_concurrent(
+    thread_executor: ThreadPoolExecutor,
+    local_store: Store[LocalConnector],
+) -> None:
+    stats = time_task_proxy(
+        executor=thread_executor,
+        store=local_store,
+        input_size=100,
+        output_size=50,
+        task_sleep=0,
+        concurrency=2,
+        total_tasks=4,
+    )
+
+    assert stats.total_tasks == 4
+    assert stats.throughput_tasks_per_s is not None
+    assert stats.input_put_ms is not None
+    assert stats.output_resolve_ms is not None
+
+
 def test_benchmark_store_and_ipfs(
     thread_executor: ThreadPoolExecutor,
     file_store: Store[FileConnector],
@@ -112,6 +235,53 @@ def test_benchmark_store_and_ipfs(
         )
 
 
+def test_benchmark_zero_copy_and_store(
+    thread_executor: ThreadPoolExecutor,
+    file_store: Store[FileConnector],
+) -> None:
+    with pytest.raises(ValueError, match='Zero-copy submission cannot'):
+        Benchmark(thread_executor, store=file_store, zero_copy=True)
+
+
+def test_benchmark_ipfs_payload_kind(
+    thread_executor: ThreadPoolExecutor,
+) -> None:
+    with pytest.raises(ValueError, match='IPFS only supports bytes'):
+        Benchmark(
+            thread_executor,
+            use_ipfs=True,
+            payload=PayloadConfig(kind='nested'),
+        )
+
+
+@pytest.mark.parametrize('kind', PAYLOAD_KINDS)
+def test_time_task_payload_kinds(
+    kind: PayloadKind,
+    thread_executor: ThreadPoolExecutor,
+    file_store: Store[FileConnector],
+) -> None:
+    payload = PayloadConfig(kind=kind, seed=0)
+
+    stats = time_task(
+        executor=thread_executor,
+        input_size=1000,
+        output_size=100,
+        task_sleep=0,
+        payload=payload,
+    )
+    assert stats.payload_kind == kind
+
+    stats = time_task_proxy(
+        executor=thread_executor,
+        store=file_store,
+        input_size=1000,
+        output_size=100,
+        task_sleep=0,
+        payload=payload,
+    )
+    assert stats.payload_kind == kind
+
+
 def test_benchmark(thread_executor: ThreadPoolExecutor) -> None:
     config = RunConfig(sleep=0, input_size_bytes=10, output_size_bytes=10)
 
@@ -124,6 +294,18 @@ def test_benchmark(thread_executor: ThreadPoolExecutor) -> None:
     assert result.output_size_bytes == config.output_size_bytes
 
 
+def test_benchmark_zero_copy(thread_executor: ThreadPoolExecutor) -> None:
+    config = RunConfig(sleep=0, input_size_bytes=10, output_size_bytes=10)
+
+    with Benchmark(thread_executor, zero_copy=True) as benchmark:
+        assert benchmark.config()['zero_copy']
+        result = benchmark.run(config)
+
+    assert result.proxystore_backend == 'ZeroCopy'
+    assert result.input_size_bytes == config.input_size_bytes
+    assert result.output_size_bytes == config.output_size_bytes
+
+
 def test_benchmark_proxystore(
     thread_executor: ThreadPoolExecutor,
     file_store: Store[FileConnector],
@@ -1,8 +1,10 @@
 from __future__ import annotations
 
 import pathlib
+import pickle
 import time
 
+import numpy
 from proxystore.connectors.local import LocalConnector
 from proxystore.proxy import Proxy
 from proxystore.store import Store
@@ -11,6 +13,9 @@ from psbench import ipfs
 from psbench.benchmarks.task_rtt.tasks import pong
 from psbench.benchmarks.task_rtt.tasks import pong_ipfs
 from psbench.benchmarks.task_rtt.tasks import pong_proxy
+from psbench.benchmarks.task_rtt.tasks import pong_zero_copy
+from psbench.benchmarks.task_rtt.tasks import ZeroCopyPayload
+from psbench.config.payload import PayloadConfig
 from testing.ipfs import mock_ipfs
 
 
@@ -24,6 +29,52 @@ def test_pong() -> None:
     assert (end - start) / 1e9 >= 0.01
 
 
+def test_pong_seeded_payload_index() -> None:
+    payload = PayloadConfig(seed=42)
+    first = pong(b'abcd', result_size=100, payload=payload, payload_index=1)
+    again = pong(b'abcd', result_size=100, payload=payload, payload_index=1)
+    second = pong(b'abcd', result_size=100, payload=payload, payload_index=2)
+
+    assert first == again
+    assert first != second
+
+
+def test_pong_zero_copy() -> None:
+    start = time.perf_counter_ns()
+    res = pong_zero_copy(ZeroCopyPayload(b'abcd'), result_size=10, sleep=0.01)
+    end = time.perf_counter_ns()
+
+    assert isinstance(res, ZeroCopyPayload)
+    assert len(res.data) == 10
+    assert (end - start) / 1e9 >= 0.01
+
+
+def test_zero_copy_payload_out_of_band() -> None:
+    data = b'abcd' * 1000
+    buffers: list[pickle.PickleBuffer] = []
+    pickled = pickle.dumps(
+        ZeroCopyPayload(data),
+        protocol=5,
+        buffer_callback=buffers.append,
+    )
+
+    assert len(buffers) == 1
+    assert len(pickled) < len(data)
+
+    result = pickle.loads(pickled, buffers=buffers)
+    assert bytes(result.data) == data
+
+
+def test_zero_copy_payload_in_band() -> None:
+    for protocol in (4, 5):
+        pickled = pickle.dumps(ZeroCopyPayload(b'abcd'), protocol=protocol)
+        assert pickle.loads(pickled).data == b'abcd'
+
+    array = numpy.arange(10)
+    result = pickle.loads(pickle.dumps(ZeroCopyPayload(array), protocol=5))
+    assert numpy.array_equal(result.data, array)
+
+
 def test_pong_ipfs(tmp_path: pathlib.Path):
     with mock_ipfs():
         cid = ipfs.add_data(b'data', tmp_path / 'data')
@@ -29,6 +29,11 @@ def test_benchmark_matrix_argparse() -> None:
             '0.01',
             '--memory-profile-interval',
             '0.001',
+            '--memory-server-pids',
+            '10',
+            '20',
+            '--memory-profiler',
+            'high-frequency',
         ],
     )
     matrix = BenchmarkMatrix.from_args(**vars(args))
@@ -42,6 +47,8 @@ def test_benchmark_matrix_argparse() -> None:
     assert matrix.stage_repeat == 3
     assert matrix.task_sleep == 0.01
     assert matrix.memory_profile_interval == 0.001
+    assert matrix.memory_server_pids == [10, 20]
+    assert matrix.memory_profiler == 'high-frequency'
 
 
 def test_benchmark_matrix_configs() -> None:
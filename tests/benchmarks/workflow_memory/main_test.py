@@ -15,6 +15,7 @@ from psbench.benchmarks.workflow_memory.main import Benchmark
 from psbench.benchmarks.workflow_memory.main import task_no_proxy
 from psbench.benchmarks.workflow_memory.main import task_proxy
 from psbench.benchmarks.workflow_memory.main import validate_workflow
+from psbench.config.payload import PayloadConfig
 from psbench.utils import randbytes
 
 
@@ -52,6 +53,22 @@ def test_task_no_proxy() -> None:
     assert (end - start) >= sleep
 
 
+def test_task_no_proxy_seeded_payload_index() -> None:
+    payload = PayloadConfig(seed=42)
+    results = [
+        task_no_proxy(
+            output_size_bytes=100,
+            sleep=0,
+            payload=payload,
+            payload_index=index,
+        )
+        for index in (0, 0, 1)
+    ]
+
+    assert results[0] == results[1]
+    assert results[0] != results[2]
+
+
 def test_task_proxy(file_store: Store[FileConnector]) -> None:
     sleep = 0.001
     size = 100
@@ -101,6 +118,30 @@ def test_benchmark_run_workflow(
     assert result.workflow_makespan_s > min_makespan
 
 
+@pytest.mark.parametrize(
+    'data_management',
+    (DataManagement.NONE, DataManagement.OWNED_PROXY),
+)
+def test_benchmark_run_workflow_payload(
+    data_management: DataManagement,
+    process_executor: ProcessPoolExecutor,
+    file_store: Store[FileConnector],
+) -> None:
+    config = RunConfig(
+        data_management=data_management,
+        stage_task_counts=[1, 3, 1],
+        stage_bytes_sizes=[1000, 1000, 1000, 1000],
+        stage_repeat=1,
+        task_sleep=0,
+    )
+    payload = PayloadConfig(kind='ndarray', shape=[10])
+
+    with Benchmark(process_executor, file_store, payload) as benchmark:
+        result = benchmark.run(config)
+
+    assert result.payload_kind == 'ndarray'
+
+
 def test_benchmark_run_workflow_mismatched_sizes(
     process_executor: ProcessPoolExecutor,
     file_store: Store[FileConnector],
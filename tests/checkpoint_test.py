@@ -0,0 +1,87 @@
+from __future__ import annotations
+
+import os
+import pathlib
+
+from psbench.checkpoint import CheckpointManifest
+from psbench.checkpoint import config_hash
+from psbench.checkpoint import get_run_dir
+from testing.benchmark import MockRunConfig
+
+
+def test_config_hash() -> None:
+    assert config_hash(MockRunConfig(param=1)) == config_hash(
+        MockRunConfig(param=1),
+    )
+    assert config_hash(MockRunConfig(param=1)) != config_hash(
+        MockRunConfig(param=2),
+    )
+
+
+def test_checkpoint_manifest(tmp_path: pathlib.Path) -> None:
+    filepath = str(tmp_path / 'dir' / 'checkpoint.txt')
+    config = MockRunConfig(param=1)
+
+    with CheckpointManifest(filepath) as checkpoint:
+        assert len(checkpoint) == 0
+        assert not checkpoint.completed(config, 0)
+        checkpoint.mark_completed(config, 0)
+        assert checkpoint.completed(config, 0)
+        assert not checkpoint.completed(config, 1)
+
+    with CheckpointManifest(filepath) as checkpoint:
+        assert len(checkpoint) == 1
+        assert checkpoint.completed(config, 0)
+
+
+def test_checkpoint_manifest_values(tmp_path: pathlib.Path) -> None:
+    filepath = str(tmp_path / 'checkpoint.txt')
+    config = MockRunConfig(param=1)
+
+    with CheckpointManifest(filepath) as checkpoint:
+        checkpoint.mark_completed(config, 0, 1.5)
+        checkpoint.mark_completed(config, 1)
+
+    with open(filepath, 'a') as f:
+        f.write(f'{config_hash(config)} 2 bad\n')
+
+    with CheckpointManifest(filepath) as checkpoint:
+        assert len(checkpoint) == 2
+        assert checkpoint.value(config, 0) == 1.5
+        assert checkpoint.completed(config, 1)
+        assert checkpoint.value(config, 1) is None
+        assert not checkpoint.completed(config, 2)
+
+
+def test_checkpoint_manifest_ignore_partial_lines(
+    tmp_path: pathlib.Path,
+) -> None:
+    filepath = str(tmp_path / 'checkpoint.txt')
+    config = MockRunConfig(param=1)
+
+    with open(filepath, 'w') as f:
+        f.write(f'{config_hash(config)} 0\n{config_hash(config)}')
+
+    with CheckpointManifest(filepath) as checkpoint:
+        assert len(checkpoint) == 1
+        assert checkpoint.completed(config, 0)
+
+
+def test_get_run_dir(tmp_path: pathlib.Path) -> None:
+    parent = str(tmp_path)
+
+    run_dir = get_run_dir(parent, 'bench')
+    assert os.path.dirname(run_dir) == parent
+    assert os.path.basename(run_dir).startswith('bench-')
+
+    # Nothing to resume so a new run directory is returned
+    assert not os.path.exists(get_run_dir(parent, 'bench', resume=True))
+
+    old_dir = os.path.join(parent, 'bench-2020-01-01-00-00-00')
+    new_dir = os.path.join(parent, 'bench-2021-01-01-00-00-00')
+    os.makedirs(old_dir)
+    os.makedirs(new_dir)
+    os.makedirs(os.path.join(parent, 'bench-other-2022-01-01-00-00-00'))
+
+    assert get_run_dir(parent, 'bench', resume=True) == new_dir
+    assert get_run_dir(parent, 'bench', resume=False) not in (old_dir, new_dir)
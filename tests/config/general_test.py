@@ -2,6 +2,8 @@ from __future__ import annotations
 
 import argparse
 
+import pytest
+
 from psbench.config.general import GeneralConfig
 
 
@@ -10,6 +12,8 @@ def test_general_argparse() -> None:
     GeneralConfig.add_parser_group(parser)
     args = parser.parse_args(
         [
+            '--checkpoint-file',
+            'test.txt',
             '--csv-file',
             'test.csv',
             '--log-level',
@@ -18,18 +22,60 @@ def test_general_argparse() -> None:
             'test.log',
             '--repeat',
             '2',
+            '--resume',
             '--run-dir',
             'test/',
         ],
     )
 
     config = GeneralConfig.from_args(**vars(args))
+    assert config.checkpoint_file == 'test.txt'
     assert config.csv_file == 'test.csv'
     assert config.log_level == 'ERROR'
     assert config.log_file == 'test.log'
     assert config.repeat == 2
+    assert config.resume
     assert config.run_dir == 'test/'
 
 
 def test_general_defaults() -> None:
     GeneralConfig.from_args()
+
+
+def test_general_adaptive_repeat() -> None:
+    parser = argparse.ArgumentParser()
+    GeneralConfig.add_parser_group(parser)
+    args = parser.parse_args(
+        [
+            '--repeat',
+            '20',
+            '--ci-field',
+            'total_time_ms',
+            '--ci-target',
+            '0.1',
+            '--ci-confidence',
+            '0.9',
+            '--min-repeat',
+            '4',
+            '--warmup',
+            '1',
+        ],
+    )
+
+    config = GeneralConfig.from_args(**vars(args))
+    adaptive = config.get_adaptive_repeat()
+    assert adaptive is not None
+    assert adaptive.field == 'total_time_ms'
+    assert adaptive.min_repeat == 4
+    assert adaptive.max_repeat == 20
+    assert adaptive.target == 0.1
+    assert adaptive.confidence == 0.9
+    assert adaptive.warmup == 1
+
+    assert GeneralConfig().get_adaptive_repeat() is None
+
+
+def test_general_adaptive_repeat_too_few_repeats() -> None:
+    config = GeneralConfig(ci_field='total_time_ms', repeat=1, min_repeat=3)
+    with pytest.raises(ValueError, match='--min-repeat'):
+        config.get_adaptive_repeat()
@@ -0,0 +1,80 @@
+from __future__ import annotations
+
+import argparse
+
+import numpy
+import pydantic
+import pytest
+
+from psbench.config.payload import PayloadConfig
+
+
+def test_payload_argparse() -> None:
+    parser = argparse.ArgumentParser()
+    PayloadConfig.add_parser_group(parser)
+    args = parser.parse_args(
+        [
+            '--payload-kind',
+            'ndarray',
+            '--payload-dtype',
+            'float32',
+            '--payload-shape',
+            '4',
+            '4',
+            '--payload-compressibility',
+            '0.9',
+            '--payload-seed',
+            '42',
+        ],
+    )
+
+    config = PayloadConfig.from_args(**vars(args))
+    assert config.kind == 'ndarray'
+    assert config.dtype == 'float32'
+    assert config.shape == [4, 4]
+    assert config.compressibility == 0.9
+    assert config.seed == 42
+
+
+def test_payload_argparse_without_kind() -> None:
+    parser = argparse.ArgumentParser()
+    PayloadConfig.add_parser_group(parser, include_kind=False)
+    args = parser.parse_args([])
+
+    assert 'payload_kind' not in vars(args)
+    assert PayloadConfig.from_args(**vars(args)).kind == 'bytes'
+
+
+def test_payload_defaults() -> None:
+    config = PayloadConfig.from_args()
+    assert config.kind == 'bytes'
+    assert config.seed is None
+
+    payload = config.generate(100)
+    assert isinstance(payload, bytes)
+    assert len(payload) == 100
+
+
+def test_payload_bad_compressibility() -> None:
+    with pytest.raises(pydantic.ValidationError):
+        PayloadConfig(kind='compressible', compressibility=2)
+
+
+def test_payload_generate_seeded() -> None:
+    config = PayloadConfig(kind='ndarray', seed=0)
+
+    a = config.generate(1000, index=0)
+    b = config.generate(1000, index=0)
+    c = config.generate(1000, index=1)
+
+    assert numpy.array_equal(a, b)
+    assert not numpy.array_equal(a, c)
+
+
+def test_payload_generate_like() -> None:
+    config = PayloadConfig(kind='nested')
+
+    payload = config.generate(10000)
+    other = config.generate_like(payload)
+
+    assert len(other['records']) == len(payload['records'])
@@ -9,6 +9,8 @@ from unittest import mock
 import pytest
 
 from psbench.config import StoreConfig
+from psbench.connectors.mmap_file import zero_copy_deserialize
+from psbench.connectors.wan import WANConnector
 
 
 class _MockDAOSConnector:
@@ -132,6 +134,35 @@ def test_store_config_margo() -> None:
         assert config.get_store(register=False) is not None
 
 
+def test_store_config_mmap_file() -> None:
+    config = StoreConfig(
+        connector='mmap-file',
+        options={'file_dir': '/tmp/x/'},
+    )
+    with mock.patch('psbench.config.store.MMapFileConnector'):
+        store = config.get_store(register=False)
+        assert store is not None
+        assert store.deserializer is zero_copy_deserialize
+
+
+def test_store_config_shm() -> None:
+    config = StoreConfig(connector='shm', options={})
+    with mock.patch('psbench.config.store.SharedMemoryConnector'):
+        assert config.get_store(register=False) is not None
+
+
+def test_store_config_wan_profile() -> None:
+    config = StoreConfig(
+        connector='file',
+        options={'file_dir': '/tmp/x/', 'wan_profile': '20ms,1Gbps'},
+    )
+    with mock.patch('psbench.config.store.FileConnector'):
+        store = config.get_store(register=False)
+        assert store is not None
+        assert isinstance(store.connector, WANConnector)
+        assert store.connector.profile.latency_ms == 20
+
+
 def test_store_config_ucx() -> None:
     config = StoreConfig(
         connector='ucx',
@@ -6,10 +6,14 @@ from unittest import mock
 import pytest
 from proxystore.stream.shims.kafka import KafkaPublisher
 from proxystore.stream.shims.kafka import KafkaSubscriber
+from proxystore.stream.shims.queue import QueuePublisher
+from proxystore.stream.shims.queue import QueueSubscriber
 from proxystore.stream.shims.redis import RedisPublisher
 from proxystore.stream.shims.redis import RedisSubscriber
 
 from psbench.config import StreamConfig
+from psbench.streams.zeromq import ZeroMQPublisher
+from psbench.streams.zeromq import ZeroMQSubscriber
 
 
 def test_stream_config_argparse_required() -> None:
@@ -33,6 +37,17 @@ def test_stream_config_argparse_example() -> None:
     assert config.servers == ['localhost']
 
 
+@pytest.mark.parametrize('kind', ('queue', 'zmq'))
+def test_stream_config_argparse_local_stream(kind: str) -> None:
+    argv = ['--stream', kind]
+    parser = argparse.ArgumentParser()
+    StreamConfig.add_parser_group(parser, argv=argv)
+    args = parser.parse_args(argv)
+    config = StreamConfig.from_args(**vars(args))
+    assert config.kind == kind
+    assert config.servers == ()
+
+
 def test_stream_config_empty_stream() -> None:
     config = StreamConfig(kind=None, topic='topic', servers=[])
     assert config.get_publisher() is None
@@ -78,3 +93,65 @@ def test_stream_config_redis() -> None:
 
     assert isinstance(publisher, RedisPublisher)
     assert isinstance(subscriber, RedisSubscriber)
+
+
+def test_stream_config_subscriber_topic() -> None:
+    config = StreamConfig(
+        kind='redis',
+        topic='topic',
+        servers=['localhost:1234'],
+    )
+
+    with mock.patch('redis.StrictRedis'):
+        subscriber = config.get_subscriber(topic='other')
+
+    assert isinstance(subscriber, RedisSubscriber)
+    assert subscriber._topics == ['other']
+
+
+def test_stream_config_queue() -> None:
+    config = StreamConfig(kind='queue', topic='topic', servers=[])
+
+    publisher = config.get_publisher()
+    subscriber = config.get_subscriber()
+    assert isinstance(publisher, QueuePublisher)
+    assert isinstance(subscriber, QueueSubscriber)
+
+    publisher.send_message('topic', b'message')
+    assert subscriber.next_message() == b'message'
+
+
+def test_stream_config_zmq() -> None:
+    config = StreamConfig(
+        kind='zmq',
+        topic='topic',
+        servers=['127.0.0.1:1234', '127.0.0.1:1235'],
+    )
+
+    with (
+        mock.patch('psbench.streams.zeromq.start_forwarder') as forwarder,
+        mock.patch('psbench.streams.zeromq.time.sleep'),
+    ):
+        publisher = config.get_publisher()
+        subscriber = config.get_subscriber()
+
+    forwarder.assert_called_once_with('127.0.0.1:1234', '127.0.0.1:1235')
+    assert isinstance(publisher, ZeroMQPublisher)
+    assert isinstance(subscriber, ZeroMQSubscriber)
+    publisher.close()
+    subscriber.close()
+
+
+def test_stream_config_zmq_default_servers() -> None:
+    config = StreamConfig(kind='zmq', topic='topic', servers=[])
+
+    with mock.patch('psbench.streams.zeromq.ZeroMQPublisher') as publisher:
+        config.get_publisher()
+    publisher.assert_called_once_with('127.0.0.1:5559')
+
+
+def test_stream_config_zmq_bad_servers() -> None:
+    config = StreamConfig(kind='zmq', topic='topic', servers=['localhost'])
+
+    with pytest.raises(ValueError, match='two server addresses'):
+        config.get_publisher()
@@ -0,0 +1,76 @@
+from __future__ import annotations
+
+import pathlib
+
+import numpy
+import pytest
+from proxystore.serialize import serialize
+from proxystore.store import Store
+
+from psbench.connectors.mmap_file import MMapFileConnector
+from psbench.connectors.mmap_file import zero_copy_deserialize
+
+
+def test_get_mmap(tmp_path: pathlib.Path) -> None:
+    with MMapFileConnector(str(tmp_path)) as connector:
+        key = connector.put(b'value')
+
+        view = connector.get(key)
+        assert isinstance(view, memoryview)
+        assert view.readonly
+        assert view == b'value'
+
+        connector.evict(key)
+        assert connector.get(key) is None
+        # Views remain valid after the object is evicted.
+        assert view == b'value'
+
+        key = connector.put(b'')
+        assert connector.get(key) == b''
+
+        assert connector.get_batch([key]) == [b'']
+
+
+def test_from_config(tmp_path: pathlib.Path) -> None:
+    connector = MMapFileConnector(str(tmp_path))
+    new = MMapFileConnector.from_config(connector.config())
+    assert isinstance(new, MMapFileConnector)
+    assert new.store_dir == connector.store_dir
+    connector.close()
+
+
+@pytest.mark.parametrize(
+    'obj',
+    (
+        numpy.arange(12, dtype=numpy.float32).reshape(3, 4),
+        numpy.asfortranarray(numpy.arange(6).reshape(2, 3)),
+    ),
+)
+def test_zero_copy_deserialize_ndarray(obj: numpy.ndarray) -> None:
+    buffer = memoryview(serialize(obj))
+
+    array = zero_copy_deserialize(buffer)
+    assert isinstance(array, numpy.ndarray)
+    assert numpy.array_equal(array, obj)
+    # Deserializing from a read-only buffer yields a read-only view.
+    assert not array.flags.writeable
+
+
+def test_zero_copy_deserialize_fallback() -> None:
+    assert bytes(zero_copy_deserialize(serialize(b'abc'))) == b'abc'
+    assert zero_copy_deserialize(serialize([1, 2])) == [1, 2]
+
+    objects = numpy.array([1, 'a'], dtype=object)
+    result = zero_copy_deserialize(serialize(objects))
+    assert result.tolist() == [1, 'a']
+
+
+def test_store_proxy(tmp_path: pathlib.Path) -> None:
+    with Store(
+        'mmap-file-test-store',
+        MMapFileConnector(str(tmp_path)),
+        deserializer=zero_copy_deserialize,
+    ) as store:
+        array = numpy.arange(100)
+        proxy = store.proxy(array)
+        assert numpy.array_equal(proxy, array)
@@ -0,0 +1,86 @@
+from __future__ import annotations
+
+from concurrent.futures import ProcessPoolExecutor
+
+from proxystore.serialize import BytesLike
+from proxystore.store import Store
+
+from psbench.connectors.shm import SharedMemoryConnector
+from psbench.connectors.shm import SharedMemoryKey
+
+
+def test_put_get_evict() -> None:
+    with SharedMemoryConnector() as connector:
+        key = connector.put(b'value')
+        assert connector.exists(key)
+
+        view = connector.get(key)
+        assert isinstance(view, memoryview)
+        assert view.readonly
+        assert view == b'value'
+
+        connector.evict(key)
+        assert not connector.exists(key)
+        assert connector.get(key) is None
+        # Views remain valid after the object is evicted.
+        assert view == b'value'
+
+        # Evicting a missing object is a no-op.
+        connector.evict(key)
+
+
+def test_put_empty() -> None:
+    with SharedMemoryConnector() as connector:
+        key = connector.put(b'')
+        assert key.size == 0
+        assert connector.get(key) == b''
+        connector.evict(key)
+
+
+def test_batch() -> None:
+    with SharedMemoryConnector() as connector:
+        values: list[BytesLike] = [b'a', b'bc', bytearray(b'def')]
+        keys = connector.put_batch(values)
+        assert connector.get_batch(keys) == values
+        for key in keys:
+            connector.evict(key)
+
+
+def test_close_clear() -> None:
+    connector = SharedMemoryConnector()
+    key = connector.put(b'value')
+    connector.close()
+    assert not connector.exists(key)
+
+    connector = SharedMemoryConnector(clear=False)
+    key = connector.put(b'value')
+    connector.close()
+    assert connector.exists(key)
+    connector.evict(key)
+
+
+def test_config() -> None:
+    connector = SharedMemoryConnector('prefix', clear=False)
+    new = SharedMemoryConnector.from_config(connector.config())
+    assert new.prefix == 'prefix'
+    assert not new.clear
+    assert repr(new) == 'SharedMemoryConnector(prefix=prefix)'
+
+
+def _get(connector: SharedMemoryConnector, key: SharedMemoryKey) -> bytes:
+    value = connector.get(key)
+    assert value is not None
+    return bytes(value)
+
+
+def test_get_in_process(process_executor: ProcessPoolExecutor) -> None:
+    with SharedMemoryConnector() as connector:
+        key = connector.put(b'value')
+        future = process_executor.submit(_get, connector, key)
+        assert future.result() == b'value'
+
+
+def test_store_proxy() -> None:
+    with Store('shm-test-store', SharedMemoryConnector()) as store:
+        proxy = store.proxy([1, 2, 3], evict=True)
+        assert proxy == [1, 2, 3]
@@ -0,0 +1,148 @@
+from __future__ import annotations
+
+import pickle
+import time
+from unittest import mock
+
+import pytest
+from proxystore.connectors.local import LocalConnector
+from proxystore.store import Store
+
+from psbench.connectors.shm import SharedMemoryConnector
+from psbench.connectors.wan import connector_name
+from psbench.connectors.wan import TokenBucket
+from psbench.connectors.wan import WANConnector
+from psbench.connectors.wan import WANProfile
+
+
+@pytest.mark.parametrize(
+    ('spec', 'expected'),
+    (
+        ('', WANProfile()),
+        (
+            '20ms,1Gbps,0.1%loss',
+            WANProfile(latency_ms=20, bandwidth_bytes_per_s=125e6, loss=0.001),
+        ),
+        (
+            'latency=1s, jitter=500us, bandwidth=100MB/s, loss=1%',
+            WANProfile(
+                latency_ms=1000,
+                jitter_ms=0.5,
+                bandwidth_bytes_per_s=100e6,
+                loss=0.01,
+            ),
+        ),
+        ('8kbps', WANProfile(bandwidth_bytes_per_s=1000)),
+    ),
+)
+def test_parse_profile(spec: str, expected: WANProfile) -> None:
+    assert WANProfile.from_str(spec) == pytest.approx(expected)
+
+
+@pytest.mark.parametrize(
+    ('spec', 'match'),
+    (
+        ('20', 'Unknown WAN characteristic'),
+        ('delay=20ms', 'Unknown WAN characteristic'),
+        ('latency=fast', 'Invalid time'),
+        ('bandwidth=20ms', 'Invalid bandwidth'),
+        ('bandwidth=0Gbps', 'greater than zero'),
+        ('loss=1', 'Invalid loss'),
+        ('100%loss', 'less than 100%'),
+    ),
+)
+def test_parse_profile_errors(spec: str, match: str) -> None:
+    with pytest.raises(ValueError, match=match):
+        WANProfile.from_str(spec)
+
+
+def test_token_bucket() -> None:
+    bucket = TokenBucket(rate=1000, capacity=100)
+    assert bucket.consume(100) == 0
+    # The bucket is empty so the second transfer waits for it to refill and
+    # the third also waits for the second.
+    assert bucket.consume(100) == pytest.approx(0.1, abs=0.01)
+    assert bucket.consume(100) == pytest.approx(0.2, abs=0.01)
+
+
+def test_wan_connector_operations() -> None:
+    with WANConnector(LocalConnector(), WANProfile()) as connector:
+        key = connector.put(b'value')
+        assert connector.exists(key)
+        assert connector.get(key) == b'value'
+        connector.evict(key)
+        assert not connector.exists(key)
+        assert connector.get(key) is None
+
+        keys = connector.put_batch([b'a', b'bc'])
+        assert connector.get_batch(keys) == [b'a', b'bc']
+
+
+def test_wan_connector_latency() -> None:
+    connector = WANConnector(LocalConnector(), '10ms')
+    start = time.perf_counter()
+    connector.put(b'value')
+    assert time.perf_counter() - start >= 0.01
+    connector.close()
+
+
+def test_wan_connector_bandwidth() -> None:
+    # The bucket holds 10 KB so a 100 KB transfer at 1 MB/s waits about
+    # 90 ms for the remaining tokens.
+    connector = WANConnector(LocalConnector(), '1MB/s')
+    start = time.perf_counter()
+    key = connector.put(b'x' * 100_000)
+    assert time.perf_counter() - start >= 0.08
+    start = time.perf_counter()
+    connector.exists(key)
+    assert time.perf_counter() - start < 0.05
+    connector.close()
+
+
+def test_wan_connector_jitter_and_loss() -> None:
+    connector = WANConnector(
+        LocalConnector(),
+        'latency=1ms,jitter=1ms,loss=50%',
+        seed=0,
+    )
+    with mock.patch('time.sleep') as sleep:
+        for _ in range(20):
+            connector.exists('key')
+    delays = [call.args[0] for call in sleep.call_args_list]
+    assert len(set(delays)) > 1
+    assert all(delay >= 0 for delay in delays)
+    # Lost segments pay the minimum retransmission timeout.
+    assert any(delay >= 0.2 for delay in delays)
+    assert any(delay < 0.2 for delay in delays)
+    connector.close()
+
+
+def test_wan_connector_config() -> None:
+    connector = WANConnector(SharedMemoryConnector(prefix='wan'), '20ms')
+    config = connector.config()
+    new = WANConnector.from_config(config)
+    assert isinstance(new.connector, SharedMemoryConnector)
+    assert new.connector.prefix == 'wan'
+    assert new.profile == connector.profile
+    connector.close()
+    new.close()
+
+
+def test_connector_name() -> None:
+    local = LocalConnector()
+    assert connector_name(local) == 'LocalConnector'
+    with WANConnector(local, '1ms') as connector:
+        assert connector_name(connector) == 'LocalConnector+WAN'
+
+
+def test_wan_connector_store_config() -> None:
+    # Proxies resolved in other processes reconstruct the store from its
+    # configuration.
+    connector = WANConnector(SharedMemoryConnector(), '1ms')
+    with Store('test-wan-config', connector, register=False) as store:
+        key = store.put(b'value')
+        config = pickle.loads(pickle.dumps(store.config()))
+        new = Store.from_config(config)
+        assert isinstance(new.connector, WANConnector)
+        assert new.get(key) == b'value'
+        store.evict(key)
@@ -0,0 +1,95 @@
+from __future__ import annotations
+
+import pickle
+import random
+import statistics
+
+import pytest
+
+from psbench.histogram import LatencyHistogram
+from psbench.histogram import merge_histograms
+
+
+def test_histogram_exact_stats() -> None:
+    values = [random.uniform(0.01, 100) for _ in range(1000)]
+    histogram = LatencyHistogram.from_values(values)
+
+    assert histogram.count == len(values)
+    assert histogram.min == min(values)
+    assert histogram.max == max(values)
+    assert histogram.mean == pytest.approx(statistics.mean(values))
+    assert histogram.stdev == pytest.approx(statistics.stdev(values))
+
+
+def test_histogram_single_value() -> None:
+    histogram = LatencyHistogram.from_values([5.0])
+
+    assert histogram.stdev == 0
+    assert histogram.percentile(0) == 5.0
+    assert histogram.percentile(50) == 5.0
+    assert histogram.percentile(100) == 5.0
+
+
+@pytest.mark.parametrize('q', (0, 50, 90, 99, 99.9, 100))
+def test_histogram_percentile_relative_error(q: float) -> None:
+    # Latencies spanning microseconds to seconds.
+    values = sorted(10 ** random.uniform(-3, 3) for _ in range(10000))
+    histogram = LatencyHistogram.from_values(values)
+
+    index = max(0, round(q / 100 * len(values)) - 1)
+    assert histogram.percentile(q) == pytest.approx(values[index], rel=0.01)
+
+
+def test_histogram_percentile_tail() -> None:
+    histogram = LatencyHistogram.from_values([1.0] * 999 + [100.0])
+
+    assert histogram.percentile(50) == pytest.approx(1.0, rel=0.01)
+    assert histogram.percentile(99.9) == pytest.approx(1.0, rel=0.01)
+    assert histogram.percentile(100) == 100.0
+
+
+def test_histogram_large_values_clamped() -> None:
+    histogram = LatencyHistogram.from_values([1e9, 2e9])
+
+    assert histogram.max == 2e9
+    assert histogram.percentile(100) == 2e9
+    assert histogram.percentile(0) <= 2e9
+
+
+def test_histogram_merge() -> None:
+    a_values = [random.uniform(0, 10) for _ in range(100)]
+    b_values = [random.uniform(5, 50) for _ in range(300)]
+    a = LatencyHistogram.from_values(a_values)
+    b = LatencyHistogram.from_values(b_values)
+
+    merged = merge_histograms([a, b, LatencyHistogram()])
+    expected = LatencyHistogram.from_values(a_values + b_values)
+
+    assert merged.counts == expected.counts
+    assert merged.count == expected.count
+    assert merged.min == expected.min
+    assert merged.max == expected.max
+    assert merged.mean == pytest.approx(expected.mean)
+    assert merged.stdev == pytest.approx(expected.stdev)
+    assert merged.percentile(99) == expected.percentile(99)
+
+
+def test_histogram_pickle() -> None:
+    histogram = LatencyHistogram.from_values([1.0, 2.0, 3.0])
+    unpickled = pickle.loads(pickle.dumps(histogram))
+
+    assert unpickled.counts == histogram.counts
+    assert unpickled.stdev == histogram.stdev
+
+
+def test_histogram_errors() -> None:
+    histogram = LatencyHistogram()
+
+    with pytest.raises(ValueError, match='no values'):
+        histogram.percentile(50)
+    with pytest.raises(ValueError, match='no values'):
+        _ = histogram.mean
+
+    histogram.record(1)
+    with pytest.raises(ValueError, match='must be in'):
+        histogram.percentile(101)
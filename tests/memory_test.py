@@ -1,11 +1,34 @@
 from __future__ import annotations
 
+import os
 import pathlib
+import subprocess
+import sys
 import time
+from collections.abc import Generator
 
+import numpy
+import psutil
 import pytest
 
+from psbench.memory import collect_process_memory_usage
+from psbench.memory import find_memory_peak
+from psbench.memory import HighFrequencyMemoryProfiler
+from psbench.memory import load_memory_samples
+from psbench.memory import ProcMemoryReader
+from psbench.memory import SAMPLE_DTYPE
 from psbench.memory import SystemMemoryProfiler
+from psbench.memory import TrackedProcess
+
+
+@pytest.fixture
+def child_pid() -> Generator[int, None, None]:
+    process = subprocess.Popen(
+        [sys.executable, '-c', 'import time; time.sleep(10)'],
+    )
+    yield process.pid
+    process.kill()
+    process.wait()
 
 
 def test_memory_profiler() -> None:
@@ -43,3 +66,173 @@ def test_memory_profiler_one_time_use() -> None:
 
     with pytest.raises(RuntimeError, match='has already finished'):
         profiler.run()
+
+
+def test_collect_process_memory_usage(child_pid: int) -> None:
+    tracked = [
+        TrackedProcess('client', os.getpid(), children=False),
+        TrackedProcess('workers', os.getpid()),
+        TrackedProcess('server', child_pid),
+    ]
+    client, workers, server = collect_process_memory_usage(tracked)
+
+    assert client.role == 'client'
+    assert client.processes == 1
+    assert client.rss_bytes > 0
+    assert client.uss_bytes > 0
+    # The child is claimed by the workers role first. Other tests may leave
+    # helper children (e.g., the multiprocessing resource tracker) running.
+    children = psutil.Process().children(recursive=True)
+    assert workers.processes == len(children)
+    assert server.processes == 0
+
+    (workers,) = collect_process_memory_usage(
+        [TrackedProcess('workers', os.getpid())],
+        exclude=(os.getpid(), *(child.pid for child in children)),
+    )
+    assert workers.processes == 0
+    assert workers.rss_bytes == 0
+
+
+def test_collect_process_memory_usage_missing_process() -> None:
+    process = subprocess.Popen([sys.executable, '-c', 'pass'])
+    process.wait()
+
+    (usage,) = collect_process_memory_usage(
+        [TrackedProcess('server', process.pid)],
+    )
+    assert usage.processes == 0
+
+
+def test_memory_profiler_process_csv_logger(
+    tmp_path: pathlib.Path,
+    child_pid: int,
+) -> None:
+    process_csv_file = tmp_path / 'process-memory.csv'
+    profiler = SystemMemoryProfiler(
+        0.001,
+        tracked_processes=[
+            TrackedProcess('client', os.getpid(), children=False),
+            TrackedProcess('server', child_pid),
+        ],
+        process_csv_file=process_csv_file,
+    )
+    profiler.start()
+
+    time.sleep(0.2)
+
+    profiler.stop()
+    profiler.join(timeout=1.0)
+
+    with open(process_csv_file) as f:
+        log = f.readlines()
+
+    # Header + at least one row per role
+    assert len(log) >= 3
+    assert any(',client,' in line for line in log)
+    assert any(',server,' in line for line in log)
+
+
+def test_memory_profiler_process_csv_required() -> None:
+    with pytest.raises(ValueError, match='CSV file is required'):
+        SystemMemoryProfiler(
+            tracked_processes=[TrackedProcess('client', os.getpid())],
+        )
+
+
+def test_proc_memory_reader_system() -> None:
+    reader = ProcMemoryReader()
+    assert reader.read() > 0
+    reader.close()
+
+
+def test_proc_memory_reader_pids(child_pid: int) -> None:
+    reader = ProcMemoryReader([os.getpid(), child_pid])
+    own = ProcMemoryReader([os.getpid()])
+    assert reader.read() > own.read() > 0
+    reader.close()
+    own.close()
+
+
+def test_high_frequency_memory_profiler(tmp_path: pathlib.Path) -> None:
+    csv_file = tmp_path / 'memory.csv'
+    profiler = HighFrequencyMemoryProfiler(0.001, csv_file)
+    profiler.start()
+
+    time.sleep(0.1)
+
+    profiler.stop()
+    profiler.join(timeout=5.0)
+
+    samples = load_memory_samples(csv_file)
+    assert len(samples) > 1
+    assert numpy.all(numpy.diff(samples['unix_timestamp']) >= 0)
+    assert numpy.all(samples['used_bytes'] > 0)
+
+
+def test_high_frequency_memory_profiler_appends(
+    tmp_path: pathlib.Path,
+) -> None:
+    csv_file = tmp_path / 'memory.csv'
+    counts = []
+    for _ in range(2):
+        profiler = HighFrequencyMemoryProfiler(0.001, csv_file)
+        profiler.start()
+        time.sleep(0.05)
+        profiler.stop()
+        profiler.join(timeout=5.0)
+        counts.append(len(load_memory_samples(csv_file)))
+
+    # Samples of the first invocation are kept (e.g., when resuming) and
+    # the header is only written once.
+    assert counts[1] > counts[0] > 1
+    lines = csv_file.read_text().splitlines()
+    assert lines[0] == 'unix_timestamp,used_bytes'
+    assert len(lines) == counts[1] + 1
+
+
+def test_high_frequency_memory_profiler_ring_wraps(
+    tmp_path: pathlib.Path,
+) -> None:
+    csv_file = tmp_path / 'memory.csv'
+    profiler = HighFrequencyMemoryProfiler(
+        0.0001,
+        csv_file,
+        capacity=5,
+        pids=[os.getpid()],
+    )
+    profiler.start()
+
+    time.sleep(0.1)
+
+    profiler.stop()
+    profiler.join(timeout=5.0)
+
+    samples = load_memory_samples(csv_file)
+    assert len(samples) == 5
+    # Oldest samples are overwritten but the output is in time order.
+    assert numpy.all(numpy.diff(samples['unix_timestamp']) >= 0)
+
+
+def test_high_frequency_memory_profiler_already_finished() -> None:
+    profiler = HighFrequencyMemoryProfiler(0.001)
+    profiler.stop()
+
+    with pytest.raises(RuntimeError, match='already finished'):
+        profiler.run()
+
+
+def test_find_memory_peak() -> None:
+    samples = numpy.array(
+        [(1.0, 10), (2.0, 20), (3.0, 50), (4.0, 30), (5.0, 100)],
+        dtype=SAMPLE_DTYPE,
+    )
+
+    peak = find_memory_peak(samples, 1.5, 4.5)
+    assert peak is not None
+    assert peak.baseline_used_bytes == 20
+    assert peak.peak_used_bytes == 50
+    assert peak.peak_timestamp == 3.0
+    assert peak.time_to_peak_s == 1.5
+
+    assert find_memory_peak(samples, 10, 20) is None
@@ -0,0 +1,214 @@
+from __future__ import annotations
+
+import multiprocessing
+import os
+import pickle
+import zlib
+
+import numpy
+import pytest
+
+from psbench.payload import COMPRESSIBLE_BLOCK_BYTES
+from psbench.payload import generate_payload
+from psbench.payload import get_payload_pool
+from psbench.payload import HEADER_SIZE
+from psbench.payload import NESTED_RECORD_BYTES
+from psbench.payload import PAYLOAD_KINDS
+from psbench.payload import payload_nbytes
+from psbench.payload import PayloadKind
+from psbench.payload import PayloadPool
+from psbench.payload import POOL_MIN_PAYLOAD_BYTES
+
+
+@pytest.mark.parametrize('size', (0, 1, HEADER_SIZE, 100, 1000, 2500))
+def test_payload_pool_get_size(size: int) -> None:
+    pool = PayloadPool(1000, seed=0)
+    payload = pool.get(size)
+
+    assert isinstance(payload, bytes)
+    assert len(payload) == size
+
+
+def test_payload_pool_unique() -> None:
+    pool = PayloadPool(1000)
+    payloads = {pool.get(100) for _ in range(100)}
+
+    assert len(payloads) == 100
+
+
+def test_payload_pool_seeded() -> None:
+    a = PayloadPool(1000, seed=42)
+    b = PayloadPool(1000, seed=42)
+
+    assert bytes(a.view(1000)) == bytes(b.view(1000))
+    assert bytes(a.view(1000)) != bytes(PayloadPool(1000, seed=0).view(1000))
+
+
+def test_payload_pool_size_rounded() -> None:
+    pool = PayloadPool(10)
+    assert pool.size_bytes == 16
+
+
+def test_payload_pool_grows_on_demand() -> None:
+    pool = PayloadPool()
+    assert pool.size_bytes == 0
+
+    pool.reserve(100)
+    assert pool.size_bytes == 104
+    view = bytes(pool.view(104))
+
+    payload = pool.get(1000)
+    assert pool.size_bytes == 1000
+    # Growing the pool keeps the existing contents.
+    assert bytes(pool.view(104)) == view
+    # Payloads larger than the original pool do not repeat content.
+    body = payload[HEADER_SIZE:]
+    assert body[:100] not in body[100:]
+
+
+def test_payload_pool_view() -> None:
+    pool = PayloadPool(1000)
+    view = pool.view(100, offset=10)
+
+    assert len(view) == 100
+    assert view.readonly
+
+    with pytest.raises(ValueError, match='exceeds the pool size'):
+        pool.view(1001)
+    with pytest.raises(ValueError, match='exceeds the pool size'):
+        pool.view(1, offset=-1)
+
+
+def test_payload_pool_stats() -> None:
+    pool = PayloadPool(1000)
+    pool.get(100)
+    pool.get(200)
+
+    stats = pool.stats()
+    assert stats.pool_size_bytes == 1000
+    assert pool.size_bytes == 1000
+    assert stats.fill_time_s >= 0
+    assert stats.payload_count == 2
+    assert stats.payload_bytes == 300
+    assert stats.payload_time_s >= 0
+
+
+def test_payload_pool_bad_size() -> None:
+    with pytest.raises(ValueError, match='negative'):
+        PayloadPool(-1)
+
+
+def _get_pool_pid(queue: multiprocessing.Queue[int]) -> None:
+    queue.put(get_payload_pool()._pid)
+
+
+def test_get_payload_pool() -> None:
+    pool = get_payload_pool()
+    assert get_payload_pool() is pool
+    assert pool._pid == os.getpid()
+
+    context = multiprocessing.get_context('fork')
+    queue: multiprocessing.Queue[int] = context.Queue()
+    process = context.Process(target=_get_pool_pid, args=(queue,))
+    process.start()
+    child_pid = queue.get(timeout=5)
+    process.join(timeout=5)
+
+    assert child_pid == process.pid
+
+
+@pytest.mark.parametrize('kind', PAYLOAD_KINDS)
+def test_generate_payload_seeded(kind: PayloadKind) -> None:
+    a = generate_payload(kind, 10000, seed=0)
+    b = generate_payload(kind, 10000, seed=0)
+    c = generate_payload(kind, 10000, seed=1)
+
+    assert pickle.dumps(a) == pickle.dumps(b)
+    assert pickle.dumps(a) != pickle.dumps(c)
+    assert payload_nbytes(a) == pytest.approx(10000, rel=0.1)
+
+
+def test_generate_payload_bytes_unseeded() -> None:
+    payload = generate_payload('bytes', 100)
+    assert isinstance(payload, bytes)
+    assert len(payload) == 100
+
+
+def test_generate_payload_bytes_pool() -> None:
+    pool = PayloadPool()
+    # The pool is only used when provided and for large payloads.
+    generate_payload('bytes', POOL_MIN_PAYLOAD_BYTES)
+    generate_payload('bytes', 100, pool=pool)
+    assert pool.stats().payload_count == 0
+
+    payload = generate_payload('bytes', POOL_MIN_PAYLOAD_BYTES, pool=pool)
+    assert len(payload) == POOL_MIN_PAYLOAD_BYTES
+    assert pool.stats().payload_count == 1
+
+
+@pytest.mark.parametrize(
+    ('dtype', 'shape', 'expected_shape'),
+    (
+        ('float64', (), (125,)),
+        ('float32', (10,), (25, 10)),
+        ('int16', (5, 5), (20, 5, 5)),
+        ('uint8', (), (1000,)),
+        ('complex64', (), (125,)),
+    ),
+)
+def test_generate_payload_ndarray(
+    dtype: str,
+    shape: tuple[int, ...],
+    expected_shape: tuple[int, ...],
+) -> None:
+    payload = generate_payload('ndarray', 1000, dtype=dtype, shape=shape)
+
+    assert isinstance(payload, numpy.ndarray)
+    assert payload.dtype == numpy.dtype(dtype)
+    assert payload.shape == expected_shape
+
+
+def test_generate_payload_ndarray_bad_dtype() -> None:
+    with pytest.raises(ValueError, match='Unsupported payload dtype'):
+        generate_payload('ndarray', 1000, dtype='bool')
+
+
+@pytest.mark.parametrize('compressibility', (0, 0.5, 0.9, 1))
+def test_generate_payload_compressible(compressibility: float) -> None:
+    size = 100 * COMPRESSIBLE_BLOCK_BYTES + 10
+    payload = generate_payload(
+        'compressible',
+        size,
+        compressibility=compressibility,
+    )
+
+    assert isinstance(payload, bytes)
+    assert len(payload) == size
+    ratio = 1 - len(zlib.compress(payload)) / size
+    assert ratio == pytest.approx(compressibility, abs=0.05)
+
+
+def test_generate_payload_compressible_bad_ratio() -> None:
+    with pytest.raises(ValueError, match='Compressibility must be in'):
+        generate_payload('compressible', 100, compressibility=1.5)
+
+
+def test_generate_payload_nested() -> None:
+    payload = generate_payload('nested', 100_000)
+
+    assert isinstance(payload, dict)
+    assert len(payload['records']) == 100_000 // NESTED_RECORD_BYTES
+    assert len(pickle.dumps(payload)) == pytest.approx(100_000, rel=0.1)
+
+
+def test_generate_payload_unknown_kind() -> None:
+    with pytest.raises(ValueError, match='Unknown payload kind'):
+        generate_payload('unknown', 100)  # type: ignore[arg-type]
+
+
+def test_payload_nbytes() -> None:
+    assert payload_nbytes(b'abc') == 3
+    assert payload_nbytes(numpy.zeros(10)) == 80
+
+    with pytest.raises(TypeError, match='Unsupported payload type'):
+        payload_nbytes(object())
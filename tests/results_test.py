@@ -1,15 +1,24 @@
 from __future__ import annotations
 
 import dataclasses
+import os
 import pathlib
+import threading
+import time
+from typing import Literal
 from typing import NamedTuple
+from typing import Optional
 
+import numpy
 import pytest
 from pydantic import BaseModel
 
+from psbench.results import AsyncResultLogger
 from psbench.results import BasicResultLogger
 from psbench.results import CSVResultLogger
 from psbench.results import field_names
+from psbench.results import load_npz_results
+from psbench.results import NPZResultLogger
 
 
 class DataBM(BaseModel):
@@ -124,3 +133,208 @@ def test_csv_logger_mismatch_headers(tmp_path: pathlib.Path) -> None:
 
     with pytest.raises(ValueError):
         CSVResultLogger(filepath, _OtherData)
+
+
+class DataOptional(BaseModel):
+    name: Literal['a', 'b']
+    flag: bool
+    count: Optional[int]  # noqa: UP045
+    note: Optional[str]  # noqa: UP045
+    mixed: Literal['a', 1]
+
+
+def test_npz_logger_basic(tmp_path: pathlib.Path) -> None:
+    dirpath = str(tmp_path / 'results')
+    with NPZResultLogger(dirpath, DataNT, batch_size=2) as logger:
+        for i in range(5):
+            logger.log(DataNT(float(i), i, str(i)))
+
+    # Two full batches and the remaining row written on close
+    assert len(os.listdir(dirpath)) == 3
+
+    table = load_npz_results(dirpath)
+    assert table['time'].dtype == numpy.float64
+    assert table['value'].dtype == numpy.int64
+    assert table['result'].dtype.kind == 'U'
+    assert table['value'].tolist() == list(range(5))
+    assert table['result'].tolist() == ['0', '1', '2', '3', '4']
+
+
+def test_npz_logger_types(tmp_path: pathlib.Path) -> None:
+    dirpath = str(tmp_path / 'results')
+    with NPZResultLogger(dirpath, DataOptional) as logger:
+        logger.log(
+            DataOptional(name='a', flag=True, count=1, note='x', mixed=1),
+        )
+        logger.log(
+            DataOptional(name='b', flag=False, count=None, note=None, mixed=1),
+        )
+
+    table = load_npz_results(dirpath)
+    assert table['name'].tolist() == ['a', 'b']
+    assert table['flag'].dtype == numpy.bool_
+    assert table['count'].dtype == numpy.float64
+    assert table['count'][0] == 1
+    assert numpy.isnan(table['count'][1])
+    assert table['note'].tolist() == ['x', '']
+    assert table['mixed'].tolist() == ['1', '1']
+
+
+def test_npz_logger_dataclass(tmp_path: pathlib.Path) -> None:
+    dirpath = str(tmp_path / 'results')
+    with NPZResultLogger(dirpath, DataDC) as logger:
+        logger.log(DataDC(1.0, 2, '3'))
+
+    assert load_npz_results(dirpath)['value'].tolist() == [2]
+
+
+def test_npz_logger_flush_interval(tmp_path: pathlib.Path) -> None:
+    dirpath = str(tmp_path / 'results')
+    logger = NPZResultLogger(dirpath, DataNT, flush_interval=0)
+    logger.log(DataNT(1.0, 2, '3'))
+
+    # Row is committed before close() with a zero flush interval
+    assert load_npz_results(dirpath)['value'].tolist() == [2]
+    logger.close()
+    logger.close()
+    assert len(os.listdir(dirpath)) == 1
+
+
+def test_npz_logger_append(tmp_path: pathlib.Path) -> None:
+    dirpath = str(tmp_path / 'results')
+    with NPZResultLogger(dirpath, DataNT) as logger:
+        logger.log(DataNT(1.0, 2, '3'))
+    with NPZResultLogger(dirpath, DataBM) as logger:
+        logger.log(DataBM(time=4.0, value=5, result='6'))
+
+    assert load_npz_results(dirpath)['value'].tolist() == [2, 5]
+
+
+def test_npz_logger_mismatch_fields(tmp_path: pathlib.Path) -> None:
+    dirpath = str(tmp_path / 'results')
+    with NPZResultLogger(dirpath, DataNT) as logger:
+        logger.log(DataNT(1.0, 2, '3'))
+
+    class _OtherData(NamedTuple):
+        x: int
+
+    with pytest.raises(ValueError, match='do not match'):
+        NPZResultLogger(dirpath, _OtherData)
+
+
+def test_load_npz_results_empty(tmp_path: pathlib.Path) -> None:
+    assert load_npz_results(str(tmp_path)) == {}
+
+
+def test_async_logger(tmp_path: pathlib.Path) -> None:
+    filepath = str(tmp_path / 'log.csv')
+    csv_logger = CSVResultLogger(filepath, DataNT)
+    with AsyncResultLogger(csv_logger, maxsize=2) as logger:
+        for i in range(10):
+            logger.log(DataNT(float(i), i, str(i)))
+
+    assert csv_logger.f.closed
+    with open(filepath) as f:
+        data = f.readlines()
+
+    assert len(data) == 11
+    assert data[-1].startswith('9.0')
+
+
+def test_async_logger_flush(tmp_path: pathlib.Path) -> None:
+    release = threading.Event()
+
+    class _SlowLogger(BasicResultLogger[DataNT]):
+        def log(self, data: DataNT) -> None:
+            release.wait()
+            super().log(data)
+
+    basic_logger = _SlowLogger(DataNT)
+    logger = AsyncResultLogger(basic_logger)
+    logger.log(DataNT(1.0, 1, '1'))
+    logger.log(DataNT(2.0, 2, '2'))
+
+    flushing = threading.Thread(target=logger.flush)
+    flushing.start()
+    flushing.join(timeout=0.05)
+    assert flushing.is_alive()
+
+    release.set()
+    flushing.join(timeout=1)
+    assert not flushing.is_alive()
+    assert len(basic_logger.results) == 2
+
+    logger.close()
+    # Flushing a closed logger is a no-op
+    logger.flush()
+
+    filepath = str(tmp_path / 'log.csv')
+    with CSVResultLogger(filepath, DataNT) as csv_logger:
+        csv_logger.log(DataNT(1.0, 1, '1'))
+        csv_logger.flush()
+        with open(filepath) as f:
+            assert len(f.readlines()) == 2
+
+
+def test_async_logger_backpressure() -> None:
+    release = threading.Event()
+
+    class _SlowLogger(BasicResultLogger[DataNT]):
+        def log(self, data: DataNT) -> None:
+            release.wait()
+            super().log(data)
+
+    basic_logger = _SlowLogger(DataNT)
+    logger = AsyncResultLogger(basic_logger, maxsize=1)
+    # First row is taken by the writer thread and the second fills the queue
+    logger.log(DataNT(1.0, 1, '1'))
+    logger.log(DataNT(2.0, 2, '2'))
+
+    blocked = threading.Thread(target=logger.log, args=(DataNT(3.0, 3, '3'),))
+    blocked.start()
+    blocked.join(timeout=0.05)
+    assert blocked.is_alive()
+
+    release.set()
+    blocked.join(timeout=1)
+    assert not blocked.is_alive()
+
+    logger.close()
+    assert [r.value for r in basic_logger.results] == [1, 2, 3]
+
+
+def test_async_logger_error_propagation() -> None:
+    class _FailingLogger(BasicResultLogger[DataNT]):
+        def log(self, data: DataNT) -> None:
+            raise OSError('disk full')
+
+    logger = AsyncResultLogger(_FailingLogger(DataNT))
+    logger.log(DataNT(1.0, 2, '3'))
+    logger.log(DataNT(4.0, 5, '6'))
+
+    with pytest.raises(RuntimeError, match='background thread') as exc_info:
+        logger.close()
+    assert isinstance(exc_info.value.__cause__, OSError)
+
+    # Second close is a no-op
+    logger.close()
+    with pytest.raises(RuntimeError, match='closed'):
+        logger.log(DataNT(1.0, 2, '3'))
+
+
+def test_async_logger_error_on_log() -> None:
+    class _FailingLogger(BasicResultLogger[DataNT]):
+        def log(self, data: DataNT) -> None:
+            raise OSError('disk full')
+
+    logger = AsyncResultLogger(_FailingLogger(DataNT))
+    logger.log(DataNT(1.0, 2, '3'))
+    # Wait for the writer thread to fail writing the first row
+    while logger._error is None:
+        time.sleep(0.001)
+
+    with pytest.raises(RuntimeError, match='background thread'):
+        logger.log(DataNT(4.0, 5, '6'))
+
+    with pytest.raises(RuntimeError):
+        logger.close()
@@ -1,6 +1,7 @@
 from __future__ import annotations
 
 import pathlib
+from unittest import mock
 
 import pytest
 
@@ -48,3 +49,11 @@ def test_main_bad_executor(tmp_path: pathlib.Path) -> None:
             ),
         ):
             main(args)
+
+
+def test_main_ci_field_unsupported() -> None:
+    args = ['--executor', 'thread', '--ci-field', 'total_time_ms']
+
+    with mock.patch('argparse.ArgumentParser._print_message'):
+        with pytest.raises(SystemExit):
+            main(args)
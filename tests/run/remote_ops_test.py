@@ -1,6 +1,9 @@
 from __future__ import annotations
 
 import pathlib
+from unittest import mock
+
+import pytest
 
 from psbench.run.remote_ops import main
 from testing.mocking import disable_logging
@@ -21,3 +24,30 @@ def test_main(tmp_path: pathlib.Path) -> None:
 
     with disable_logging('psbench.run.remote_ops'):
         main(args)
+
+
+def test_main_local(tmp_path: pathlib.Path) -> None:
+    args = [
+        'redis',
+        '--local',
+        '--local-latency-ms',
+        '0.1',
+        '--ops',
+        'get',
+        'set',
+        '--payload-sizes',
+        '100',
+        '--run-dir',
+        str(tmp_path),
+    ]
+
+    with disable_logging('psbench.run.remote_ops'):
+        main(args)
+
+
+def test_main_ci_field_unsupported() -> None:
+    args = ['redis', '--local', '--ci-field', 'avg_time_ms']
+
+    with mock.patch('argparse.ArgumentParser._print_message'):
+        with pytest.raises(SystemExit):
+            main(args)
@@ -0,0 +1,21 @@
+from __future__ import annotations
+
+import pathlib
+
+from psbench.run.serialization import main
+from testing.mocking import disable_logging
+
+
+def test_main(tmp_path: pathlib.Path) -> None:
+    args = [
+        '--payload-sizes',
+        '100',
+        '--payload-kinds',
+        'bytes',
+        'ndarray',
+        '--run-dir',
+        str(tmp_path),
+    ]
+
+    with disable_logging('psbench.run.serialization'):
+        main(args)
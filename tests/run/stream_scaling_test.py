@@ -3,12 +3,24 @@ from __future__ import annotations
 import pathlib
 from unittest import mock
 
+import pytest
+
 from psbench.run.stream_scaling import main
 from testing.mocking import disable_logging
 
 
-def test_stream_scaling_main(tmp_path: pathlib.Path) -> None:
+@pytest.mark.parametrize('results_format', ('csv', 'npz'))
+def test_stream_scaling_main(
+    results_format: str,
+    tmp_path: pathlib.Path,
+) -> None:
+    # The extra result paths should only replace the extension even if the
+    # run directory contains '.csv'.
+    run_dir = tmp_path / 'runs.csv'
+
     argv = [
+        '--item-results-format',
+        results_format,
         '--data-size-bytes',
         '1',
         '2',
@@ -44,5 +56,44 @@ def test_stream_scaling_main(tmp_path: pathlib.Path) -> None:
         mock.patch(
             'psbench.run.stream_scaling.runner',
         ),
+        mock.patch(
+            'psbench.run.stream_scaling.get_run_dir',
+            return_value=str(run_dir),
+        ),
+        mock.patch(
+            'psbench.run.stream_scaling.CSVResultLogger',
+        ) as csv_logger,
+        mock.patch(
+            'psbench.run.stream_scaling.NPZResultLogger',
+        ) as npz_logger,
     ):
         main(argv)
+
+    csv_paths = {call.args[0] for call in csv_logger.call_args_list}
+    npz_paths = {call.args[0] for call in npz_logger.call_args_list}
+    if results_format == 'npz':
+        assert npz_paths == {
+            str(run_dir / 'results-items'),
+            str(run_dir / 'results-queue-depth'),
+        }
+    else:
+        assert npz_paths == set()
+        assert str(run_dir / 'results-items.csv') in csv_paths
+        assert str(run_dir / 'results-queue-depth.csv') in csv_paths
+    assert str(run_dir / 'results.csv') in csv_paths
+    assert str(run_dir / 'results-dispatchers.csv') in csv_paths
+
+
+def test_stream_scaling_main_queue_requires_thread_executor() -> None:
+    argv = [
+        '--executor',
+        'process',
+        '--ps-connector',
+        'local',
+        '--stream',
+        'queue',
+    ]
+
+    with mock.patch('argparse.ArgumentParser._print_message'):
+        with pytest.raises(SystemExit):
+            main(argv)
@@ -3,6 +3,11 @@ from __future__ import annotations
 import pathlib
 from unittest import mock
 
+import numpy
+import pytest
+
+from psbench.memory import SAMPLE_DTYPE
+from psbench.run.workflow_memory import _log_memory_peaks
 from psbench.run.workflow_memory import main
 from testing.globus_compute import mock_globus_compute
 from testing.mocking import disable_logging
@@ -39,7 +44,97 @@ def test_main(tmp_path: pathlib.Path) -> None:
         ),
         mock.patch(
             'psbench.run.workflow_memory.SystemMemoryProfiler',
-        ),
+        ) as mock_profiler,
         mock_globus_compute(),
     ):
+        mock_profiler.return_value.exitcode = 0
         main(args)
+
+    mock_profiler.return_value.join.assert_called_once_with()
+
+
+@pytest.mark.parametrize('exitcode', (0, 1))
+def test_main_high_frequency(exitcode: int, tmp_path: pathlib.Path) -> None:
+    args = [
+        '--executor',
+        'globus',
+        '--globus-compute-endpoint',
+        'UUID',
+        '--data-management',
+        'none',
+        '--stage-task-counts',
+        '1',
+        '1',
+        '--stage-bytes-sizes',
+        '100',
+        '--task-sleep',
+        '0.01',
+        '--run-dir',
+        str(tmp_path),
+        '--ps-connector',
+        'file',
+        '--ps-file-dir',
+        str(tmp_path / 'dump'),
+        '--memory-profiler',
+        'high-frequency',
+    ]
+
+    with (
+        disable_logging('psbench.run.workflow_memory'),
+        mock.patch(
+            'psbench.config.StoreConfig.get_store',
+        ),
+        mock.patch(
+            'psbench.run.workflow_memory.HighFrequencyMemoryProfiler',
+        ) as mock_profiler,
+        mock.patch(
+            'psbench.run.workflow_memory._log_memory_peaks',
+        ) as mock_log_peaks,
+        mock_globus_compute(),
+    ):
+        mock_profiler.return_value.exitcode = exitcode
+        if exitcode == 0:
+            main(args)
+        else:
+            with pytest.raises(RuntimeError, match='exited with code 1'):
+                main(args)
+
+    # Samples are only read once the profiler finished writing them.
+    assert mock_log_peaks.call_count == (1 if exitcode == 0 else 0)
+
+
+def test_log_memory_peaks(tmp_path: pathlib.Path) -> None:
+    memory_file = tmp_path / 'memory.csv'
+    results_file = tmp_path / 'results.csv'
+    peaks_file = tmp_path / 'peaks.csv'
+
+    samples = numpy.array(
+        [(1.0, 10), (2.0, 30), (3.0, 20), (4.0, 50)],
+        dtype=SAMPLE_DTYPE,
+    )
+    numpy.savetxt(
+        memory_file,
+        samples,
+        fmt=['%.6f', '%d'],
+        delimiter=',',
+        header='unix_timestamp,used_bytes',
+        comments='',
+    )
+    results_file.write_text(
+        'data_management,workflow_start_timestamp,workflow_end_timestamp\n'
+        'none,1.0,3.0\n'
+        'none,10.0,11.0\n',
+    )
+
+    # Peaks of a previous invocation are recomputed rather than duplicated.
+    for _ in range(2):
+        _log_memory_peaks(
+            str(memory_file),
+            str(results_file),
+            str(peaks_file),
+        )
+
+    lines = peaks_file.read_text().splitlines()
+    # Header and one peak since the second run has no samples.
+    assert len(lines) == 2
+    assert lines[1].split(',')[3] == '30'
@@ -1,7 +1,17 @@
 from __future__ import annotations
 
+import math
+import pathlib
+from unittest import mock
+
+import pytest
+
+from psbench.checkpoint import CheckpointManifest
 from psbench.results import BasicResultLogger
+from psbench.runner import AdaptiveRepeat
+from psbench.runner import relative_ci_half_width
 from psbench.runner import runner
+from psbench.runner import t_quantile
 from testing.benchmark import MockBenchmark
 from testing.benchmark import MockRunConfig
 from testing.benchmark import MockRunResult
@@ -16,3 +26,160 @@ def test_runner() -> None:
             runner(benchmark, configs, logger, repeat=repeat)
 
         assert len(logger.results) == repeat * len(configs)
+
+
+def test_runner_checkpoint(tmp_path: pathlib.Path) -> None:
+    configs = [MockRunConfig(param=i) for i in range(3)]
+    checkpoint_file = str(tmp_path / 'checkpoint.txt')
+
+    with CheckpointManifest(checkpoint_file) as checkpoint:
+        checkpoint.mark_completed(configs[0], 0)
+        checkpoint.mark_completed(configs[0], 1)
+        checkpoint.mark_completed(configs[1], 0)
+
+    with (
+        BasicResultLogger(MockRunResult) as logger,
+        CheckpointManifest(checkpoint_file) as checkpoint,
+        MockBenchmark() as benchmark,
+    ):
+        runner(benchmark, configs, logger, repeat=2, checkpoint=checkpoint)
+
+        assert [r.value for r in logger.results] == [1, 2, 2]
+        assert len(checkpoint) == 6
+
+
+def test_runner_checkpoint_after_flush(tmp_path: pathlib.Path) -> None:
+    configs = [MockRunConfig(param=1)]
+    checkpoint_file = str(tmp_path / 'checkpoint.txt')
+    calls = mock.Mock()
+
+    with (
+        BasicResultLogger(MockRunResult) as logger,
+        CheckpointManifest(checkpoint_file) as checkpoint,
+        MockBenchmark() as benchmark,
+        mock.patch.object(logger, 'flush', calls.flush),
+        mock.patch.object(
+            checkpoint,
+            'mark_completed',
+            calls.mark_completed,
+        ),
+    ):
+        runner(benchmark, configs, logger, checkpoint=checkpoint)
+
+    assert [c[0] for c in calls.mock_calls] == ['flush', 'mark_completed']
+
+
+@pytest.mark.parametrize(
+    ('p', 'df', 'expected'),
+    (
+        (0.975, 2, 4.303),
+        (0.975, 10, 2.228),
+        (0.95, 5, 2.015),
+        (0.995, 30, 2.750),
+    ),
+)
+def test_t_quantile(p: float, df: int, expected: float) -> None:
+    assert t_quantile(p, df) == pytest.approx(expected, rel=0.01)
+
+
+def test_relative_ci_half_width() -> None:
+    assert relative_ci_half_width([1], 0.95) == math.inf
+    assert relative_ci_half_width([0, 0], 0.95) == math.inf
+    assert relative_ci_half_width([1, 1, 1], 0.95) == 0
+    assert relative_ci_half_width([1, 2, 3], 0.95) == pytest.approx(
+        1.242,
+        rel=0.01,
+    )
+
+
+def test_runner_adaptive_converges() -> None:
+    configs = [MockRunConfig(param=i) for i in range(1, 4)]
+    adaptive = AdaptiveRepeat(field='value', min_repeat=3, warmup=2)
+
+    with (
+        BasicResultLogger(MockRunResult) as logger,
+        MockBenchmark() as benchmark,
+        mock.patch.object(benchmark, 'run', wraps=benchmark.run) as run,
+    ):
+        runner(benchmark, configs, logger, adaptive=adaptive)
+
+        # Values are constant so each config converges after min repeats
+        # and warmup results are not logged.
+        assert len(logger.results) == 3 * len(configs)
+        assert run.call_count == 5 * len(configs)
+
+
+def test_runner_adaptive_max_repeat() -> None:
+    configs = [MockRunConfig(param=1)]
+    adaptive = AdaptiveRepeat(
+        field='time',
+        min_repeat=2,
+        max_repeat=5,
+        target=1e-12,
+    )
+
+    with (
+        BasicResultLogger(MockRunResult) as logger,
+        MockBenchmark() as benchmark,
+    ):
+        runner(benchmark, configs, logger, adaptive=adaptive)
+
+        assert len(logger.results) == 5
+
+
+def test_runner_adaptive_resume(tmp_path: pathlib.Path) -> None:
+    configs = [MockRunConfig(param=i) for i in range(1, 3)]
+    adaptive = AdaptiveRepeat(field='value', min_repeat=3, warmup=2)
+    checkpoint_file = str(tmp_path / 'checkpoint.txt')
+
+    with (
+        BasicResultLogger(MockRunResult) as logger,
+        CheckpointManifest(checkpoint_file) as checkpoint,
+        MockBenchmark() as benchmark,
+    ):
+        runner(benchmark, configs[:1], logger, adaptive=adaptive)
+        assert len(checkpoint) == 0
+
+    with (
+        BasicResultLogger(MockRunResult) as logger,
+        CheckpointManifest(checkpoint_file) as checkpoint,
+        MockBenchmark() as benchmark,
+    ):
+        runner(
+            benchmark,
+            configs[:1],
+            logger,
+            adaptive=adaptive,
+            checkpoint=checkpoint,
+        )
+        assert len(checkpoint) == 3
+
+    with (
+        BasicResultLogger(MockRunResult) as logger,
+        CheckpointManifest(checkpoint_file) as checkpoint,
+        MockBenchmark() as benchmark,
+        mock.patch.object(benchmark, 'run', wraps=benchmark.run) as run,
+    ):
+        runner(
+            benchmark,
+            configs,
+            logger,
+            adaptive=adaptive,
+            checkpoint=checkpoint,
+        )
+
+        # The first config already converged so neither its runs nor its
+        # warmup runs are repeated.
+        assert len(checkpoint) == 6
+        assert len(logger.results) == 3
+        assert run.call_count == 5
+        assert checkpoint.value(configs[0], 0) == 1
+
+
+def test_runner_adaptive_bad_field() -> None:
+    with (
+        BasicResultLogger(MockRunResult) as logger,
+        MockBenchmark() as benchmark,
+    ):
+        with pytest.raises(ValueError, match='not a field'):
+            runner(benchmark, [], logger, adaptive=AdaptiveRepeat(field='x'))
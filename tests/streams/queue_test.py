@@ -0,0 +1,36 @@
+from __future__ import annotations
+
+import threading
+
+from psbench.streams.queue import get_publisher
+from psbench.streams.queue import get_subscriber
+from psbench.streams.queue import TopicQueues
+
+
+def test_topic_queues_created_on_access() -> None:
+    queues = TopicQueues()
+    assert len(queues) == 0
+    assert 'topic' in queues
+    assert queues['topic'] is queues['topic']
+    assert list(queues) == ['topic']
+    assert len(queues) == 1
+
+
+def test_publish_subscribe() -> None:
+    publisher = get_publisher()
+    subscriber = get_subscriber('queue-test-topic')
+
+    messages = [f'message-{i}'.encode() for i in range(5)]
+
+    def _publish() -> None:
+        for message in messages:
+            publisher.send_message('queue-test-topic', message)
+
+    thread = threading.Thread(target=_publish)
+    thread.start()
+    received = [subscriber.next_message() for _ in messages]
+    thread.join()
+
+    assert received == messages
+    publisher.close()
+    subscriber.close()
@@ -0,0 +1,68 @@
+from __future__ import annotations
+
+import socket
+
+import pytest
+import zmq
+
+from psbench.streams.zeromq import start_forwarder
+from psbench.streams.zeromq import ZeroMQForwarder
+from psbench.streams.zeromq import ZeroMQPublisher
+from psbench.streams.zeromq import ZeroMQSubscriber
+
+
+def _open_port() -> int:
+    with socket.socket() as s:
+        s.bind(('127.0.0.1', 0))
+        return s.getsockname()[1]
+
+
+def test_publish_subscribe() -> None:
+    with ZeroMQForwarder() as forwarder:
+        subscriber = ZeroMQSubscriber(forwarder.backend, topic='topic-1')
+        publisher = ZeroMQPublisher(forwarder.frontend)
+
+        # Subscriptions match by prefix so the message for topic-10 must
+        # be skipped by the subscriber.
+        publisher.send_message('topic-10', b'other')
+        publisher.send_message('topic-1', b'message')
+        assert next(iter(subscriber)) == b'message'
+
+        publisher.close()
+        subscriber.close()
+
+
+def test_publish_subscribe_parts() -> None:
+    with ZeroMQForwarder() as forwarder:
+        subscriber = ZeroMQSubscriber(forwarder.backend, topic='topic')
+        publisher = ZeroMQPublisher(forwarder.frontend)
+
+        publisher.send_message_parts('topic', [b'header', b'data'])
+        assert subscriber.next_message_parts() == [b'header', b'data']
+        publisher.send_message_parts('topic', [b'header', b'data'])
+        assert subscriber.next_message() == b'headerdata'
+
+        publisher.close()
+        subscriber.close()
+
+
+def test_forwarder_start_stop() -> None:
+    forwarder = ZeroMQForwarder()
+    forwarder.start()
+    with pytest.raises(RuntimeError, match='already running'):
+        forwarder.start()
+    forwarder.stop()
+    forwarder.stop()
+
+    with ZeroMQForwarder() as forwarder:
+        with pytest.raises(zmq.ZMQError):
+            ZeroMQForwarder(frontend=forwarder.frontend).start()
+
+
+def test_start_forwarder() -> None:
+    frontend = f'127.0.0.1:{_open_port()}'
+    backend = f'127.0.0.1:{_open_port()}'
+    forwarder = start_forwarder(frontend, backend)
+    assert start_forwarder(frontend, backend) is forwarder
+    assert forwarder.frontend == frontend
+    assert forwarder.backend == backend